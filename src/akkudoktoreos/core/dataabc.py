@@ -821,6 +821,7 @@ class DataSequence(DataABC, DatabaseRecordProtocolMixin[DataRecord]):
 
         avail_record = await self.db_get_record(record_date_time_timestamp)
         if avail_record:
+            self._db_journal_record(avail_record)
             # Merge values, only updating fields where data record has a non-None value
             for field, val in record.model_dump(exclude_unset=True).items():
                 if field in record.record_keys_writable():
@@ -877,6 +878,7 @@ class DataSequence(DataABC, DatabaseRecordProtocolMixin[DataRecord]):
             await self.db_insert_record(new_record)
         else:
             # Update the DataRecord with all new values
+            self._db_journal_record(record)
             for key, value in values.items():
                 setattr(record, key, value)
             await self.db_mark_dirty_record(record)
@@ -912,6 +914,7 @@ class DataSequence(DataABC, DatabaseRecordProtocolMixin[DataRecord]):
                 await self.db_insert_record(new_record)
             else:
                 # Update existing record's specified key
+                self._db_journal_record(avail_record)
                 setattr(avail_record, key, values[i])
                 await self.db_mark_dirty_record(avail_record)
 
@@ -947,9 +950,96 @@ class DataSequence(DataABC, DatabaseRecordProtocolMixin[DataRecord]):
                 await self.db_insert_record(new_record)
             else:
                 # Update existing record's specified key
+                self._db_journal_record(avail_record)
                 setattr(avail_record, key, value)
                 await self.db_mark_dirty_record(avail_record)
 
+    async def _key_from_array(
+        self,
+        key: str,
+        values: Union[np.ndarray, list[Any]],
+        start_datetime: Optional[DateTime] = None,
+        interval: Optional[Duration] = None,
+    ) -> None:
+        """Update the sequence from an array of values at fixed time intervals.
+
+        Internal implementation of `key_from_array`. Callers must
+        acquire ``self._record_lock`` before calling this method.
+
+        The timestamps of the values are generated in UTC by fixed absolute
+        stepping, like `db_generate_timestamps`. Existing records get their
+        ``key`` field updated, records for the remaining timestamps are created
+        and merged into the sequence in one step.
+
+        Args:
+            key: Field name in the data record to update.
+            values: Values at ``start_datetime`` and the following intervals.
+                None/ NaN values are skipped.
+            start_datetime: Datetime of the first value. Defaults to the
+                energy management start datetime.
+            interval: Fixed time interval between the values. Defaults to 1 hour.
+
+        Raises:
+            KeyError: If ``key`` is not in the writable record keys.
+            ValueError: If the interval is not positive.
+        """
+        self._validate_key_writable(key)
+
+        if start_datetime is None:
+            start_datetime = self.ems_start_datetime
+        # Ensure datetime objects are normalized - same as DataRecord date_time
+        start_datetime = to_datetime(start_datetime)
+
+        if interval is None:
+            interval = to_duration("1 hour")
+        interval_sec = int(to_duration(interval).total_seconds())
+        if interval_sec <= 0:
+            raise ValueError(f"Interval must be positive: {interval}")
+
+        values_array = np.asarray(values)
+        value_mask = ~pd.isna(values_array)
+        if not value_mask.any():
+            return
+
+        epochs = (
+            start_datetime.int_timestamp
+            + np.arange(len(values_array), dtype=np.int64) * interval_sec
+        )[value_mask]
+        # Plain python values - as given by key_from_lists
+        key_values = values_array[value_mask].tolist()
+        db_timestamps = DatabaseTimestamp.from_epochs(epochs)
+
+        avail_records = await self.db_get_records(db_timestamps)
+
+        record_class = self.record_class()
+        timezone = start_datetime.timezone
+        new_records: list[DataRecord] = []
+        new_timestamps: list[DatabaseTimestamp] = []
+        updated_timestamps: list[DatabaseTimestamp] = []
+        for db_timestamp, epoch, value, avail_record in zip(
+            db_timestamps, epochs.tolist(), key_values, avail_records
+        ):
+            if avail_record is None:
+                # Create a new DataRecord if none exists.
+                # The date_time is already normalized, skip the per record validation of the
+                # constructor. The value is validated on assignment.
+                new_record = record_class.model_construct(
+                    _fields_set={"date_time"},
+                    date_time=DateTime.fromtimestamp(epoch, timezone),
+                    configured_data={},
+                )
+                setattr(new_record, key, value)
+                new_records.append(new_record)
+                new_timestamps.append(db_timestamp)
+            else:
+                # Update existing record's specified key
+                self._db_journal_record(avail_record, timestamp=db_timestamp)
+                setattr(avail_record, key, value)
+                updated_timestamps.append(db_timestamp)
+
+        await self.db_mark_dirty_timestamps(updated_timestamps)
+        await self.db_insert_records(new_records, timestamps=new_timestamps)
+
     # data sequence access usable also for async access
 
     async def insert_by_datetime(self, record: DataRecord) -> None:
@@ -1420,6 +1510,40 @@ class DataSequence(DataABC, DatabaseRecordProtocolMixin[DataRecord]):
 
         return array
 
+    async def key_from_array(
+        self,
+        key: str,
+        values: Union[np.ndarray, list[Any]],
+        start_datetime: Optional[DateTime] = None,
+        interval: Optional[Duration] = None,
+    ) -> None:
+        """Update the DataSequence from an array of values at fixed time intervals.
+
+        Counterpart of `key_to_array`. The values are upserted in one bulk operation instead of
+        record by record, which makes it the preferred way to store whole forecast arrays.
+
+        The datetimes of the values advance strictly in UTC, guaranteeing constant spacing across
+        daylight saving transitions. None/ NaN values are skipped, existing records at their
+        datetimes are left unchanged.
+
+        Args:
+            key (str): The field name in the DataRecord that corresponds to the values.
+            values (np.ndarray, list): The values at ``start_datetime`` and the following
+                intervals.
+            start_datetime (datetime, optional): The datetime of the first value. Defaults to the
+                energy management start datetime.
+            interval (duration, optional): The fixed time interval. Defaults to 1 hour.
+
+        Example:
+            .. code-block:: python
+
+                await sequence.key_from_array(
+                    "load_mean", values, start_datetime=start, interval=to_duration("15 minutes")
+                )
+        """
+        async with self._record_lock:
+            await self._key_from_array(key, values, start_datetime, interval)
+
     async def to_dataframe(
         self,
         start_datetime: Optional[DateTime] = None,
@@ -1525,6 +1649,7 @@ class DataSequence(DataABC, DatabaseRecordProtocolMixin[DataRecord]):
         end_timestamp = DatabaseTimestamp.from_datetime(end_datetime) if end_datetime else None
 
         async for record in self.db_iterate_records(start_timestamp, end_timestamp):
+            self._db_journal_record(record)
             del record[key]
             await self.db_mark_dirty_record(record)
 
@@ -1644,6 +1769,18 @@ class DataProvider(SingletonMixin, DataSequence):
             return
         super().__init__(*args, **kwargs)
 
+    @classmethod
+    def provider_dependencies(cls) -> list[str]:
+        """Return the ids of the providers whose data this provider uses on update.
+
+        A data container updates the providers concurrently. A provider is only updated after
+        the providers it depends on are updated. Dependencies on providers that are not part of
+        the container are ignored.
+
+        To be overridden by derived classes that use the data of other providers.
+        """
+        return []
+
     def db_namespace(self) -> str:
         """Namespace of database."""
         return self.provider_id()
@@ -1782,22 +1919,11 @@ class DataImportMixin(StartMixin):
                 f"{dict(zip(valid_keys, value_lengths))}"
             )
 
-        values_count = value_lengths[0]
-
         # Process each valid key
-        start_timestamp = DatabaseTimestamp.from_datetime(start_datetime)
         for key in valid_keys:
             try:
-                values = import_data[key]
-
                 # Update values, skipping any None/NaN
-                for value_index, value_db_datetime in enumerate(
-                    self.db_generate_timestamps(start_timestamp, values_count, interval)  # type: ignore[attr-defined]
-                ):
-                    value = values[value_index]
-                    value_datetime = DatabaseTimestamp.to_datetime(value_db_datetime)
-                    if value is not None and not pd.isna(value):
-                        await self._update_value(value_datetime, key, value)  # type: ignore
+                await self._key_from_array(key, import_data[key], start_datetime, interval)  # type: ignore[attr-defined]
 
             except (IndexError, TypeError) as e:
                 raise ValueError(f"Error processing values for key '{key}': {e}")
@@ -1855,36 +1981,20 @@ class DataImportMixin(StartMixin):
         if not valid_columns:
             return
 
-        # For DataFrame, length validation is implicit since all columns have same length
-        values_count = len(df)
-
-        # Generate value_datetime_mapping once if not using datetime index
-        if not has_datetime_index:
-            # Create values datetime list
-            start_timestamp = DatabaseTimestamp.from_datetime(start_datetime)
-            value_db_datetimes = list(
-                self.db_generate_timestamps(start_timestamp, values_count, interval)  # type: ignore[attr-defined]
-            )
-
         # Process each valid column
         for column in valid_columns:
             try:
-                values = df[column].tolist()
-
                 if has_datetime_index:
                     # Use the DataFrame's datetime index
+                    values = df[column].tolist()
                     for dt, value in zip(index_datetimes, values):
                         if value is not None and not pd.isna(value):
                             await self._update_value(dt, column, value)  # type: ignore
                 else:
-                    # Use the pre-generated datetime index
-                    for value_index in range(values_count):
-                        value = values[value_index]
-                        value_datetime = DatabaseTimestamp.to_datetime(
-                            value_db_datetimes[value_index]
-                        )
-                        if value is not None and not pd.isna(value):
-                            await self._update_value(value_datetime, column, value)  # type: ignore
+                    # Values at fixed intervals from start datetime, skipping any None/NaN
+                    await self._key_from_array(  # type: ignore[attr-defined]
+                        column, df[column].to_numpy(), start_datetime, interval
+                    )
 
             except Exception as e:
                 raise ValueError(f"Error processing column '{column}': {e}")
@@ -2198,6 +2308,28 @@ class DataImportProvider(DataImportMixin, DataProvider):
 # ==================== DataContainer ====================
 
 
+class DataProviderUpdate(PydanticBaseModel):
+    """Outcome of the latest data update of a provider by a data container."""
+
+    provider_id: str = Field(json_schema_extra={"description": "Provider id."})
+    start_datetime: DateTime = Field(
+        json_schema_extra={"description": "Start datetime of the update."}
+    )
+    duration_sec: float = Field(json_schema_extra={"description": "Duration of the update [s]."})
+    success: bool = Field(
+        json_schema_extra={"description": "True if the provider finished the update without error."}
+    )
+    timed_out: bool = Field(
+        default=False,
+        json_schema_extra={
+            "description": "True if the update was cancelled because it exceeded the timeout."
+        },
+    )
+    error: Optional[str] = Field(
+        default=None, json_schema_extra={"description": "Error message of a failed update."}
+    )
+
+
 class DataContainer(SingletonMixin, DataABC):
     """A container for managing multiple DataProvider instances.
 
@@ -2228,6 +2360,16 @@ class DataContainer(SingletonMixin, DataABC):
             object.__setattr__(self, "_container_lock_instance", lock)
             return lock
 
+    @property
+    def provider_updates(self) -> dict[str, DataProviderUpdate]:
+        """Outcome of the latest update of the providers by provider id."""
+        try:
+            return object.__getattribute__(self, "_provider_updates_instance")
+        except AttributeError:
+            updates: dict[str, DataProviderUpdate] = {}
+            object.__setattr__(self, "_provider_updates_instance", updates)
+            return updates
+
     @field_validator("providers", mode="after")
     def check_providers(cls, value: list[DataProvider]) -> list[DataProvider]:
         # Check each item in the list
@@ -2297,6 +2439,130 @@ class DataContainer(SingletonMixin, DataABC):
     def keys(self) -> KeysView[str]:
         return dict.fromkeys(self.record_keys).keys()
 
+    def provider_update_timeout(self, provider: DataProvider) -> Optional[float]:
+        """Return the maximum duration of a provider update [s].
+
+        To be overridden by derived classes that make the timeout configurable.
+
+        Args:
+            provider: The provider to be updated.
+
+        Returns:
+            Optional[float]: Timeout in seconds, None for no timeout.
+        """
+        return None
+
+    def providers_update_order(self) -> list[DataProvider]:
+        """Return the providers ordered such that each provider follows its dependencies.
+
+        The order of the providers list is kept as far as the dependencies allow.
+
+        Returns:
+            list[DataProvider]: The providers in update order.
+
+        Raises:
+            ValueError: If the provider dependencies are circular.
+        """
+        providers = {provider.provider_id(): provider for provider in self.providers}
+        ordered: list[DataProvider] = []
+        visiting: set[str] = set()
+        done: set[str] = set()
+
+        def visit(provider_id: str) -> None:
+            if provider_id in done:
+                return
+            if provider_id in visiting:
+                raise ValueError(f"Circular provider dependency at provider {provider_id}.")
+            visiting.add(provider_id)
+            for dependency_id in providers[provider_id].provider_dependencies():
+                if dependency_id in providers:
+                    visit(dependency_id)
+            visiting.remove(provider_id)
+            done.add(provider_id)
+            ordered.append(providers[provider_id])
+
+        for provider_id in providers:
+            visit(provider_id)
+        return ordered
+
+    async def _update_provider(
+        self,
+        provider: DataProvider,
+        dependencies: list["asyncio.Task[Optional[str]]"],
+        force_enable: Optional[bool],
+        force_update: Optional[bool],
+    ) -> Optional[str]:
+        """Update one provider after the providers it depends on are updated.
+
+        An update exceeding the provider timeout is cancelled. If the update is cancelled or
+        fails, the records changed by the update are rolled back - the provider keeps the data
+        it had before the update. Only the changed records are journaled for the rollback.
+
+        Returns:
+            Optional[str]: Error message if an enabled provider failed, otherwise None.
+        """
+        if dependencies:
+            await asyncio.wait(dependencies)
+
+        provider_id = provider.provider_id()
+        start_datetime = to_datetime()
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        timeout = self.provider_update_timeout(provider)
+        error = None
+        message = None
+        timed_out = False
+        async with provider._sequence_lock:
+            async with provider._record_lock:
+                await provider._db_journal_begin()
+        try:
+            await asyncio.wait_for(
+                provider.update_data(force_enable=force_enable, force_update=force_update),
+                timeout=timeout,
+            )
+        except asyncio.TimeoutError:
+            timed_out = True
+            logger.warning(
+                f"Provider {provider_id} update cancelled after {timeout} seconds - "
+                "keeping the last data."
+            )
+        except Exception as e:
+            message = str(e)
+            trace = "".join(traceback.TracebackException.from_exception(e).format())
+            error = (
+                f"Provider {provider_id} fails on update - "
+                f"enabled={provider.enabled()}, "
+                f"force_enable={force_enable}, "
+                f"force_update={force_update}"
+                f":\n{e}\n{trace}"
+            )
+        async with provider._sequence_lock:
+            async with provider._record_lock:
+                if timed_out or error is not None:
+                    provider._db_journal_rollback()
+                else:
+                    provider._db_journal_end()
+        duration_sec = loop.time() - start
+        self.provider_updates[provider_id] = DataProviderUpdate(
+            provider_id=provider_id,
+            start_datetime=start_datetime,
+            duration_sec=duration_sec,
+            success=error is None and not timed_out,
+            timed_out=timed_out,
+            error=message,
+        )
+        if error is None:
+            logger.debug(f"Provider {provider_id} update took {duration_sec:.3f} seconds.")
+            return None
+        if provider.enabled():
+            # The active provider failed — this is a real error worth propagating.
+            logger.error(error)
+            return error
+        # A non-active provider failed (e.g. missing config while force_enable=True).
+        # Log as warning and continue so the remaining providers still run.
+        logger.warning(error)
+        return None
+
     async def update_data(
         self,
         force_enable: Optional[bool] = False,
@@ -2304,38 +2570,38 @@ class DataContainer(SingletonMixin, DataABC):
     ) -> None:
         """Update data from all providers.
 
-        Acquires both the bulk and write locks for the duration, ensuring no
-        concurrent writes or other bulk operations can interleave with the
-        provider updates.
+        Providers are updated concurrently. A provider is updated after the providers it depends
+        on (see `DataProvider.provider_dependencies`). A provider update that exceeds the
+        provider timeout is cancelled. A cancelled or failed provider update is rolled back and
+        the provider keeps its last data. The outcome of each provider update is recorded in
+        `provider_updates`.
+
+        Acquires the container lock for the duration, ensuring no other bulk operation can
+        interleave with the provider updates.
 
         Args:
             force_enable: If True, forces the update even if a provider is disabled.
             force_update: If True, forces providers to update even if data is cached.
 
         Raises:
-            RuntimeError: If an enabled provider fails during update.
+            RuntimeError: If an enabled provider fails during update. Raised after all
+                other providers are updated.
         """
         async with self._container_lock:
-            for provider in self.providers:
-                try:
-                    await provider.update_data(force_enable=force_enable, force_update=force_update)
-                except Exception as e:
-                    trace = "".join(traceback.TracebackException.from_exception(e).format())
-                    error = (
-                        f"Provider {provider.provider_id()} fails on update - "
-                        f"enabled={provider.enabled()}, "
-                        f"force_enable={force_enable}, "
-                        f"force_update={force_update}"
-                        f":\n{e}\n{trace}"
-                    )
-                    if provider.enabled():
-                        # The active provider failed — this is a real error worth propagating.
-                        logger.error(error)
-                        raise RuntimeError(error)
-                    else:
-                        # A non-active provider failed (e.g. missing config while force_enable=True).
-                        # Log as warning and continue so the remaining providers still run.
-                        logger.warning(error)
+            tasks: dict[str, asyncio.Task[Optional[str]]] = {}
+            for provider in self.providers_update_order():
+                dependencies = [
+                    tasks[dependency_id]
+                    for dependency_id in provider.provider_dependencies()
+                    if dependency_id in tasks
+                ]
+                tasks[provider.provider_id()] = asyncio.create_task(
+                    self._update_provider(provider, dependencies, force_enable, force_update)
+                )
+            errors = await asyncio.gather(*tasks.values())
+        for error in errors:
+            if error is not None:
+                raise RuntimeError(error)
 
     async def key_to_series(
         self,
@@ -7,6 +7,8 @@ import gzip
 import pickle
 from abc import ABC, abstractmethod
 from enum import Enum, auto
+from itertools import chain
+from operator import itemgetter
 from pathlib import Path
 from threading import Lock
 from typing import (
@@ -21,11 +23,13 @@ from typing import (
     Optional,
     Protocol,
     Self,
+    Sequence,
     Type,
     TypeVar,
     Union,
 )
 
+import numpy as np
 from loguru import logger
 from numpydantic import NDArray, Shape
 
@@ -282,6 +286,8 @@ class DataRecordProtocol(Protocol):
 
     def model_dump(self) -> dict: ...
 
+    def model_copy(self, *, deep: bool = False) -> Self: ...
+
 
 T_Record = TypeVar("T_Record", bound=DataRecordProtocol)
 
@@ -304,6 +310,15 @@ class DatabaseTimestamp(str):
 
         return cls(dt.in_timezone("UTC").format("YYYYMMDDTHHmmss[Z]"))
 
+    @classmethod
+    def from_epochs(cls, epochs: Union[np.ndarray, Sequence[int]]) -> list["DatabaseTimestamp"]:
+        """Convert UTC epoch seconds to database timestamps in one vectorized step."""
+        iso_strings = np.datetime_as_string(np.asarray(epochs, dtype="datetime64[s]"), unit="s")
+        # "2024-10-27T12:34:56" -> "20241027T123456Z"
+        return [
+            cls(f"{s[0:4]}{s[5:7]}{s[8:10]}T{s[11:13]}{s[14:16]}{s[17:19]}Z") for s in iso_strings
+        ]
+
     def to_datetime(self) -> DateTime:
         from pendulum import parse
 
@@ -428,6 +443,20 @@ class DatabaseRecordProtocol(Protocol, Generic[T_Record]):
 
     def _db_reset_state(self) -> None: ...
 
+    async def _db_journal_begin(self) -> None: ...
+
+    def _db_journal_record(
+        self,
+        record: T_Record,
+        *,
+        timestamp: Optional[DatabaseTimestamp] = None,
+        copy: bool = True,
+    ) -> None: ...
+
+    def _db_journal_end(self) -> None: ...
+
+    def _db_journal_rollback(self) -> None: ...
+
     @property
     def db_enabled(self) -> bool: ...
 
@@ -442,6 +471,10 @@ class DatabaseRecordProtocol(Protocol, Generic[T_Record]):
 
     async def db_get_record(self, target_timestamp: DatabaseTimestamp) -> Optional[T_Record]: ...
 
+    async def db_get_records(
+        self, timestamps: Sequence[DatabaseTimestamp]
+    ) -> list[Optional[T_Record]]: ...
+
     async def db_insert_record(
         self,
         record: T_Record,
@@ -449,6 +482,14 @@ class DatabaseRecordProtocol(Protocol, Generic[T_Record]):
         mark_dirty: bool = True,
     ) -> None: ...
 
+    async def db_insert_records(
+        self,
+        records: Sequence[T_Record],
+        *,
+        timestamps: Optional[Sequence[DatabaseTimestamp]] = None,
+        mark_dirty: bool = True,
+    ) -> None: ...
+
     async def db_iterate_records(
         self,
         start_timestamp: Optional[DatabaseTimestampType] = None,
@@ -470,6 +511,8 @@ class DatabaseRecordProtocol(Protocol, Generic[T_Record]):
     # ---- dirty tracking ----
     async def db_mark_dirty_record(self, record: T_Record) -> None: ...
 
+    async def db_mark_dirty_timestamps(self, timestamps: Iterable[DatabaseTimestamp]) -> None: ...
+
     async def db_save_records(self) -> int: ...
 
     # ---- Remove old records from database to free space ----
@@ -608,6 +651,10 @@ class DatabaseRecordProtocolMixin(
             self._db_new_timestamps: set[DatabaseTimestamp] = set()
             # - deleted records since last save
             self._db_deleted_timestamps: set[DatabaseTimestamp] = set()
+            # Original state of changed records for a rollback, None if not journaling
+            self._db_journal: Optional[
+                dict[DatabaseTimestamp, tuple[Optional[T_Record], bool, bool, bool]]
+            ] = None
 
             self._db_version: int = 1
 
@@ -812,6 +859,83 @@ class DatabaseRecordProtocolMixin(
         except Exception:
             logger.debug("_db_reset_state called on uninitialized sequence")
 
+    # -----------------------------------------------------
+    # Rollback journal
+    # -----------------------------------------------------
+
+    async def _db_journal_begin(self) -> None:
+        """Start journaling the changes to the in memory records for a rollback.
+
+        The journal keeps the original state of a record on its first change only, so the cost
+        of journaling is proportional to the number of changed records.
+        """
+        await self._db_ensure_initialized()
+        self._db_journal = {}
+
+    def _db_journal_record(
+        self,
+        record: T_Record,
+        *,
+        timestamp: Optional[DatabaseTimestamp] = None,
+        copy: bool = True,
+    ) -> None:
+        """Journal the original state of a record that is about to be changed.
+
+        Has to be called before the record is changed in place, inserted or deleted. A no-op if
+        no journal is active or the record was already journaled.
+
+        Args:
+            record: The record in its original state. For an insertion, a record with the
+                timestamp of the inserted record; the record is not kept.
+            timestamp: The database timestamp of the record, if already known.
+            copy: Keep a copy of the record. The record itself can be kept if it is not changed
+                in place afterwards, e.g. because it is deleted.
+        """
+        journal = getattr(self, "_db_journal", None)
+        if journal is None:
+            return
+        if timestamp is None:
+            timestamp = DatabaseTimestamp.from_datetime(record.date_time)
+        if timestamp in journal:
+            return
+        original = self._db_record_index.get(timestamp)
+        if original is not None and copy:
+            original = original.model_copy()
+        journal[timestamp] = (
+            original,
+            timestamp in self._db_dirty_timestamps,
+            timestamp in self._db_new_timestamps,
+            timestamp in self._db_deleted_timestamps,
+        )
+
+    def _db_journal_end(self) -> None:
+        """Stop journaling and keep the changes."""
+        self._db_journal = None
+
+    def _db_journal_rollback(self) -> None:
+        """Stop journaling and restore the original state of all journaled records."""
+        journal = getattr(self, "_db_journal", None)
+        self._db_journal = None
+        if not journal:
+            return
+        record_index = self._db_record_index
+        for timestamp, (original, dirty, new, deleted) in journal.items():
+            if original is None:
+                record_index.pop(timestamp, None)
+            else:
+                record_index[timestamp] = original
+            for timestamps, member in (
+                (self._db_dirty_timestamps, dirty),
+                (self._db_new_timestamps, new),
+                (self._db_deleted_timestamps, deleted),
+            ):
+                if member:
+                    timestamps.add(timestamp)
+                else:
+                    timestamps.discard(timestamp)
+        self._db_sorted_timestamps[:] = sorted(record_index)
+        self.records[:] = [record_index[timestamp] for timestamp in self._db_sorted_timestamps]
+
     def _db_clone_empty(self: T_DatabaseRecordProtocol) -> T_DatabaseRecordProtocol:
         """Create an empty internal clone for database operations.
 
@@ -1392,6 +1516,34 @@ class DatabaseRecordProtocolMixin(
 
         return record
 
+    async def db_get_records(
+        self, timestamps: Sequence[DatabaseTimestamp]
+    ) -> list[Optional[T_Record]]:
+        """Get the records at the specified timestamps (exact match only).
+
+        Bulk counterpart of `db_get_record` without time window. The range spanned by the
+        timestamps is loaded once instead of once per timestamp.
+
+        Args:
+            timestamps: The timestamps to search for.
+
+        Returns:
+            The record at each timestamp, or None if there is no record at this timestamp.
+        """
+        await self._db_ensure_initialized()
+
+        if not timestamps:
+            return []
+
+        first_timestamp = min(timestamps)
+        await self._db_ensure_loaded(
+            first_timestamp,
+            self._db_timestamp_after(max(timestamps)),
+            center_timestamp=first_timestamp,
+        )
+        record_index = self._db_record_index
+        return [record_index.get(timestamp) for timestamp in timestamps]
+
     async def db_insert_record(
         self,
         record: T_Record,
@@ -1414,6 +1566,8 @@ class DatabaseRecordProtocolMixin(
             # No duplicates allowed
             raise ValueError(f"Duplicate timestamp {record.date_time} -> {db_record_date_time}")
 
+        self._db_journal_record(record, timestamp=db_record_date_time)
+
         if db_record_date_time in self._db_deleted_timestamps:
             # Clear tombstone - if we are re-inserting
             self._db_deleted_timestamps.discard(db_record_date_time)
@@ -1428,6 +1582,81 @@ class DatabaseRecordProtocolMixin(
             self._db_dirty_timestamps.add(db_record_date_time)
             self._db_new_timestamps.add(db_record_date_time)
 
+    async def db_insert_records(
+        self,
+        records: Sequence[T_Record],
+        *,
+        timestamps: Optional[Sequence[DatabaseTimestamp]] = None,
+        mark_dirty: bool = True,
+    ) -> None:
+        """Insert new records in one sorted merge.
+
+        Bulk counterpart of `db_insert_record`. Instead of a sorted insert per record, the new
+        records are appended if they are all later than the records in memory, or merged with
+        the records in memory by one sort otherwise.
+
+        Args:
+            records: The records to insert.
+            timestamps: The database timestamps of the records, if already known. Derived from
+                ``record.date_time`` otherwise.
+            mark_dirty: Mark the records as new and dirty for the next save.
+
+        Raises:
+            ValueError: If a record timestamp is duplicated or a record already exists at the
+                timestamp.
+        """
+        # Ensure db in memory data and metadata is initialized
+        await self._db_ensure_initialized()
+
+        if timestamps is None:
+            timestamps = [DatabaseTimestamp.from_datetime(record.date_time) for record in records]
+        elif len(timestamps) != len(records):
+            raise ValueError(f"Got {len(timestamps)} timestamps for {len(records)} records")
+
+        if not records:
+            return
+
+        new_index = dict(zip(timestamps, records))
+        if len(new_index) != len(records):
+            raise ValueError("Duplicate timestamps in records to insert")
+
+        await self._db_ensure_loaded(
+            start_timestamp=min(new_index),
+            end_timestamp=self._db_timestamp_after(max(new_index)),
+        )
+
+        # Memory only
+        duplicates = new_index.keys() & self._db_record_index.keys()
+        if duplicates:
+            # No duplicates allowed
+            raise ValueError(f"Duplicate timestamps {sorted(duplicates)}")
+
+        if getattr(self, "_db_journal", None) is not None:
+            for timestamp, record in new_index.items():
+                self._db_journal_record(record, timestamp=timestamp)
+
+        # Clear tombstones - if we are re-inserting
+        self._db_deleted_timestamps.difference_update(new_index)
+
+        # insert
+        new_items = sorted(new_index.items())
+        if not self._db_sorted_timestamps or new_items[0][0] > self._db_sorted_timestamps[-1]:
+            self._db_sorted_timestamps.extend(timestamp for timestamp, _ in new_items)
+            self.records.extend(record for _, record in new_items)
+        else:
+            # Both sides are sorted runs - the sort merges them in linear time
+            merged_items = sorted(
+                chain(zip(self._db_sorted_timestamps, self.records), new_items),
+                key=itemgetter(0),
+            )
+            self._db_sorted_timestamps[:] = [timestamp for timestamp, _ in merged_items]
+            self.records[:] = [record for _, record in merged_items]
+        self._db_record_index.update(new_index)
+
+        if mark_dirty:
+            self._db_dirty_timestamps.update(new_index)
+            self._db_new_timestamps.update(new_index)
+
     # -----------------------------------------------------
     # Load (range)
     # -----------------------------------------------------
@@ -1561,6 +1790,9 @@ class DatabaseRecordProtocolMixin(
             to_delete.append(dt)
 
         for dt in to_delete:
+            record = self._db_record_index.get(dt)
+            if record is not None:
+                self._db_journal_record(record, timestamp=dt, copy=False)
             record = self._db_record_index.pop(dt, None)
             if record is not None:
                 idx = bisect.bisect_left(self._db_sorted_timestamps, dt)
@@ -1635,6 +1867,17 @@ class DatabaseRecordProtocolMixin(
         record_date_time_timestamp = DatabaseTimestamp.from_datetime(record.date_time)
         self._db_dirty_timestamps.add(record_date_time_timestamp)
 
+    async def db_mark_dirty_timestamps(self, timestamps: Iterable[DatabaseTimestamp]) -> None:
+        """Mark the records at the timestamps dirty for the next save.
+
+        Bulk counterpart of `db_mark_dirty_record` for callers that already know the database
+        timestamps of the changed records.
+        """
+        # Ensure db in memory data and metadata is initialized
+        await self._db_ensure_initialized()
+
+        self._db_dirty_timestamps.update(timestamps)
+
     # -----------------------------------------------------
     # Bulk save (flush dirty only)
     # -----------------------------------------------------
@@ -1,11 +1,12 @@
+import hashlib
 import traceback
 from asyncio import Lock, get_running_loop
-from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 from enum import StrEnum
-from typing import ClassVar, Optional, cast
+from typing import AsyncIterator, ClassVar, Optional
 
 from loguru import logger
-from pydantic import computed_field
+from pydantic import Field, computed_field
 
 from akkudoktoreos.core.cache import CacheEnergyManagementStore
 from akkudoktoreos.core.coreabc import (
@@ -17,17 +18,21 @@ from akkudoktoreos.core.coreabc import (
 from akkudoktoreos.core.emplan import EnergyManagementPlan
 from akkudoktoreos.core.emsettings import EnergyManagementMode
 from akkudoktoreos.core.pydantic import PydanticBaseModel
-from akkudoktoreos.optimization.genetic.genetic import GeneticOptimization
 from akkudoktoreos.optimization.genetic.geneticparams import (
     GeneticOptimizationParameters,
 )
 from akkudoktoreos.optimization.genetic.geneticsolution import GeneticSolution
 from akkudoktoreos.optimization.optimization import OptimizationSolution
+from akkudoktoreos.optimization.optimizationstatus import (
+    OptimizationProgress,
+    get_optimization_status,
+)
+from akkudoktoreos.optimization.optimizationworker import (
+    OPTIMIZATION_CLASSES,
+    OptimizationWorker,
+)
 from akkudoktoreos.utils.datetimeutil import DateTime, to_datetime
 
-# The executor to execute the CPU heavy energy management run
-executor = ThreadPoolExecutor(max_workers=1)
-
 
 class EnergyManagementStage(StrEnum):
     """Enumeration of the main stages in the energy management lifecycle."""
@@ -35,10 +40,74 @@ class EnergyManagementStage(StrEnum):
     IDLE = "IDLE"
     DATA_ACQUISITION = "DATA_AQUISITION"
     FORECAST_RETRIEVAL = "FORECAST_RETRIEVAL"
+    PREPARATION = "PREPARATION"
     OPTIMIZATION = "OPTIMIZATION"
+    PUBLICATION = "PUBLICATION"
     CONTROL_DISPATCH = "CONTROL_DISPATCH"
 
 
+class EnergyManagementStageRun(PydanticBaseModel):
+    """Record of a stage of an energy management run."""
+
+    stage: EnergyManagementStage = Field(
+        json_schema_extra={"description": "The energy management stage."}
+    )
+    start_datetime: DateTime = Field(
+        json_schema_extra={"description": "Datetime the stage started."}
+    )
+    end_datetime: Optional[DateTime] = Field(
+        default=None,
+        json_schema_extra={"description": "Datetime the stage ended. None if still running."},
+    )
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def duration_sec(self) -> Optional[float]:
+        """Duration of the stage [seconds]. None if still running."""
+        if self.end_datetime is None:
+            return None
+        return (self.end_datetime - self.start_datetime).total_seconds()
+
+
+class EnergyManagementRun(PydanticBaseModel):
+    """Record of an energy management run."""
+
+    start_datetime: DateTime = Field(json_schema_extra={"description": "Datetime the run started."})
+    end_datetime: Optional[DateTime] = Field(
+        default=None,
+        json_schema_extra={"description": "Datetime the run ended. None if still running."},
+    )
+    mode: EnergyManagementMode = Field(
+        json_schema_extra={"description": "Energy management mode of the run."}
+    )
+    algorithm: Optional[str] = Field(
+        default=None,
+        json_schema_extra={"description": "Optimization algorithm. None if not optimizing."},
+    )
+    status: str = Field(
+        default="RUNNING",
+        json_schema_extra={"description": "Status of the run [RUNNING | DONE | FAILED]."},
+    )
+    message: Optional[str] = Field(
+        default=None,
+        json_schema_extra={
+            "description": "Why the run failed or skipped the optimization. None if not."
+        },
+    )
+    stages: list[EnergyManagementStageRun] = Field(
+        default_factory=list,
+        json_schema_extra={"description": "The stages of the run in execution order."},
+    )
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def duration_sec(self) -> Optional[float]:
+        """Duration of the run [seconds]. None if still running."""
+        if self.end_datetime is None:
+            return None
+        return (self.end_datetime - self.start_datetime).total_seconds()
+
+
 async def ems_manage_energy() -> None:
     """Repeating task for managing energy.
 
@@ -75,6 +144,21 @@ class EnergyManagement(
     # energy management lock (for energy management run)
     _run_lock: ClassVar[Lock] = Lock()
 
+    # Input fingerprint of the latest energy management run with optimization
+    _optimization_fingerprint: ClassVar[Optional[str]] = None
+
+    # Reason the optimization of the latest energy management run was skipped, None if not skipped
+    _optimization_skip_reason: ClassVar[Optional[str]] = None
+
+    # Records of the latest energy management runs, oldest first
+    _runs: ClassVar[list[EnergyManagementRun]] = []
+
+    # Maximum number of energy management run records kept
+    _runs_max: ClassVar[int] = 100
+
+    # Worker process for the CPU heavy optimization, started on first use
+    _optimization_worker: ClassVar[Optional[OptimizationWorker]] = None
+
     @computed_field  # type: ignore[prop-decorator]
     @property
     def start_datetime(self) -> DateTime:
@@ -146,6 +230,152 @@ class EnergyManagement(
         """
         return cls._genetic_solution
 
+    @classmethod
+    def runs(cls) -> list[EnergyManagementRun]:
+        """Get the records of the latest energy management runs.
+
+        Returns:
+            list[EnergyManagementRun]: The run records, oldest first.
+        """
+        return list(cls._runs)
+
+    @classmethod
+    def optimization_skip_reason(cls) -> Optional[str]:
+        """Get the reason the optimization of the latest energy management run was skipped.
+
+        Returns:
+            Optional[str]: The reason or None if the optimization was not skipped.
+        """
+        return cls._optimization_skip_reason
+
+    @classmethod
+    def optimization_progress(cls) -> OptimizationProgress:
+        """Get the progress of the running or latest optimization.
+
+        Returns:
+            OptimizationProgress: Progress of the optimization.
+        """
+        return get_optimization_status().progress()
+
+    @classmethod
+    def cancel_optimization(cls) -> bool:
+        """Request cancellation of the running optimization.
+
+        The genetic algorithm stops at the next generation boundary and the best solution found
+        so far is used.
+
+        Returns:
+            bool: True if cancellation was requested, False if no optimization is running.
+        """
+        status = get_optimization_status()
+        if not status.progress().running:
+            return False
+        logger.info("Cancellation of the running optimization requested.")
+        status.cancel()
+        return True
+
+    @classmethod
+    def shutdown(cls) -> None:
+        """Stop the optimization worker process."""
+        if cls._optimization_worker is not None:
+            cls._optimization_worker.close()
+            cls._optimization_worker = None
+
+    def optimization_fingerprint(
+        self,
+        algorithm: str,
+        parameters: GeneticOptimizationParameters,
+        ngen: Optional[int],
+        fixed_seed: Optional[int],
+    ) -> str:
+        """Fingerprint of the input of an optimization run.
+
+        Covers the start datetime, the algorithm and its settings and the optimization
+        parameters. State of charge and forecast values are quantized by the fingerprint
+        tolerances of the energy management configuration.
+
+        Args:
+            algorithm (str): The optimization algorithm.
+            parameters (GeneticOptimizationParameters): Optimization parameters.
+            ngen (int, optional): Number of generations.
+            fixed_seed (int, optional): Random seed. None = random.
+
+        Returns:
+            str: Hex digest of the fingerprint.
+        """
+        parameters_fingerprint = parameters.fingerprint(
+            soc_tolerance=self.config.ems.fingerprint_soc_tolerance,
+            energy_tolerance_wh=self.config.ems.fingerprint_energy_tolerance_wh,
+        )
+        optimization_settings = self.config.optimization.model_dump_json(
+            exclude_computed_fields=True
+        )
+        fingerprint_input = "|".join(
+            (
+                str(EnergyManagement._start_datetime),
+                algorithm,
+                str(ngen),
+                str(fixed_seed),
+                optimization_settings,
+                parameters_fingerprint,
+            )
+        )
+        return hashlib.sha256(fingerprint_input.encode("utf-8")).hexdigest()
+
+    async def optimize(
+        self,
+        algorithm: str,
+        parameters: GeneticOptimizationParameters,
+        ngen: Optional[int],
+        fixed_seed: Optional[int],
+    ) -> GeneticSolution:
+        """Run the CPU heavy optimization without blocking the event loop.
+
+        The optimization runs in the optimization worker process, or in a thread of the default
+        executor if the worker process is disabled by configuration.
+
+        Args:
+            algorithm (str): The optimization algorithm.
+            parameters (GeneticOptimizationParameters): Optimization parameters.
+            ngen (int, optional): Number of generations.
+            fixed_seed (int, optional): Random seed. None = random.
+
+        Returns:
+            GeneticSolution: The solution of the optimization.
+        """
+        if EnergyManagement._start_datetime is None:  # Make mypy happy - already set by run
+            raise RuntimeError("Start datetime not set.")
+        start_datetime = EnergyManagement._start_datetime
+        verbose = bool(self.config.server.verbose)
+
+        status = get_optimization_status()
+        status.begin(algorithm)
+        try:
+            if self.config.optimization.worker_process:
+                if EnergyManagement._optimization_worker is None:
+                    EnergyManagement._optimization_worker = OptimizationWorker()
+                return await EnergyManagement._optimization_worker.optimize(
+                    algorithm,
+                    parameters,
+                    start_datetime,
+                    ngen=ngen,
+                    fixed_seed=fixed_seed,
+                    verbose=verbose,
+                )
+
+            optimization = OPTIMIZATION_CLASSES[algorithm](verbose=verbose, fixed_seed=fixed_seed)
+            loop = get_running_loop()
+            return await loop.run_in_executor(
+                None,
+                lambda: optimization.optimize_ems(
+                    start_hour=start_datetime.hour,
+                    parameters=parameters,
+                    ngen=ngen,
+                ),
+            )
+        finally:
+            status.end()
+
     async def run(
         self,
         start_datetime: Optional[DateTime] = None,
@@ -163,6 +393,11 @@ class EnergyManagement(
         start datetime, updating predictions, and optionally starting
         optimization depending on the selected mode or configuration.
 
+        The run is a pipeline of stages - data acquisition, forecast retrieval, preparation,
+        optimization, publication and control dispatch. Each stage runs at most once and hands
+        its outputs to the next stage. The stages run are recorded with their timing in the
+        run record (see `runs()`).
+
         Args:
             start_datetime (DateTime): The starting timestamp of the energy management run.
             mode (EnergyManagementMode): The management mode to use. Must be one of:
@@ -174,6 +409,8 @@ class EnergyManagement(
             algorithm (str, optional):
                 The algorithm to use. Must be one of:
                 - "GENETIC": Optimization uses the `GENETIC` optimization algorithm.
+                - "DP": Optimization uses the `DP` (dynamic programming) algorithm.
+                - "MILP": Optimization uses the `MILP` (mixed-integer linear programming) algorithm.
 
                 Defaults to the algorithm defined in the current configuration.
             genetic_parameters (GeneticOptimizationParameters, optional): The
@@ -203,11 +440,57 @@ class EnergyManagement(
                 logger.info("Energy management run disabled.")
                 return
 
+            if algorithm is None:
+                algorithm = self.config.optimization.algorithm
+
             logger.info("Starting energy management run.")
+            record = EnergyManagementRun(
+                start_datetime=to_datetime(),
+                mode=mode,
+                algorithm=algorithm if mode == EnergyManagementMode.OPTIMIZATION else None,
+            )
+            EnergyManagement._runs.append(record)
+            del EnergyManagement._runs[: -EnergyManagement._runs_max]
+
+            try:
+                record.status = await self._run_pipeline(
+                    record,
+                    start_datetime=start_datetime,
+                    mode=mode,
+                    algorithm=algorithm,
+                    genetic_parameters=genetic_parameters,
+                    genetic_individuals=genetic_individuals,
+                    genetic_seed=genetic_seed,
+                    force_enable=bool(force_enable),
+                    force_update=bool(force_update),
+                )
+            except BaseException:
+                record.status = "FAILED"
+                raise
+            finally:
+                record.end_datetime = to_datetime()
+                # energy management run finished
+                EnergyManagement._stage = EnergyManagementStage.IDLE
 
-            # --- Data Aquisition ---
-            EnergyManagement._stage = EnergyManagementStage.DATA_ACQUISITION
+    async def _run_pipeline(
+        self,
+        record: EnergyManagementRun,
+        start_datetime: Optional[DateTime],
+        mode: EnergyManagementMode,
+        algorithm: str,
+        genetic_parameters: Optional[GeneticOptimizationParameters],
+        genetic_individuals: Optional[int],
+        genetic_seed: Optional[int],
+        force_enable: bool,
+        force_update: bool,
+    ) -> str:
+        """Run the stages of an energy management run.
 
+        Returns:
+            str: Status of the run.
+        """
+        # --- Data Aquisition ---
+        async with self._run_stage(record, EnergyManagementStage.DATA_ACQUISITION):
             # Remember/ set the start datetime of this energy management run.
             # None leads to current time as start datetime
             self.set_start_datetime(start_datetime)
@@ -215,183 +498,140 @@ class EnergyManagement(
             # Throw away any memory cached results of the last energy management run.
             CacheEnergyManagementStore().clear()
 
-            # --- Adapter update     ---
-            try:
-                await self.adapter.update_data(force_enable)
-            except Exception as e:
-                trace = "".join(traceback.TracebackException.from_exception(e).format())
-                error_msg = (
-                    f"Adapter update failed - phase {EnergyManagement._stage}:\n{e}\n{trace}"
-                )
-                logger.error(error_msg)
+            await self._update_adapters(force_enable)
 
-            # --- Prediction ---
-            EnergyManagement._stage = EnergyManagementStage.FORECAST_RETRIEVAL
-
-            # Update the predictions
+        # --- Prediction ---
+        async with self._run_stage(record, EnergyManagementStage.FORECAST_RETRIEVAL):
             logger.info("Starting energy management prediction update.")
             await self.prediction.update_data(force_enable=force_enable, force_update=force_update)
 
-            if mode == EnergyManagementMode.PREDICTION:
-                logger.info("Energy management run done (predictions updated)")
-                EnergyManagement._stage = EnergyManagementStage.IDLE
-                return
-
-            # --- Optimization ---
-            EnergyManagement._stage = EnergyManagementStage.OPTIMIZATION
-            optimization_start = to_datetime()
-            logger.info("Starting energy management optimization.")
-
-            if algorithm is None:
-                algorithm = self.config.optimization.algorithm
-
-            if algorithm == "GENETIC":
-                # Prepare optimization parameters
-                # This also creates default configurations for missing values and updates the predictions
-                logger.info("Starting optimzation parameter preparation.")
-                if genetic_parameters is None:
-                    genetic_parameters = await GeneticOptimizationParameters.prepare()
-                    if genetic_parameters is None:
-                        logger.error(
-                            "Energy management run canceled. Could not prepare optimisation parameters."
-                        )
-                        EnergyManagement._stage = EnergyManagementStage.IDLE
-                        return
-
-                # Take values from config if not given
-                if genetic_individuals is None:
-                    genetic_individuals = self.config.optimization.genetic.individuals
-                if genetic_seed is None:
-                    genetic_seed = self.config.optimization.genetic.seed
-
-                if EnergyManagement._start_datetime is None:  # Make mypy happy - already set by us
-                    raise RuntimeError("Start datetime not set.")
-
-                # --- Optimization (CPU-bound → MUST offload) ---
-                try:
-                    optimization = GeneticOptimization(
-                        verbose=bool(self.config.server.verbose),
-                        fixed_seed=genetic_seed,
-                    )
-
-                    loop = get_running_loop()
-                    start_hour = EnergyManagement._start_datetime.hour
-                    solution = await loop.run_in_executor(
-                        None,
-                        lambda: optimization.optimize_ems(
-                            start_hour=start_hour,
-                            parameters=cast(
-                                GeneticOptimizationParameters, genetic_parameters
-                            ),  # cast for mypy
-                            ngen=genetic_individuals,
-                        ),
-                    )
-
-                except Exception:
-                    logger.exception("Energy management optimization failed.")
-                    EnergyManagement._stage = EnergyManagementStage.IDLE
-                    return
-
-            else:
-                logger.error(f"Unknown optimization algorithm: '{algorithm}'. Skipping.")
-                EnergyManagement._stage = EnergyManagementStage.IDLE
-                return
-
-            optimization_duration = to_datetime() - optimization_start
-            logger.info(
-                "Energy management optimization ({}) completed in {:.1f} seconds.",
-                algorithm,
-                optimization_duration.total_seconds(),
-            )
-
-            logger.debug(
-                "Energy management optimization solution:\n{}",
-                EnergyManagement._optimization_solution,
-            )
-            logger.debug("Energy management plan:\n{}", EnergyManagement._plan)
-
-            # --- Control dispatch by adapters ---
-            EnergyManagement._stage = EnergyManagementStage.CONTROL_DISPATCH
-
-            # Make genetic solution public
-            EnergyManagement._genetic_solution = solution
-
-            # Make optimization solution public
-            EnergyManagement._optimization_solution = await solution.optimization_solution()
+        if mode == EnergyManagementMode.PREDICTION:
+            logger.info("Energy management run done (predictions updated)")
+            return "DONE"
 
-            # Make plan public
-            EnergyManagement._plan = solution.energy_management_plan()
-
-            logger.debug(
-                "Energy management genetic solution:\n{}", EnergyManagement._genetic_solution
-            )
+        if algorithm not in OPTIMIZATION_CLASSES:
+            record.message = f"Unknown optimization algorithm: '{algorithm}'."
+            logger.error("{} Skipping.", record.message)
+            return "FAILED"
 
+        # --- Preparation ---
+        async with self._run_stage(record, EnergyManagementStage.PREPARATION):
+            # The DP and the MILP share parameters and solution with the GENETIC algorithm
+            # Prepare optimization parameters
+            # This also creates default configurations for missing values and updates the predictions
             if genetic_parameters is None:
+                logger.info("Starting optimzation parameter preparation.")
                 genetic_parameters = await GeneticOptimizationParameters.prepare()
-
-            if not genetic_parameters:
-                logger.error("Energy management run canceled. Could not prepare parameters.")
-                EnergyManagement._stage = EnergyManagementStage.IDLE
-                return
-
-            EnergyManagement._stage = EnergyManagementStage.OPTIMIZATION
-
+            # Take values from config if not given
             if genetic_individuals is None:
                 genetic_individuals = self.config.optimization.genetic.individuals
             if genetic_seed is None:
                 genetic_seed = self.config.optimization.genetic.seed
 
-            if EnergyManagement._start_datetime is None:
-                raise RuntimeError("Start datetime not set.")
-
-            # --- Optimization (CPU-bound → MUST offload) ---
-            try:
-                optimization = GeneticOptimization(
-                    verbose=bool(self.config.server.verbose),
+            fingerprint = None
+            if genetic_parameters is not None:
+                fingerprint = self.optimization_fingerprint(
+                    algorithm,
+                    genetic_parameters,
+                    ngen=genetic_individuals,
                     fixed_seed=genetic_seed,
                 )
 
-                loop = get_running_loop()
-                start_hour = EnergyManagement._start_datetime.hour
-                solution = await loop.run_in_executor(
-                    None,
-                    lambda: optimization.optimize_ems(
-                        start_hour=start_hour,
-                        parameters=genetic_parameters,
+        if genetic_parameters is None or fingerprint is None:
+            record.message = "Could not prepare optimisation parameters."
+            logger.error("Energy management run canceled. {}", record.message)
+            return "FAILED"
+
+        # Skip the optimization if the input is unchanged since the last optimization
+        EnergyManagement._optimization_skip_reason = None
+        if (
+            self.config.ems.skip_unchanged_optimization
+            and not force_update
+            and EnergyManagement._genetic_solution is not None
+            and fingerprint == EnergyManagement._optimization_fingerprint
+        ):
+            EnergyManagement._optimization_skip_reason = (
+                "Optimization input unchanged since the last optimization "
+                f"(fingerprint {fingerprint[:12]})."
+            )
+            record.message = EnergyManagement._optimization_skip_reason
+            logger.info(
+                "Energy management optimization skipped: {}",
+                EnergyManagement._optimization_skip_reason,
+            )
+        else:
+            # --- Optimization (CPU-bound → MUST offload) ---
+            logger.info("Starting energy management optimization.")
+            try:
+                async with self._run_stage(
+                    record, EnergyManagementStage.OPTIMIZATION
+                ) as optimization_stage:
+                    solution = await self.optimize(
+                        algorithm,
+                        genetic_parameters,
                         ngen=genetic_individuals,
-                    ),
-                )
-
-            except Exception:
+                        fixed_seed=genetic_seed,
+                    )
+            except Exception as e:
                 logger.exception("Energy management optimization failed.")
-                EnergyManagement._stage = EnergyManagementStage.IDLE
-                return
+                record.message = f"Optimization failed: {e}"
+                return "FAILED"
+            logger.info(
+                "Energy management optimization ({}) completed in {:.1f} seconds.",
+                algorithm,
+                optimization_stage.duration_sec,
+            )
 
-            EnergyManagement._genetic_solution = solution
-            EnergyManagement._optimization_solution = await solution.optimization_solution()
-            EnergyManagement._plan = solution.energy_management_plan()
+            # --- Publication ---
+            async with self._run_stage(record, EnergyManagementStage.PUBLICATION):
+                # Make genetic solution public
+                EnergyManagement._genetic_solution = solution
+                # Make optimization solution public
+                EnergyManagement._optimization_solution = await solution.optimization_solution()
+                # Make plan public
+                EnergyManagement._plan = solution.energy_management_plan()
+                # Remember the input of this optimization - unless the optimization stopped
+                # early with the best solution so far, which a later run shall improve on
+                if solution.stop_reason in ("cancelled", "time_limit"):
+                    EnergyManagement._optimization_fingerprint = None
+                else:
+                    EnergyManagement._optimization_fingerprint = fingerprint
 
             logger.debug("Genetic solution:\n{}", EnergyManagement._genetic_solution)
             logger.debug("Optimization solution:\n{}", EnergyManagement._optimization_solution)
             logger.debug("Plan:\n{}", EnergyManagement._plan)
-            logger.info("Energy management run done (optimization updated)")
-
-            # --- Dispatch control by adapters ---
-            EnergyManagement._stage = EnergyManagementStage.CONTROL_DISPATCH
 
-            # Dispatch (sync → optionally offload)
-            try:
-                await self.adapter.update_data(force_enable)
-            except Exception as e:
-                trace = "".join(traceback.TracebackException.from_exception(e).format())
-                error_msg = (
-                    f"Adapter update failed - phase {EnergyManagement._stage}:\n{e}\n{trace}"
-                )
-                logger.error(error_msg)
+        # --- Dispatch control by adapters ---
+        async with self._run_stage(record, EnergyManagementStage.CONTROL_DISPATCH):
+            await self._update_adapters(force_enable)
 
-            # --- Idle ---
-            # Remember energy run datetime.
-            EnergyManagement._last_run_datetime = to_datetime()
+        # Remember energy run datetime.
+        EnergyManagement._last_run_datetime = to_datetime()
 
-            # energy management run finished
-            EnergyManagement._stage = EnergyManagementStage.IDLE
+        if EnergyManagement._optimization_skip_reason is None:
+            logger.info("Energy management run done (optimization updated)")
+        else:
+            logger.info("Energy management run done (optimization skipped)")
+        return "DONE"
+
+    @asynccontextmanager
+    async def _run_stage(
+        self, record: EnergyManagementRun, stage: EnergyManagementStage
+    ) -> AsyncIterator[EnergyManagementStageRun]:
+        """Run a stage of the energy management run and record its timing."""
+        EnergyManagement._stage = stage
+        stage_record = EnergyManagementStageRun(stage=stage, start_datetime=to_datetime())
+        record.stages.append(stage_record)
+        try:
+            yield stage_record
+        finally:
+            stage_record.end_datetime = to_datetime()
+
+    async def _update_adapters(self, force_enable: bool) -> None:
+        """Update the adapters - errors are logged, not raised."""
+        try:
+            await self.adapter.update_data(force_enable)
+        except Exception as e:
+            trace = "".join(traceback.TracebackException.from_exception(e).format())
+            error_msg = f"Adapter update failed - phase {EnergyManagement._stage}:\n{e}\n{trace}"
+            logger.error(error_msg)
@@ -55,3 +55,41 @@ class EnergyManagementCommonSettings(SettingsBaseModel):
             "examples": ["OPTIMIZATION", "PREDICTION"],
         },
     )
+
+    skip_unchanged_optimization: bool = Field(
+        default=True,
+        json_schema_extra={
+            "description": (
+                "Skip the optimization of an energy management run if the optimization input is "
+                "unchanged since the last optimization. The solution and plan of the last "
+                "optimization are kept. An optimization that was cancelled or stopped at its time "
+                "limit is not skipped. Defaults to True."
+            ),
+            "examples": [True, False],
+        },
+    )
+
+    fingerprint_soc_tolerance: float = Field(
+        default=1.0,
+        ge=0.0,
+        json_schema_extra={
+            "description": (
+                "State of charge tolerance of the optimization input fingerprint [%]. The state "
+                "of charge is quantized by this step before comparing. 0 = exact. Defaults to 1.0."
+            ),
+            "examples": [1.0, 0.0],
+        },
+    )
+
+    fingerprint_energy_tolerance_wh: float = Field(
+        default=10.0,
+        ge=0.0,
+        json_schema_extra={
+            "description": (
+                "PV and load forecast tolerance of the optimization input fingerprint [Wh]. The "
+                "forecast values are quantized by this step before comparing. 0 = exact. "
+                "Defaults to 10.0."
+            ),
+            "examples": [10.0, 0.0],
+        },
+    )
@@ -12,9 +12,14 @@ from akkudoktoreos.optimization.genetic.geneticdevices import (
 class Battery:
     """Represents a battery device with methods to simulate energy charging and discharging."""
 
-    def __init__(self, parameters: BaseBatteryParameters, prediction_hours: int):
+    def __init__(
+        self, parameters: BaseBatteryParameters, prediction_hours: int, step_hours: float = 1.0
+    ):
         self.parameters = parameters
         self.prediction_hours = prediction_hours
+        # Duration of a simulation step [h] - charge and discharge arrays are per step
+        self.step_hours = step_hours
+        self.prediction_steps = round(prediction_hours / step_hours)
         self._setup()
 
     def _setup(self) -> None:
@@ -45,8 +50,12 @@ class Battery:
             self.max_charge_power_w = self.parameters.max_charge_power_w
         else:
             self.max_charge_power_w = self.capacity_wh  # TODO this should not be equal capacity_wh
-        self.discharge_array = np.full(self.prediction_hours, 0)
-        self.charge_array = np.full(self.prediction_hours, 0)
+        # Maximum charge (and discharge) energy per simulation step
+        self.max_charge_wh = self.max_charge_power_w * self.step_hours
+        # Per-step charge and discharge factors - preallocated, reset in place
+        self._hours_state = np.zeros((2, self.prediction_steps))
+        self.charge_array = self._hours_state[0]
+        self.discharge_array = self._hours_state[1]
         self.soc_wh = (self.initial_soc_percentage / 100) * self.capacity_wh
         self.min_soc_wh = (self.min_soc_percentage / 100) * self.capacity_wh
         self.max_soc_wh = (self.max_soc_percentage / 100) * self.capacity_wh
@@ -77,8 +86,8 @@ class Battery:
             "initial_soc_percentage": self.initial_soc_percentage,
             "soc_wh": self.soc_wh,
             "hours": self.prediction_hours,
-            "discharge_array": self.discharge_array,
-            "charge_array": self.charge_array,
+            "discharge_array": self.discharge_array.copy(),
+            "charge_array": self.charge_array.copy(),
             "charging_efficiency": self.charging_efficiency,
             "discharging_efficiency": self.discharging_efficiency,
             "max_charge_power_w": self.max_charge_power_w,
@@ -86,26 +95,28 @@ class Battery:
 
     def reset(self) -> None:
         """Resets the battery state to its initial values."""
-        self.soc_wh = (self.initial_soc_percentage / 100) * self.capacity_wh
-        self.soc_wh = min(self.soc_wh, self.max_soc_wh)  # Only clamp to max
-        self.discharge_array = np.full(self.prediction_hours, 0)
-        self.charge_array = np.full(self.prediction_hours, 0)
+        self.soc_wh = self.initial_soc_wh()
+        self._hours_state.fill(0.0)
+        self.charge_array = self._hours_state[0]
+        self.discharge_array = self._hours_state[1]
 
     def set_discharge_per_hour(self, discharge_array: np.ndarray) -> None:
-        """Sets the discharge values for each hour."""
-        if len(discharge_array) != self.prediction_hours:
+        """Sets the discharge values for each simulation step."""
+        if len(discharge_array) != self.prediction_steps:
             raise ValueError(
-                f"Discharge array must have exactly {self.prediction_hours} elements. Got {len(discharge_array)} elements."
+                f"Discharge array must have exactly {self.prediction_steps} elements. Got {len(discharge_array)} elements."
             )
-        self.discharge_array = np.array(discharge_array)
+        self.discharge_array = self._hours_state[1]
+        np.copyto(self.discharge_array, discharge_array)
 
     def set_charge_per_hour(self, charge_array: np.ndarray) -> None:
-        """Sets the charge values for each hour."""
-        if len(charge_array) != self.prediction_hours:
+        """Sets the charge values for each simulation step."""
+        if len(charge_array) != self.prediction_steps:
             raise ValueError(
-                f"Charge array must have exactly {self.prediction_hours} elements. Got {len(charge_array)} elements."
+                f"Charge array must have exactly {self.prediction_steps} elements. Got {len(charge_array)} elements."
             )
-        self.charge_array = np.array(charge_array)
+        self.charge_array = self._hours_state[0]
+        np.copyto(self.charge_array, charge_array)
 
     def current_soc_percentage(self) -> float:
         """Calculates the current state of charge in percentage."""
@@ -138,7 +149,7 @@ class Battery:
         raw_available_wh = max(self.soc_wh - self.min_soc_wh, 0.0)
 
         # Maximum raw discharge due to power limit
-        max_raw_wh = self.max_charge_power_w  # TODO rename to max_discharge_power_w
+        max_raw_wh = self.max_charge_wh  # TODO rename to max_discharge_wh
 
         # Actual raw withdrawal (internal)
         raw_withdrawal_wh = min(raw_available_wh, max_raw_wh)
@@ -181,7 +192,7 @@ class Battery:
         **Mode 2:**
 
         - `wh is None` and `charge_factor > 0`
-        - The raw requested energy is `max_charge_power_w * charge_factor`.
+        - The raw requested energy is `max_charge_wh * charge_factor`.
         - If the request exceeds remaining capacity, the algorithm tries to find a lower
           `charge_factor` that is compatible. If such a charge factor exists, this hour’s
           `charge_factor` is replaced.
@@ -191,7 +202,7 @@ class Battery:
         Charging is constrained by:
 
         - Available SoC headroom (``max_soc_wh − soc_wh``)
-        - ``max_charge_power_w``
+        - ``max_charge_wh`` (maximum charge power times the step duration)
         - ``charging_efficiency``
 
         Args:
@@ -229,7 +240,7 @@ class Battery:
 
         # Provide fast (3x..5x) local read access (vs. self.xxx) for repetitive read access
         soc_wh_fast = self.soc_wh
-        max_charge_power_w_fast = self.max_charge_power_w
+        max_charge_wh_fast = self.max_charge_wh
         charging_efficiency_fast = self.charging_efficiency
 
         # Decide mode & determine raw_request_wh and raw_charge_wh
@@ -237,13 +248,13 @@ class Battery:
             raw_request_wh = wh
             raw_charge_wh = max(self.max_soc_wh - soc_wh_fast, 0.0) / charging_efficiency_fast
         elif wh is None and charge_factor > 0.0:  # mode 2
-            raw_request_wh = max_charge_power_w_fast * charge_factor
+            raw_request_wh = max_charge_wh_fast * charge_factor
             raw_charge_wh = max(self.max_soc_wh - soc_wh_fast, 0.0) / charging_efficiency_fast
             if raw_request_wh > raw_charge_wh:
                 # Use a lower charge factor
                 lower_charge_factors = self._lower_charge_rates_desc(charge_factor)
                 for charge_factor in lower_charge_factors:
-                    raw_request_wh = max_charge_power_w_fast * charge_factor
+                    raw_request_wh = max_charge_wh_fast * charge_factor
                     if raw_request_wh <= raw_charge_wh:
                         self.charge_array[hour] = charge_factor
                         break
@@ -258,7 +269,7 @@ class Battery:
             )
 
         # Remaining capacity
-        max_raw_wh = min(raw_charge_wh, max_charge_power_w_fast)
+        max_raw_wh = min(raw_charge_wh, max_charge_wh_fast)
 
         # Actual raw intake
         raw_input_wh = raw_request_wh if raw_request_wh < max_raw_wh else max_raw_wh
@@ -281,3 +292,115 @@ class Battery:
         """Returns the current usable energy in the battery."""
         usable_energy = (self.soc_wh - self.min_soc_wh) * self.discharging_efficiency
         return max(usable_energy, 0.0)
+
+    # ------------------------------------------------------------------
+    # Population-batched simulation
+    # ------------------------------------------------------------------
+    #
+    # The batch methods below mirror `discharge_energy` and `charge_energy` for a whole
+    # population of individuals. The state of charge is not kept in the battery object but in
+    # an array `soc_wh` (one entry per individual) that is provided by the caller and updated in
+    # place. Only individuals selected by `mask` are processed; all others keep their state and
+    # get zero energy. The floating point operations are the same as in the scalar methods, so
+    # results are identical to simulating the individuals one by one.
+
+    def initial_soc_wh(self) -> float:
+        """Returns the state of charge [Wh] the battery starts with after `reset()`."""
+        soc_wh = (self.initial_soc_percentage / 100) * self.capacity_wh
+        return min(soc_wh, self.max_soc_wh)  # Only clamp to max
+
+    def discharge_energy_batch(
+        self, soc_wh: np.ndarray, wh: np.ndarray, mask: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Discharge energy from the battery for a population of individuals.
+
+        Vectorized counterpart of `discharge_energy`.
+
+        Args:
+            soc_wh (np.ndarray): State of charge per individual [Wh]. Updated in place.
+            wh (np.ndarray): Requested delivered energy per individual [Wh].
+            mask (np.ndarray): Boolean array, True where discharging is requested and allowed.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]:
+                delivered_wh: Actual delivered energy per individual [Wh].
+                losses_wh: Conversion losses per individual [Wh].
+        """
+        raw_available_wh = np.maximum(soc_wh - self.min_soc_wh, 0.0)
+        raw_withdrawal_wh = np.minimum(raw_available_wh, self.max_charge_wh)
+        max_deliverable_wh = raw_withdrawal_wh * self.discharging_efficiency
+        delivered_wh = np.where(mask, np.minimum(wh, max_deliverable_wh), 0.0)
+        raw_used_wh = delivered_wh / self.discharging_efficiency
+        soc_wh[:] = np.where(mask, np.maximum(soc_wh - raw_used_wh, self.min_soc_wh), soc_wh)
+        losses_wh = raw_used_wh - delivered_wh
+        return delivered_wh, losses_wh
+
+    def charge_energy_batch(
+        self,
+        soc_wh: np.ndarray,
+        wh: Optional[np.ndarray],
+        mask: np.ndarray,
+        charge_factor: Optional[np.ndarray] = None,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Charge energy into the battery for a population of individuals.
+
+        Vectorized counterpart of `charge_energy`. Mode 1 is selected by `wh`, mode 2 by
+        `charge_factor` (with `wh` None). In mode 2 individuals whose requested charge factor
+        does not fit into the remaining capacity fall back to the highest lower charge rate,
+        or are not charged at all if there is none. Individuals whose new SoC would exceed the
+        capacity (`charge_energy` raises a ValueError in this case) are flagged as overflow and
+        their state of charge is not updated.
+
+        Args:
+            soc_wh (np.ndarray): State of charge per individual [Wh]. Updated in place.
+            wh (np.ndarray | None): Requested raw energy per individual [Wh] (mode 1).
+            mask (np.ndarray): Boolean array, True where charging is requested and allowed.
+            charge_factor (np.ndarray | None): Fraction of max charge power per individual
+                (mode 2).
+
+        Returns:
+            tuple[np.ndarray, np.ndarray, np.ndarray]:
+                stored_wh: Energy stored after efficiency per individual [Wh].
+                losses_wh: Conversion losses per individual [Wh].
+                overflow: Boolean array, True where the new SoC would exceed the capacity.
+
+        Raises:
+            ValueError: If the mode is ambiguous (neither mode 1 nor mode 2).
+        """
+        max_charge_wh_fast = self.max_charge_wh
+        charging_efficiency_fast = self.charging_efficiency
+
+        raw_charge_wh = np.maximum(self.max_soc_wh - soc_wh, 0.0) / charging_efficiency_fast
+        if wh is not None and charge_factor is None:  # mode 1
+            raw_request_wh = wh
+        elif wh is None and charge_factor is not None:  # mode 2
+            raw_request_wh = max_charge_wh_fast * charge_factor
+            too_high = mask & (raw_request_wh > raw_charge_wh)
+            if np.any(too_high):
+                # Use the highest lower charge rate that fits into the remaining capacity
+                rates = self.charge_rates
+                fits = (rates[None, :] < charge_factor[:, None]) & (
+                    max_charge_wh_fast * rates[None, :] <= raw_charge_wh[:, None]
+                )
+                has_lower = np.any(fits, axis=1)
+                lower_idx = len(rates) - 1 - np.argmax(fits[:, ::-1], axis=1)
+                lower_request_wh = max_charge_wh_fast * rates[lower_idx]
+                raw_request_wh = np.where(too_high, lower_request_wh, raw_request_wh)
+                # ignore request - penalty for missing SoC will be applied
+                mask = mask & ~(too_high & ~has_lower)
+        else:
+            raise ValueError(
+                f"{self.parameters.device_id}: charge_energy_batch must be called either "
+                "with wh != None, or with wh == None and charge_factor != None."
+            )
+
+        max_raw_wh = np.minimum(raw_charge_wh, max_charge_wh_fast)
+        raw_input_wh = np.where(
+            mask, np.where(raw_request_wh < max_raw_wh, raw_request_wh, max_raw_wh), 0.0
+        )
+        stored_wh = raw_input_wh * charging_efficiency_fast
+        new_soc = soc_wh + stored_wh
+        overflow = mask & (new_soc > self.capacity_wh)
+        soc_wh[:] = np.where(mask & ~overflow, new_soc, soc_wh)
+        losses_wh = raw_input_wh - stored_wh
+        return stored_wh, losses_wh, overflow
@@ -11,16 +11,30 @@ class HomeAppliance:
         parameters: HomeApplianceParameters,
         optimization_hours: int,
         prediction_hours: int,
+        step_hours: float = 1.0,
     ):
         self.parameters: HomeApplianceParameters = parameters
         self.prediction_hours = prediction_hours
+        # Duration of a simulation step [h] - start hours and load curve are in steps
+        self.step_hours = step_hours
+        self.prediction_steps = round(prediction_hours / step_hours)
+        self.steps_per_day = round(24 / step_hours)
         self._setup()
 
     def _setup(self) -> None:
         """Sets up the home appliance parameters based provided parameters."""
-        self.load_curve = np.zeros(self.prediction_hours)  # Initialize the load curve with zeros
         self.duration_h = self.parameters.duration_h
+        self.duration_steps = max(round(self.duration_h / self.step_hours), 1)
         self.consumption_wh = self.parameters.consumption_wh
+        # Precompute the load curve per start step [start_step, step], the last row is for no
+        # start. Calculate energy per step based on total consumption and duration.
+        energy_per_step = self.consumption_wh / self.duration_steps
+        self.load_curves = np.zeros((self.prediction_steps + 1, self.prediction_steps))
+        for start_step in range(self.prediction_steps):
+            end_step = min(start_step + self.duration_steps, self.prediction_steps)
+            self.load_curves[start_step, start_step:end_step] = energy_per_step
+        self.load_curves.flags.writeable = False
+        self.load_curve = self.load_curves[self.prediction_steps]  # Initialize with zeros
         # setup possible start times
         if self.parameters.time_windows is None:
             self.parameters.time_windows = TimeWindowSequence(
@@ -33,28 +47,34 @@ class HomeAppliance:
             )
         start_datetime = to_datetime().set(hour=0, minute=0, second=0)
         duration = to_duration(f"{self.duration_h} hours")
+        step_seconds = round(self.step_hours * 3600)
         self.start_allowed: list[bool] = []
-        for hour in range(0, self.prediction_hours):
+        for step in range(0, self.prediction_steps):
             self.start_allowed.append(
                 self.parameters.time_windows.contains(
-                    start_datetime.add(hours=hour), duration=duration
+                    start_datetime.add(seconds=step * step_seconds), duration=duration
                 )
             )
         start_earliest = self.parameters.time_windows.earliest_start_time(duration, start_datetime)
         if start_earliest:
-            self.start_earliest = start_earliest.hour
+            self.start_earliest = (
+                start_earliest.hour * 3600 + start_earliest.minute * 60
+            ) // step_seconds
         else:
             self.start_earliest = 0
         start_latest = self.parameters.time_windows.latest_start_time(duration, start_datetime)
         if start_latest:
-            self.start_latest = start_latest.hour
+            self.start_latest = (
+                start_latest.hour * 3600 + start_latest.minute * 60
+            ) // step_seconds
         else:
-            self.start_latest = 23
+            self.start_latest = self.steps_per_day - 1
 
     def set_starting_time(self, start_hour: int, global_start_hour: int = 0) -> int:
         """Sets the start time of the device and generates the corresponding load curve.
 
-        :param start_hour: The hour at which the device should start.
+        :param start_hour: The simulation step (the hour for hourly steps) at which the device
+            should start.
         """
         if not self.start_allowed[start_hour]:
             # It is not allowed (by the time windows) to start the application at this time
@@ -64,37 +84,62 @@ class HomeAppliance:
             else:
                 # There is no time window left to run the application
                 # Set the start into tomorrow
-                start_hour = self.start_earliest + 24
+                start_hour = self.start_earliest + self.steps_per_day
 
-        self.reset_load_curve()
-
-        # Calculate power per hour based on total consumption and duration
-        power_per_hour = self.consumption_wh / self.duration_h  # Convert to watt-hours
-
-        # Set the power for the duration of use in the load curve array
-        if start_hour < len(self.load_curve):
-            end_hour = min(start_hour + self.duration_h, self.prediction_hours)
-            self.load_curve[start_hour:end_hour] = power_per_hour
+        # Use the precomputed load curve for the start hour, no load if beyond the prediction
+        self.load_curve = self.load_curves[min(start_hour, self.prediction_steps)]
 
         return start_hour
 
     def reset_load_curve(self) -> None:
         """Resets the load curve."""
-        self.load_curve = np.zeros(self.prediction_hours)
+        self.load_curve = self.load_curves[self.prediction_steps]
 
     def get_load_curve(self) -> np.ndarray:
         """Returns the current load curve."""
         return self.load_curve
 
     def get_load_for_hour(self, hour: int) -> float:
-        """Returns the load for a specific hour.
+        """Returns the load for a specific simulation step.
 
-        :param hour: The hour for which the load is queried.
-        :return: The load in watts for the specified hour.
+        :param hour: The simulation step (the hour for hourly steps) for which the load is queried.
+        :return: The load energy in watt-hours for the specified step.
         """
-        if hour < 0 or hour >= self.prediction_hours:
+        if hour < 0 or hour >= self.prediction_steps:
             raise ValueError(
-                f"The specified hour {hour} is outside the available time frame {self.prediction_hours}."
+                f"The specified hour {hour} is outside the available time frame {self.prediction_steps}."
             )
 
         return self.load_curve[hour]
+
+    def load_curves_batch(
+        self, start_hours: np.ndarray, global_start_hour: int = 0
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Generate the load curves for a population of start hours.
+
+        Vectorized counterpart of `set_starting_time`. The device state is not changed.
+
+        Args:
+            start_hours (np.ndarray): Requested start step per individual.
+            global_start_hour (int): Start step of the simulation.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]:
+                start_hours: Start step per individual after applying the time windows.
+                load_curves: Load curve per individual, shape (individuals, prediction_steps).
+        """
+        start_hours = np.asarray(start_hours, dtype=int)
+        start_allowed = np.array(self.start_allowed, dtype=bool)[start_hours]
+        if global_start_hour <= self.start_latest:
+            # There is a time window left to start the appliance. Use it
+            fallback_start_hour = self.start_latest
+        else:
+            # There is no time window left to run the application
+            # Set the start into tomorrow
+            fallback_start_hour = self.start_earliest + self.steps_per_day
+        start_hours = np.where(start_allowed, start_hours, fallback_start_hour)
+
+        # Select the precomputed load curves - a copy, the caller may change it
+        load_curves = self.load_curves[np.minimum(start_hours, self.prediction_steps)]
+
+        return start_hours, load_curves
@@ -1,5 +1,6 @@
-from typing import Optional
+from typing import Optional, Union
 
+import numpy as np
 from loguru import logger
 
 from akkudoktoreos.devices.genetic.battery import Battery
@@ -12,9 +13,12 @@ class Inverter:
         self,
         parameters: InverterParameters,
         battery: Optional[Battery] = None,
+        step_hours: float = 1.0,
     ):
         self.parameters: InverterParameters = parameters
         self.battery: Optional[Battery] = battery
+        # Duration of a simulation step [h] - energies are per step
+        self.step_hours = step_hours
         self._setup()
 
     def _setup(self) -> None:
@@ -23,9 +27,8 @@ class Inverter:
             logger.error(error_msg)
             raise ValueError(error_msg)
         self.self_consumption_predictor = get_eos_load_interpolator()
-        self.max_power_wh = (
-            self.parameters.max_power_wh
-        )  # Maximum power that the inverter can handle
+        # Maximum energy that the inverter can handle per simulation step
+        self.max_power_wh = self.parameters.max_power_wh * self.step_hours
         self.dc_to_ac_efficiency = self.parameters.dc_to_ac_efficiency
         self.ac_to_dc_efficiency = self.parameters.ac_to_dc_efficiency
         self.max_ac_charge_power_w = self.parameters.max_ac_charge_power_w
@@ -50,8 +53,9 @@ class Inverter:
                 self_consumption = self.max_power_wh
             else:
                 # Calculate scr using cached results per energy management/optimization run
+                # The self consumption rate is given for the average power of the step
                 scr = self.self_consumption_predictor.calculate_self_consumption(
-                    consumption, generation
+                    consumption / self.step_hours, generation / self.step_hours
                 )
 
                 # Remaining power after consumption
@@ -130,3 +134,138 @@ class Inverter:
             self_consumption = generation + battery_discharge_ac
 
         return grid_export, grid_import, losses, self_consumption
+
+    def process_energy_batch(
+        self,
+        generation: Union[float, np.ndarray],
+        consumption: np.ndarray,
+        discharge_allowed: np.ndarray,
+        charge_allowed: np.ndarray,
+        battery_soc_wh: Optional[np.ndarray] = None,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Process the energy of one hour for a population of individuals.
+
+        Vectorized counterpart of `process_energy`. Individuals may have different consumption
+        and battery states and either share the same PV generation or have their own.
+
+        Args:
+            generation (Union[float, np.ndarray]): PV generation of the hour [Wh], shared or
+                per individual.
+            consumption (np.ndarray): Consumption per individual [Wh].
+            discharge_allowed (np.ndarray): Boolean array, True where battery discharge is
+                allowed in this hour.
+            charge_allowed (np.ndarray): Boolean array, True where battery charging is allowed
+                in this hour.
+            battery_soc_wh (np.ndarray, optional): Battery state of charge per individual [Wh].
+                Updated in place. Required if the inverter has a battery.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+                grid_export, grid_import, losses, self_consumption and a boolean array that
+                is True where the battery would exceed its capacity.
+        """
+        battery = self.battery
+        if battery and battery_soc_wh is None:
+            raise ValueError("Battery state of charge array required for battery simulation.")
+
+        losses = np.zeros_like(consumption)
+        grid_export = np.zeros_like(consumption)
+        grid_import = np.zeros_like(consumption)
+        self_consumption = np.zeros_like(consumption)
+        overflow = np.zeros(consumption.shape, dtype=bool)
+
+        # Cache inverter DC→AC efficiency for discharge path
+        dc_to_ac_eff = self.dc_to_ac_efficiency
+        max_power_wh = self.max_power_wh
+
+        surplus = generation >= consumption
+        # Consumption exceeds maximum inverter power
+        surplus_overload = surplus & (consumption > max_power_wh)
+        # Regular surplus handling with self consumption rate
+        surplus_regular = surplus & ~surplus_overload
+        deficit = ~surplus
+
+        losses = np.where(surplus_overload, generation - max_power_wh, losses)
+        grid_import = np.where(surplus_overload, -(max_power_wh - consumption), grid_import)
+        self_consumption = np.where(surplus_overload, max_power_wh, self_consumption)
+
+        scr = np.zeros_like(consumption)
+        if np.any(surplus_regular):
+            scr[surplus_regular] = self.self_consumption_predictor.calculate_self_consumption_batch(
+                consumption[surplus_regular] / self.step_hours,
+                (generation[surplus_regular] if isinstance(generation, np.ndarray) else generation)
+                / self.step_hours,
+            )
+        remaining_power = (generation - consumption) * scr
+        remaining_load_evq = (generation - consumption) * (1.0 - scr)
+        discharge_regular = surplus_regular & (remaining_load_evq > 0)
+
+        # Shortfall in case of insufficient generation
+        shortfall = consumption - generation
+        available_ac_power = np.maximum(max_power_wh - generation, 0)
+
+        from_battery_ac = np.zeros_like(consumption)
+        if battery:
+            # Request more DC from battery to account for DC→AC conversion loss
+            dc_request = np.where(
+                discharge_regular,
+                remaining_load_evq / dc_to_ac_eff,
+                np.minimum(shortfall, available_ac_power) / dc_to_ac_eff,
+            )
+            from_battery_dc, discharge_losses = battery.discharge_energy_batch(
+                battery_soc_wh,  # type: ignore[arg-type]
+                dc_request,
+                (discharge_regular | deficit) & discharge_allowed,
+            )
+            # Convert DC output to AC
+            from_battery_ac = from_battery_dc * dc_to_ac_eff
+            inverter_discharge_losses = from_battery_dc - from_battery_ac
+            discharging = discharge_regular | deficit
+            losses = np.where(
+                discharging, losses + (discharge_losses + inverter_discharge_losses), losses
+            )
+            remaining_load_evq = np.where(
+                discharge_regular, remaining_load_evq - from_battery_ac, remaining_load_evq
+            )
+
+        # If the battery cannot fully cover the remaining consumption, the rest is drawn from the grid
+        grid_import = np.where(
+            discharge_regular & (remaining_load_evq > 0),
+            grid_import + remaining_load_evq,
+            grid_import,
+        )
+
+        charge_regular = surplus_regular & (remaining_power > 0)
+        if battery:
+            # Load battery with excess energy (DC path, no inverter conversion needed)
+            charged_energie, charge_losses, overflow = battery.charge_energy_batch(
+                battery_soc_wh,  # type: ignore[arg-type]
+                remaining_power,
+                charge_regular & charge_allowed,
+            )
+            remaining_surplus = remaining_power - (charged_energie + charge_losses)
+        else:
+            charge_losses = np.zeros_like(consumption)
+            remaining_surplus = remaining_power
+
+        # Feed-in to the grid based on remaining capacity
+        export_limit = max_power_wh - consumption
+        export_limited = charge_regular & (remaining_surplus > export_limit)
+        grid_export = np.where(
+            export_limited,
+            export_limit,
+            np.where(charge_regular, remaining_surplus, grid_export),
+        )
+        losses = np.where(export_limited, losses + (remaining_surplus - grid_export), losses)
+        losses = np.where(charge_regular, losses + charge_losses, losses)
+
+        # Self-consumption is equal to the load
+        self_consumption = np.where(
+            surplus_regular, consumption + from_battery_ac, self_consumption
+        )
+
+        # Draw remaining required power from the grid (discharge_losses are already subtracted in the battery)
+        grid_import = np.where(deficit, shortfall - from_battery_ac, grid_import)
+        self_consumption = np.where(deficit, generation + from_battery_ac, self_consumption)
+
+        return grid_export, grid_import, losses, self_consumption, overflow
@@ -0,0 +1,137 @@
+"""Dynamic programming algorithm."""
+
+from typing import Optional
+
+import numpy as np
+
+from akkudoktoreos.optimization.genetic.geneticsolver import GeneticSolverOptimization
+
+
+class DPOptimization(GeneticSolverOptimization):
+    """DP (dynamic programming) algorithm to solve energy optimization.
+
+    For a single battery behind an inverter the optimization is a finite-state control problem:
+    Per hour the battery is idle, allowed to discharge or AC charged at one of its charge rates.
+    The DP calculates the optimal cost-to-go for a grid of battery states of charge by backward
+    induction over the hours and then rolls the optimal decisions forward from the actual start
+    state of charge. The cost of a decision is the simulated balance plus the AC charging
+    break-even penalty of the fitness function. Between the grid points the cost-to-go is linearly
+    interpolated, so the solution is optimal up to the resolution of the state of charge grid.
+
+    Device setup, simulation and solution are shared with the GENETIC algorithm. The DP decisions
+    are encoded as a genome of the GENETIC algorithm, so the result is a `GeneticSolution`.
+    Configurations with devices the DP does not model and robust optimization over load scenarios
+    fall back to the genetic search.
+    """
+
+    solver_name = "DP"
+
+    def solver_supported(self) -> bool:
+        """Check whether the DP models all devices of the optimization run.
+
+        Returns:
+            bool: True if the run can be solved by the DP, False if the genetic search is needed.
+        """
+        return (
+            super().solver_supported()
+            and not self.optimize_ev
+            and self.opti_param.get("home_appliance", 0) == 0
+            and self.simulation.load_energy_scenarios is None  # no robust scenarios
+        )
+
+    def battery_residual_value(self, soc_wh: np.ndarray) -> np.ndarray:
+        """Value of the energy left in the battery at the end of the simulation.
+
+        Same valuation as applied by the fitness function of the GENETIC algorithm.
+
+        Args:
+            soc_wh (np.ndarray): Battery state of charge [Wh].
+
+        Returns:
+            np.ndarray: Residual value of the battery energy.
+        """
+        battery = self.simulation.battery
+        inverter = self.simulation.inverter
+        if battery is None or inverter is None or self.parameters is None:
+            return np.zeros_like(soc_wh)
+        energy_content = (
+            np.maximum((soc_wh - battery.min_soc_wh) * battery.discharging_efficiency, 0.0)
+            * inverter.dc_to_ac_efficiency
+        )
+        return energy_content * self.parameters.ems.price_per_wh_battery
+
+    def solve(self) -> Optional[tuple[list[int], str]]:
+        """Solve the optimization run by dynamic programming.
+
+        Returns:
+            tuple[list[int], str]: The genome of the solution and the stop reason "dp_grid".
+        """
+        battery = self.simulation.battery
+        if battery is None or self.simulation.load_energy_array is None:  # Make mypy happy
+            raise ValueError("DP optimization requires a battery and a prepared simulation.")
+        prediction_hours = self.config.prediction.hours
+        start_hour = self.ems.start_datetime.hour
+        end_hour = len(self.simulation.load_energy_array)
+
+        # Decisions per hour as battery states of the genome
+        len_bat = len(self.bat_possible_charge_values)
+        action_states = np.array(
+            [0, len_bat] + [2 * len_bat + i for i in range(len_bat)], dtype=int
+        )
+        actions = len(action_states)
+        ac_charge, dc_charge, discharge = self.decode_charge_discharge(
+            np.repeat(action_states[:, np.newaxis], prediction_hours, axis=1)
+        )
+        ev_charge = np.zeros(ac_charge.shape)
+        ac_charge_penalties = self.ac_charge_break_even_penalties(ac_charge, 0)
+        if ac_charge_penalties is None:
+            ac_charge_penalties = np.zeros(ac_charge.shape)
+
+        # Battery state of charge grid of the value function
+        initial_soc_wh = battery.initial_soc_wh()
+        soc_grid = np.linspace(
+            min(battery.min_soc_wh, initial_soc_wh),
+            max(battery.max_soc_wh, initial_soc_wh),
+            self.config.optimization.dp.soc_steps,
+        )
+        steps = len(soc_grid)
+
+        def step(hour: int, soc_wh: np.ndarray, repeats: int) -> tuple[np.ndarray, np.ndarray]:
+            """Simulate all decisions for one hour; returns costs and next states of charge."""
+            result = self.simulation.simulate_batch(
+                hour,
+                np.repeat(ac_charge, repeats, axis=0),
+                np.repeat(dc_charge, repeats, axis=0),
+                np.repeat(discharge, repeats, axis=0),
+                np.repeat(ev_charge, repeats, axis=0),
+                battery_soc_wh=soc_wh,
+                end_hour=hour + 1,
+            )
+            costs = np.where(
+                result["invalid"],
+                np.inf,
+                result["Gesamtbilanz_Euro"] + np.repeat(ac_charge_penalties[:, hour], repeats),
+            )
+            return costs, result["battery_soc_wh"]
+
+        # Backward induction of the cost-to-go on the state of charge grid
+        cost_to_go = np.zeros((end_hour - start_hour + 1, steps))
+        cost_to_go[-1] = -self.battery_residual_value(soc_grid)
+        for hour in range(end_hour - 1, start_hour - 1, -1):
+            costs, next_soc_wh = step(hour, np.tile(soc_grid, actions), steps)
+            next_cost_to_go = cost_to_go[hour - start_hour + 1]
+            total_costs = costs + np.interp(next_soc_wh, soc_grid, next_cost_to_go)
+            cost_to_go[hour - start_hour] = total_costs.reshape(actions, steps).min(axis=0)
+
+        # Roll the optimal decisions forward from the actual state of charge
+        battery_states = np.zeros(prediction_hours, dtype=int)
+        soc_wh = initial_soc_wh
+        for hour in range(start_hour, end_hour):
+            costs, next_soc_wh = step(hour, np.full(actions, soc_wh), 1)
+            next_cost_to_go = cost_to_go[hour - start_hour + 1]
+            best = int(np.argmin(costs + np.interp(next_soc_wh, soc_grid, next_cost_to_go)))
+            battery_states[hour] = action_states[best]
+            soc_wh = next_soc_wh[best]
+
+        # EV and appliance not optimized
+        return self.merge_individual(battery_states, None, None), "dp_grid"
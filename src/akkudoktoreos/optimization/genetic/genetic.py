@@ -1,14 +1,18 @@
 """Genetic algorithm."""
 
+import math
 import random
+import statistics
+import threading
 import time
-from typing import Any, Optional
+from typing import Any, Callable, ClassVar, Iterable, Optional
 
+import cachebox
 import numpy as np
-from deap import algorithms, base, creator, tools
+from deap import base, tools
 from loguru import logger
 from numpydantic import NDArray, Shape
-from pydantic import ConfigDict, Field
+from pydantic import ConfigDict, Field, PrivateAttr
 
 from akkudoktoreos.core.pydantic import PydanticBaseModel
 from akkudoktoreos.devices.genetic.battery import Battery
@@ -18,11 +22,85 @@ from akkudoktoreos.optimization.genetic.geneticparams import (
     GeneticEnergyManagementParameters,
     GeneticOptimizationParameters,
 )
+from akkudoktoreos.optimization.genetic.geneticpool import (
+    GeneticEvaluationPool,
+    acquire_evaluation_pool,
+    release_evaluation_pool,
+    resolve_workers,
+)
 from akkudoktoreos.optimization.genetic.geneticsolution import (
     GeneticSimulationResult,
     GeneticSolution,
 )
 from akkudoktoreos.optimization.optimizationabc import OptimizationBase
+from akkudoktoreos.optimization.optimizationstatus import get_optimization_status
+from akkudoktoreos.utils.datetimeutil import to_datetime
+
+
+class GeneticSimulationState:
+    """Preallocated per-hour arrays of the simulation of one individual.
+
+    All per-hour arrays are rows of one contiguous float64 buffer that is allocated once for the
+    prediction horizon and reset in place by every simulation run.
+    """
+
+    # Per-hour actions of the individual
+    ACTION_ROWS: ClassVar[tuple[str, ...]] = (
+        "ac_charge_hours",
+        "dc_charge_hours",
+        "bat_discharge_hours",
+        "ev_charge_hours",
+        "ev_discharge_hours",
+    )
+    # Per-hour results of the simulation
+    RESULT_ROWS: ClassVar[tuple[str, ...]] = (
+        "loads_energy_per_hour",
+        "feedin_energy_per_hour",
+        "consumption_energy_per_hour",
+        "costs_per_hour",
+        "revenue_per_hour",
+        "losses_wh_per_hour",
+        "electricity_price_per_hour",
+        "soc_per_hour",
+        "soc_ev_per_hour",
+        "home_appliance_wh_per_hour",
+    )
+
+    __slots__ = ("hours", "buffer", "results", "mask", *ACTION_ROWS, *RESULT_ROWS)
+
+    hours: int
+    buffer: np.ndarray
+    results: np.ndarray
+    mask: np.ndarray
+    ac_charge_hours: np.ndarray
+    dc_charge_hours: np.ndarray
+    bat_discharge_hours: np.ndarray
+    ev_charge_hours: np.ndarray
+    ev_discharge_hours: np.ndarray
+    loads_energy_per_hour: np.ndarray
+    feedin_energy_per_hour: np.ndarray
+    consumption_energy_per_hour: np.ndarray
+    costs_per_hour: np.ndarray
+    revenue_per_hour: np.ndarray
+    losses_wh_per_hour: np.ndarray
+    electricity_price_per_hour: np.ndarray
+    soc_per_hour: np.ndarray
+    soc_ev_per_hour: np.ndarray
+    home_appliance_wh_per_hour: np.ndarray
+
+    def __init__(self, hours: int) -> None:
+        """Allocate the state for the given number of hours."""
+        self.hours = hours
+        self.buffer = np.zeros((len(self.ACTION_ROWS) + len(self.RESULT_ROWS), hours))
+        self.results = self.buffer[len(self.ACTION_ROWS) :]
+        for row, name in enumerate(self.ACTION_ROWS + self.RESULT_ROWS):
+            setattr(self, name, self.buffer[row])
+        # Scratch mask for element selection
+        self.mask = np.zeros(hours, dtype=bool)
+
+    def __reduce__(self) -> tuple[type, tuple[int]]:
+        """Pickle the size only - the content is rebuilt by the next simulation run."""
+        return (self.__class__, (self.hours,))
 
 
 class GeneticSimulation(PydanticBaseModel):
@@ -36,8 +114,15 @@ class GeneticSimulation(PydanticBaseModel):
     start_hour: int = Field(
         default=0,
         ge=0,
-        le=23,
-        json_schema_extra={"description": "Starting hour on day for optimizations."},
+        json_schema_extra={
+            "description": "Starting step on day for optimizations - the hour for hourly steps."
+        },
+    )
+
+    step_hours: float = Field(
+        default=1.0,
+        gt=0,
+        json_schema_extra={"description": "Duration of a simulation step [h]."},
     )
 
     optimization_hours: Optional[int] = Field(
@@ -77,6 +162,25 @@ class GeneticSimulation(PydanticBaseModel):
         },
     )
 
+    load_energy_scenarios: Optional[NDArray[Shape["*, *"], float]] = Field(
+        default=None,
+        json_schema_extra={
+            "description": "Load energy per forecast scenario and hour for robust optimization."
+        },
+    )
+    pv_prediction_scenarios: Optional[NDArray[Shape["*, *"], float]] = Field(
+        default=None,
+        json_schema_extra={
+            "description": "PV energy per forecast scenario and hour for robust optimization."
+        },
+    )
+    elect_price_scenarios: Optional[NDArray[Shape["*, *"], float]] = Field(
+        default=None,
+        json_schema_extra={
+            "description": "Electricity price per forecast scenario and hour for robust optimization."
+        },
+    )
+
     battery: Optional[Battery] = Field(default=None, json_schema_extra={"description": "TBD."})
     ev: Optional[Battery] = Field(default=None, json_schema_extra={"description": "TBD."})
     home_appliance: Optional[HomeAppliance] = Field(
@@ -104,6 +208,24 @@ class GeneticSimulation(PydanticBaseModel):
         json_schema_extra={"description": "Home appliance start hour - None denotes no start."},
     )
 
+    # Preallocated per-hour arrays of the simulation of one individual
+    _state: Optional[GeneticSimulationState] = PrivateAttr(default=None)
+
+    def state(self, hours: int) -> GeneticSimulationState:
+        """Get the preallocated simulation state, allocate it on first use.
+
+        Args:
+            hours (int): Number of hours of the simulation.
+
+        Returns:
+            GeneticSimulationState: State with per-hour arrays for the given number of hours.
+        """
+        state = self._state
+        if state is None or state.hours != hours:
+            state = GeneticSimulationState(hours)
+            self._state = state
+        return state
+
     def prepare(
         self,
         parameters: GeneticEnergyManagementParameters,
@@ -112,13 +234,16 @@ class GeneticSimulation(PydanticBaseModel):
         ev: Optional[Battery] = None,
         home_appliance: Optional[HomeAppliance] = None,
         inverter: Optional[Inverter] = None,
+        step_hours: float = 1.0,
     ) -> None:
         """Prepare simulation runs.
 
-        Populate internal arrays and device references used during simulation.
+        Populate internal arrays and device references used during simulation. The arrays hold
+        one value per simulation step of `step_hours` duration; energies are per step.
         """
         self.optimization_hours = optimization_hours
         self.prediction_hours = prediction_hours
+        self.step_hours = step_hours
 
         # Load arrays from provided EMS parameters
         self.load_energy_array = np.array(parameters.total_load, float)
@@ -130,6 +255,11 @@ class GeneticSimulation(PydanticBaseModel):
             else np.full(len(self.load_energy_array), parameters.feed_in_tariff_per_wh, float)
         )
 
+        # No forecast scenarios until prepared
+        self.load_energy_scenarios = None
+        self.pv_prediction_scenarios = None
+        self.elect_price_scenarios = None
+
         # Associate devices
         if inverter:
             self.battery = inverter.battery
@@ -140,13 +270,84 @@ class GeneticSimulation(PydanticBaseModel):
         self.inverter = inverter
 
         # Initialize per-hour action arrays for the prediction horizon
-        self.ac_charge_hours = np.full(self.prediction_hours, 0.0)
-        self.dc_charge_hours = np.full(self.prediction_hours, 0.0)
-        self.bat_discharge_hours = np.full(self.prediction_hours, 0.0)
-        self.ev_charge_hours = np.full(self.prediction_hours, 0.0)
-        self.ev_discharge_hours = np.full(self.prediction_hours, 0.0)
+        self.set_actions(0.0, 0.0, 0.0, 0.0)
         self.home_appliance_start_hour = None
 
+    def prepare_scenarios(
+        self,
+        scenarios: int,
+        load_std: np.ndarray,
+        pv_std: np.ndarray,
+        price_std: np.ndarray,
+        seed: Optional[int] = None,
+    ) -> None:
+        """Prepare forecast scenarios for robust simulation runs.
+
+        The scenarios are stratified quantile scenarios: Each scenario shifts the whole load, PV
+        and price forecast by one quantile of the normal distribution of the forecast error.
+        The quantiles of load, PV and price are combined in random order, so their deviations
+        are not correlated. Load and PV energy are not negative.
+
+        Args:
+            scenarios (int): Number of scenarios.
+            load_std (np.ndarray): Standard deviation of the load forecast per hour [Wh].
+            pv_std (np.ndarray): Standard deviation of the PV forecast per hour [Wh].
+            price_std (np.ndarray): Standard deviation of the price forecast per hour.
+            seed (int, optional): Random seed for the combination of the quantiles.
+        """
+        if (
+            self.load_energy_array is None
+            or self.pv_prediction_wh is None
+            or self.elect_price_hourly is None
+        ):
+            raise ValueError("Mandatory data missing - simulation not prepared.")
+        normal = statistics.NormalDist()
+        quantiles = np.array([normal.inv_cdf((idx + 0.5) / scenarios) for idx in range(scenarios)])
+        rng = np.random.default_rng(seed)
+
+        def deviations(std: np.ndarray) -> np.ndarray:
+            return rng.permutation(quantiles)[:, None] * np.asarray(std, dtype=float)[None, :]
+
+        self.load_energy_scenarios = np.maximum(
+            self.load_energy_array[None, :] + deviations(load_std), 0.0
+        )
+        self.pv_prediction_scenarios = np.maximum(
+            self.pv_prediction_wh[None, :] + deviations(pv_std), 0.0
+        )
+        self.elect_price_scenarios = self.elect_price_hourly[None, :] + deviations(price_std)
+
+    def set_actions(
+        self,
+        ac_charge_hours: Any,
+        dc_charge_hours: Any,
+        bat_discharge_hours: Any,
+        ev_charge_hours: Any,
+    ) -> None:
+        """Set the per-hour actions for the next simulation run.
+
+        The actions are copied to the preallocated simulation state. Scalars are applied to all
+        hours. EV discharge is not used and set to zero.
+
+        Args:
+            ac_charge_hours (Any): AC charge factor per hour.
+            dc_charge_hours (Any): DC charge factor per hour.
+            bat_discharge_hours (Any): Battery discharge allowance per hour.
+            ev_charge_hours (Any): EV charge factor per hour.
+        """
+        if self.prediction_hours is None:
+            raise ValueError("Prediction hours not set - simulation not prepared.")
+        state = self.state(round(self.prediction_hours / self.step_hours))
+        np.copyto(state.ac_charge_hours, ac_charge_hours)
+        np.copyto(state.dc_charge_hours, dc_charge_hours)
+        np.copyto(state.bat_discharge_hours, bat_discharge_hours)
+        np.copyto(state.ev_charge_hours, ev_charge_hours)
+        state.ev_discharge_hours.fill(0.0)
+        self.ac_charge_hours = state.ac_charge_hours
+        self.dc_charge_hours = state.dc_charge_hours
+        self.bat_discharge_hours = state.bat_discharge_hours
+        self.ev_charge_hours = state.ev_charge_hours
+        self.ev_discharge_hours = state.ev_discharge_hours
+
     def reset(self) -> None:
         if self.ev:
             self.ev.reset()
@@ -159,6 +360,9 @@ class GeneticSimulation(PydanticBaseModel):
 
         battery_soc_per_hour begin of the hour, initial hour state!
         load_wh_per_hour integral of last hour (end state)
+
+        The per-hour results are held by the preallocated simulation state. They are valid until
+        the next simulation run - copy them to keep them.
         """
         # Remember start hour
         self.start_hour = start_hour
@@ -225,20 +429,22 @@ class GeneticSimulation(PydanticBaseModel):
         end_hour = len(load_energy_array_fast)
         total_hours = end_hour - start_hour
 
-        # Pre-allocate arrays for the results, optimized for speed
-        loads_energy_per_hour = np.full((total_hours), np.nan)
-        feedin_energy_per_hour = np.full((total_hours), np.nan)
-        consumption_energy_per_hour = np.full((total_hours), np.nan)
-        costs_per_hour = np.full((total_hours), np.nan)
-        revenue_per_hour = np.full((total_hours), np.nan)
-        losses_wh_per_hour = np.full((total_hours), np.nan)
-        electricity_price_per_hour = np.full((total_hours), np.nan)
+        # Reset the preallocated arrays for the results, optimized for speed
+        state = self.state(end_hour)
+        state.results.fill(np.nan)
+        loads_energy_per_hour = state.loads_energy_per_hour[:total_hours]
+        feedin_energy_per_hour = state.feedin_energy_per_hour[:total_hours]
+        consumption_energy_per_hour = state.consumption_energy_per_hour[:total_hours]
+        costs_per_hour = state.costs_per_hour[:total_hours]
+        revenue_per_hour = state.revenue_per_hour[:total_hours]
+        losses_wh_per_hour = state.losses_wh_per_hour[:total_hours]
+        electricity_price_per_hour = state.electricity_price_per_hour[:total_hours]
+        soc_per_hour = state.soc_per_hour[:total_hours]
+        soc_ev_per_hour = state.soc_ev_per_hour[:total_hours]
+        home_appliance_wh_per_hour = state.home_appliance_wh_per_hour[:total_hours]
 
         # Set initial state
         if battery_fast:
-            # Pre-allocate arrays for the results, optimized for speed
-            soc_per_hour = np.full((total_hours), np.nan)
-
             soc_per_hour[0] = battery_fast.current_soc_percentage()
 
             # Determine AC charging availability from inverter parameters
@@ -264,25 +470,22 @@ class GeneticSimulation(PydanticBaseModel):
             dc_charge_hours_fast[end_hour:] = 0
             ac_charge_hours_fast[0:start_hour] = 0
             ac_charge_hours_fast[end_hour:] = 0
-            battery_fast.charge_array = np.where(
-                ac_charge_hours_fast != 0, ac_charge_hours_fast, dc_charge_hours_fast
-            )
+            battery_fast.set_charge_per_hour(dc_charge_hours_fast)
+            np.not_equal(ac_charge_hours_fast, 0, out=state.mask)
+            np.copyto(battery_fast.charge_array, ac_charge_hours_fast, where=state.mask)
             # Fill the discharge array of the battery
             bat_discharge_hours_fast[0:start_hour] = 0
             bat_discharge_hours_fast[end_hour:] = 0
             battery_fast.discharge_array = bat_discharge_hours_fast
         else:
             # Default return if no battery is available
-            soc_per_hour = np.full((total_hours), 0)
+            soc_per_hour.fill(0.0)
             ac_to_dc_eff_fast = 1.0
             dc_to_ac_eff_fast = 1.0
             max_ac_charge_w_fast = None
             ac_charging_possible = False
 
         if ev_fast:
-            # Pre-allocate arrays for the results, optimized for speed
-            soc_ev_per_hour = np.full((total_hours), np.nan)
-
             soc_ev_per_hour[0] = ev_fast.current_soc_percentage()
             # Fill the charge array of the ev
             ev_charge_hours_fast[0:start_hour] = 0
@@ -294,20 +497,17 @@ class GeneticSimulation(PydanticBaseModel):
             ev_fast.discharge_array = ev_discharge_hours_fast
         else:
             # Default return if no electric vehicle is available
-            soc_ev_per_hour = np.full((total_hours), 0)
+            soc_ev_per_hour.fill(0.0)
 
         if home_appliance_fast and self.home_appliance_start_hour is not None:
             home_appliance_enabled = True
-            # Pre-allocate arrays for the results, optimized for speed
-            home_appliance_wh_per_hour = np.full((total_hours), np.nan)
-
             self.home_appliance_start_hour = home_appliance_fast.set_starting_time(
                 self.home_appliance_start_hour, start_hour
             )
         else:
             home_appliance_enabled = False
             # Default return if no home appliance is available
-            home_appliance_wh_per_hour = np.full((total_hours), 0)
+            home_appliance_wh_per_hour.fill(0.0)
 
         for hour in range(start_hour, end_hour):
             hour_idx = hour - start_hour
@@ -424,10 +624,461 @@ class GeneticSimulation(PydanticBaseModel):
             "Electricity_price": electricity_price_per_hour,
         }
 
+    def simulate_batch(
+        self,
+        start_hour: int,
+        ac_charge_hours: np.ndarray,
+        dc_charge_hours: np.ndarray,
+        bat_discharge_hours: np.ndarray,
+        ev_charge_hours: np.ndarray,
+        home_appliance_start_hours: Optional[np.ndarray] = None,
+        battery_soc_wh: Optional[np.ndarray] = None,
+        end_hour: Optional[int] = None,
+        scenarios: bool = False,
+    ) -> dict[str, Any]:
+        """Simulate energy usage and costs for a population of individuals.
+
+        Population-batched counterpart of `simulate`. The per-hour action arrays have the shape
+        (individuals, prediction_hours). All individuals are stepped through the horizon
+        together using NumPy state arrays for the battery SoC, EV SoC, grid import/export,
+        losses and costs. The results are identical to calling `simulate` for each individual.
+
+        The device objects are only used for their parameters, their state is not changed.
+
+        Args:
+            start_hour (int): Start hour of the simulation.
+            ac_charge_hours (np.ndarray): AC charge factors per individual and hour.
+            dc_charge_hours (np.ndarray): DC charge factors per individual and hour.
+            bat_discharge_hours (np.ndarray): Battery discharge allowance per individual and hour.
+            ev_charge_hours (np.ndarray): EV charge factors per individual and hour.
+            home_appliance_start_hours (np.ndarray, optional): Home appliance start hour per
+                individual. Negative values denote no start.
+            battery_soc_wh (np.ndarray, optional): Battery SoC per individual at the start hour
+                [Wh]. Defaults to the initial SoC of the battery.
+            end_hour (int, optional): Hour the simulation ends (exclusive). Defaults to the end
+                of the prediction horizon.
+            scenarios (bool): Simulate every individual for every prepared forecast scenario
+                instead of the forecast. The results then have one row per individual and
+                scenario, the scenarios of an individual are adjacent.
+
+        Returns:
+            dict[str, Any]: Same keys as `simulate` with per-hour values of shape
+            (individuals, hours) and totals of shape (individuals,). Additional keys:
+
+            - "battery_soc_wh": Battery SoC at the end of the simulation per individual.
+            - "ev_soc_wh": EV SoC at the end of the simulation per individual.
+            - "invalid": True for individuals the simulation failed for.
+        """
+        # Remember start hour
+        self.start_hour = start_hour
+
+        load_energy_array_fast = self.load_energy_array
+        pv_prediction_wh_fast = self.pv_prediction_wh
+        elect_price_hourly_fast = self.elect_price_hourly
+        elect_revenue_per_hour_arr_fast = self.elect_revenue_per_hour_arr
+        battery_fast = self.battery
+        ev_fast = self.ev
+        home_appliance_fast = self.home_appliance
+        inverter_fast = self.inverter
+
+        if (
+            load_energy_array_fast is None
+            or pv_prediction_wh_fast is None
+            or elect_price_hourly_fast is None
+            or elect_revenue_per_hour_arr_fast is None
+        ):
+            error_msg = "Mandatory data missing - simulation not prepared."
+            logger.error(error_msg)
+            raise ValueError(error_msg)
+
+        if not (
+            len(load_energy_array_fast)
+            == len(pv_prediction_wh_fast)
+            == len(elect_price_hourly_fast)
+        ):
+            error_msg = f"Array sizes do not match: Load Curve = {len(load_energy_array_fast)}, PV Forecast = {len(pv_prediction_wh_fast)}, Electricity Price = {len(elect_price_hourly_fast)}"
+            logger.error(error_msg)
+            raise ValueError(error_msg)
+
+        if end_hour is None:
+            end_hour = len(load_energy_array_fast)
+        total_hours = end_hour - start_hour
+
+        # Work on copies - the caller's action arrays stay untouched
+        ac_charge_hours_fast = np.array(ac_charge_hours, dtype=float, ndmin=2)
+        dc_charge_hours_fast = np.array(dc_charge_hours, dtype=float, ndmin=2)
+        bat_discharge_hours_fast = np.array(bat_discharge_hours, dtype=float, ndmin=2)
+        ev_charge_hours_fast = np.array(ev_charge_hours, dtype=float, ndmin=2)
+
+        # Forecasts per row - None if all rows share the forecast
+        load_rows: Optional[np.ndarray] = None
+        pv_rows: Optional[np.ndarray] = None
+        price_rows: Optional[np.ndarray] = None
+        if scenarios:
+            if (
+                self.load_energy_scenarios is None
+                or self.pv_prediction_scenarios is None
+                or self.elect_price_scenarios is None
+            ):
+                error_msg = "Forecast scenarios missing - scenarios not prepared."
+                logger.error(error_msg)
+                raise ValueError(error_msg)
+            # One row per individual and scenario
+            scenario_count = len(self.load_energy_scenarios)
+            population_size = ac_charge_hours_fast.shape[0]
+            ac_charge_hours_fast = np.repeat(ac_charge_hours_fast, scenario_count, axis=0)
+            dc_charge_hours_fast = np.repeat(dc_charge_hours_fast, scenario_count, axis=0)
+            bat_discharge_hours_fast = np.repeat(bat_discharge_hours_fast, scenario_count, axis=0)
+            ev_charge_hours_fast = np.repeat(ev_charge_hours_fast, scenario_count, axis=0)
+            if home_appliance_start_hours is not None:
+                home_appliance_start_hours = np.repeat(home_appliance_start_hours, scenario_count)
+            if battery_soc_wh is not None:
+                battery_soc_wh = np.repeat(battery_soc_wh, scenario_count)
+            load_rows = np.tile(self.load_energy_scenarios, (population_size, 1))
+            pv_rows = np.tile(self.pv_prediction_scenarios, (population_size, 1))
+            price_rows = np.tile(self.elect_price_scenarios, (population_size, 1))
+        individuals = ac_charge_hours_fast.shape[0]
+        for hours_array in (
+            ac_charge_hours_fast,
+            dc_charge_hours_fast,
+            bat_discharge_hours_fast,
+            ev_charge_hours_fast,
+        ):
+            hours_array[:, 0:start_hour] = 0
+            hours_array[:, end_hour:] = 0
+
+        # Pre-allocate arrays for the results
+        shape = (individuals, total_hours)
+        loads_energy_per_hour = np.full(shape, np.nan)
+        feedin_energy_per_hour = np.full(shape, np.nan)
+        consumption_energy_per_hour = np.full(shape, np.nan)
+        costs_per_hour = np.full(shape, np.nan)
+        revenue_per_hour = np.full(shape, np.nan)
+        losses_wh_per_hour = np.full(shape, np.nan)
+        electricity_price_per_hour = np.full(shape, np.nan)
+        invalid = np.zeros(individuals, dtype=bool)
+
+        # Set initial state
+        if battery_soc_wh is None:
+            battery_soc_wh = np.zeros(individuals)
+            if battery_fast:
+                battery_soc_wh[:] = battery_fast.initial_soc_wh()
+        else:
+            battery_soc_wh = np.array(battery_soc_wh, dtype=float)
+        if battery_fast:
+            soc_per_hour = np.full(shape, np.nan)
+
+            # Determine AC charging availability from inverter parameters
+            if inverter_fast:
+                ac_to_dc_eff_fast = inverter_fast.ac_to_dc_efficiency
+                max_ac_charge_w_fast = inverter_fast.max_ac_charge_power_w
+            else:
+                ac_to_dc_eff_fast = 1.0
+                max_ac_charge_w_fast = None
+
+            ac_charging_possible = ac_to_dc_eff_fast > 0 and (
+                max_ac_charge_w_fast is None or max_ac_charge_w_fast > 0
+            )
+
+            # If AC charging is disabled via inverter, zero out AC charge hours
+            if not ac_charging_possible:
+                ac_charge_hours_fast = np.zeros_like(ac_charge_hours_fast)
+
+            bat_charge_array = np.where(
+                ac_charge_hours_fast != 0, ac_charge_hours_fast, dc_charge_hours_fast
+            )
+        else:
+            # Default return if no battery is available
+            soc_per_hour = np.full(shape, 0)
+            ac_to_dc_eff_fast = 1.0
+            max_ac_charge_w_fast = None
+            ac_charging_possible = False
+            bat_charge_array = np.zeros_like(ac_charge_hours_fast)
+
+        ev_soc_wh = np.zeros(individuals)
+        if ev_fast:
+            soc_ev_per_hour = np.full(shape, np.nan)
+            ev_soc_wh[:] = ev_fast.initial_soc_wh()
+        else:
+            # Default return if no electric vehicle is available
+            soc_ev_per_hour = np.full(shape, 0)
+
+        if home_appliance_fast and home_appliance_start_hours is not None:
+            home_appliance_start_hours = np.asarray(home_appliance_start_hours, dtype=int)
+            home_appliance_enabled = home_appliance_start_hours >= 0
+            home_appliance_wh_per_hour = np.full(shape, np.nan)
+            home_appliance_wh_per_hour[~home_appliance_enabled] = 0.0
+            _, home_appliance_load_curves = home_appliance_fast.load_curves_batch(
+                np.where(home_appliance_enabled, home_appliance_start_hours, start_hour),
+                start_hour,
+            )
+            home_appliance_load_curves[~home_appliance_enabled] = 0.0
+        else:
+            home_appliance_enabled = np.zeros(individuals, dtype=bool)
+            # Default return if no home appliance is available
+            home_appliance_wh_per_hour = np.full(shape, 0)
+            home_appliance_load_curves = None
+
+        for hour in range(start_hour, end_hour):
+            hour_idx = hour - start_hour
+
+            # Accumulate loads and PV generation
+            if load_rows is None:
+                consumption = np.full(individuals, load_energy_array_fast[hour])
+            else:
+                consumption = load_rows[:, hour]
+            losses_wh = np.zeros(individuals)
+
+            # Home appliances
+            if home_appliance_load_curves is not None:
+                ha_load = home_appliance_load_curves[:, hour]
+                consumption = np.where(home_appliance_enabled, consumption + ha_load, consumption)
+                home_appliance_wh_per_hour[home_appliance_enabled, hour_idx] = ha_load[
+                    home_appliance_enabled
+                ]
+
+            # E-Auto handling
+            if ev_fast:
+                soc_ev_per_hour[:, hour_idx] = (ev_soc_wh / ev_fast.capacity_wh) * 100
+                ev_factor = ev_charge_hours_fast[:, hour]
+                ev_charging = ev_factor > 0
+                if np.any(ev_charging):
+                    loaded_energy_ev, ev_charge_losses, ev_overflow = ev_fast.charge_energy_batch(
+                        ev_soc_wh, None, ev_charging, charge_factor=ev_factor
+                    )
+                    invalid |= ev_overflow
+                    consumption = np.where(ev_charging, consumption + loaded_energy_ev, consumption)
+                    losses_wh = np.where(ev_charging, losses_wh + ev_charge_losses, losses_wh)
+
+            # Save battery SOC before inverter processing = true begin-of-interval state.
+            if battery_fast:
+                soc_per_hour[:, hour_idx] = (battery_soc_wh / battery_fast.capacity_wh) * 100
+
+            # Process inverter logic
+            if inverter_fast:
+                (
+                    energy_feedin_grid_actual,
+                    energy_consumption_grid_actual,
+                    losses,
+                    self_consumption,
+                    inverter_overflow,
+                ) = inverter_fast.process_energy_batch(
+                    pv_prediction_wh_fast[hour] if pv_rows is None else pv_rows[:, hour],
+                    consumption,
+                    bat_discharge_hours_fast[:, hour] != 0,
+                    bat_charge_array[:, hour] != 0,
+                    battery_soc_wh,
+                )
+                invalid |= inverter_overflow
+            else:
+                energy_feedin_grid_actual = np.zeros(individuals)
+                energy_consumption_grid_actual = np.zeros(individuals)
+                losses = np.zeros(individuals)
+
+            # AC PV Battery Charge
+            if battery_fast and ac_charging_possible:
+                hour_ac_charge = ac_charge_hours_fast[:, hour]
+                # Cap charge factor by max_ac_charge_power_w if set
+                effective_charge_factor = hour_ac_charge
+                if max_ac_charge_w_fast is not None and battery_fast.max_charge_power_w > 0:
+                    max_dc_factor = (
+                        max_ac_charge_w_fast * ac_to_dc_eff_fast
+                    ) / battery_fast.max_charge_power_w
+                    effective_charge_factor = np.minimum(effective_charge_factor, max_dc_factor)
+                ac_charging = (hour_ac_charge > 0.0) & (effective_charge_factor > 0)
+                if np.any(ac_charging):
+                    battery_charged_energy_actual, battery_losses_actual, ac_overflow = (
+                        battery_fast.charge_energy_batch(
+                            battery_soc_wh,
+                            None,
+                            ac_charging & (bat_charge_array[:, hour] != 0),
+                            charge_factor=effective_charge_factor,
+                        )
+                    )
+                    invalid |= ac_overflow
+
+                    # DC energy entering the battery (before battery internal efficiency)
+                    dc_energy = battery_charged_energy_actual + battery_losses_actual
+                    # AC energy consumed from grid (accounts for AC→DC conversion loss)
+                    ac_energy = dc_energy / ac_to_dc_eff_fast
+                    # Inverter AC→DC conversion losses
+                    inverter_charge_losses = ac_energy - dc_energy
+
+                    consumption = np.where(ac_charging, consumption + ac_energy, consumption)
+                    energy_consumption_grid_actual = np.where(
+                        ac_charging,
+                        energy_consumption_grid_actual + ac_energy,
+                        energy_consumption_grid_actual,
+                    )
+                    losses_wh = np.where(
+                        ac_charging,
+                        losses_wh + (battery_losses_actual + inverter_charge_losses),
+                        losses_wh,
+                    )
+
+            # Update hourly arrays
+            feedin_energy_per_hour[:, hour_idx] = energy_feedin_grid_actual
+            consumption_energy_per_hour[:, hour_idx] = energy_consumption_grid_actual
+            losses_wh_per_hour[:, hour_idx] = losses_wh + losses
+            loads_energy_per_hour[:, hour_idx] = consumption
+            hourly_electricity_price = (
+                elect_price_hourly_fast[hour] if price_rows is None else price_rows[:, hour]
+            )
+            electricity_price_per_hour[:, hour_idx] = hourly_electricity_price
+
+            # Financial calculations
+            costs_per_hour[:, hour_idx] = energy_consumption_grid_actual * hourly_electricity_price
+            revenue_per_hour[:, hour_idx] = (
+                energy_feedin_grid_actual * elect_revenue_per_hour_arr_fast[hour]
+            )
+
+        total_cost = np.nansum(costs_per_hour, axis=1)
+        total_losses = np.nansum(losses_wh_per_hour, axis=1)
+        total_revenue = np.nansum(revenue_per_hour, axis=1)
+
+        return {
+            "Last_Wh_pro_Stunde": loads_energy_per_hour,
+            "Netzeinspeisung_Wh_pro_Stunde": feedin_energy_per_hour,
+            "Netzbezug_Wh_pro_Stunde": consumption_energy_per_hour,
+            "Kosten_Euro_pro_Stunde": costs_per_hour,
+            "akku_soc_pro_stunde": soc_per_hour,
+            "Einnahmen_Euro_pro_Stunde": revenue_per_hour,
+            "Gesamtbilanz_Euro": total_cost - total_revenue,  # Fitness score ("FitnessMin")
+            "EAuto_SoC_pro_Stunde": soc_ev_per_hour,
+            "Gesamteinnahmen_Euro": total_revenue,
+            "Gesamtkosten_Euro": total_cost,
+            "Verluste_Pro_Stunde": losses_wh_per_hour,
+            "Gesamt_Verluste": total_losses,
+            "Home_appliance_wh_per_hour": home_appliance_wh_per_hour,
+            "Electricity_price": electricity_price_per_hour,
+            "battery_soc_wh": battery_soc_wh,
+            "ev_soc_wh": ev_soc_wh,
+            "invalid": invalid,
+        }
+
+
+class GeneticFitness(base.Fitness):
+    """Fitness of an individual of the GENETIC algorithm - the fitness is minimized."""
+
+    weights = (-1.0,)
+
+
+class GeneticIndividual(list):
+    """Individual of the GENETIC algorithm - a genome with its fitness.
+
+    Fixed classes instead of classes created by DEAP's `creator` module, so optimizations do
+    not share module global state and can run in parallel.
+
+    Attributes:
+        extra_data (tuple[float, float, float]): Total balance, losses and unmet EV SoC of the
+            simulation. Set when the individual is evaluated.
+    """
+
+    extra_data: tuple[float, float, float]
+
+    def __init__(self, iterable: Iterable = ()) -> None:
+        """Initialize the individual with the genome and an invalid fitness."""
+        super().__init__(iterable)
+        self.fitness = GeneticFitness()
+
+
+def rand_int(low: int, up: int, rng: random.Random) -> int:
+    """Draw an integer uniformly between low and up inclusively."""
+    return rng.randint(low, up)
+
+
+def mut_uniform_int(
+    individual: list[int], low: int, up: int, indpb: float, rng: random.Random
+) -> tuple[list[int]]:
+    """Mutate genes with probability indpb to integers uniformly drawn between low and up.
+
+    Same as DEAP's `tools.mutUniformInt`, but draws from the given random generator instead of
+    the module global one.
+    """
+    for i in range(len(individual)):
+        if rng.random() < indpb:
+            individual[i] = rng.randint(low, up)
+    return (individual,)
+
+
+def cx_two_point(ind1: list[int], ind2: list[int], rng: random.Random) -> tuple[list, list]:
+    """Swap the genes between two random crossover points of two individuals in place.
+
+    Same as DEAP's `tools.cxTwoPoint`, but draws from the given random generator instead of the
+    module global one.
+    """
+    size = min(len(ind1), len(ind2))
+    cxpoint1 = rng.randint(1, size)
+    cxpoint2 = rng.randint(1, size - 1)
+    if cxpoint2 >= cxpoint1:
+        cxpoint2 += 1
+    else:  # Swap the two cx points
+        cxpoint1, cxpoint2 = cxpoint2, cxpoint1
+    ind1[cxpoint1:cxpoint2], ind2[cxpoint1:cxpoint2] = (
+        ind2[cxpoint1:cxpoint2],
+        ind1[cxpoint1:cxpoint2],
+    )
+    return ind1, ind2
+
+
+def sel_tournament(individuals: list, k: int, tournsize: int, rng: random.Random) -> list:
+    """Select k individuals, each the best of tournsize randomly chosen individuals.
+
+    Same as DEAP's `tools.selTournament`, but draws from the given random generator instead of
+    the module global one.
+    """
+    return [
+        max((rng.choice(individuals) for _ in range(tournsize)), key=lambda ind: ind.fitness)
+        for _ in range(k)
+    ]
+
+
+class GeneticOptimizationContext:
+    """Reusable setup of GENETIC optimization runs.
+
+    Holds the simulation, the devices and the configuration dependent DEAP toolbox operators of
+    an optimization run for later runs. A device or the toolbox operators are only rebuilt if
+    their configuration changed. A context is used by one optimization run at a time.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty context."""
+        self.simulation = GeneticSimulation()
+        self.toolbox: Optional[base.Toolbox] = None
+        self.toolbox_key: Optional[tuple] = None
+        self.devices: dict[str, tuple[str, Any]] = {}
+
+    def device(self, name: str, key: str, factory: Callable[[], Any]) -> Any:
+        """Get a device of the context, build it if new or its configuration changed.
+
+        Args:
+            name (str): Name of the device in the context.
+            key (str): Configuration key of the device.
+            factory (Callable): Builds the device.
+
+        Returns:
+            Any: The device.
+        """
+        cached = self.devices.get(name)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        device = factory()
+        self.devices[name] = (key, device)
+        return device
+
 
 class GeneticOptimization(OptimizationBase):
     """GENETIC algorithm to solve energy optimization."""
 
+    # Optimization contexts for reuse by later optimization runs, not in use by a run.
+    _contexts: ClassVar[list[GeneticOptimizationContext]] = []
+    _contexts_lock: ClassVar[threading.Lock] = threading.Lock()
+    _contexts_max: ClassVar[int] = 2
+
+    # Best uncovered future price per hour for the AC charge break-even penalty, only available
+    # during optimization.
+    ac_charge_best_uncovered_prices: Optional[np.ndarray] = None
+
     def __init__(
         self,
         verbose: bool = False,
@@ -435,7 +1086,14 @@ class GeneticOptimization(OptimizationBase):
     ):
         """Initialize the optimization problem with the required parameters."""
         self.opti_param: dict[str, Any] = {}
-        self.fixed_ev_hours = self.config.prediction.hours - self.config.optimization.horizon_hours
+        # Simulation steps of the optimization interval - the genome has one gene per step
+        self.step_hours = (self.config.optimization.interval or 3600) / 3600
+        self.steps_per_day = round(24 / self.step_hours)
+        self.prediction_steps = round(self.config.prediction.hours / self.step_hours)
+        # Steps after the optimization horizon, EV is not charged
+        self.fixed_ev_hours = self.prediction_steps - round(
+            self.config.optimization.horizon_hours / self.step_hours
+        )
         self.ev_possible_charge_values: list[float] = [1.0]
         # Separate charge-level list for battery AC charging (independent of EV rates).
         # Populated from parameters.pv_battery.charge_rates in optimize_ems.
@@ -445,16 +1103,32 @@ class GeneticOptimization(OptimizationBase):
         self.optimize_ev = True
         self.optimize_dc_charge = False
         self.fitness_history: dict[str, Any] = {}
+        # Process pool for parallel fitness evaluation, only available during optimization
+        self.evaluation_pool: Optional[GeneticEvaluationPool] = None
+        # Fitness cache by genome, only available during optimization
+        self.fitness_cache: Optional[cachebox.LRUCache] = None
+        self.fitness_cache_hits = 0
+        self.fitness_cache_misses = 0
 
         # Set a fixed seed for random operations if provided or in debug mode
-        if self.fix_seed is not None:
-            random.seed(self.fix_seed)
-        elif logger.level == "DEBUG":
+        if self.fix_seed is None and logger.level == "DEBUG":
             self.fix_seed = random.randint(1, 100000000000)  # noqa: S311
-            random.seed(self.fix_seed)
+        # Random generator of this optimization - concurrent optimizations do not interfere
+        self.rng = random.Random(self.fix_seed)  # noqa: S311
 
-        # Create Simulation
+        # Create Simulation - replaced by the simulation of the optimization context on run
         self.simulation = GeneticSimulation()
+        self.context: Optional[GeneticOptimizationContext] = None
+
+    @property
+    def start_step(self) -> int:
+        """Simulation step of the energy management start on the start day.
+
+        For hourly steps this is the start hour.
+        """
+        start_datetime = self.ems.start_datetime
+        seconds = start_datetime.hour * 3600 + start_datetime.minute * 60
+        return int(seconds // round(self.step_hours * 3600))
 
     def decode_charge_discharge(
         self, discharge_hours_bin: np.ndarray
@@ -511,30 +1185,30 @@ class GeneticOptimization(OptimizationBase):
             total_states = 3 * len_bat
 
         # 1. Mutating the charge_discharge part
-        charge_discharge_part = individual[: self.config.prediction.hours]
-        (charge_discharge_mutated,) = self.toolbox.mutate_charge_discharge(charge_discharge_part)
+        charge_discharge_part = individual[: self.prediction_steps]
+        (charge_discharge_mutated,) = self.toolbox.mutate_charge_discharge(
+            charge_discharge_part, rng=self.rng
+        )
 
         # Instead of a fixed clamping to 0..8 or 0..6 dynamically:
         charge_discharge_mutated = np.clip(charge_discharge_mutated, 0, total_states - 1)
-        individual[: self.config.prediction.hours] = charge_discharge_mutated
+        individual[: self.prediction_steps] = charge_discharge_mutated
 
         # 2. Mutating the EV charge part, if active
         if self.optimize_ev:
-            ev_charge_part = individual[
-                self.config.prediction.hours : self.config.prediction.hours * 2
-            ]
-            (ev_charge_part_mutated,) = self.toolbox.mutate_ev_charge_index(ev_charge_part)
-            ev_charge_part_mutated[self.config.prediction.hours - self.fixed_ev_hours :] = [
+            ev_charge_part = individual[self.prediction_steps : self.prediction_steps * 2]
+            (ev_charge_part_mutated,) = self.toolbox.mutate_ev_charge_index(
+                ev_charge_part, rng=self.rng
+            )
+            ev_charge_part_mutated[self.prediction_steps - self.fixed_ev_hours :] = [
                 0
             ] * self.fixed_ev_hours
-            individual[self.config.prediction.hours : self.config.prediction.hours * 2] = (
-                ev_charge_part_mutated
-            )
+            individual[self.prediction_steps : self.prediction_steps * 2] = ev_charge_part_mutated
 
         # 3. Mutating the appliance start time, if applicable
         if self.opti_param["home_appliance"] > 0:
             appliance_part = [individual[-1]]
-            (appliance_part_mutated,) = self.toolbox.mutate_hour(appliance_part)
+            (appliance_part_mutated,) = self.toolbox.mutate_hour(appliance_part, rng=self.rng)
             individual[-1] = appliance_part_mutated[0]
 
         return (individual,)
@@ -543,20 +1217,21 @@ class GeneticOptimization(OptimizationBase):
     def create_individual(self) -> list[int]:
         # Start with discharge states for the individual
         individual_components = [
-            self.toolbox.attr_discharge_state() for _ in range(self.config.prediction.hours)
+            self.toolbox.attr_discharge_state(rng=self.rng) for _ in range(self.prediction_steps)
         ]
 
         # Add EV charge index values if optimize_ev is True
         if self.optimize_ev:
             individual_components += [
-                self.toolbox.attr_ev_charge_index() for _ in range(self.config.prediction.hours)
+                self.toolbox.attr_ev_charge_index(rng=self.rng)
+                for _ in range(self.prediction_steps)
             ]
 
         # Add the start time of the household appliance if it's being optimized
         if self.opti_param["home_appliance"] > 0:
-            individual_components += [self.toolbox.attr_int()]
+            individual_components += [self.toolbox.attr_int(rng=self.rng)]
 
-        return creator.Individual(individual_components)
+        return GeneticIndividual(individual_components)
 
     def merge_individual(
         self,
@@ -582,7 +1257,7 @@ class GeneticOptimization(OptimizationBase):
             individual.extend(ev_charge_hours_index.tolist())
         elif self.optimize_ev:
             # If optimize_ev is active but no EV data is available, append zeros
-            individual.extend([0] * self.config.prediction.hours)
+            individual.extend([0] * self.prediction_steps)
 
         # Add dishwasher start time if applicable
         if self.opti_param.get("home_appliance", 0) > 0 and washingstart_int is not None:
@@ -604,13 +1279,13 @@ class GeneticOptimization(OptimizationBase):
         3. Dishwasher start time (integer if applicable).
         """
         # Discharge hours as a NumPy array of ints
-        discharge_hours_bin = np.array(individual[: self.config.prediction.hours], dtype=int)
+        discharge_hours_bin = np.array(individual[: self.prediction_steps], dtype=int)
 
         # EV charge hours as a NumPy array of ints (if optimize_ev is True)
         ev_charge_hours_index = (
             # append ev charging states to individual
             np.array(
-                individual[self.config.prediction.hours : self.config.prediction.hours * 2],
+                individual[self.prediction_steps : self.prediction_steps * 2],
                 dtype=int,
             )
             if self.optimize_ev
@@ -627,18 +1302,13 @@ class GeneticOptimization(OptimizationBase):
         return discharge_hours_bin, ev_charge_hours_index, washingstart_int
 
     def setup_deap_environment(self, opti_param: dict[str, Any], start_hour: int) -> None:
-        """Set up the DEAP environment with fitness and individual creation rules."""
-        self.opti_param = opti_param
-
-        # Remove existing definitions if any
-        for attr in ["FitnessMin", "Individual"]:
-            if attr in creator.__dict__:
-                del creator.__dict__[attr]
+        """Set up the DEAP toolbox with the individual creation and variation rules.
 
-        creator.create("FitnessMin", base.Fitness, weights=(-1.0,))
-        creator.create("Individual", list, fitness=creator.FitnessMin)
+        The operators that only depend on the state spaces are taken from the toolbox of the
+        optimization context if the state spaces did not change.
+        """
+        self.opti_param = opti_param
 
-        self.toolbox = base.Toolbox()
         # Battery state space uses bat_possible_charge_values; EV index space uses ev_possible_charge_values.
         len_bat = len(self.bat_possible_charge_values)
         len_ev = len(self.ev_possible_charge_values)
@@ -653,45 +1323,76 @@ class GeneticOptimization(OptimizationBase):
         else:
             total_states = 3 * len_bat
 
-        # State space: 0 .. (total_states - 1)
-        self.toolbox.register("attr_discharge_state", random.randint, 0, total_states - 1)
+        toolbox_key = (total_states, len_ev, self.optimize_ev, start_hour, self.steps_per_day)
+        if (
+            self.context is not None
+            and self.context.toolbox is not None
+            and self.context.toolbox_key == toolbox_key
+        ):
+            self.toolbox = self.context.toolbox
+        else:
+            self.toolbox = base.Toolbox()
+
+            # State space: 0 .. (total_states - 1)
+            # The operators draw from the random generator of the optimization given on call.
+            self.toolbox.register("attr_discharge_state", rand_int, 0, total_states - 1)
+
+            # EV attributes (separate index space)
+            if self.optimize_ev:
+                self.toolbox.register(
+                    "attr_ev_charge_index",
+                    rand_int,
+                    0,
+                    len_ev - 1,
+                )
 
-        # EV attributes (separate index space)
-        if self.optimize_ev:
+            # Household appliance start time
+            self.toolbox.register("attr_int", rand_int, start_hour, self.steps_per_day - 1)
+
+            self.toolbox.register("mate", cx_two_point)
+
+            # Mutation operator for battery charge/discharge states
             self.toolbox.register(
-                "attr_ev_charge_index",
-                random.randint,
-                0,
-                len_ev - 1,
+                "mutate_charge_discharge",
+                mut_uniform_int,
+                low=0,
+                up=total_states - 1,
+                indpb=0.2,
             )
 
-        # Household appliance start time
-        self.toolbox.register("attr_int", random.randint, start_hour, 23)
+            # Mutation operator for EV states (separate index space)
+            self.toolbox.register(
+                "mutate_ev_charge_index",
+                mut_uniform_int,
+                low=0,
+                up=len_ev - 1,
+                indpb=0.2,
+            )
 
-        self.toolbox.register("individual", self.create_individual)
-        self.toolbox.register("population", tools.initRepeat, list, self.toolbox.individual)
-        self.toolbox.register("mate", tools.cxTwoPoint)
+            # Mutation for household appliance
+            self.toolbox.register(
+                "mutate_hour",
+                mut_uniform_int,
+                low=start_hour,
+                up=self.steps_per_day - 1,
+                indpb=0.2,
+            )
 
-        # Mutation operator for battery charge/discharge states
-        self.toolbox.register(
-            "mutate_charge_discharge", tools.mutUniformInt, low=0, up=total_states - 1, indpb=0.2
-        )
+            self.toolbox.register("select", sel_tournament, tournsize=3)
 
-        # Mutation operator for EV states (separate index space)
-        self.toolbox.register(
-            "mutate_ev_charge_index",
-            tools.mutUniformInt,
-            low=0,
-            up=len_ev - 1,
-            indpb=0.2,
-        )
+            if self.context is not None:
+                self.context.toolbox = self.toolbox
+                self.context.toolbox_key = toolbox_key
 
-        # Mutation for household appliance
-        self.toolbox.register("mutate_hour", tools.mutUniformInt, low=start_hour, up=23, indpb=0.2)
+        # Operators bound to this optimization
+        self.toolbox.register("individual", self.create_individual)
+        self.toolbox.register("population", tools.initRepeat, list, self.toolbox.individual)
 
         # Custom mutate function remains unchanged
         self.toolbox.register("mutate", self.mutate)
-        self.toolbox.register("select", tools.selTournament, tournsize=3)
+
+        # Score whole generations by the population-batched simulation
+        self.toolbox.register("map", self.map_evaluate)
 
     def evaluate_inner(self, individual: list[int]) -> dict[str, Any]:
         """Simulates the energy management system (EMS) using the provided individual solution.
@@ -711,31 +1412,28 @@ class GeneticOptimization(OptimizationBase):
             discharge_hours_bin
         )
 
-        self.simulation.bat_discharge_hours = discharge
-        # Set DC charge hours only if DC optimization is enabled
-        if self.optimize_dc_charge:
-            self.simulation.dc_charge_hours = dc_charge_hours
-        else:
-            self.simulation.dc_charge_hours = np.full(self.config.prediction.hours, 1)
-        self.simulation.ac_charge_hours = ac_charge_hours
-
         if ev_charge_hours_index is not None:
-            ev_charge_hours_float = np.array(
-                [self.ev_possible_charge_values[i] for i in ev_charge_hours_index],
-                float,
-            )
-            # discharge is set to 0 by default
-            self.simulation.ev_charge_hours = ev_charge_hours_float
+            ev_charge_hours_float = np.asarray(self.ev_possible_charge_values, dtype=float)[
+                ev_charge_hours_index
+            ]
         else:
-            # discharge is set to 0 by default
-            self.simulation.ev_charge_hours = np.full(self.config.prediction.hours, 0)
+            ev_charge_hours_float = 0.0
+
+        # Set DC charge hours only if DC optimization is enabled
+        # EV discharge is set to 0 by default
+        self.simulation.set_actions(
+            ac_charge_hours=ac_charge_hours,
+            dc_charge_hours=dc_charge_hours if self.optimize_dc_charge else 1.0,
+            bat_discharge_hours=discharge,
+            ev_charge_hours=ev_charge_hours_float,
+        )
 
         # Do the simulation and return result.
-        return self.simulation.simulate(self.ems.start_datetime.hour)
+        return self.simulation.simulate(self.start_step)
 
     def evaluate(
         self,
-        individual: list[int],
+        individual: GeneticIndividual,
         parameters: GeneticOptimizationParameters,
         start_hour: int,
         worst_case: bool,
@@ -747,13 +1445,13 @@ class GeneticOptimization(OptimizationBase):
         fitness score compatible with DEAP (i.e., returned as a 1-tuple).
 
         Args:
-            individual (list[int]):
+            individual (GeneticIndividual):
                 The genome representing one candidate solution.
             parameters (GeneticOptimizationParameters):
                 Optimization parameters that influence simulation behavior,
                 constraints, and scoring logic.
             start_hour (int):
-                The simulation start hour (0–23 or domain-specific).
+                The simulation start step - the hour for hourly steps.
                 Used to initialize time-based scheduling or constraints.
             worst_case (bool):
                 If True, evaluates the solution under worst-case assumptions
@@ -780,6 +1478,127 @@ class GeneticOptimization(OptimizationBase):
             # Return bad fitness score ("FitnessMin") in case of an exception
             return (100000.0,)
 
+        return self.fitness(
+            individual,
+            simulation_result,
+            ac_charge_hours=self.simulation.ac_charge_hours,
+            battery_energy_content=(
+                self.simulation.battery.current_energy_content() if self.simulation.battery else 0.0
+            ),
+            ev_soc_percentage=(
+                self.simulation.ev.current_soc_percentage() if self.simulation.ev else None
+            ),
+            parameters=parameters,
+            start_hour=start_hour,
+            worst_case=worst_case,
+        )
+
+    def ac_charge_break_even_penalties(
+        self, ac_charge_hours: np.ndarray, start_hour: int
+    ) -> Optional[np.ndarray]:
+        """Calculate the AC charging break-even penalty per hour.
+
+        AC charging is penalised in hours where the best electricity price still available for
+        new AC charge does not reach the break-even price of the charge price divided by the
+        round-trip efficiency.
+
+        Args:
+            ac_charge_hours (np.ndarray): AC charge factors per hour. Leading axes (e.g. several
+                decisions) are kept; the hours are on the last axis.
+            start_hour (int): First hour to calculate the penalty for.
+
+        Returns:
+            Optional[np.ndarray]: Penalty per hour from `start_hour` on with the shape of the
+                given AC charge factors, 0 for justified hours. None if no penalty applies to the
+                simulation setup.
+        """
+        if (
+            not self.simulation.battery
+            or not self.simulation.inverter
+            or self.simulation.elect_price_hourly is None
+            or self.simulation.load_energy_array is None
+        ):
+            return None
+
+        inv = self.simulation.inverter
+        bat = self.simulation.battery
+
+        # Full round-trip efficiency: 1 Wh drawn from grid → η Wh delivered to AC load
+        round_trip_eff = (
+            inv.ac_to_dc_efficiency
+            * bat.charging_efficiency
+            * bat.discharging_efficiency
+            * inv.dc_to_ac_efficiency
+        )
+        if round_trip_eff <= 0:
+            return None
+
+        prices_arr = self.simulation.elect_price_hourly
+        n = len(prices_arr)
+
+        # Best price still available for new AC charge per hour - the same for all
+        # individuals, thus usually precomputed once per optimization run.
+        best_uncovered_prices = self.ac_charge_best_uncovered_prices
+        if best_uncovered_prices is None:
+            best_uncovered_prices = self.calculate_ac_charge_best_uncovered_prices()
+
+        # Configurable penalty multiplier (default 1 = economic loss in currency units)
+        try:
+            ac_penalty_factor = float(
+                self.config.optimization.genetic.penalties["ac_charge_break_even"]
+            )
+        except Exception:
+            ac_penalty_factor = 1.0
+
+        end_hour = min(np.shape(ac_charge_hours)[-1], n)
+        ac_factor = np.asarray(ac_charge_hours, dtype=float)[..., start_hour:end_hour]
+        charge_price = np.asarray(prices_arr[start_hour:end_hour], dtype=float)
+        best_uncovered_price = best_uncovered_prices[start_hour:end_hour]
+
+        # Price that a future discharge hour must reach to break even
+        break_even_price = charge_price / round_trip_eff
+
+        # AC charging at these hours is economically unjustified.
+        unjustified = (
+            (ac_factor > 0.0) & (charge_price > 0) & (best_uncovered_price < break_even_price)
+        )
+        # Penalty = excess cost per Wh × AC energy requested this hour.
+        ac_wh = bat.max_charge_wh * ac_factor / max(inv.ac_to_dc_efficiency, 1e-9)
+        excess_cost_per_wh = break_even_price - best_uncovered_price
+        return np.where(unjustified, ac_wh * excess_cost_per_wh * ac_penalty_factor, 0.0)
+
+    def fitness(
+        self,
+        individual: GeneticIndividual,
+        simulation_result: dict[str, Any],
+        ac_charge_hours: Optional[np.ndarray],
+        battery_energy_content: float,
+        ev_soc_percentage: Optional[float],
+        parameters: GeneticOptimizationParameters,
+        start_hour: int,
+        worst_case: bool,
+    ) -> tuple[float]:
+        """Calculate the fitness score of an individual from its simulation result.
+
+        Shared by `evaluate` and `evaluate_population`. The device end states are given
+        explicitly as the population-batched simulation does not keep them in the device objects.
+
+        Args:
+            individual (GeneticIndividual): The genome of the simulated individual. EV charge
+                hours that can not be used are reset in place.
+            simulation_result (dict[str, Any]): Simulation result of the individual.
+            ac_charge_hours (np.ndarray, optional): Decoded AC charge factors of the individual.
+            battery_energy_content (float): Usable battery energy at the end of the simulation
+                [Wh].
+            ev_soc_percentage (float, optional): EV state of charge at the end of the simulation
+                [%], None if there is no EV.
+            parameters (GeneticOptimizationParameters): Optimization parameters.
+            start_hour (int): The simulation start hour.
+            worst_case (bool): Evaluate under worst-case assumptions.
+
+        Returns:
+            tuple[float]: A single-element tuple containing the computed fitness score.
+        """
         total_balance = simulation_result["Gesamtbilanz_Euro"] * (-1.0 if worst_case else 1.0)
 
         # EV 100% & charge not allowed
@@ -853,17 +1672,16 @@ class GeneticOptimization(OptimizationBase):
         #     individual[:] = adjusted_individual
 
         # More metrics
-        individual.extra_data = (  # type: ignore[attr-defined]
+        individual.extra_data = (
             simulation_result["Gesamtbilanz_Euro"],
             simulation_result["Gesamt_Verluste"],
-            parameters.ev.min_soc_percentage - self.simulation.ev.current_soc_percentage()
-            if parameters.ev and self.simulation.ev
+            parameters.ev.min_soc_percentage - ev_soc_percentage
+            if parameters.ev and ev_soc_percentage is not None
             else 0,
         )
 
         # Adjust total balance with battery value and penalties for unmet SOC
         if self.simulation.battery:
-            battery_energy_content = self.simulation.battery.current_energy_content()
             # Apply DC→AC inverter efficiency to residual battery value
             # (stored DC energy must pass through inverter to be usable as AC)
             if self.simulation.inverter:
@@ -884,90 +1702,14 @@ class GeneticOptimization(OptimizationBase):
         # This penalty does not double-count the simulation result – it amplifies the "bad
         # decision" signal so that the genetic algorithm converges faster away from
         # unprofitable charging regions.
-        if (
-            self.simulation.battery
-            and self.simulation.inverter
-            and self.simulation.ac_charge_hours is not None
-            and self.simulation.elect_price_hourly is not None
-            and self.simulation.load_energy_array is not None
-        ):
-            inv = self.simulation.inverter
-            bat = self.simulation.battery
-
-            # Full round-trip efficiency: 1 Wh drawn from grid → η Wh delivered to AC load
-            round_trip_eff = (
-                inv.ac_to_dc_efficiency
-                * bat.charging_efficiency
-                * bat.discharging_efficiency
-                * inv.dc_to_ac_efficiency
-            )
-
-            if round_trip_eff > 0:
-                ac_charge_arr = self.simulation.ac_charge_hours
-                prices_arr = self.simulation.elect_price_hourly
-                load_arr = self.simulation.load_energy_array
-                n = len(prices_arr)
-
-                # Usable AC energy already in battery from prior PV charging (zero grid cost).
-                # This covers the most expensive future hours first, pushing AC charging demand
-                # to cheaper hours where the break-even hurdle may not be met.
-                initial_soc_wh = (bat.initial_soc_percentage / 100.0) * bat.capacity_wh
-                free_ac_wh = (
-                    max(0.0, initial_soc_wh - bat.min_soc_wh)
-                    * bat.discharging_efficiency
-                    * inv.dc_to_ac_efficiency
-                )
-
-                # Configurable penalty multiplier (default 1 = economic loss in currency units)
-                try:
-                    ac_penalty_factor = float(
-                        self.config.optimization.genetic.penalties["ac_charge_break_even"]
-                    )
-                except Exception:
-                    ac_penalty_factor = 1.0
-
-                for hour in range(start_hour, min(len(ac_charge_arr), n)):
-                    ac_factor = ac_charge_arr[hour]
-                    if ac_factor <= 0.0:
-                        continue
-
-                    charge_price = prices_arr[hour]
-                    if charge_price <= 0:
-                        continue
-
-                    # Price that a future discharge hour must reach to break even
-                    break_even_price = charge_price / round_trip_eff
-
-                    # Build list of (price, load_wh) for all future hours in the horizon
-                    future = [
-                        (float(prices_arr[h]), float(load_arr[h])) for h in range(hour + 1, n)
-                    ]
-                    # Sort descending by price so we "use" the most expensive hours first
-                    future.sort(key=lambda x: -x[0])
-
-                    # Consume free PV energy against the highest-price future hours.
-                    # The first uncovered (partially or fully) hour defines the best
-                    # price still available for the new AC charge.
-                    remaining_free = free_ac_wh
-                    best_uncovered_price = 0.0
-                    for fp, fl in future:
-                        if remaining_free >= fl:
-                            # Entire expensive hour is already covered by free PV energy
-                            remaining_free -= fl
-                        else:
-                            # First hour not (fully) covered: this is where new charge goes
-                            best_uncovered_price = fp
-                            break
-
-                    if best_uncovered_price < break_even_price:
-                        # AC charging at this hour is economically unjustified.
-                        # Penalty = excess cost per Wh × DC energy requested this hour.
-                        dc_wh = bat.max_charge_power_w * ac_factor
-                        ac_wh = dc_wh / max(inv.ac_to_dc_efficiency, 1e-9)
-                        excess_cost_per_wh = break_even_price - best_uncovered_price
-                        total_balance += ac_wh * excess_cost_per_wh * ac_penalty_factor
-
-        if self.optimize_ev and parameters.ev and self.simulation.ev:
+        if ac_charge_hours is not None:
+            ac_charge_penalties = self.ac_charge_break_even_penalties(ac_charge_hours, start_hour)
+            if ac_charge_penalties is not None:
+                # Accumulate hour by hour to keep the exact floating point result
+                for penalty in ac_charge_penalties[ac_charge_penalties != 0.0]:
+                    total_balance += penalty
+
+        if self.optimize_ev and parameters.ev and ev_soc_percentage is not None:
             try:
                 penalty = self.config.optimization.genetic.penalties["ev_soc_miss"]
             except Exception:
@@ -976,7 +1718,6 @@ class GeneticOptimization(OptimizationBase):
                 logger.error(
                     "Penalty function parameter `ev_soc_miss` not configured, using {}.", penalty
                 )
-            ev_soc_percentage = self.simulation.ev.current_soc_percentage()
             if (
                 ev_soc_percentage < parameters.ev.min_soc_percentage
                 or ev_soc_percentage > parameters.ev.max_soc_percentage
@@ -985,6 +1726,554 @@ class GeneticOptimization(OptimizationBase):
 
         return (total_balance,)
 
+    def calculate_ac_charge_best_uncovered_prices(self) -> np.ndarray:
+        """Calculate the best future price still available for AC charged energy per hour.
+
+        Energy already stored in the battery (from PV, zero grid cost) covers the most expensive
+        future hours first. For every hour of the simulation the future hours are consumed in
+        order of descending price until the free energy is exhausted; the price of the first
+        hour that is not (fully) covered is the best price new AC charge energy can be sold at.
+
+        Prices, loads and the free battery energy do not change during an optimization run, so
+        the prices are calculated once per run and the break-even penalty becomes a lookup.
+
+        Returns:
+            np.ndarray: Best uncovered future price per hour, 0 if there is none.
+        """
+        inv = self.simulation.inverter
+        bat = self.simulation.battery
+        prices_arr = self.simulation.elect_price_hourly
+        load_arr = self.simulation.load_energy_array
+        if inv is None or bat is None or prices_arr is None or load_arr is None:
+            return np.zeros(0 if prices_arr is None else len(prices_arr))
+        n = len(prices_arr)
+
+        # Usable AC energy already in battery from prior PV charging (zero grid cost).
+        initial_soc_wh = (bat.initial_soc_percentage / 100.0) * bat.capacity_wh
+        free_ac_wh = (
+            max(0.0, initial_soc_wh - bat.min_soc_wh)
+            * bat.discharging_efficiency
+            * inv.dc_to_ac_efficiency
+        )
+
+        # All hours sorted descending by price, ties in hour order. The future hours of an hour
+        # keep this order.
+        future = sorted(
+            ((h, float(prices_arr[h]), float(load_arr[h])) for h in range(n)),
+            key=lambda x: -x[1],
+        )
+
+        best_uncovered_prices = np.zeros(n)
+        for hour in range(n):
+            remaining_free = free_ac_wh
+            for fh, fp, fl in future:
+                if fh <= hour:
+                    continue
+                if remaining_free >= fl:
+                    # Entire expensive hour is already covered by free PV energy
+                    remaining_free -= fl
+                else:
+                    # First hour not (fully) covered: this is where new charge goes
+                    best_uncovered_prices[hour] = fp
+                    break
+        return best_uncovered_prices
+
+    def evaluate_population(
+        self,
+        population: list[GeneticIndividual],
+        parameters: GeneticOptimizationParameters,
+        start_hour: int,
+        worst_case: bool,
+    ) -> list[tuple[float]]:
+        """Evaluate the fitness scores of a whole population in one call.
+
+        Population-batched counterpart of `evaluate`. The fitness scores are identical to calling
+        `evaluate` for each individual.
+
+        Individuals with a genome that was already evaluated during the optimization run are
+        taken from the fitness cache instead of being simulated again. The cache also remembers
+        the in place repair of the genome done by `fitness`, so a cached individual ends up
+        exactly like a simulated one.
+
+        Args:
+            population (list[GeneticIndividual]): The genomes of the individuals to evaluate.
+            parameters (GeneticOptimizationParameters): Optimization parameters.
+            start_hour (int): The simulation start hour.
+            worst_case (bool): Evaluate under worst-case assumptions.
+
+        Returns:
+            list[tuple[float]]: The fitness score per individual as DEAP compatible tuples.
+        """
+        if self.fitness_cache is None:
+            return self.evaluate_population_inner(population, parameters, start_hour, worst_case)
+
+        keys = [(tuple(individual), worst_case) for individual in population]
+
+        # Only simulate genomes that are neither cached nor duplicates within the population
+        entries: dict[tuple[tuple[int, ...], bool], tuple[Any, ...]] = {}
+        misses: dict[tuple[tuple[int, ...], bool], GeneticIndividual] = {}
+        for key, individual in zip(keys, population):
+            if key in entries or key in misses:
+                continue
+            entry = self.fitness_cache.get(key)
+            if entry is None:
+                misses[key] = individual
+            else:
+                entries[key] = entry
+        miss_fitnesses = self.evaluate_population_inner(
+            list(misses.values()), parameters, start_hour, worst_case
+        )
+        for (key, individual), miss_fitness in zip(misses.items(), miss_fitnesses):
+            entry = (miss_fitness, getattr(individual, "extra_data", None), list(individual))
+            self.fitness_cache[key] = entry
+            entries[key] = entry
+        self.fitness_cache_misses += len(misses)
+        self.fitness_cache_hits += len(population) - len(misses)
+
+        fitnesses: list[tuple[float]] = []
+        for key, individual in zip(keys, population):
+            cached_fitness, extra_data, genome = entries[key]
+            # Apply the repair of the genome and the metrics of the evaluated individual
+            individual[:] = genome
+            if extra_data is not None:
+                individual.extra_data = extra_data
+            fitnesses.append(cached_fitness)
+        return fitnesses
+
+    def evaluate_population_inner(
+        self,
+        population: list[GeneticIndividual],
+        parameters: GeneticOptimizationParameters,
+        start_hour: int,
+        worst_case: bool,
+    ) -> list[tuple[float]]:
+        """Evaluates the fitness scores of a whole population without the fitness cache.
+
+        All individuals are simulated together by `GeneticSimulation.simulate_batch`.
+
+        This is an internal function.
+        """
+        if not population:
+            return []
+
+        try:
+            genomes = np.array([list(individual) for individual in population])
+            prediction_hours = self.prediction_steps
+            discharge_hours_bin = genomes[:, :prediction_hours].astype(int)
+            ac_charge_hours, dc_charge_hours, discharge = self.decode_charge_discharge(
+                discharge_hours_bin
+            )
+            if not self.optimize_dc_charge:
+                dc_charge_hours = np.ones_like(discharge_hours_bin, dtype=float)
+            if self.optimize_ev:
+                ev_charge_hours_index = genomes[:, prediction_hours : prediction_hours * 2].astype(
+                    int
+                )
+                ev_charge_hours = np.asarray(self.ev_possible_charge_values, dtype=float)[
+                    ev_charge_hours_index
+                ]
+            else:
+                ev_charge_hours = np.zeros_like(discharge_hours_bin, dtype=float)
+            home_appliance_start_hours: Optional[np.ndarray] = None
+            if self.opti_param.get("home_appliance", 0) > 0:
+                home_appliance_start_hours = genomes[:, -1].astype(int)
+                # Start hour 0 denotes no start (see evaluate_inner)
+                home_appliance_start_hours[home_appliance_start_hours == 0] = -1
+
+            simulate_batch = (
+                self.evaluation_pool.simulate_batch
+                if self.evaluation_pool
+                else self.simulation.simulate_batch
+            )
+            scenarios = self.simulation.load_energy_scenarios is not None
+            batch_result = simulate_batch(
+                self.start_step,
+                ac_charge_hours=ac_charge_hours,
+                dc_charge_hours=dc_charge_hours,
+                bat_discharge_hours=discharge,
+                ev_charge_hours=ev_charge_hours,
+                home_appliance_start_hours=home_appliance_start_hours,
+                scenarios=scenarios,
+            )
+            if scenarios:
+                batch_result = self.aggregate_scenarios(batch_result, len(population), parameters)
+        except Exception as e:
+            logger.warning("Population simulation failed - evaluating one by one: {}", e)
+            return [
+                self.evaluate(individual, parameters, start_hour, worst_case)
+                for individual in population
+            ]
+
+        # Usable battery energy at the end of the simulation - see Battery.current_energy_content()
+        battery = self.simulation.battery
+        if battery:
+            battery_energy_content = np.maximum(
+                (batch_result["battery_soc_wh"] - battery.min_soc_wh)
+                * battery.discharging_efficiency,
+                0.0,
+            )
+        else:
+            battery_energy_content = np.zeros(len(population))
+        ev = self.simulation.ev
+        fitnesses: list[tuple[float]] = []
+        for idx, individual in enumerate(population):
+            if batch_result["invalid"][idx]:
+                # Return bad fitness score ("FitnessMin") in case of a simulation error
+                fitnesses.append((100000.0,))
+                continue
+            simulation_result = {
+                key: value[idx]
+                for key, value in batch_result.items()
+                if key not in ("battery_soc_wh", "ev_soc_wh", "invalid")
+            }
+            fitnesses.append(
+                self.fitness(
+                    individual,
+                    simulation_result,
+                    ac_charge_hours=ac_charge_hours[idx],
+                    battery_energy_content=battery_energy_content[idx],
+                    ev_soc_percentage=(
+                        (batch_result["ev_soc_wh"][idx] / ev.capacity_wh) * 100 if ev else None
+                    ),
+                    parameters=parameters,
+                    start_hour=start_hour,
+                    worst_case=worst_case,
+                )
+            )
+        return fitnesses
+
+    def aggregate_scenarios(
+        self,
+        batch_result: dict[str, Any],
+        individuals: int,
+        parameters: GeneticOptimizationParameters,
+    ) -> dict[str, Any]:
+        """Aggregate the scenario results of a population to one result per individual.
+
+        The cost of an individual in a scenario is the total balance less the residual value of
+        the battery energy at the end of the scenario. The cost over all scenarios is either the
+        expected cost or the conditional value at risk (CVaR) - the mean cost of the worst
+        scenarios - as configured by `scenario_objective`.
+
+        The aggregated total balance is set such that `fitness` applied to the aggregated
+        result scores the individual by the aggregated cost. All other values are the means
+        over the scenarios. An individual is invalid if any of its scenarios is invalid.
+
+        Args:
+            batch_result (dict[str, Any]): Result of `GeneticSimulation.simulate_batch` with
+                scenarios - the scenarios of an individual are adjacent.
+            individuals (int): Number of individuals.
+            parameters (GeneticOptimizationParameters): Optimization parameters.
+
+        Returns:
+            dict[str, Any]: Same keys and shapes as `GeneticSimulation.simulate_batch` without
+            scenarios.
+        """
+        aggregated: dict[str, Any] = {}
+        for key, value in batch_result.items():
+            value = value.reshape(individuals, -1, *value.shape[1:])
+            if key == "invalid":
+                aggregated[key] = value.any(axis=1)
+            else:
+                aggregated[key] = value.mean(axis=1)
+
+        balance = batch_result["Gesamtbilanz_Euro"].reshape(individuals, -1)
+        battery = self.simulation.battery
+        if battery:
+            value_per_wh = parameters.ems.price_per_wh_battery
+            if self.simulation.inverter:
+                value_per_wh *= self.simulation.inverter.dc_to_ac_efficiency
+
+            def residual_value(battery_soc_wh: np.ndarray) -> np.ndarray:
+                # Same valuation as `fitness`
+                return (
+                    np.maximum(
+                        (battery_soc_wh - battery.min_soc_wh) * battery.discharging_efficiency,
+                        0.0,
+                    )
+                    * value_per_wh
+                )
+
+            costs = balance - residual_value(
+                batch_result["battery_soc_wh"].reshape(individuals, -1)
+            )
+            aggregated_residual_value = residual_value(aggregated["battery_soc_wh"])
+        else:
+            costs = balance
+            aggregated_residual_value = np.zeros(individuals)
+
+        settings = self.config.optimization.genetic
+        if settings.scenario_objective == "cvar":
+            # Mean cost of the (1 - alpha) worst scenarios
+            worst = max(1, math.ceil((1.0 - settings.scenario_cvar_alpha) * costs.shape[1]))
+            cost = np.sort(costs, axis=1)[:, -worst:].mean(axis=1)
+        else:
+            cost = costs.mean(axis=1)
+        aggregated["Gesamtbilanz_Euro"] = cost + aggregated_residual_value
+        return aggregated
+
+    def map_evaluate(self, func: Any, iterable: Any) -> list[Any]:
+        """Map function for the DEAP toolbox.
+
+        Evaluations of the toolbox `evaluate` function are routed to the population-batched
+        `evaluate_population`, so that a whole generation is scored in one call. Any other
+        function is mapped one by one.
+        """
+        if func is getattr(self.toolbox, "evaluate", None) and hasattr(
+            self.toolbox, "evaluate_population"
+        ):
+            return self.toolbox.evaluate_population(list(iterable))
+        return list(map(func, iterable))
+
+    def prepare_scenarios(self, parameters: GeneticOptimizationParameters) -> None:
+        """Prepare the forecast scenarios of the simulation for robust optimization.
+
+        The scenarios are generated once per optimization run and shared by all evaluations.
+        The standard deviation of the load forecast is taken from the load prediction if
+        available, otherwise it is given by the configured relative load uncertainty. PV and
+        price deviations are given by the configured relative uncertainties.
+
+        Args:
+            parameters (GeneticOptimizationParameters): Optimization parameters.
+        """
+        settings = self.config.optimization.genetic
+        if settings.scenarios <= 0:
+            return
+        load = np.array(parameters.ems.total_load, float)
+        if parameters.ems.total_load_std is not None:
+            load_std = np.array(parameters.ems.total_load_std, float)
+        else:
+            load_std = settings.scenario_load_uncertainty * load
+        self.simulation.prepare_scenarios(
+            settings.scenarios,
+            load_std=load_std,
+            pv_std=settings.scenario_pv_uncertainty
+            * np.array(parameters.ems.pv_forecast_wh, float),
+            price_std=settings.scenario_price_uncertainty
+            * np.abs(np.array(parameters.ems.electricity_price_per_wh, float)),
+            seed=self.fix_seed,
+        )
+        logger.debug("Prepared {} forecast scenarios.", settings.scenarios)
+
+    def create_evaluation_pool(self) -> Optional[GeneticEvaluationPool]:
+        """Get the process pool for parallel fitness evaluation of the prepared simulation.
+
+        The worker processes are kept for later optimization runs; hand the pool back by
+        `release_evaluation_pool`.
+
+        Returns:
+            Optional[GeneticEvaluationPool]: The pool, or None if evaluation shall be serial.
+        """
+        try:
+            workers = resolve_workers(self.config.optimization.genetic.workers)
+        except Exception:
+            workers = 1
+        if workers < 2:
+            return None
+        try:
+            pool = acquire_evaluation_pool(self.simulation, workers=workers)
+        except Exception as e:
+            logger.warning("Parallel evaluation not available - evaluating serially: {}", e)
+            return None
+        logger.debug("Parallel evaluation by {} worker processes.", workers)
+        return pool
+
+    def create_fitness_cache(self) -> Optional[cachebox.LRUCache]:
+        """Create the fitness cache for an optimization run.
+
+        Returns:
+            Optional[cachebox.LRUCache]: The cache, or None if fitness shall not be cached.
+        """
+        try:
+            maxsize = self.config.optimization.genetic.fitness_cache_size
+        except Exception:
+            maxsize = 0
+        if not maxsize:
+            return None
+        return cachebox.LRUCache(maxsize=maxsize)
+
+    def warm_start_population(self, population: list[Any], start_solution: list[float]) -> int:
+        """Seed the initial population from a (time shifted) start solution.
+
+        The first individuals of the population are replaced by the start solution and mutated
+        variants of it. The fraction of seeded individuals is given by the `warm_start_fraction`
+        configuration.
+
+        Args:
+            population (list): The initial population.
+            start_solution (list[float]): The start solution genome.
+
+        Returns:
+            int: Number of seeded individuals.
+        """
+        if len(start_solution) != len(population[0]):
+            logger.info(
+                "Start solution length {} does not match genome length {} - not used.",
+                len(start_solution),
+                len(population[0]),
+            )
+            return 0
+
+        # Keep the genes in the state spaces of this run
+        len_bat = len(self.bat_possible_charge_values)
+        total_states = 3 * len_bat + 2 if self.optimize_dc_charge else 3 * len_bat
+        hours = self.prediction_steps
+        genome = np.rint(start_solution).astype(int)
+        genome[:hours] = np.clip(genome[:hours], 0, total_states - 1)
+        if self.optimize_ev:
+            genome[hours : hours * 2] = np.clip(
+                genome[hours : hours * 2], 0, len(self.ev_possible_charge_values) - 1
+            )
+        start_individual = GeneticIndividual(genome.tolist())
+
+        seeds = max(
+            1, round(self.config.optimization.genetic.warm_start_fraction * len(population))
+        )
+        population[0] = start_individual
+        for i in range(1, seeds):
+            (population[i],) = self.toolbox.mutate(self.toolbox.clone(start_individual))
+        logger.debug("Warm start: {} individuals seeded from start solution.", seeds)
+        return seeds
+
+    def heuristic_individuals(self) -> list[list[int]]:
+        """Create rule based individuals from the price, PV and load forecast.
+
+        The battery schedules are:
+
+        - Price quantiles: AC charge in the hours with a price below the lower quantile,
+          discharge in the hours with a price above the upper quantile, idle otherwise.
+        - PV surplus: Charge from PV surplus only, discharge in all other hours.
+
+        The electric vehicle is charged at full rate in the cheapest hours before the end of the
+        optimization horizon, as many hours as needed to reach its minimum state of charge.
+
+        Returns:
+            list[list[int]]: Genomes of the rule based individuals.
+        """
+        hours = self.prediction_steps
+        start_hour = self.start_step
+        if start_hour >= hours:
+            return []
+        prices = np.asarray(self.simulation.elect_price_hourly, float)[:hours]
+        pv = np.asarray(self.simulation.pv_prediction_wh, float)[:hours]
+        load = np.asarray(self.simulation.load_energy_array, float)[:hours]
+
+        # Battery states
+        len_bat = len(self.bat_possible_charge_values)
+        idle = 3 * len_bat + 1 if self.optimize_dc_charge else 0  # PV may charge the battery
+        discharge = len_bat
+        ac_charge = 2 * len_bat + int(np.argmax(self.bat_possible_charge_values))
+
+        schedules = []
+        for low, high in ((0.1, 0.9), (0.2, 0.8), (0.3, 0.7), (None, 0.5), (None, 0.75)):
+            schedule = np.full(hours, idle, dtype=int)
+            schedule[prices >= np.quantile(prices[start_hour:], high)] = discharge
+            if low is not None:
+                schedule[prices <= np.quantile(prices[start_hour:], low)] = ac_charge
+            schedules.append(schedule)
+        schedules.append(np.where(pv > load, idle, discharge).astype(int))
+
+        # Electric vehicle - charge in the cheapest hours before the deadline
+        ev_charge_hours_index = None
+        if self.optimize_ev:
+            ev_charge_hours_index = np.zeros(hours, dtype=int)
+            ev = self.simulation.ev
+            deadline = hours - self.fixed_ev_hours
+            if ev is not None and deadline > start_hour:
+                full_rate = int(np.argmax(self.ev_possible_charge_values))
+                charge_per_hour_wh = (
+                    ev.max_charge_wh
+                    * self.ev_possible_charge_values[full_rate]
+                    * ev.charging_efficiency
+                )
+                needed_wh = (
+                    max(ev.parameters.min_soc_percentage - ev.initial_soc_percentage, 0)
+                    / 100
+                    * ev.capacity_wh
+                )
+                if charge_per_hour_wh > 0 and needed_wh > 0:
+                    charge_hours = min(
+                        math.ceil(needed_wh / charge_per_hour_wh), deadline - start_hour
+                    )
+                    cheapest_hours = start_hour + np.argsort(
+                        prices[start_hour:deadline], kind="stable"
+                    )
+                    ev_charge_hours_index[cheapest_hours[:charge_hours]] = full_rate
+
+        individuals = []
+        for schedule in schedules:
+            washingstart_int = (
+                self.toolbox.attr_int(rng=self.rng)
+                if self.opti_param.get("home_appliance", 0) > 0
+                else None
+            )
+            individuals.append(
+                self.merge_individual(schedule, ev_charge_hours_index, washingstart_int)
+            )
+        return individuals
+
+    def heuristic_seed_population(self, population: list[Any], seeded: int = 0) -> int:
+        """Seed the initial population with rule based individuals.
+
+        The individuals after the already seeded ones are replaced by the rule based individuals
+        and mutated variants of them. The fraction of seeded individuals is given by the
+        `heuristic_seeding_fraction` configuration.
+
+        Args:
+            population (list): The initial population.
+            seeded (int): Number of individuals at the start of the population that are already
+                seeded (e.g. by warm start) and are kept.
+
+        Returns:
+            int: Number of seeded individuals.
+        """
+        fraction = self.config.optimization.genetic.heuristic_seeding_fraction
+        if fraction <= 0:
+            return 0
+        heuristics = self.heuristic_individuals()
+        seeds = min(max(1, round(fraction * len(population))), len(population) - seeded)
+        if not heuristics or seeds <= 0:
+            return 0
+        for i in range(seeds):
+            individual = GeneticIndividual(heuristics[i % len(heuristics)])
+            if i >= len(heuristics):
+                (individual,) = self.toolbox.mutate(individual)
+            population[seeded + i] = individual
+        logger.debug("Heuristic seeding: {} individuals seeded from rule based schedules.", seeds)
+        return seeds
+
+    def vary(self, population: list, lambda_: int, cxpb: float, mutpb: float) -> list:
+        """Create the offspring of a population by crossover, mutation or reproduction.
+
+        Same as DEAP's `algorithms.varOr`, but draws from the random generator of the
+        optimization instead of the module global one.
+
+        Args:
+            population (list): Individuals to vary.
+            lambda_ (int): Number of offspring individuals.
+            cxpb (float): Probability of an offspring to be created by crossover.
+            mutpb (float): Probability of an offspring to be created by mutation.
+
+        Returns:
+            list: The offspring individuals.
+        """
+        offspring = []
+        for _ in range(lambda_):
+            op_choice = self.rng.random()
+            if op_choice < cxpb:  # Apply crossover
+                ind1, ind2 = [self.toolbox.clone(i) for i in self.rng.sample(population, 2)]
+                ind1, ind2 = self.toolbox.mate(ind1, ind2, rng=self.rng)
+                del ind1.fitness.values
+                offspring.append(ind1)
+            elif op_choice < cxpb + mutpb:  # Apply mutation
+                ind = self.toolbox.clone(self.rng.choice(population))
+                (ind,) = self.toolbox.mutate(ind)
+                del ind.fitness.values
+                offspring.append(ind)
+            else:  # Apply reproduction
+                offspring.append(self.rng.choice(population))
+        return offspring
+
     def optimize(
         self,
         start_solution: Optional[list[float]] = None,
@@ -992,6 +2281,11 @@ class GeneticOptimization(OptimizationBase):
     ) -> tuple[Any, dict[str, list[Any]]]:
         """Run the optimization process using a genetic algorithm.
 
+        With more than one island configured, the population is split into islands that evolve
+        side by side and exchange their best individuals in a ring every migration interval. The
+        offspring of all islands are evaluated in one batch, so the evaluation pool spreads all
+        islands over the worker processes.
+
         @TODO: optimize() ngen default (200) is different from optimize_ems() ngen default (400).
         """
         # Set the number of inviduals in a generation
@@ -1013,23 +2307,116 @@ class GeneticOptimization(OptimizationBase):
         logger.debug("Start optimize: {}", start_solution)
 
         # Insert the start solution into the population if provided
+        seeded = 0
         if start_solution is not None:
-            for _ in range(10):
-                population.insert(0, creator.Individual(start_solution))
-
-        # Run the evolutionary algorithm
-        pop, log = algorithms.eaMuPlusLambda(
-            population,
-            self.toolbox,
-            mu=100,
-            lambda_=150,
-            cxpb=0.6,
-            mutpb=0.4,
-            ngen=ngen,
-            stats=stats,
-            halloffame=hof,
-            verbose=self.verbose,
-        )
+            if self.config.optimization.genetic.warm_start:
+                seeded = self.warm_start_population(population, start_solution)
+            else:
+                for _ in range(10):
+                    population.insert(0, GeneticIndividual(start_solution))
+                seeded = 10
+
+        # Seed rule based individuals
+        self.heuristic_seed_population(population, seeded)
+
+        # Stopping policy
+        genetic_settings = self.config.optimization.genetic
+        early_stopping_generations = genetic_settings.early_stopping_generations
+        early_stopping_tolerance = genetic_settings.early_stopping_tolerance
+        time_limit_sec = genetic_settings.time_limit_sec
+
+        # Island model - the population is split round robin, so warm start seeds are spread
+        islands = max(min(genetic_settings.islands, len(population)), 1)
+        populations = [population[island::islands] for island in range(islands)]
+
+        # Run the evolutionary algorithm - (mu + lambda) as by DEAP's eaMuPlusLambda
+        mu = math.ceil(100 / islands)
+        lambda_ = math.ceil(150 / islands)
+        cxpb = 0.6
+        mutpb = 0.4
+        migrants = min(genetic_settings.migrants, mu)
+        start_time = time.monotonic()
+
+        log = tools.Logbook()
+        log.header = ["gen", "nevals"] + stats.fields
+        island_logs = [tools.Logbook() for _ in range(islands)] if islands > 1 else []
+
+        # Publish the progress, check for cancellation
+        status = get_optimization_status()
+        status.start_generations(ngen)
+
+        def record(gen: int, nevals: int) -> None:
+            """Record the statistics of the generation."""
+            log.record(gen=gen, nevals=nevals, **stats.compile(sum(populations, [])))
+            for island_log, island_population in zip(island_logs, populations):
+                island_log.record(gen=gen, **stats.compile(island_population))
+            status.update(
+                gen, nevals, hof[0].fitness.values[0], log[-1]["avg"], time_limit_sec=time_limit_sec
+            )
+            if self.verbose:
+                print(log.stream)
+
+        # Evaluate the individuals with an invalid fitness
+        invalid_ind = [ind for pop in populations for ind in pop if not ind.fitness.valid]
+        fitnesses = self.toolbox.map(self.toolbox.evaluate, invalid_ind)
+        for ind, fit in zip(invalid_ind, fitnesses):
+            ind.fitness.values = fit
+        for pop in populations:
+            hof.update(pop)
+        record(0, len(invalid_ind))
+
+        best_fitness = hof[0].fitness.values[0]
+        generations_without_improvement = 0
+        stop_reason = "generations"
+        gen = 0
+        while gen < ngen:
+            if time_limit_sec is not None and time.monotonic() - start_time >= time_limit_sec:
+                stop_reason = "time_limit"
+                break
+            if status.cancel_requested():
+                stop_reason = "cancelled"
+                break
+            gen += 1
+
+            # Vary the populations
+            offsprings = [self.vary(pop, lambda_, cxpb, mutpb) for pop in populations]
+
+            # Evaluate the individuals with an invalid fitness - all islands in one batch
+            invalid_ind = [
+                ind for offspring in offsprings for ind in offspring if not ind.fitness.valid
+            ]
+            fitnesses = self.toolbox.map(self.toolbox.evaluate, invalid_ind)
+            for ind, fit in zip(invalid_ind, fitnesses):
+                ind.fitness.values = fit
+
+            # Update the hall of fame and select the next generation populations
+            for pop, offspring in zip(populations, offsprings):
+                hof.update(offspring)
+                pop[:] = self.toolbox.select(pop + offspring, mu, rng=self.rng)
+
+            # Migrate the best individuals to the next island in the ring
+            if islands > 1 and gen % genetic_settings.migration_interval == 0:
+                tools.migRing(populations, migrants, tools.selBest, replacement=tools.selWorst)
+
+            record(gen, len(invalid_ind))
+
+            # Check for convergence of the best fitness ("FitnessMin")
+            generation_best_fitness = hof[0].fitness.values[0]
+            if generation_best_fitness < best_fitness - early_stopping_tolerance * abs(
+                best_fitness
+            ):
+                generations_without_improvement = 0
+            else:
+                generations_without_improvement += 1
+            best_fitness = min(best_fitness, generation_best_fitness)
+            if (
+                early_stopping_generations is not None
+                and generations_without_improvement >= early_stopping_generations
+            ):
+                stop_reason = "converged"
+                break
+
+        logger.debug("Optimization stopped after {} generations: {}", gen, stop_reason)
 
         # Store fitness history
         self.fitness_history = {
@@ -1037,10 +2424,18 @@ class GeneticOptimization(OptimizationBase):
             "avg": log.select("avg"),  # Average fitness for each generation (Y-axis)
             "max": log.select("max"),  # Maximum fitness for each generation (Y-axis)
             "min": log.select("min"),  # Minimum fitness for each generation (Y-axis)
+            "generations": gen,  # Number of generations evolved
+            "stop_reason": stop_reason,  # "generations", "converged", "time_limit" or "cancelled"
         }
+        if island_logs:
+            # Fitness history per island of the island model
+            self.fitness_history["islands"] = [
+                {key: island_log.select(key) for key in ("avg", "max", "min")}
+                for island_log in island_logs
+            ]
 
         member: dict[str, list[float]] = {"balance": [], "losses": [], "constraints": []}
-        for ind in population:
+        for ind in sum(populations, []):
             if hasattr(ind, "extra_data"):
                 extra_value1, extra_value2, extra_value3 = ind.extra_data
                 member["balance"].append(extra_value1)
@@ -1074,24 +2469,89 @@ class GeneticOptimization(OptimizationBase):
                 generations = 400
                 logger.error("Generations not configured. Using {}.", generations)
 
+        # Take the simulation and the devices from a reusable optimization context
+        self.context = self.acquire_context()
+        try:
+            # The simulation works in steps of the optimization interval
+            return self.optimize_ems_context(
+                parameters=parameters,
+                start_hour=self.start_step,
+                worst_case=worst_case,
+                generations=generations,
+            )
+        finally:
+            self.release_context(self.context)
+            self.context = None
+
+    @classmethod
+    def acquire_context(cls) -> GeneticOptimizationContext:
+        """Get an optimization context for an optimization run.
+
+        Returns:
+            GeneticOptimizationContext: A context of an earlier run or a new context.
+        """
+        with cls._contexts_lock:
+            if cls._contexts:
+                return cls._contexts.pop()
+        return GeneticOptimizationContext()
+
+    @classmethod
+    def release_context(cls, context: GeneticOptimizationContext) -> None:
+        """Give back an optimization context after the optimization run for reuse.
+
+        Args:
+            context (GeneticOptimizationContext): The context of the optimization run.
+        """
+        with cls._contexts_lock:
+            if len(cls._contexts) < cls._contexts_max:
+                cls._contexts.append(context)
+
+    def optimize_ems_context(
+        self,
+        parameters: GeneticOptimizationParameters,
+        start_hour: int,
+        worst_case: bool,
+        generations: int,
+    ) -> GeneticSolution:
+        """Perform EMS optimization with the devices of the optimization context.
+
+        The start hour is given as simulation step on the start day.
+        """
+        if self.context is None:  # Make mypy happy - set by optimize_ems
+            raise RuntimeError("Optimization context not set.")
+        context = self.context
+        self.simulation = context.simulation
         self.simulation.reset()
+        prediction_hours = self.config.prediction.hours
+        optimization_hours = self.config.optimization.horizon_hours
+        step_hours = self.step_hours
 
         # Initialize PV and EV batteries
         battery: Optional[Battery] = None
         if parameters.pv_battery:
-            battery = Battery(
-                parameters.pv_battery,
-                prediction_hours=self.config.prediction.hours,
+            pv_battery = parameters.pv_battery
+            battery = context.device(
+                "pv_battery",
+                f"{prediction_hours}:{step_hours}:{pv_battery.model_dump_json()}",
+                lambda: Battery(
+                    pv_battery, prediction_hours=prediction_hours, step_hours=step_hours
+                ),
             )
-            battery.set_charge_per_hour(np.full(self.config.prediction.hours, 0))
+            battery.reset()
+            battery.set_charge_per_hour(np.full(self.prediction_steps, 0))
 
         ev: Optional[Battery] = None
         if parameters.ev:
-            ev = Battery(
-                parameters.ev,
-                prediction_hours=self.config.prediction.hours,
+            ev_parameters = parameters.ev
+            ev = context.device(
+                "ev",
+                f"{prediction_hours}:{step_hours}:{ev_parameters.model_dump_json()}",
+                lambda: Battery(
+                    ev_parameters, prediction_hours=prediction_hours, step_hours=step_hours
+                ),
             )
-            ev.set_charge_per_hour(np.full(self.config.prediction.hours, 1))
+            ev.reset()
+            ev.set_charge_per_hour(np.full(self.prediction_steps, 1))
             self.optimize_ev = (
                 parameters.ev.min_soc_percentage - parameters.ev.initial_soc_percentage >= 0
             )
@@ -1145,22 +2605,32 @@ class GeneticOptimization(OptimizationBase):
         logger.debug("Battery AC charge levels: {}", self.bat_possible_charge_values)
 
         # Initialize household appliance if applicable
-        dishwasher = (
-            HomeAppliance(
-                parameters=parameters.dishwasher,
-                optimization_hours=self.config.optimization.horizon_hours,
-                prediction_hours=self.config.prediction.hours,
+        # The allowed start hours depend on the time windows at the current date
+        dishwasher: Optional[HomeAppliance] = None
+        if parameters.dishwasher is not None:
+            dishwasher_parameters = parameters.dishwasher
+            dishwasher = context.device(
+                "dishwasher",
+                f"{to_datetime().date()}:{optimization_hours}:{prediction_hours}:{step_hours}:"
+                f"{dishwasher_parameters.model_dump_json()}",
+                lambda: HomeAppliance(
+                    parameters=dishwasher_parameters,
+                    optimization_hours=optimization_hours,
+                    prediction_hours=prediction_hours,
+                    step_hours=step_hours,
+                ),
             )
-            if parameters.dishwasher is not None
-            else None
-        )
+            dishwasher.reset_load_curve()
 
         # Initialize the inverter and energy management system
         inverter: Optional[Inverter] = None
         if parameters.inverter:
-            inverter = Inverter(
-                parameters.inverter,
-                battery=battery,
+            inverter_parameters = parameters.inverter
+            battery_key = context.devices["pv_battery"][0] if battery else None
+            inverter = context.device(
+                "inverter",
+                f"{battery_key}:{step_hours}:{inverter_parameters.model_dump_json()}",
+                lambda: Inverter(inverter_parameters, battery=battery, step_hours=step_hours),
             )
 
         # Prepare device simulation
@@ -1171,7 +2641,9 @@ class GeneticOptimization(OptimizationBase):
             inverter=inverter,  # battery is part of inverter
             ev=ev,
             home_appliance=dishwasher,
+            step_hours=step_hours,
         )
+        self.prepare_scenarios(parameters)
 
         # Setup the DEAP environment and optimization process
         self.setup_deap_environment({"home_appliance": 1 if dishwasher else 0}, start_hour)
@@ -1179,9 +2651,33 @@ class GeneticOptimization(OptimizationBase):
             "evaluate",
             lambda ind: self.evaluate(ind, parameters, start_hour, worst_case),
         )
+        self.toolbox.register(
+            "evaluate_population",
+            lambda population: self.evaluate_population(
+                population, parameters, start_hour, worst_case
+            ),
+        )
 
         start_time = time.time()
-        start_solution, extra_data = self.optimize(parameters.start_solution, ngen=generations)
+        self.ac_charge_best_uncovered_prices = self.calculate_ac_charge_best_uncovered_prices()
+        self.evaluation_pool = self.create_evaluation_pool()
+        self.fitness_cache = self.create_fitness_cache()
+        self.fitness_cache_hits = 0
+        self.fitness_cache_misses = 0
+        try:
+            start_solution, extra_data = self.optimize(parameters.start_solution, ngen=generations)
+        finally:
+            if self.evaluation_pool:
+                release_evaluation_pool(self.evaluation_pool)
+                self.evaluation_pool = None
+            if self.fitness_cache is not None:
+                logger.debug(
+                    "Fitness cache: {} hits, {} misses.",
+                    self.fitness_cache_hits,
+                    self.fitness_cache_misses,
+                )
+                self.fitness_cache = None
+            self.ac_charge_best_uncovered_prices = None
         elapsed_time = time.time() - start_time
         logger.debug(f"Time evaluate inner: {elapsed_time:.4f} sec.")
 
@@ -1253,5 +2749,7 @@ class GeneticOptimization(OptimizationBase):
                 "ev_obj": self.simulation.ev,
                 "start_solution": start_solution,
                 "washingstart": washingstart_int,
+                "generations": self.fitness_history.get("generations"),
+                "stop_reason": self.fitness_history.get("stop_reason"),
             }
         )
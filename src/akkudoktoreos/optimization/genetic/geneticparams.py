@@ -8,8 +8,12 @@ It also provides a method to assemble these parameters from predictions,
 forecasts, and fallback defaults, preparing them for optimization runs.
 """
 
+import hashlib
+import json
 from typing import Optional, Union
 
+import numpy as np
+import pandas as pd
 from loguru import logger
 from pydantic import (
     AliasChoices,
@@ -76,6 +80,12 @@ class GeneticEnergyManagementParameters(GeneticParametersBaseModel):
             "description": "An array of floats representing the total load (consumption) in watts for different time intervals."
         },
     )
+    total_load_std: Optional[list[float]] = Field(
+        default=None,
+        json_schema_extra={
+            "description": "An array of floats representing the standard deviation of the total load in watts for different time intervals. Used for robust optimization over forecast scenarios."
+        },
+    )
 
     # Computed fields for backward compatibility (deprecated German names)
     @computed_field(json_schema_extra={"deprecated": True})
@@ -118,6 +128,7 @@ class GeneticEnergyManagementParameters(GeneticParametersBaseModel):
                 isinstance(self.feed_in_tariff_per_wh, list)
                 and pv_forecast_length != len(self.feed_in_tariff_per_wh)
             )
+            or (self.total_load_std is not None and pv_forecast_length != len(self.total_load_std))
         ):
             raise ValueError("Input lists have different lengths")
         return self
@@ -205,6 +216,95 @@ class GeneticOptimizationParameters(
             raise ValueError("Requires at least two values.")
         return start_solution
 
+    @staticmethod
+    def time_shift_start_solution(
+        start_solution: list[float], hours: int, prediction_hours: int, steps_per_day: int = 24
+    ) -> Optional[list[float]]:
+        """Time shift the start solution of an earlier optimization run.
+
+        The genome of the GENETIC algorithm is indexed by the hour from midnight of the start day
+        of the optimization run. It holds the battery state of every prediction hour, optionally
+        followed by the EV charge index of every prediction hour and the home appliance start
+        hour. The hourly parts are shifted to the start day of the new run. Hours that are new to
+        the prediction horizon get the battery state of the same hour one day earlier (idle if
+        not available) and no EV charging.
+
+        For optimization intervals other than one hour, hours are simulation steps.
+
+        Args:
+            start_solution (list[float]): Genome of the earlier optimization run.
+            hours (int): Hours from the start day of the earlier run to the start day of the new
+                run.
+            prediction_hours (int): Number of prediction hours.
+            steps_per_day (int): Number of hours (simulation steps) of a day. Defaults to 24.
+
+        Returns:
+            list[float]: The time shifted genome or None if the genome can not be shifted.
+        """
+        hourly_parts, appliance_parts = divmod(len(start_solution), prediction_hours)
+        if (
+            hours < 0
+            or hours >= prediction_hours
+            or hourly_parts not in (1, 2)
+            or appliance_parts > 1
+        ):
+            return None
+
+        shifted: list[float] = []
+        for part in range(hourly_parts):
+            values = list(
+                start_solution[part * prediction_hours + hours : (part + 1) * prediction_hours]
+            )
+            for hour in range(len(values), prediction_hours):
+                if part == 0 and hour >= steps_per_day:
+                    # Battery: Same as one day earlier
+                    values.append(values[hour - steps_per_day])
+                else:
+                    # Battery: Idle, EV: No charging
+                    values.append(0)
+            shifted.extend(values)
+        # Home appliance start hour
+        shifted.extend(start_solution[hourly_parts * prediction_hours :])
+        return shifted
+
+    def fingerprint(self, soc_tolerance: float = 0.0, energy_tolerance_wh: float = 0.0) -> str:
+        """Fingerprint of the optimization input.
+
+        Optimization parameters with the same fingerprint are considered to lead to the same
+        optimization result. The state of charge of the battery and the electric vehicle and the
+        PV and load forecasts are quantized by the given tolerances before fingerprinting, so
+        that small changes do not alter the fingerprint. All other parameters contribute their
+        exact value. The start solution is only a hint for the optimization and is not part of
+        the fingerprint.
+
+        Args:
+            soc_tolerance (float): Quantization step of the state of charge [%]. 0 = exact.
+            energy_tolerance_wh (float): Quantization step of the PV and load forecasts [Wh].
+                0 = exact.
+
+        Returns:
+            str: Hex digest of the fingerprint.
+        """
+
+        def quantize(value: float, tolerance: float) -> float:
+            if tolerance <= 0:
+                return value
+            return round(value / tolerance)
+
+        data = self.model_dump(mode="json", include_computed_fields=False)
+        data.pop("start_solution", None)
+        for key in ("pv_forecast_wh", "total_load"):
+            data["ems"][key] = [quantize(value, energy_tolerance_wh) for value in data["ems"][key]]
+        for device in ("pv_battery", "ev"):
+            if data.get(device) is not None:
+                data[device]["initial_soc_percentage"] = quantize(
+                    data[device]["initial_soc_percentage"], soc_tolerance
+                )
+
+        return hashlib.sha256(
+            json.dumps(data, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()
+
     @classmethod
     async def prepare(cls) -> "Optional[GeneticOptimizationParameters]":
         """Prepare optimization parameters from config, forecast and measurement data.
@@ -253,9 +353,10 @@ class GeneticOptimizationParameters(
         if cls.config.optimization.interval is None:
             logger.info("Optimization interval unknown - defaulting to 3600 seconds.")
             cls.config.optimization.interval = 3600
-        if cls.config.optimization.interval != 3600:
+        if 3600 % cls.config.optimization.interval != 0:
             logger.info(
-                "Optimization interval '{}' seconds not supported - forced to 3600 seconds."
+                "Optimization interval '{}' seconds does not divide an hour - forced to 3600 seconds.",
+                cls.config.optimization.interval,
             )
             cls.config.optimization.interval = 3600
         # Check genetic algorithm definitions
@@ -278,8 +379,31 @@ class GeneticOptimizationParameters(
         # Add forecast and device data
         interval = to_duration(cls.config.optimization.interval)
         power_to_energy_per_interval_factor = cls.config.optimization.interval / 3600
+        steps_per_hour = 3600 // cls.config.optimization.interval
         parameter_start_datetime = ems.start_datetime.set(hour=0, second=0, microsecond=0)
         parameter_end_datetime = parameter_start_datetime.add(hours=cls.config.prediction.hours)
+
+        # Align the start solution of the last run to the start day of this run
+        last_optimization_solution = ems.optimization_solution()
+        if start_solution is not None and cls.config.optimization.genetic.warm_start:
+            if last_optimization_solution is None or last_optimization_solution.valid_from is None:
+                start_solution = None
+            else:
+                last_start_datetime = last_optimization_solution.valid_from.set(
+                    hour=0, minute=0, second=0, microsecond=0
+                )
+                shift_steps = round(
+                    (parameter_start_datetime - last_start_datetime).total_seconds()
+                    / cls.config.optimization.interval
+                )
+                start_solution = cls.time_shift_start_solution(
+                    start_solution,
+                    shift_steps,
+                    cls.config.prediction.hours * steps_per_hour,
+                    steps_per_day=24 * steps_per_hour,
+                )
+            if start_solution is None:
+                logger.info("Start solution of last run can not be time shifted - not used.")
         max_retries = 10
 
         for attempt in range(1, max_retries + 1):
@@ -373,7 +497,7 @@ class GeneticOptimizationParameters(
                     interval=interval,
                     fill_method="ffill",
                 )
-                loadforecast_power_w = array.tolist()
+                loadforecast_power_w = (array * power_to_energy_per_interval_factor).tolist()
             except Exception as e:
                 logger.info(
                     "No Load forecast data available - defaulting to demo data. Parameter preparation attempt {}: {}",
@@ -392,6 +516,23 @@ class GeneticOptimizationParameters(
                 )
                 # Retry
                 continue
+            # Standard deviation of the load forecast, if provided by the load provider
+            loadforecast_std_power_w: Optional[list[float]] = None
+            if "loadakkudoktor_std_power_w" in cls.prediction.record_keys:
+                try:
+                    array = await cls.prediction.key_to_array(
+                        key="loadakkudoktor_std_power_w",
+                        start_datetime=parameter_start_datetime,
+                        end_datetime=parameter_end_datetime,
+                        interval=interval,
+                        fill_method="ffill",
+                    )
+                    if not np.any(pd.isna(array)):
+                        loadforecast_std_power_w = (
+                            array * power_to_energy_per_interval_factor
+                        ).tolist()
+                except Exception as e:
+                    logger.debug("No load forecast standard deviation available: {}", e)
             try:
                 array = await cls.prediction.key_to_array(
                     key="feed_in_tariff_wh",
@@ -685,6 +826,7 @@ class GeneticOptimizationParameters(
                         electricity_price_per_wh=elecprice_marketprice_wh,
                         feed_in_tariff_per_wh=feed_in_tariff_wh,
                         total_load=loadforecast_power_w,
+                        total_load_std=loadforecast_std_power_w,
                         price_per_wh_battery=battery_lcos_kwh / 1000,
                     ),
                     temperature_forecast=weather_temp_air,
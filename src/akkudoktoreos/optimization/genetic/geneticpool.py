@@ -0,0 +1,385 @@
+"""Parallel fitness evaluation for the GENETIC optimization algorithm.
+
+The population-batched simulation of a generation is split into chunks that are simulated by a
+pool of worker processes. The forecast arrays and the device setup of the simulation are handed
+over to the workers once per optimization run through shared memory; only the per individual
+action arrays and the simulation results are transferred for each chunk.
+
+Starting the spawned worker processes costs seconds of imports. The pool is therefore kept for
+later optimization runs of the process: `acquire_evaluation_pool` binds the idle pool to the
+simulation of the run - only the shared memory is refreshed - and `release_evaluation_pool` hands
+it back. In the optimization worker process the pool lives as long as the worker process.
+
+The simulation is deterministic and the chunk results are reassembled in population order, so the
+results are identical to the serial evaluation - also for fixed seed optimization runs.
+"""
+
+import atexit
+import itertools
+import multiprocessing
+import os
+import pickle
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import TYPE_CHECKING, Any, Optional, Union
+
+import numpy as np
+from loguru import logger
+
+if TYPE_CHECKING:
+    from akkudoktoreos.optimization.genetic.genetic import GeneticSimulation
+
+
+# Forecast arrays of the simulation that are shared with the workers.
+SHARED_ARRAY_NAMES = (
+    "load_energy_array",
+    "pv_prediction_wh",
+    "elect_price_hourly",
+    "elect_revenue_per_hour_arr",
+)
+
+# Shared memory name, shape and dtype of an array shared with the workers.
+SharedArraySpec = tuple[str, tuple[int, ...], str]
+# Simulation binding of the pool: binding id, template (shared memory name, size) and the shared
+# arrays by simulation attribute name.
+PoolBinding = tuple[int, tuple[str, int], dict[str, SharedArraySpec]]
+
+# Binding id of the simulation of the worker process, set by `_bind_worker`.
+_worker_binding_id: Optional[int] = None
+# Simulation of the worker process, set up by `_bind_worker`.
+_worker_simulation: Optional["GeneticSimulation"] = None
+# Keep the shared memory of the worker process attached while the simulation uses it.
+_worker_shared_memory: list[SharedMemory] = []
+
+
+def _bind_worker(binding: PoolBinding) -> "GeneticSimulation":
+    """Bind the worker process to the simulation of the optimization run.
+
+    The simulation is only set up again if the pool was bound to another simulation since the
+    last chunk simulated by this worker.
+
+    Args:
+        binding (PoolBinding): Simulation binding of the pool.
+
+    Returns:
+        GeneticSimulation: The simulation of the worker process.
+    """
+    global _worker_binding_id, _worker_simulation
+
+    binding_id, (template_name, template_size), shared_arrays = binding
+    if _worker_simulation is not None and _worker_binding_id == binding_id:
+        return _worker_simulation
+
+    _worker_simulation = None
+    for shm in _worker_shared_memory:
+        shm.close()
+    _worker_shared_memory.clear()
+
+    shm = SharedMemory(name=template_name)
+    try:
+        template = np.ndarray((template_size,), dtype=np.uint8, buffer=shm.buf).tobytes()
+        simulation = pickle.loads(template)  # noqa: S301 - own data
+    finally:
+        shm.close()
+    for attribute, (shm_name, shape, dtype) in shared_arrays.items():
+        shm = SharedMemory(name=shm_name)
+        _worker_shared_memory.append(shm)
+        setattr(simulation, attribute, np.ndarray(shape, dtype=dtype, buffer=shm.buf))
+    _worker_simulation = simulation
+    _worker_binding_id = binding_id
+    return simulation
+
+
+def _simulate_batch(
+    binding: PoolBinding,
+    start_hour: int,
+    ac_charge_hours: np.ndarray,
+    dc_charge_hours: np.ndarray,
+    bat_discharge_hours: np.ndarray,
+    ev_charge_hours: np.ndarray,
+    home_appliance_start_hours: Optional[np.ndarray],
+    scenarios: bool = False,
+) -> dict[str, Any]:
+    """Simulate a chunk of the population in a worker process."""
+    return _bind_worker(binding).simulate_batch(
+        start_hour,
+        ac_charge_hours,
+        dc_charge_hours,
+        bat_discharge_hours,
+        ev_charge_hours,
+        home_appliance_start_hours,
+        scenarios=scenarios,
+    )
+
+
+def resolve_workers(workers: Union[int, str, None]) -> int:
+    """Resolve the configured number of worker processes.
+
+    Args:
+        workers (int, str, None): Number of workers or "auto" for the number of CPUs.
+
+    Returns:
+        int: Number of worker processes, at least 1.
+    """
+    if workers is None:
+        return 1
+    if workers == "auto":
+        return os.cpu_count() or 1
+    return max(int(workers), 1)
+
+
+class GeneticEvaluationPool:
+    """Process pool for the population-batched simulation of the GENETIC algorithm.
+
+    The pool is bound to one prepared simulation at a time. `bind()` binds the running worker
+    processes to the simulation of another optimization run. Use it as a context manager or call
+    `close()` to stop the workers and free the shared memory.
+
+    Example:
+        .. code-block:: python
+
+            with GeneticEvaluationPool(simulation, workers=4) as pool:
+                result = pool.simulate_batch(start_hour, ac, dc, discharge, ev, None)
+    """
+
+    # Binding ids are unique per process - a pool never repeats the id of another binding.
+    _binding_ids = itertools.count(1)
+
+    def __init__(self, simulation: "GeneticSimulation", workers: int):
+        """Start the worker processes.
+
+        Args:
+            simulation (GeneticSimulation): The prepared simulation.
+            workers (int): Number of worker processes.
+        """
+        self.simulation: Optional["GeneticSimulation"] = None
+        self.workers = workers
+        self._shared_memory: dict[str, SharedMemory] = {}
+        self._binding: Optional[PoolBinding] = None
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+        try:
+            # Do not fork - the optimization may run in a thread of a multi-threaded server.
+            self._executor = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            self.bind(simulation)
+        except Exception:
+            self.close()
+            raise
+
+    def __enter__(self) -> "GeneticEvaluationPool":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    @property
+    def closed(self) -> bool:
+        """True if the worker processes are stopped."""
+        return self._executor is None
+
+    def _share(self, key: str, data: Union[np.ndarray, bytes]) -> str:
+        """Copy data to the shared memory of the given key.
+
+        The shared memory of the previous binding is reused if the data fits into it.
+
+        Returns:
+            str: Name of the shared memory.
+        """
+        if isinstance(data, bytes):
+            data = np.frombuffer(data, dtype=np.uint8)
+        nbytes = data.nbytes
+        shm = self._shared_memory.get(key)
+        if shm is None or shm.size < nbytes:
+            if shm is not None:
+                shm.close()
+                shm.unlink()
+            shm = SharedMemory(create=True, size=max(nbytes, 1))
+            self._shared_memory[key] = shm
+        np.ndarray(data.shape, dtype=data.dtype, buffer=shm.buf)[...] = data
+        return shm.name
+
+    def bind(self, simulation: "GeneticSimulation") -> None:
+        """Bind the pool to the prepared simulation of an optimization run.
+
+        The forecast arrays and the device setup are copied to shared memory. The worker
+        processes pick up the new simulation with their next chunk.
+
+        Args:
+            simulation (GeneticSimulation): The prepared simulation.
+        """
+        if self._executor is None:
+            raise RuntimeError("Evaluation pool is closed.")
+        # Invalidate the binding while the shared memory is rewritten
+        self._binding = None
+        self.simulation = simulation
+
+        shared_arrays: dict[str, SharedArraySpec] = {}
+        for attribute in SHARED_ARRAY_NAMES:
+            array = np.ascontiguousarray(getattr(simulation, attribute), dtype=float)
+            shared_arrays[attribute] = (
+                self._share(attribute, array),
+                array.shape,
+                array.dtype.str,
+            )
+
+        # The forecast arrays are provided by shared memory - do not pickle them.
+        template = pickle.dumps(
+            simulation.model_copy(update={name: None for name in SHARED_ARRAY_NAMES})
+        )
+        template_name = self._share("template", template)
+        self._binding = (next(self._binding_ids), (template_name, len(template)), shared_arrays)
+
+    def unbind(self) -> None:
+        """Release the simulation of the optimization run, keep the worker processes."""
+        self._binding = None
+        self.simulation = None
+
+    def close(self) -> None:
+        """Stop the worker processes and free the shared memory."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+        for shm in self._shared_memory.values():
+            shm.close()
+            shm.unlink()
+        self._shared_memory.clear()
+        self._binding = None
+
+    def simulate_batch(
+        self,
+        start_hour: int,
+        ac_charge_hours: np.ndarray,
+        dc_charge_hours: np.ndarray,
+        bat_discharge_hours: np.ndarray,
+        ev_charge_hours: np.ndarray,
+        home_appliance_start_hours: Optional[np.ndarray] = None,
+        scenarios: bool = False,
+    ) -> dict[str, Any]:
+        """Simulate a population in parallel.
+
+        Same interface and results as `GeneticSimulation.simulate_batch`. The population is split
+        into one chunk per worker. The forecast scenarios of the simulation are handed over to
+        the workers with the simulation on binding of the pool. If the pool fails, the population
+        is simulated in the calling process and the pool is closed.
+        """
+        simulation = self.simulation
+        if simulation is None:
+            raise RuntimeError("Evaluation pool is not bound to a simulation.")
+        individuals = len(ac_charge_hours)
+        if self._executor is None or self._binding is None or individuals < 2:
+            return simulation.simulate_batch(
+                start_hour,
+                ac_charge_hours,
+                dc_charge_hours,
+                bat_discharge_hours,
+                ev_charge_hours,
+                home_appliance_start_hours,
+                scenarios=scenarios,
+            )
+
+        chunks = np.array_split(np.arange(individuals), min(self.workers, individuals))
+        try:
+            futures = [
+                self._executor.submit(
+                    _simulate_batch,
+                    self._binding,
+                    start_hour,
+                    ac_charge_hours[chunk],
+                    dc_charge_hours[chunk],
+                    bat_discharge_hours[chunk],
+                    ev_charge_hours[chunk],
+                    None
+                    if home_appliance_start_hours is None
+                    else home_appliance_start_hours[chunk],
+                    scenarios,
+                )
+                for chunk in chunks
+            ]
+            chunk_results = [future.result() for future in futures]
+        except Exception as e:
+            logger.warning("Parallel evaluation failed - continuing serially: {}", e)
+            self.close()
+            return simulation.simulate_batch(
+                start_hour,
+                ac_charge_hours,
+                dc_charge_hours,
+                bat_discharge_hours,
+                ev_charge_hours,
+                home_appliance_start_hours,
+                scenarios=scenarios,
+            )
+
+        # Keep the simulation in the state of a serial run
+        simulation.start_hour = start_hour
+        return {
+            key: np.concatenate([result[key] for result in chunk_results])
+            for key in chunk_results[0]
+        }
+
+
+# Idle evaluation pool of the process, kept for the next optimization run.
+_idle_pool: Optional[GeneticEvaluationPool] = None
+_idle_pool_lock = threading.Lock()
+
+
+def acquire_evaluation_pool(simulation: "GeneticSimulation", workers: int) -> GeneticEvaluationPool:
+    """Get an evaluation pool bound to the simulation of an optimization run.
+
+    The idle pool of the process is reused if it has the requested number of workers. Otherwise -
+    or if the idle pool is taken by a concurrent optimization run - a new pool is started.
+
+    Args:
+        simulation (GeneticSimulation): The prepared simulation.
+        workers (int): Number of worker processes.
+
+    Returns:
+        GeneticEvaluationPool: The pool. Hand it back by `release_evaluation_pool`.
+    """
+    global _idle_pool
+
+    with _idle_pool_lock:
+        pool, _idle_pool = _idle_pool, None
+    if pool is not None and not pool.closed and pool.workers == workers:
+        try:
+            pool.bind(simulation)
+            return pool
+        except Exception as e:
+            logger.debug("Can not reuse evaluation pool - starting a new one: {}", e)
+    if pool is not None:
+        pool.close()
+    return GeneticEvaluationPool(simulation, workers=workers)
+
+
+def release_evaluation_pool(pool: GeneticEvaluationPool) -> None:
+    """Hand back an evaluation pool after the optimization run.
+
+    The pool is kept as the idle pool of the process. If there is already an idle pool or the
+    pool failed, it is closed.
+
+    Args:
+        pool (GeneticEvaluationPool): The pool of `acquire_evaluation_pool`.
+    """
+    global _idle_pool
+
+    pool.unbind()
+    if not pool.closed:
+        with _idle_pool_lock:
+            if _idle_pool is None:
+                _idle_pool = pool
+                return
+    pool.close()
+
+
+@atexit.register
+def close_evaluation_pool() -> None:
+    """Stop the idle evaluation pool of the process and free its shared memory."""
+    global _idle_pool
+
+    with _idle_pool_lock:
+        pool, _idle_pool = _idle_pool, None
+    if pool is not None:
+        pool.close()
@@ -25,7 +25,7 @@ from akkudoktoreos.devices.devicesabc import (
 from akkudoktoreos.devices.genetic.battery import Battery
 from akkudoktoreos.optimization.genetic.geneticdevices import GeneticParametersBaseModel
 from akkudoktoreos.optimization.optimization import OptimizationSolution
-from akkudoktoreos.utils.datetimeutil import to_datetime, to_duration
+from akkudoktoreos.utils.datetimeutil import DateTime, to_datetime, to_duration
 from akkudoktoreos.utils.utils import NumpyEncoder
 
 
@@ -282,6 +282,26 @@ class GeneticSolution(ConfigMixin, GeneticParametersBaseModel):
             "description": "Can be `null` or contain an object representing the start of washing (if applicable)."
         },
     )
+    generations: Optional[int] = Field(
+        default=None,
+        json_schema_extra={
+            "description": "Number of generations evolved by the genetic algorithm.",
+            "examples": [400],
+        },
+    )
+    stop_reason: Optional[str] = Field(
+        default=None,
+        json_schema_extra={
+            "description": (
+                "Why the genetic algorithm stopped: 'generations' (all generations evolved), "
+                "'converged' (no improvement), 'time_limit' (wall-clock limit reached), "
+                "'cancelled' (cancellation requested), "
+                "'dp_grid' (solved by the DP algorithm on a state of charge grid) or 'optimal' (solved to optimality "
+                "by the MILP algorithm)."
+            ),
+            "examples": ["generations", "converged", "time_limit", "dp_grid", "optimal"],
+        },
+    )
 
     # Computed fields for backward compatibility (deprecated German names)
     @computed_field(json_schema_extra={"deprecated": True})
@@ -456,6 +476,24 @@ class GeneticSolution(ConfigMixin, GeneticParametersBaseModel):
 
         return effective_ac, effective_dc, effective_dis
 
+    def _interval_start_step(self, start_datetime: DateTime) -> tuple[int, int]:
+        """Optimization interval and simulation step of the start on the start day.
+
+        The solution arrays hold one value per optimization interval; the hour for the default
+        interval of one hour.
+
+        Args:
+            start_datetime (DateTime): Start of the energy management run.
+
+        Returns:
+            tuple[int, int]: Optimization interval [sec] and step of the start datetime counted
+            from midnight of the start day.
+        """
+        interval_sec = self.config.optimization.interval or 3600
+        local_start = start_datetime.in_timezone(self.config.general.timezone)
+        start_day_step = (local_start.hour * 3600 + local_start.minute * 60) // interval_sec
+        return interval_sec, start_day_step
+
     async def optimization_solution(self) -> OptimizationSolution:
         """Provide the genetic solution as a general optimization solution.
 
@@ -469,20 +507,19 @@ class GeneticSolution(ConfigMixin, GeneticParametersBaseModel):
         - GRID_SUPPORT_IMPORT: ac_charge  > 0 and discharge_allowed == 0 or 1
         """
         start_datetime = get_ems().start_datetime
-        start_day_hour = start_datetime.in_timezone(self.config.general.timezone).hour
-        interval_hours = 1
-        power_to_energy_per_interval_factor = 1.0
+        interval_sec, start_day_step = self._interval_start_step(start_datetime)
+        power_to_energy_per_interval_factor = interval_sec / 3600
 
         # --- Create index based on list length and interval ---
         # Ensure we only use the minimum of results and commands if differing
-        periods = min(len(self.result.costs_per_hour), len(self.ac_charge) - start_day_hour)
+        periods = min(len(self.result.costs_per_hour), len(self.ac_charge) - start_day_step)
         time_index = pd.date_range(
             start=start_datetime,
             periods=periods,
-            freq=f"{interval_hours}h",
+            freq=f"{interval_sec}s",
         )
         n_points = len(time_index)
-        end_datetime = start_datetime.add(hours=n_points)
+        end_datetime = start_datetime.add(seconds=n_points * interval_sec)
 
         # Fill solution into dataframe with correct column names
         # - load_energy_wh: Load of all energy consumers in wh"
@@ -498,7 +535,7 @@ class GeneticSolution(ConfigMixin, GeneticParametersBaseModel):
         solution = pd.DataFrame(
             {
                 "date_time": time_index,
-                # result starts at start_day_hour
+                # result starts at start_day_step
                 "load_energy_wh": self.result.load_wh_per_hour[:n_points],
                 "grid_feedin_energy_wh": self.result.grid_feed_in_wh_per_hour[:n_points],
                 "grid_consumption_energy_wh": self.result.grid_consumption_wh_per_hour[:n_points],
@@ -513,18 +550,18 @@ class GeneticSolution(ConfigMixin, GeneticParametersBaseModel):
         battery_device_id = self._battery_device_id()
         solution[f"{battery_device_id}_soc_factor"] = [
             v / 100
-            for v in self.result.battery_soc_per_hour[:n_points]  # result starts at start_day_hour
+            for v in self.result.battery_soc_per_hour[:n_points]  # result starts at start_day_step
         ]
         operation: dict[str, list[float]] = {
             "genetic_ac_charge_factor": [],
             "genetic_dc_charge_factor": [],
             "genetic_discharge_allowed_factor": [],
         }
-        # ac_charge, dc_charge, discharge_allowed start at hour 0 of start day
+        # ac_charge, dc_charge, discharge_allowed start at step 0 of start day
         for hour_idx, rate in enumerate(self.ac_charge):
-            if hour_idx < start_day_hour:
+            if hour_idx < start_day_step:
                 continue
-            if hour_idx >= start_day_hour + n_points:
+            if hour_idx >= start_day_step + n_points:
                 break
             ac_charge_hour = self.ac_charge[hour_idx]
             dc_charge_hour = self.dc_charge[hour_idx]
@@ -537,7 +574,7 @@ class GeneticSolution(ConfigMixin, GeneticParametersBaseModel):
 
             # SOC-clamped effective values — what can physically be executed at
             # this hour given the expected battery state of charge.
-            result_idx = hour_idx - start_day_hour
+            result_idx = hour_idx - start_day_step
             soc_h_pct = (
                 self.result.battery_soc_per_hour[result_idx]
                 if result_idx < len(self.result.battery_soc_per_hour)
@@ -569,7 +606,7 @@ class GeneticSolution(ConfigMixin, GeneticParametersBaseModel):
             solution[key] = operation[key]
 
         # Add EV battery solution
-        # ev_charge_hours_float start at hour 0 of start day
+        # ev_charge_hours_float start at step 0 of start day
         # result.ev_soc_per_hour start at start_datetime.hour
         if self.ev_obj:
             ev_device_id = self._ev_device_id()
@@ -598,9 +635,9 @@ class GeneticSolution(ConfigMixin, GeneticParametersBaseModel):
                     "genetic_ev_charge_factor": [],
                 }
                 for hour_idx, rate in enumerate(self.ev_charge_hours_float):
-                    if hour_idx < start_day_hour:
+                    if hour_idx < start_day_step:
                         continue
-                    if hour_idx >= start_day_hour + n_points:
+                    if hour_idx >= start_day_step + n_points:
                         break
                     operation["genetic_ev_charge_factor"].append(rate)
                     operation_mode, operation_mode_factor = self._battery_operation_from_solution(
@@ -630,7 +667,7 @@ class GeneticSolution(ConfigMixin, GeneticParametersBaseModel):
             # Use config and not self.washingstart as washingstart may be None (no start)
             # even if configured to be started.
             homeappliance_device_id = self._homeappliance_device_id()
-            # result starts at start_day_hour
+            # result starts at start_day_step
             solution[f"{homeappliance_device_id}_energy_wh"] = (
                 self.result.home_appliance_wh_per_hour[:n_points]
             )
@@ -728,17 +765,26 @@ class GeneticSolution(ConfigMixin, GeneticParametersBaseModel):
                     key=pred_key,
                     start_datetime=start_datetime,
                     end_datetime=end_datetime,
-                    interval=to_duration(f"{interval_hours} hours"),
+                    interval=to_duration(f"{interval_sec} seconds"),
                     fill_method=pred_fill_method,
                 )
                 # 'key_to_array()' creates None values array if no data records are available.
                 if array is not None and array.size > 0 and not np.any(pd.isna(array)):
                     prediction[pred_solution_key] = (array * pred_solution_factor).tolist()
 
+        comment = "Optimization solution derived from GeneticSolution."
+        if self.generations is not None:
+            comment += f" Evolved {self.generations} generations, stopped by {self.stop_reason}."
+        elif self.stop_reason == "dp_grid":
+            comment += " Solved by dynamic programming on a state of charge grid."
+        elif self.stop_reason == "optimal":
+            comment += " Solved to optimality by mixed-integer linear programming."
+        elif self.stop_reason == "time_limit":
+            comment += " Mixed-integer linear programming stopped by time limit."
         optimization_solution = OptimizationSolution(
             id=f"optimization-genetic@{to_datetime(as_string=True)}",
             generated_at=to_datetime(),
-            comment="Optimization solution derived from GeneticSolution.",
+            comment=comment,
             valid_from=start_datetime,
             valid_until=start_datetime.add(hours=self.config.optimization.horizon_hours),
             total_losses_energy_wh=self.result.total_losses,
@@ -756,7 +802,7 @@ class GeneticSolution(ConfigMixin, GeneticParametersBaseModel):
     def energy_management_plan(self) -> EnergyManagementPlan:
         """Provide the genetic solution as an energy management plan."""
         start_datetime = get_ems().start_datetime
-        start_day_hour = start_datetime.in_timezone(self.config.general.timezone).hour
+        interval_sec, start_day_step = self._interval_start_step(start_datetime)
         plan = EnergyManagementPlan(
             id=f"plan-genetic@{to_datetime(as_string=True)}",
             generated_at=to_datetime(),
@@ -768,16 +814,16 @@ class GeneticSolution(ConfigMixin, GeneticParametersBaseModel):
         last_operation_mode: Optional[str] = None
         last_operation_mode_factor: Optional[float] = None
         resource_id = self._battery_device_id()
-        # ac_charge, dc_charge, discharge_allowed start at hour 0 of start day
-        logger.debug("BAT: {} - {}", resource_id, self.ac_charge[start_day_hour:])
+        # ac_charge, dc_charge, discharge_allowed start at step 0 of start day
+        logger.debug("BAT: {} - {}", resource_id, self.ac_charge[start_day_step:])
         for hour_idx, rate in enumerate(self.ac_charge):
-            if hour_idx < start_day_hour:
+            if hour_idx < start_day_step:
                 continue
             # Derive SOC-clamped effective factors so that FRBCInstruction
             # operation_mode_factor reflects what can physically be executed,
             # while the raw genetic gene values are preserved in the solution
             # dataframe (genetic_*_factor columns).
-            result_idx = hour_idx - start_day_hour
+            result_idx = hour_idx - start_day_step
             soc_h_pct = (
                 self.result.battery_soc_per_hour[result_idx]
                 if result_idx < len(self.result.battery_soc_per_hour)
@@ -800,7 +846,7 @@ class GeneticSolution(ConfigMixin, GeneticParametersBaseModel):
                 continue
             last_operation_mode = operation_mode
             last_operation_mode_factor = operation_mode_factor
-            execution_time = start_datetime.add(hours=hour_idx - start_day_hour)
+            execution_time = start_datetime.add(seconds=(hour_idx - start_day_step) * interval_sec)
             plan.add_instruction(
                 FRBCInstruction(
                     resource_id=resource_id,
@@ -812,7 +858,7 @@ class GeneticSolution(ConfigMixin, GeneticParametersBaseModel):
             )
 
         # Add EV battery instructions (fill rate based control)
-        # ev_charge_hours_float start at hour 0 of start day
+        # ev_charge_hours_float start at step 0 of start day
         if self.ev_obj:
             resource_id = self._ev_device_id()
             if self.ev_charge_hours_float is None:
@@ -831,10 +877,10 @@ class GeneticSolution(ConfigMixin, GeneticParametersBaseModel):
                 last_operation_mode = None
                 last_operation_mode_factor = None
                 logger.debug(
-                    "EV: {} - {}", resource_id, self.ev_charge_hours_float[start_day_hour:]
+                    "EV: {} - {}", resource_id, self.ev_charge_hours_float[start_day_step:]
                 )
                 for hour_idx, rate in enumerate(self.ev_charge_hours_float):
-                    if hour_idx < start_day_hour:
+                    if hour_idx < start_day_step:
                         continue
                     operation_mode, operation_mode_factor = self._battery_operation_from_solution(
                         rate, 0.0, False
@@ -847,7 +893,9 @@ class GeneticSolution(ConfigMixin, GeneticParametersBaseModel):
                         continue
                     last_operation_mode = operation_mode
                     last_operation_mode_factor = operation_mode_factor
-                    execution_time = start_datetime.add(hours=hour_idx - start_day_hour)
+                    execution_time = start_datetime.add(
+                        seconds=(hour_idx - start_day_step) * interval_sec
+                    )
                     plan.add_instruction(
                         FRBCInstruction(
                             resource_id=resource_id,
@@ -876,7 +924,7 @@ class GeneticSolution(ConfigMixin, GeneticParametersBaseModel):
                     else:
                         operation_mode = ApplianceOperationMode.OFF  # type: ignore[assignment]
                     operation_mode_factor = 1.0
-                    execution_time = start_datetime.add(hours=hours)
+                    execution_time = start_datetime.add(seconds=hours * interval_sec)
                     plan.add_instruction(
                         DDBCInstruction(
                             resource_id=resource_id,
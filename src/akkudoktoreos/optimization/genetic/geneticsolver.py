@@ -0,0 +1,140 @@
+"""Solver algorithms on top of the GENETIC algorithm.
+
+Algorithms that solve the optimization directly - instead of evolving a population - share device
+setup, simulation and solution with the GENETIC algorithm. Their decisions are encoded as a genome
+of the GENETIC algorithm and simulated by the device models, so the result is a `GeneticSolution`.
+Optimization runs a solver does not model fall back to the genetic search.
+"""
+
+from typing import Any, ClassVar, Optional
+
+from loguru import logger
+
+from akkudoktoreos.optimization.genetic.genetic import (
+    GeneticIndividual,
+    GeneticOptimization,
+)
+from akkudoktoreos.optimization.genetic.geneticparams import (
+    GeneticOptimizationParameters,
+)
+from akkudoktoreos.optimization.genetic.geneticsolution import GeneticSolution
+
+
+class GeneticSolverOptimization(GeneticOptimization):
+    """Base class of solver algorithms that fall back to the genetic search.
+
+    Subclasses implement `solve()` and extend `solver_supported()` by the conditions of their
+    model.
+    """
+
+    # Name of the algorithm in log messages
+    solver_name: ClassVar[str] = "Solver"
+
+    def __init__(
+        self,
+        verbose: bool = False,
+        fixed_seed: Optional[int] = None,
+    ):
+        """Initialize the optimization problem with the required parameters."""
+        super().__init__(verbose=verbose, fixed_seed=fixed_seed)
+        # Parameters of the optimization run, only available during optimization
+        self.parameters: Optional[GeneticOptimizationParameters] = None
+        self.worst_case = False
+
+    def solver_supported(self) -> bool:
+        """Check whether the solver models the optimization run.
+
+        Solvers model a battery behind an inverter in hourly steps without DC charge
+        optimization and without the worst case optimization.
+
+        Returns:
+            bool: True if the run can be solved, False if the genetic search is needed.
+        """
+        return (
+            self.parameters is not None
+            and self.simulation.battery is not None
+            and self.simulation.inverter is not None
+            and not self.optimize_dc_charge
+            and not self.worst_case
+            and self.step_hours == 1.0  # hourly steps only
+        )
+
+    def solve(self) -> Optional[tuple[list[int], str]]:
+        """Solve the optimization run.
+
+        Only called if `solver_supported()`.
+
+        Returns:
+            tuple[list[int], str]: The genome of the solution and the stop reason, None if no
+            solution was found.
+        """
+        raise NotImplementedError
+
+    def optimize(
+        self,
+        start_solution: Optional[list[float]] = None,
+        ngen: int = 200,
+    ) -> tuple[Any, dict[str, list[Any]]]:
+        """Run the optimization process using the solver.
+
+        Falls back to the genetic search if the solver does not model the run or finds no
+        solution.
+
+        Args:
+            start_solution (list[float], optional): Start solution for the genetic search
+                fallback. Not needed by the solver.
+            ngen (int): Number of generations for the genetic search fallback.
+
+        Returns:
+            tuple[Any, dict[str, list[Any]]]: The best individual and its extra data.
+        """
+        solution = None
+        if self.solver_supported():
+            solution = self.solve()
+            if solution is None:
+                logger.warning(
+                    "{} optimization found no solution - falling back to GENETIC.",
+                    self.solver_name,
+                )
+        else:
+            logger.info(
+                "{} optimization does not model the devices - falling back to GENETIC.",
+                self.solver_name,
+            )
+        if solution is None:
+            return super().optimize(start_solution, ngen=ngen)
+
+        genome, stop_reason = solution
+        individual = GeneticIndividual(genome)
+        individual.fitness.values = self.toolbox.evaluate(individual)
+        fitness = individual.fitness.values[0]
+        logger.debug("{} optimization solved: fitness {}", self.solver_name, fitness)
+
+        self.fitness_history = {
+            "gen": [0],
+            "avg": [fitness],
+            "max": [fitness],
+            "min": [fitness],
+            "generations": None,
+            "stop_reason": stop_reason,
+        }
+        balance, losses, constraints = individual.extra_data
+        return individual, {"balance": [balance], "losses": [losses], "constraints": [constraints]}
+
+    def optimize_ems(
+        self,
+        parameters: GeneticOptimizationParameters,
+        start_hour: Optional[int] = None,
+        worst_case: bool = False,
+        ngen: Optional[int] = None,
+    ) -> GeneticSolution:
+        """Perform EMS (Energy Management System) optimization and visualize results."""
+        self.parameters = parameters
+        self.worst_case = worst_case
+        try:
+            return super().optimize_ems(
+                parameters, start_hour=start_hour, worst_case=worst_case, ngen=ngen
+            )
+        finally:
+            self.parameters = None
+            self.worst_case = False
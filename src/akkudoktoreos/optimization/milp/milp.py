@@ -0,0 +1,384 @@
+"""Mixed-integer linear programming algorithm."""
+
+import time
+from typing import Any, Iterable, Optional
+
+import numpy as np
+from loguru import logger
+from scipy.optimize import Bounds, LinearConstraint, OptimizeResult, milp
+from scipy.sparse import coo_array
+
+from akkudoktoreos.optimization.genetic.geneticsolver import GeneticSolverOptimization
+
+
+class MILPModel:
+    """Mixed-integer linear program in the form solved by `scipy.optimize.milp`.
+
+    Variables and constraints are added one by one; the sparse constraint matrix is built when
+    the program is solved.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty program without variables and constraints."""
+        # Per variable: objective coefficient, bounds and integrality
+        self.cost: list[float] = []
+        self.lower: list[float] = []
+        self.upper: list[float] = []
+        self.integrality: list[int] = []
+        # Constraint matrix entries in coordinate format
+        self.rows: list[int] = []
+        self.cols: list[int] = []
+        self.values: list[float] = []
+        # Per constraint: bounds
+        self.row_lower: list[float] = []
+        self.row_upper: list[float] = []
+
+    def add_variable(
+        self,
+        lower: float = 0.0,
+        upper: float = np.inf,
+        cost: float = 0.0,
+        integer: bool = False,
+    ) -> int:
+        """Add a variable.
+
+        Args:
+            lower (float): Lower bound of the variable.
+            upper (float): Upper bound of the variable.
+            cost (float): Coefficient of the variable in the objective to minimize.
+            integer (bool): True for an integer variable.
+
+        Returns:
+            int: Index of the variable.
+        """
+        self.cost.append(cost)
+        self.lower.append(lower)
+        self.upper.append(upper)
+        self.integrality.append(1 if integer else 0)
+        return len(self.cost) - 1
+
+    def add_binary(self, cost: float = 0.0) -> int:
+        """Add a binary variable.
+
+        Args:
+            cost (float): Coefficient of the variable in the objective to minimize.
+
+        Returns:
+            int: Index of the variable.
+        """
+        return self.add_variable(0.0, 1.0, cost=cost, integer=True)
+
+    def add_constraint(
+        self, terms: Iterable[tuple[int, float]], lower: float = -np.inf, upper: float = np.inf
+    ) -> None:
+        """Add the linear constraint lower <= sum(coefficient * variable) <= upper.
+
+        Args:
+            terms (Iterable[tuple[int, float]]): Pairs of variable index and coefficient.
+            lower (float): Lower bound of the constraint.
+            upper (float): Upper bound of the constraint.
+        """
+        row = len(self.row_lower)
+        for col, value in terms:
+            self.rows.append(row)
+            self.cols.append(col)
+            self.values.append(value)
+        self.row_lower.append(lower)
+        self.row_upper.append(upper)
+
+    def solve(self, time_limit_sec: Optional[float] = None) -> OptimizeResult:
+        """Solve the program by the HiGHS solver.
+
+        Args:
+            time_limit_sec (float, optional): Time limit of the solver. None = no limit.
+
+        Returns:
+            OptimizeResult: The result of `scipy.optimize.milp`.
+        """
+        matrix = coo_array(
+            (self.values, (self.rows, self.cols)),
+            shape=(len(self.row_lower), len(self.cost)),
+        ).tocsr()
+        options: dict[str, Any] = {"disp": False}
+        if time_limit_sec is not None:
+            options["time_limit"] = time_limit_sec
+        return milp(
+            c=np.array(self.cost),
+            integrality=np.array(self.integrality),
+            bounds=Bounds(np.array(self.lower), np.array(self.upper)),
+            constraints=LinearConstraint(matrix, self.row_lower, self.row_upper),
+            options=options,
+        )
+
+
+class MILPOptimization(GeneticSolverOptimization):
+    """MILP (mixed-integer linear programming) algorithm to solve energy optimization.
+
+    The energy optimization is formulated as a mixed-integer linear program on hourly energies
+    and solved by the HiGHS solver bundled with SciPy. Per hour the program decides the battery
+    state (idle, discharge or AC charge at one of the battery charge rates), the EV charge rate
+    and the start hour of the home appliance. Battery and inverter efficiencies are the same as
+    used by the `Battery` and `Inverter` device models. The self-consumption rate of the inverter
+    depends on the consumption of the hour and is linearized piecewise.
+
+    Device setup, simulation and solution are shared with the GENETIC algorithm. The decisions
+    are encoded as a genome of the GENETIC algorithm and simulated by the device models, so the
+    result is a `GeneticSolution`. Configurations the MILP does not model fall back to the genetic
+    search.
+    """
+
+    solver_name = "MILP"
+
+    def solve(self) -> Optional[tuple[list[int], str]]:
+        """Build and solve the mixed-integer linear program of the optimization run.
+
+        Returns:
+            tuple[list[int], str]: The genome of the solution and the stop reason ("optimal" or
+            "time_limit"), None if no solution was found.
+        """
+        battery = self.simulation.battery
+        inverter = self.simulation.inverter
+        ev = self.simulation.ev
+        home_appliance = self.simulation.home_appliance
+        parameters = self.parameters
+        load = self.simulation.load_energy_array
+        pv = self.simulation.pv_prediction_wh
+        prices = self.simulation.elect_price_hourly
+        revenues = self.simulation.elect_revenue_per_hour_arr
+        if (
+            battery is None
+            or inverter is None
+            or parameters is None
+            or load is None
+            or pv is None
+            or prices is None
+            or revenues is None
+        ):  # Make mypy happy
+            raise ValueError("MILP optimization requires a battery and a prepared simulation.")
+        milp_settings = self.config.optimization.milp
+        prediction_hours = self.config.prediction.hours
+        start_hour = self.ems.start_datetime.hour
+        end_hour = len(load)
+
+        model = MILPModel()
+
+        # Battery AC charge levels as raw DC energy per hour, capped by the inverter AC power
+        ac_to_dc_eff = inverter.ac_to_dc_efficiency
+        dc_to_ac_eff = inverter.dc_to_ac_efficiency
+        max_ac_charge_w = inverter.max_ac_charge_power_w
+        ac_charging_possible = ac_to_dc_eff > 0 and (max_ac_charge_w is None or max_ac_charge_w > 0)
+        ac_charge_wh = [
+            battery.max_charge_power_w
+            * (
+                min(rate, max_ac_charge_w * ac_to_dc_eff / battery.max_charge_power_w)
+                if max_ac_charge_w is not None and battery.max_charge_power_w > 0
+                else rate
+            )
+            for rate in self.bat_possible_charge_values
+        ]
+        discharge_ac_eff = battery.discharging_efficiency * dc_to_ac_eff
+
+        # EV charge levels as AC energy per hour
+        ev_charge_wh: list[float] = []
+        if self.optimize_ev and ev is not None:
+            ev_charge_wh = [
+                ev.max_charge_power_w * rate * ev.charging_efficiency
+                for rate in self.ev_possible_charge_values
+            ]
+        ev_charge_hours = prediction_hours - self.fixed_ev_hours
+
+        # Home appliance load curve per possible start hour
+        appliance_starts: list[int] = []
+        appliance_curves = np.zeros((0, prediction_hours))
+        if home_appliance is not None and self.opti_param.get("home_appliance", 0) > 0:
+            appliance_starts = list(range(start_hour, 24))
+            _, appliance_curves = home_appliance.load_curves_batch(
+                np.array(appliance_starts), start_hour
+            )
+            # Start hour 0 denotes no start (see evaluate_inner)
+            appliance_curves[np.array(appliance_starts) == 0] = 0.0
+            appliance_start_vars = [model.add_binary() for _ in appliance_starts]
+            model.add_constraint([(var, 1.0) for var in appliance_start_vars], 1.0, 1.0)
+
+        soc_wh: Any = battery.initial_soc_wh()  # Constant or variable index
+        soc_lower = min(battery.min_soc_wh, soc_wh)
+        ev_soc_wh: Any = ev.initial_soc_wh() if ev_charge_wh and ev else None
+        decisions: list[dict[str, Any]] = []
+        for hour in range(start_hour, end_hour):
+            generation = float(pv[hour])
+
+            # Battery
+            charge_dc = model.add_variable(0.0, battery.max_charge_power_w)
+            discharge_raw = model.add_variable(0.0, battery.max_charge_power_w)
+            discharge = model.add_binary()
+            ac_charge = [model.add_binary() for _ in ac_charge_wh] if ac_charging_possible else []
+            model.add_constraint([(discharge, 1.0)] + [(var, 1.0) for var in ac_charge], upper=1.0)
+            model.add_constraint(
+                [(discharge_raw, 1.0), (discharge, -battery.max_charge_power_w)], upper=0.0
+            )
+            next_soc_wh = model.add_variable(soc_lower, battery.max_soc_wh)
+            soc_terms = [
+                (next_soc_wh, 1.0),
+                (charge_dc, -battery.charging_efficiency),
+                (discharge_raw, 1.0),
+            ] + [
+                (var, -wh * battery.charging_efficiency) for var, wh in zip(ac_charge, ac_charge_wh)
+            ]
+            if isinstance(soc_wh, int):
+                model.add_constraint(soc_terms + [(soc_wh, -1.0)], 0.0, 0.0)
+            else:
+                model.add_constraint(soc_terms, soc_wh, soc_wh)
+            soc_wh = next_soc_wh
+
+            # Consumption of the hour: load, EV charge and home appliance
+            consumption_terms: list[tuple[int, float]] = []
+            consumption_max = float(load[hour])
+            ev_charge: list[int] = []
+            if ev_charge_wh:
+                ev_charge = [model.add_binary() for _ in ev_charge_wh]
+                model.add_constraint([(var, 1.0) for var in ev_charge], 1.0, 1.0)
+                if hour >= ev_charge_hours:
+                    # No EV charging at the fixed hours (see mutate)
+                    model.lower[ev_charge[0]] = 1.0
+                consumption_terms += [(var, -wh) for var, wh in zip(ev_charge, ev_charge_wh)]
+                consumption_max += max(ev_charge_wh)
+                next_ev_soc_wh = model.add_variable(0.0, ev.max_soc_wh)  # type: ignore[union-attr]
+                ev_terms = [(next_ev_soc_wh, 1.0)] + [
+                    (var, -wh) for var, wh in zip(ev_charge, ev_charge_wh)
+                ]
+                if isinstance(ev_soc_wh, int):
+                    model.add_constraint(ev_terms + [(ev_soc_wh, -1.0)], 0.0, 0.0)
+                else:
+                    model.add_constraint(ev_terms, ev_soc_wh, ev_soc_wh)
+                ev_soc_wh = next_ev_soc_wh
+            if appliance_starts:
+                consumption_terms += [
+                    (var, -curve[hour])
+                    for var, curve in zip(appliance_start_vars, appliance_curves)
+                    if curve[hour] > 0
+                ]
+                consumption_max += float(appliance_curves[:, hour].max())
+
+            # Piecewise linear energy flows of the inverter over the consumption
+            breakpoints = [float(load[hour])]
+            if consumption_max > breakpoints[0]:
+                breakpoints = list(
+                    np.linspace(breakpoints[0], consumption_max, milp_settings.scr_segments + 1)
+                )
+                if breakpoints[0] < generation < breakpoints[-1]:
+                    breakpoints = sorted(breakpoints + [generation])
+            surplus = []  # PV energy left to charge the battery or feed in
+            need = []  # Energy to cover by battery discharge or grid import
+            for consumption in breakpoints:
+                if generation >= consumption:
+                    scr = inverter.self_consumption_predictor.calculate_self_consumption(
+                        consumption, generation
+                    )
+                    surplus.append((generation - consumption) * scr)
+                    need.append((generation - consumption) * (1.0 - scr))
+                else:
+                    surplus.append(0.0)
+                    need.append(consumption - generation)
+            weights = [model.add_variable(0.0, 1.0) for _ in breakpoints]
+            model.add_constraint([(var, 1.0) for var in weights], 1.0, 1.0)
+            model.add_constraint(
+                [(var, x) for var, x in zip(weights, breakpoints)] + consumption_terms,
+                float(load[hour]),
+                float(load[hour]),
+            )
+            if len(weights) > 2:
+                # Only two adjacent breakpoints may be weighted (SOS2)
+                segments = [model.add_binary() for _ in range(len(weights) - 1)]
+                model.add_constraint([(var, 1.0) for var in segments], 1.0, 1.0)
+                for idx, weight in enumerate(weights):
+                    adjacent = segments[max(idx - 1, 0) : idx + 1]
+                    model.add_constraint(
+                        [(weight, 1.0)] + [(var, -1.0) for var in adjacent], upper=0.0
+                    )
+
+            # Energy balance
+            grid_import = model.add_variable(cost=float(prices[hour]))
+            grid_export = model.add_variable(cost=-float(revenues[hour]))
+            load_import = model.add_variable()
+            model.add_constraint(
+                [(var, wh) for var, wh in zip(weights, need)]
+                + [(discharge_raw, -discharge_ac_eff), (load_import, -1.0)],
+                0.0,
+                0.0,
+            )
+            model.add_constraint(
+                [(var, wh) for var, wh in zip(weights, surplus)]
+                + [(charge_dc, -1.0), (grid_export, -1.0)],
+                lower=0.0,
+            )
+            model.add_constraint(
+                [(grid_export, 1.0)] + [(var, x) for var, x in zip(weights, breakpoints)],
+                upper=inverter.max_power_wh,
+            )
+            model.add_constraint(
+                [(grid_import, 1.0), (load_import, -1.0)]
+                + [(var, -wh / ac_to_dc_eff) for var, wh in zip(ac_charge, ac_charge_wh)],
+                0.0,
+                0.0,
+            )
+            decisions.append(
+                {"discharge": discharge, "ac_charge": ac_charge, "ev_charge": ev_charge}
+            )
+
+        # Value of the energy left in the battery - same as applied by the fitness function
+        if isinstance(soc_wh, int):
+            model.cost[soc_wh] -= discharge_ac_eff * parameters.ems.price_per_wh_battery
+
+        # Penalty for missing the EV target state of charge - same as applied by the fitness function
+        if (
+            ev_charge_wh
+            and ev is not None
+            and parameters.ev is not None
+            and isinstance(ev_soc_wh, int)
+        ):
+            try:
+                penalty = float(self.config.optimization.genetic.penalties["ev_soc_miss"])
+            except Exception:
+                penalty = 10
+            ev_soc_miss = model.add_variable(cost=penalty * 100 / ev.capacity_wh)
+            model.add_constraint(
+                [(ev_soc_miss, 1.0), (ev_soc_wh, 1.0)],
+                lower=parameters.ev.min_soc_percentage / 100 * ev.capacity_wh,
+            )
+
+        start_time = time.perf_counter()
+        result = model.solve(milp_settings.time_limit_sec)
+        solve_time = time.perf_counter() - start_time
+        logger.info(
+            "MILP optimization solved {} variables, {} constraints in {:.3f} seconds: {}",
+            len(model.cost),
+            len(model.row_lower),
+            solve_time,
+            result.message,
+        )
+        if result.x is None:
+            return None
+
+        # Decode the decisions to a genome
+        x = np.rint(result.x).astype(int)
+        len_bat = len(self.bat_possible_charge_values)
+        battery_states = np.zeros(prediction_hours, dtype=int)
+        ev_charge_index = np.zeros(prediction_hours, dtype=int) if self.optimize_ev else None
+        for hour, decision in zip(range(start_hour, end_hour), decisions):
+            if x[decision["discharge"]]:
+                battery_states[hour] = len_bat
+            for idx, var in enumerate(decision["ac_charge"]):
+                if x[var]:
+                    battery_states[hour] = 2 * len_bat + idx
+            if ev_charge_index is not None:
+                for idx, var in enumerate(decision["ev_charge"]):
+                    if x[var]:
+                        ev_charge_index[hour] = idx
+        appliance_start: Optional[int] = None
+        if appliance_starts:
+            appliance_start = next(
+                start for start, var in zip(appliance_starts, appliance_start_vars) if x[var]
+            )
+        genome = self.merge_individual(battery_states, ev_charge_index, appliance_start)
+        stop_reason = "optimal" if result.status == 0 else "time_limit"
+        return genome, stop_reason
@@ -1,6 +1,6 @@
-from typing import Optional, Union
+from typing import Literal, Optional, Union
 
-from pydantic import Field, computed_field
+from pydantic import Field, computed_field, field_validator
 
 from akkudoktoreos.config.configabc import SettingsBaseModel
 from akkudoktoreos.core.coreabc import get_ems
@@ -41,6 +41,222 @@ class GeneticCommonSettings(SettingsBaseModel):
         },
     )
 
+    workers: Union[int, Literal["auto"]] = Field(
+        default=1,
+        json_schema_extra={
+            "description": (
+                "Number of worker processes for parallel fitness evaluation [>= 1]. "
+                "'auto' = number of CPUs. Defaults to 1 (no parallel evaluation)."
+            ),
+            "examples": [1, "auto"],
+        },
+    )
+
+    fitness_cache_size: int = Field(
+        default=10000,
+        ge=0,
+        json_schema_extra={
+            "description": (
+                "Maximum number of fitness evaluations remembered during an optimization run "
+                "[>= 0]. Individuals with an already evaluated genome are not simulated again. "
+                "0 = no cache. Defaults to 10000."
+            ),
+            "examples": [10000, 0],
+        },
+    )
+
+    early_stopping_generations: Optional[int] = Field(
+        default=None,
+        ge=1,
+        json_schema_extra={
+            "description": (
+                "Stop the evolution after this number of generations without improvement of the "
+                "best fitness [>= 1]. None = evolve all generations."
+            ),
+            "examples": [None, 50],
+        },
+    )
+
+    early_stopping_tolerance: float = Field(
+        default=0.0,
+        ge=0.0,
+        json_schema_extra={
+            "description": (
+                "Minimum relative improvement of the best fitness that resets the early stopping "
+                "generation count [>= 0]. Defaults to 0.0 (any improvement)."
+            ),
+            "examples": [0.0, 0.001],
+        },
+    )
+
+    time_limit_sec: Optional[float] = Field(
+        default=None,
+        gt=0.0,
+        json_schema_extra={
+            "description": (
+                "Wall-clock time limit of the evolution in seconds [> 0]. The best solution found "
+                "so far is used when the limit is reached. None = no time limit."
+            ),
+            "examples": [None, 60.0],
+        },
+    )
+
+    warm_start: bool = Field(
+        default=False,
+        json_schema_extra={
+            "description": (
+                "Warm start from the solution of the last energy management run. The last "
+                "solution is time shifted to the start of the new run and a fraction of the "
+                "initial population is seeded with mutated variants of it. Defaults to False."
+            ),
+            "examples": [False, True],
+        },
+    )
+
+    warm_start_fraction: float = Field(
+        default=0.2,
+        ge=0.0,
+        le=1.0,
+        json_schema_extra={
+            "description": (
+                "Fraction of the initial population seeded from the warm start solution "
+                "[0.0 - 1.0]. Defaults to 0.2."
+            ),
+            "examples": [0.2],
+        },
+    )
+
+    heuristic_seeding_fraction: float = Field(
+        default=0.0,
+        ge=0.0,
+        le=1.0,
+        json_schema_extra={
+            "description": (
+                "Fraction of the initial population seeded from rule based schedules "
+                "[0.0 - 1.0]. The schedules charge the battery in cheap hours, discharge it in "
+                "expensive hours or charge it from PV surplus only and charge the electric "
+                "vehicle in the cheapest hours. Defaults to 0.0 (random initial population)."
+            ),
+            "examples": [0.0, 0.1],
+        },
+    )
+
+    islands: int = Field(
+        default=1,
+        ge=1,
+        json_schema_extra={
+            "description": (
+                "Number of islands (sub-populations) evolved side by side [>= 1]. The individuals "
+                "are split among the islands and the best individuals migrate between them. "
+                "Defaults to 1 (single population)."
+            ),
+            "examples": [1, 4],
+        },
+    )
+
+    migration_interval: int = Field(
+        default=10,
+        ge=1,
+        json_schema_extra={
+            "description": (
+                "Number of generations between migrations of the island model [>= 1]. "
+                "Defaults to 10."
+            ),
+            "examples": [10],
+        },
+    )
+
+    migrants: int = Field(
+        default=5,
+        ge=1,
+        json_schema_extra={
+            "description": (
+                "Number of best individuals of an island that migrate to the next island in the "
+                "ring, replacing its worst individuals [>= 1]. Defaults to 5."
+            ),
+            "examples": [5],
+        },
+    )
+
+    scenarios: int = Field(
+        default=0,
+        ge=0,
+        json_schema_extra={
+            "description": (
+                "Number of forecast scenarios of load, PV and price each individual is scored "
+                "against for robust optimization [>= 0]. The scenarios are generated once per "
+                "run from the forecast uncertainties. Defaults to 0 (single forecast)."
+            ),
+            "examples": [0, 16],
+        },
+    )
+
+    scenario_objective: Literal["expected", "cvar"] = Field(
+        default="expected",
+        json_schema_extra={
+            "description": (
+                "Fitness across the forecast scenarios - 'expected' cost or conditional value "
+                "at risk 'cvar' (average cost of the worst scenarios). Defaults to 'expected'."
+            ),
+            "examples": ["expected", "cvar"],
+        },
+    )
+
+    scenario_cvar_alpha: float = Field(
+        default=0.8,
+        ge=0.0,
+        lt=1.0,
+        json_schema_extra={
+            "description": (
+                "Confidence level of the conditional value at risk [0.0 - 1.0[. The fitness is "
+                "the average cost of the worst (1 - alpha) share of the scenarios. "
+                "Defaults to 0.8."
+            ),
+            "examples": [0.8],
+        },
+    )
+
+    scenario_load_uncertainty: float = Field(
+        default=0.1,
+        ge=0.0,
+        json_schema_extra={
+            "description": (
+                "Standard deviation of the load forecast relative to the load, used if the "
+                "parameters do not provide the load standard deviation. Defaults to 0.1."
+            ),
+            "examples": [0.1],
+        },
+    )
+
+    scenario_pv_uncertainty: float = Field(
+        default=0.2,
+        ge=0.0,
+        json_schema_extra={
+            "description": (
+                "Standard deviation of the PV forecast relative to the PV energy. Defaults to 0.2."
+            ),
+            "examples": [0.2],
+        },
+    )
+
+    scenario_price_uncertainty: float = Field(
+        default=0.1,
+        ge=0.0,
+        json_schema_extra={
+            "description": (
+                "Standard deviation of the electricity price forecast relative to the price. "
+                "Defaults to 0.1."
+            ),
+            "examples": [0.1],
+        },
+    )
+
+    @field_validator("workers")
+    def validate_workers(cls, value: Union[int, str]) -> Union[int, str]:
+        if isinstance(value, int) and value < 1:
+            raise ValueError("Number of workers must be at least 1 or 'auto'.")
+        return value
+
     # --- Penalties (existing) -------------------------------------------------
 
     penalties: dict[str, Union[float, int, str]] = Field(
@@ -55,6 +271,50 @@ class GeneticCommonSettings(SettingsBaseModel):
     )
 
 
+class DPCommonSettings(SettingsBaseModel):
+    """General Dynamic Programming Optimization Algorithm Configuration."""
+
+    soc_steps: int = Field(
+        default=200,
+        ge=10,
+        json_schema_extra={
+            "description": (
+                "Number of battery state of charge steps the value function is calculated for "
+                "[>= 10]. Defaults to 200."
+            ),
+            "examples": [200],
+        },
+    )
+
+
+class MILPCommonSettings(SettingsBaseModel):
+    """General Mixed-Integer Linear Programming Optimization Algorithm Configuration."""
+
+    scr_segments: int = Field(
+        default=4,
+        ge=1,
+        json_schema_extra={
+            "description": (
+                "Number of linear segments approximating the inverter self-consumption rate over "
+                "the consumption of an hour [>= 1]. Defaults to 4."
+            ),
+            "examples": [4],
+        },
+    )
+
+    time_limit_sec: Optional[float] = Field(
+        default=60.0,
+        gt=0,
+        json_schema_extra={
+            "description": (
+                "Wall-clock time limit of the MILP solver [s]. The best solution found so far is "
+                "used when the limit is reached. None = no limit. Defaults to 60 seconds."
+            ),
+            "examples": [60.0],
+        },
+    )
+
+
 class OptimizationCommonSettings(SettingsBaseModel):
     """General Optimization Configuration."""
 
@@ -80,8 +340,25 @@ class OptimizationCommonSettings(SettingsBaseModel):
     algorithm: str = Field(
         default="GENETIC",
         json_schema_extra={
-            "description": "The optimization algorithm. Defaults to GENETIC",
-            "examples": ["GENETIC"],
+            "description": (
+                "The optimization algorithm. 'GENETIC', 'DP' (dynamic programming) or 'MILP' "
+                "(mixed-integer linear programming). DP and MILP fall back to GENETIC for devices "
+                "they do not model and for optimization intervals below one hour. "
+                "Defaults to GENETIC"
+            ),
+            "examples": ["GENETIC", "DP", "MILP"],
+        },
+    )
+
+    worker_process: bool = Field(
+        default=True,
+        json_schema_extra={
+            "description": (
+                "Run the optimization in a dedicated, long-lived worker process. The server stays "
+                "responsive while optimizing. False runs the optimization in a thread of the "
+                "server process. Defaults to True."
+            ),
+            "examples": [True],
         },
     )
 
@@ -93,6 +370,22 @@ class OptimizationCommonSettings(SettingsBaseModel):
         },
     )
 
+    dp: DPCommonSettings = Field(
+        default_factory=DPCommonSettings,
+        json_schema_extra={
+            "description": "Dynamic programming optimization algorithm configuration.",
+            "examples": [{"soc_steps": 200}],
+        },
+    )
+
+    milp: MILPCommonSettings = Field(
+        default_factory=MILPCommonSettings,
+        json_schema_extra={
+            "description": "Mixed-integer linear programming optimization algorithm configuration.",
+            "examples": [{"scr_segments": 4, "time_limit_sec": 60.0}],
+        },
+    )
+
     # Computed fields
     @computed_field  # type: ignore[prop-decorator]
     @property
@@ -0,0 +1,203 @@
+"""Status of the running optimization.
+
+The optimization publishes its progress to the optimization status and checks it for a
+cancellation request at every generation boundary. The status is kept in shared memory, so it is
+shared between the server and the optimization worker process.
+"""
+
+import multiprocessing
+import time
+from typing import Any, Optional
+
+from pydantic import Field
+
+from akkudoktoreos.core.pydantic import PydanticBaseModel
+
+
+class OptimizationProgress(PydanticBaseModel):
+    """Progress of the running or latest optimization."""
+
+    running: bool = Field(json_schema_extra={"description": "True if an optimization is running."})
+    algorithm: Optional[str] = Field(
+        default=None,
+        json_schema_extra={"description": "Algorithm of the running or latest optimization."},
+    )
+    generation: int = Field(
+        json_schema_extra={"description": "Number of generations evolved so far."}
+    )
+    generations: int = Field(
+        json_schema_extra={"description": "Number of generations to evolve at most."}
+    )
+    best_fitness: Optional[float] = Field(
+        default=None,
+        json_schema_extra={"description": "Best fitness so far. None if not yet evaluated."},
+    )
+    avg_fitness: Optional[float] = Field(
+        default=None,
+        json_schema_extra={
+            "description": "Average fitness of the latest generation. None if not yet evaluated."
+        },
+    )
+    evaluations_per_sec: Optional[float] = Field(
+        default=None,
+        json_schema_extra={"description": "Fitness evaluations per second."},
+    )
+    eta_sec: Optional[float] = Field(
+        default=None,
+        json_schema_extra={
+            "description": "Estimated time until the optimization is done [seconds]."
+        },
+    )
+    cancel_requested: bool = Field(
+        json_schema_extra={"description": "True if cancellation of the optimization is requested."}
+    )
+
+
+class OptimizationStatus:
+    """Shared status of the running optimization.
+
+    The status values are held in a shared memory array and the cancellation request in an
+    event, both created by the spawn context of the optimization worker process. The status
+    object is handed over to the worker process on start of the process.
+    """
+
+    # Slots of the shared status array
+    _RUNNING = 0
+    _GENERATION = 1
+    _GENERATIONS = 2
+    _BEST_FITNESS = 3
+    _AVG_FITNESS = 4
+    _EVALUATIONS = 5
+    _START_TIME = 6
+    _ETA_SEC = 7
+    _EVALUATIONS_PER_SEC = 8
+    _SLOTS = 9
+
+    def __init__(self) -> None:
+        """Initialize the shared status - no optimization running."""
+        context = multiprocessing.get_context("spawn")
+        self._values: Any = context.Array("d", [float("nan")] * self._SLOTS)
+        self._values[self._RUNNING] = 0.0
+        self._values[self._GENERATION] = 0.0
+        self._values[self._GENERATIONS] = 0.0
+        self._cancel: Any = context.Event()
+        # Only known to the process that started the optimization
+        self.algorithm: Optional[str] = None
+
+    def begin(self, algorithm: Optional[str] = None) -> None:
+        """Mark the start of an optimization - resets progress and cancellation request."""
+        self._cancel.clear()
+        with self._values.get_lock():
+            for slot in range(self._SLOTS):
+                self._values[slot] = float("nan")
+            self._values[self._RUNNING] = 1.0
+            self._values[self._GENERATION] = 0.0
+            self._values[self._GENERATIONS] = 0.0
+        self.algorithm = algorithm
+
+    def end(self) -> None:
+        """Mark the end of an optimization - a pending cancellation request is dropped."""
+        self._values[self._RUNNING] = 0.0
+        self._cancel.clear()
+
+    def start_generations(self, generations: int) -> None:
+        """Mark the start of the evolution of the given number of generations."""
+        with self._values.get_lock():
+            self._values[self._GENERATION] = 0.0
+            self._values[self._GENERATIONS] = float(generations)
+            self._values[self._EVALUATIONS] = 0.0
+            self._values[self._START_TIME] = time.time()
+            self._values[self._ETA_SEC] = float("nan")
+            self._values[self._EVALUATIONS_PER_SEC] = float("nan")
+
+    def update(
+        self,
+        generation: int,
+        evaluations: int,
+        best_fitness: float,
+        avg_fitness: float,
+        time_limit_sec: Optional[float] = None,
+    ) -> None:
+        """Publish the progress after a generation.
+
+        Args:
+            generation (int): Number of generations evolved so far.
+            evaluations (int): Number of fitness evaluations of the generation.
+            best_fitness (float): Best fitness so far.
+            avg_fitness (float): Average fitness of the generation.
+            time_limit_sec (float, optional): Wall-clock time limit of the evolution.
+        """
+        with self._values.get_lock():
+            elapsed = time.time() - self._values[self._START_TIME]
+            generations = self._values[self._GENERATIONS]
+            self._values[self._GENERATION] = float(generation)
+            self._values[self._EVALUATIONS] += float(evaluations)
+            self._values[self._BEST_FITNESS] = float(best_fitness)
+            self._values[self._AVG_FITNESS] = float(avg_fitness)
+            if elapsed > 0:
+                self._values[self._EVALUATIONS_PER_SEC] = self._values[self._EVALUATIONS] / elapsed
+            if generation > 0:
+                eta_sec = elapsed / generation * max(generations - generation, 0)
+                if time_limit_sec is not None:
+                    eta_sec = min(eta_sec, max(time_limit_sec - elapsed, 0.0))
+                self._values[self._ETA_SEC] = eta_sec
+
+    def cancel(self) -> None:
+        """Request cancellation of the running optimization."""
+        self._cancel.set()
+
+    def cancel_requested(self) -> bool:
+        """Check for a cancellation request of the running optimization."""
+        return self._cancel.is_set()
+
+    def progress(self) -> OptimizationProgress:
+        """Get the progress of the running or latest optimization.
+
+        Returns:
+            OptimizationProgress: Progress of the optimization.
+        """
+        with self._values.get_lock():
+            values = list(self._values)
+
+        def value(slot: int) -> Optional[float]:
+            return None if values[slot] != values[slot] else values[slot]  # NaN -> None
+
+        return OptimizationProgress(
+            running=bool(values[self._RUNNING]),
+            algorithm=self.algorithm,
+            generation=int(value(self._GENERATION) or 0),
+            generations=int(value(self._GENERATIONS) or 0),
+            best_fitness=value(self._BEST_FITNESS),
+            avg_fitness=value(self._AVG_FITNESS),
+            evaluations_per_sec=value(self._EVALUATIONS_PER_SEC),
+            eta_sec=value(self._ETA_SEC),
+            cancel_requested=self.cancel_requested(),
+        )
+
+
+# Status of the optimization in this process
+_optimization_status: Optional[OptimizationStatus] = None
+
+
+def get_optimization_status() -> OptimizationStatus:
+    """Get the optimization status of this process.
+
+    Returns:
+        OptimizationStatus: The optimization status, created on first use.
+    """
+    global _optimization_status
+    if _optimization_status is None:
+        _optimization_status = OptimizationStatus()
+    return _optimization_status
+
+
+def set_optimization_status(status: OptimizationStatus) -> None:
+    """Set the optimization status of this process.
+
+    Used by the optimization worker process to share the status of the server process.
+
+    Args:
+        status (OptimizationStatus): The shared optimization status.
+    """
+    global _optimization_status
+    _optimization_status = status
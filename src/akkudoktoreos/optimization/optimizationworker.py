@@ -0,0 +1,276 @@
+"""Optimization worker process.
+
+The energy management optimization is CPU bound Python code. Run in a thread of the server it
+holds the GIL and stalls the event loop - REST and EOSdash requests wait until the optimization
+is done. The optimization worker runs the optimization in a dedicated, long-lived process
+instead. Imports and algorithm setup are paid once per worker process, not per run. The same
+holds for the evaluation pool of the GENETIC algorithm - its processes are children of the worker
+process and are kept for later runs.
+
+Each run hands the serialized optimization parameters and a snapshot of the configuration to the
+worker, so the worker optimizes with exactly the configuration of the calling process. The
+solution is returned to the calling process.
+"""
+
+import asyncio
+import concurrent.futures
+import json
+import multiprocessing
+import os
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing.sharedctypes import Synchronized
+from multiprocessing.synchronize import Event
+from typing import Optional
+
+import psutil
+from loguru import logger
+
+from akkudoktoreos.core.coreabc import ConfigMixin, get_config, get_ems
+from akkudoktoreos.optimization.dp.dp import DPOptimization
+from akkudoktoreos.optimization.genetic.genetic import GeneticOptimization
+from akkudoktoreos.optimization.genetic.geneticparams import (
+    GeneticOptimizationParameters,
+)
+from akkudoktoreos.optimization.genetic.geneticsolution import GeneticSolution
+from akkudoktoreos.optimization.milp.milp import MILPOptimization
+from akkudoktoreos.optimization.optimizationstatus import (
+    OptimizationStatus,
+    get_optimization_status,
+    set_optimization_status,
+)
+from akkudoktoreos.utils.datetimeutil import DateTime
+
+# Optimization algorithms - all share parameters and solution with the GENETIC algorithm.
+OPTIMIZATION_CLASSES: dict[str, type[GeneticOptimization]] = {
+    "GENETIC": GeneticOptimization,
+    "DP": DPOptimization,
+    "MILP": MILPOptimization,
+}
+
+# Configuration snapshot applied to the worker process, set by `_optimize`.
+_worker_config_json: Optional[str] = None
+
+# Set by the calling process if it cancelled the worker process, set by `_init_worker`.
+_worker_cancelled: Optional[Event] = None
+
+
+def _init_worker(status: OptimizationStatus, pid: "Synchronized[int]", cancelled: Event) -> None:
+    """Initialize the worker process.
+
+    The configuration of the worker is solely given by the snapshots of the calling process, so
+    environment, dotenv and file settings are not read. The optimization status is shared with
+    the calling process. The process id is handed back to the calling process to be able to
+    terminate the worker process.
+    """
+    global _worker_cancelled
+
+    _worker_cancelled = cancelled
+    pid.value = os.getpid()
+    set_optimization_status(status)
+    get_config(
+        init={
+            "with_env_settings": False,
+            "with_dotenv_settings": False,
+            "with_file_settings": False,
+            "with_file_secret_settings": False,
+        }
+    )
+    get_ems(init=True)
+
+
+def _optimize(
+    algorithm: str,
+    parameters_json: str,
+    config_json: str,
+    start_datetime: DateTime,
+    ngen: Optional[int],
+    fixed_seed: Optional[int],
+    verbose: bool,
+) -> GeneticSolution:
+    """Run the optimization in the worker process."""
+    global _worker_config_json
+
+    if _worker_cancelled is not None and _worker_cancelled.is_set():
+        # Cancelled while the worker process was starting up - do not touch the shared status
+        raise RuntimeError("Optimization worker process cancelled.")
+
+    from akkudoktoreos.core.cache import CacheEnergyManagementStore
+    from akkudoktoreos.core.logging import logging_track_config
+
+    config = get_config()
+    if config_json != _worker_config_json:
+        config.reset_settings()
+        config.merge_settings_from_dict(json.loads(config_json))
+        if config.logging.console_level:
+            # Log like the calling process (set up by the server)
+            logging_track_config(config, "logging", None, None)
+        _worker_config_json = config_json
+
+    get_ems().set_start_datetime(start_datetime)
+    CacheEnergyManagementStore().clear()
+
+    parameters = GeneticOptimizationParameters.model_validate_json(parameters_json)
+    optimization = OPTIMIZATION_CLASSES[algorithm](verbose=verbose, fixed_seed=fixed_seed)
+    return optimization.optimize_ems(
+        parameters=parameters, start_hour=start_datetime.hour, ngen=ngen
+    )
+
+
+class OptimizationWorker(ConfigMixin):
+    """Long-lived worker process for the energy management optimization.
+
+    The worker process is started on first use and kept for later runs. A cancelled run
+    terminates the worker process; the next run starts a new one.
+
+    Example:
+        .. code-block:: python
+
+            worker = OptimizationWorker()
+            solution = await worker.optimize("GENETIC", parameters, start_datetime)
+            worker.close()
+    """
+
+    def __init__(self) -> None:
+        """Initialize the worker - the worker process is started on first use."""
+        self._executor: Optional[concurrent.futures.ProcessPoolExecutor] = None
+        # Process id of the worker process, set by the worker process on start; 0 = not started.
+        self._pid: Optional["Synchronized[int]"] = None
+        # Cancellation of the worker process, checked by the worker before each optimization.
+        self._cancelled: Optional[Event] = None
+        # Process id and cancellation of cancelled worker processes that may still be starting.
+        # Kept until the process is gone - the process reads them on start.
+        self._cancelled_workers: list[tuple["Synchronized[int]", Event]] = []
+
+    def _get_executor(self) -> concurrent.futures.ProcessPoolExecutor:
+        """Get the executor of the worker process, start it if needed."""
+        if self._executor is None:
+            # Do not fork - the optimization is started from a multi-threaded server.
+            mp_context = multiprocessing.get_context("spawn")
+            self._pid = mp_context.Value("i", 0)
+            self._cancelled = mp_context.Event()
+            self._executor = concurrent.futures.ProcessPoolExecutor(
+                max_workers=1,
+                mp_context=mp_context,
+                initializer=_init_worker,
+                initargs=(get_optimization_status(), self._pid, self._cancelled),
+            )
+        return self._executor
+
+    def config_snapshot(self) -> str:
+        """Snapshot of the configuration of the calling process for the worker process.
+
+        Returns:
+            str: The configuration as JSON string.
+        """
+        return self.config.model_dump_json(exclude_computed_fields=True)
+
+    async def optimize(
+        self,
+        algorithm: str,
+        parameters: GeneticOptimizationParameters,
+        start_datetime: DateTime,
+        ngen: Optional[int] = None,
+        fixed_seed: Optional[int] = None,
+        verbose: bool = False,
+    ) -> GeneticSolution:
+        """Run the optimization in the worker process.
+
+        The event loop is not blocked while the worker optimizes. If the awaiting task is
+        cancelled, the worker process is terminated.
+
+        Args:
+            algorithm (str): The optimization algorithm, one of `OPTIMIZATION_CLASSES`.
+            parameters (GeneticOptimizationParameters): Optimization parameters.
+            start_datetime (DateTime): Start datetime of the energy management run.
+            ngen (int, optional): Number of generations. Defaults to the configuration.
+            fixed_seed (int, optional): Random seed. None = random.
+            verbose (bool): Verbose optimization output.
+
+        Returns:
+            GeneticSolution: The solution of the optimization.
+
+        Raises:
+            ValueError: If the algorithm is unknown.
+        """
+        if algorithm not in OPTIMIZATION_CLASSES:
+            raise ValueError(f"Unknown optimization algorithm: '{algorithm}'.")
+
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(
+            self._get_executor(),
+            _optimize,
+            algorithm,
+            parameters.model_dump_json(),
+            self.config_snapshot(),
+            start_datetime,
+            ngen,
+            fixed_seed,
+            verbose,
+        )
+        try:
+            return await future
+        except asyncio.CancelledError:
+            logger.info("Optimization cancelled - terminating optimization worker process.")
+            self.cancel()
+            raise
+        except BrokenProcessPool:
+            # The worker process died - start a new one on next use
+            self.cancel()
+            raise
+
+    def cancel(self) -> bool:
+        """Cancel a running optimization by terminating the worker process and its children.
+
+        A worker process that is still starting up did not report its process id yet and can not
+        be terminated. It is flagged as cancelled instead - it skips the optimizations already
+        handed to it and exits.
+
+        Returns:
+            bool: True if the worker process was terminated, is already gone or was flagged as
+                cancelled, False if there is no worker process or it could not be terminated.
+        """
+        executor = self._executor
+        if executor is None or self._pid is None or self._cancelled is None:
+            return False
+        # Flag first - a worker process that reports its process id after it was read below
+        # sees the flag before it starts to optimize.
+        self._cancelled.set()
+        pid = self._pid.value
+        self._cancelled_workers = [
+            (worker_pid, cancelled)
+            for worker_pid, cancelled in self._cancelled_workers
+            if not worker_pid.value or psutil.pid_exists(worker_pid.value)
+        ]
+        if not pid:
+            self._cancelled_workers.append((self._pid, self._cancelled))
+        self._executor = None
+        self._pid = None
+        self._cancelled = None
+        terminated = True
+        if pid:
+            try:
+                process = psutil.Process(pid)
+                # The evaluation pool processes of the worker process are terminated as well.
+                children = process.children(recursive=True)
+                process.terminate()
+                for child in children:
+                    try:
+                        child.terminate()
+                    except psutil.NoSuchProcess:
+                        pass
+            except psutil.NoSuchProcess:
+                pass
+            except psutil.Error as e:
+                logger.error("Can not terminate optimization worker process {}: {}", pid, e)
+                terminated = False
+        else:
+            logger.info("Optimization worker process cancelled while starting up.")
+        executor.shutdown(wait=False, cancel_futures=True)
+        return terminated
+
+    def close(self) -> None:
+        """Stop the worker process.
+
+        A running optimization is aborted - closing does not wait for the optimization to finish.
+        """
+        self.cancel()
@@ -63,6 +63,31 @@ class ElecPriceCommonSettings(SettingsBaseModel):
         },
     )
 
+    ets_refit_hours: int = Field(
+        default=168,
+        ge=0,
+        json_schema_extra={
+            "description": (
+                "Hours of new prices after which the exponential smoothing model used to "
+                "extrapolate prices beyond the published horizon is fully refitted. In between, "
+                "the fitted model is updated incrementally. 0 refits on every update."
+            ),
+            "examples": [168],
+        },
+    )
+
+    ets_refit_error_ratio: float = Field(
+        default=2.0,
+        ge=1.0,
+        json_schema_extra={
+            "description": (
+                "Refit the exponential smoothing model when the forecast error on new prices "
+                "exceeds the error of the last fit by this factor."
+            ),
+            "examples": [2.0],
+        },
+    )
+
     elecpricefixed: ElecPriceFixedCommonSettings = Field(
         default_factory=ElecPriceFixedCommonSettings,
         json_schema_extra={"description": "Fixed electricity price provider settings."},
@@ -5,10 +5,14 @@ Notes:
 """
 
 from abc import abstractmethod
+from datetime import datetime
 from typing import List, Optional
 
-from pydantic import Field, computed_field
+import numpy as np
+from loguru import logger
+from pydantic import Field, PrivateAttr, computed_field
 
+from akkudoktoreos.prediction.elecpriceets import ElecPriceETSModel
 from akkudoktoreos.prediction.predictionabc import PredictionProvider, PredictionRecord
 
 
@@ -63,6 +67,10 @@ class ElecPriceProvider(PredictionProvider):
         json_schema_extra={"description": "List of ElecPriceDataRecord records"},
     )
 
+    # Cached exponential smoothing model and the (exclusive) end of the history it has seen
+    _ets_model: Optional[ElecPriceETSModel] = PrivateAttr(default=None)
+    _ets_end_datetime: Optional[datetime] = PrivateAttr(default=None)
+
     @classmethod
     @abstractmethod
     def provider_id(cls) -> str:
@@ -70,3 +78,47 @@ class ElecPriceProvider(PredictionProvider):
 
     def enabled(self) -> bool:
         return self.provider_id() == self.config.elecprice.provider
+
+    def _predict_ets_cached(
+        self, history: np.ndarray, end_datetime: datetime, seasonal_periods: int, hours: int
+    ) -> np.ndarray:
+        """Extrapolate hourly prices by the cached exponential smoothing model.
+
+        The model fitted on a previous update is updated incrementally by the prices added to the
+        history since then. The model is fully refitted on the first call, when the seasonal
+        periods change, after `elecprice.ets_refit_hours` of new prices or when the forecast
+        error on the new prices exceeds the error of the fit by `elecprice.ets_refit_error_ratio`.
+
+        Args:
+            history (np.ndarray): Hourly prices up to `end_datetime`.
+            end_datetime (datetime): End of the history (exclusive).
+            seasonal_periods (int): Number of hours in a season.
+            hours (int): Number of hours to forecast.
+
+        Returns:
+            np.ndarray: Price forecast, one value per hour following the history.
+        """
+        model = self._ets_model
+        rmse: Optional[float] = None
+        if model is not None and self._ets_end_datetime is not None:
+            new_hours = int((end_datetime - self._ets_end_datetime).total_seconds() // 3600)
+            if 0 <= new_hours <= len(history) and model.seasonal_periods == seasonal_periods:
+                rmse = model.update(history[len(history) - new_hours :])
+            else:
+                model = None
+
+        if model is None or model.needs_refit(
+            seasonal_periods,
+            refit_steps=self.config.elecprice.ets_refit_hours,
+            error_ratio=self.config.elecprice.ets_refit_error_ratio,
+            rmse=rmse,
+        ):
+            logger.debug(
+                f"{self.provider_id()}: fit exponential smoothing model on {len(history)} prices."
+            )
+            model = ElecPriceETSModel(seasonal_periods)
+            model.fit(history)
+
+        self._ets_model = model
+        self._ets_end_datetime = end_datetime
+        return model.forecast(hours)
@@ -6,11 +6,11 @@ humidity, cloud cover, and solar irradiance. The data is mapped to the `ElecPric
 format, enabling consistent access to forecasted and historical electricity price attributes.
 """
 
+import asyncio
 from typing import Any, List, Optional, Union
 
 import numpy as np
 import pandas as pd
-import requests
 from loguru import logger
 from pydantic import ValidationError
 from statsmodels.tsa.holtwinters import ExponentialSmoothing
@@ -19,6 +19,7 @@ from akkudoktoreos.core.cache import cache_in_file
 from akkudoktoreos.core.pydantic import PydanticBaseModel
 from akkudoktoreos.prediction.elecpriceabc import ElecPriceProvider
 from akkudoktoreos.utils.datetimeutil import to_datetime, to_duration
+from akkudoktoreos.utils.httpclient import get_http_client
 
 
 class AkkudoktorElecPriceMeta(PydanticBaseModel):
@@ -108,7 +109,7 @@ class ElecPriceAkkudoktor(ElecPriceProvider):
         date = to_datetime(self.ems_start_datetime - to_duration("35 days"), as_string="YYYY-MM-DD")
         last_date = to_datetime(self.end_datetime, as_string="YYYY-MM-DD")
         url = f"{source}/prices?start={date}&end={last_date}&tz={self.config.general.timezone}"
-        response = requests.get(url, timeout=10)
+        response = get_http_client().get(url, timeout=10)
         logger.debug(f"Response from {url}: {response}")
         response.raise_for_status()  # Raise an error for bad responses
         akkudoktor_data = self._validate_data(response.content)
@@ -146,7 +147,7 @@ class ElecPriceAkkudoktor(ElecPriceProvider):
         The final mapped and processed data is inserted into the sequence as `ElecPriceDataRecord`.
         """
         # Get Akkudoktor electricity price data
-        akkudoktor_data = self._request_forecast(force_update=force_update)  # type: ignore
+        akkudoktor_data = await asyncio.to_thread(self._request_forecast, force_update=force_update)  # type: ignore
         if not self.ems_start_datetime:
             raise ValueError(f"Start DateTime not set: {self.ems_start_datetime}")
 
@@ -196,9 +197,13 @@ class ElecPriceAkkudoktor(ElecPriceProvider):
             return
 
         if amount_datasets > 800:  # we do the full ets with seasons of 1 week
-            prediction = self._predict_ets(history, seasonal_periods=168, hours=needed_hours)
+            prediction = self._predict_ets_cached(
+                history, highest_orig_datetime, seasonal_periods=168, hours=needed_hours
+            )
         elif amount_datasets > 168:  # not enough data to do seasons of 1 week, but enough for 1 day
-            prediction = self._predict_ets(history, seasonal_periods=24, hours=needed_hours)
+            prediction = self._predict_ets_cached(
+                history, highest_orig_datetime, seasonal_periods=24, hours=needed_hours
+            )
         elif amount_datasets > 0:  # not enough data for ets, do median
             prediction = self._predict_median(history, hours=needed_hours)
         else:
@@ -206,14 +211,13 @@ class ElecPriceAkkudoktor(ElecPriceProvider):
             raise ValueError("No data available")
 
         # write predictions into the records, update if exist.
-        prediction_series = pd.Series(
-            data=prediction,
-            index=[
-                highest_orig_datetime + to_duration(f"{i + 1} hours")
-                for i in range(len(prediction))
-            ],
+        prediction_interval = to_duration("1 hour")
+        await self.key_from_array(
+            "elecprice_marketprice_wh",
+            prediction,
+            start_datetime=highest_orig_datetime + prediction_interval,
+            interval=prediction_interval,
         )
-        await self.key_from_series("elecprice_marketprice_wh", prediction_series)
 
         # history2 = await self.key_to_array(key="elecprice_marketprice_wh", fill_method="linear") + 0.0002
         # return history, history2, prediction  # for debug main
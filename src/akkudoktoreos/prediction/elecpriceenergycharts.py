@@ -6,13 +6,13 @@ humidity, cloud cover, and solar irradiance. The data is mapped to the `ElecPric
 format, enabling consistent access to forecasted and historical electricity price attributes.
 """
 
+import asyncio
 from datetime import datetime
 from enum import StrEnum
 from typing import Any, List, Optional, Union
 
 import numpy as np
 import pandas as pd
-import requests
 from loguru import logger
 from pydantic import Field, ValidationError
 from statsmodels.tsa.holtwinters import ExponentialSmoothing
@@ -22,6 +22,7 @@ from akkudoktoreos.core.cache import cache_in_file
 from akkudoktoreos.core.pydantic import PydanticBaseModel
 from akkudoktoreos.prediction.elecpriceabc import ElecPriceProvider
 from akkudoktoreos.utils.datetimeutil import to_datetime, to_duration
+from akkudoktoreos.utils.httpclient import get_http_client
 
 
 class EnergyChartsBiddingZones(StrEnum):
@@ -135,7 +136,7 @@ class ElecPriceEnergyCharts(ElecPriceProvider):
         last_date = to_datetime(self.end_datetime, as_string="YYYY-MM-DD")
         bidding_zone = str(self.config.elecprice.energycharts.bidding_zone)
         url = f"{source}/price?bzn={bidding_zone}&start={start_date}&end={last_date}"
-        response = requests.get(url, timeout=30)
+        response = get_http_client().get(url, timeout=30)
         logger.debug(f"Response from {url}: {response}")
         response.raise_for_status()  # Raise an error for bad responses
         energy_charts_data = self._validate_data(response.content)
@@ -237,8 +238,8 @@ class ElecPriceEnergyCharts(ElecPriceProvider):
                 self.ems_start_datetime - to_duration(f"{past_days} days"), as_string="YYYY-MM-DD"
             )
             # Get Energy-Charts electricity price data
-            energy_charts_data = self._request_forecast(
-                start_date=start_date, force_update=force_update
+            energy_charts_data = await asyncio.to_thread(
+                self._request_forecast, start_date=start_date, force_update=force_update
             )  # type: ignore
 
             # Parse and store data
@@ -276,9 +277,13 @@ class ElecPriceEnergyCharts(ElecPriceProvider):
             return
 
         if amount_datasets > 800:  # we do the full ets with seasons of 1 week
-            prediction = self._predict_ets(history, seasonal_periods=168, hours=needed_hours)
+            prediction = self._predict_ets_cached(
+                history, self.highest_orig_datetime, seasonal_periods=168, hours=needed_hours
+            )
         elif amount_datasets > 168:  # not enough data to do seasons of 1 week, but enough for 1 day
-            prediction = self._predict_ets(history, seasonal_periods=24, hours=needed_hours)
+            prediction = self._predict_ets_cached(
+                history, self.highest_orig_datetime, seasonal_periods=24, hours=needed_hours
+            )
         elif amount_datasets > 0:  # not enough data for ets, do median
             prediction = self._predict_median(history, hours=needed_hours)
         else:
@@ -286,11 +291,10 @@ class ElecPriceEnergyCharts(ElecPriceProvider):
             raise ValueError("No data available")
 
         # write predictions into the records, update if exist.
-        prediction_series = pd.Series(
-            data=prediction,
-            index=[
-                self.highest_orig_datetime + to_duration(f"{i + 1} hours")
-                for i in range(len(prediction))
-            ],
+        prediction_interval = to_duration("1 hour")
+        await self.key_from_array(
+            "elecprice_marketprice_wh",
+            prediction,
+            start_datetime=to_datetime(self.highest_orig_datetime + prediction_interval),
+            interval=prediction_interval,
         )
-        await self.key_from_series("elecprice_marketprice_wh", prediction_series)
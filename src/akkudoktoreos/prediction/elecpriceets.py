@@ -0,0 +1,162 @@
+"""Exponential smoothing model for electricity price extrapolation.
+
+Electricity price providers extend the published prices beyond the publication horizon by an
+additive seasonal exponential smoothing (Holt-Winters) model. Fitting the model optimizes the
+smoothing parameters over the whole price history, which is costly for weekly seasons.
+
+`ElecPriceETSModel` keeps the fitted smoothing parameters and the model state (level and seasonal
+components). New prices update the state by the exponential smoothing recurrences without
+optimizing the parameters again. The model is fully refitted when the caller decides so, e.g. on
+a schedule or when the one step ahead forecast error drifts away from the error of the fit.
+"""
+
+from typing import Optional
+
+import numpy as np
+from statsmodels.tsa.holtwinters import ExponentialSmoothing
+
+
+class ElecPriceETSModel:
+    """Additive seasonal exponential smoothing model with incremental state update.
+
+    The model has no trend component. For an observation ``y`` the state is updated by:
+
+    - level: ``alpha * (y - season) + (1 - alpha) * level``
+    - season: ``gamma * (y - level) + (1 - gamma) * season``
+
+    which are the recurrences used by `statsmodels` for the fit. Updating the state with new
+    observations therefore gives the same forecast as a filter run with the fitted parameters over
+    the extended history.
+
+    Outliers are capped to the bounds determined from the history at the time of the fit.
+
+    Args:
+        seasonal_periods (int): Number of time steps in a season.
+        sigma (int): Cap outliers to mean +/- sigma times the standard deviation of the history.
+
+    Attributes:
+        smoothing_level (float): Fitted smoothing parameter of the level (alpha).
+        smoothing_seasonal (float): Fitted smoothing parameter of the seasonal components (gamma).
+        level (float): Level after the last observation.
+        season (np.ndarray): Seasonal components, starting with the component of the next time
+            step.
+        fit_rmse (float): Root mean squared one step ahead error of the fit.
+        fit_steps (int): Number of observations used for the fit.
+        update_steps (int): Number of observations added by updates since the fit.
+    """
+
+    def __init__(self, seasonal_periods: int, sigma: int = 2) -> None:
+        self.seasonal_periods = seasonal_periods
+        self.sigma = sigma
+        self.smoothing_level = 0.0
+        self.smoothing_seasonal = 0.0
+        self.level = 0.0
+        self.season = np.zeros(seasonal_periods)
+        self.lower_bound = -np.inf
+        self.upper_bound = np.inf
+        self.fit_rmse = 0.0
+        self.fit_steps = 0
+        self.update_steps = 0
+
+    def fit(self, history: np.ndarray) -> None:
+        """Fit the model to the history.
+
+        Args:
+            history (np.ndarray): Observations, one per time step.
+        """
+        mean = history.mean()
+        std = history.std()
+        self.lower_bound = mean - self.sigma * std
+        self.upper_bound = mean + self.sigma * std
+        clean_history = history.clip(min=self.lower_bound, max=self.upper_bound)
+        result = ExponentialSmoothing(
+            clean_history, seasonal="add", seasonal_periods=self.seasonal_periods
+        ).fit()
+        self.smoothing_level = float(result.params["smoothing_level"])
+        self.smoothing_seasonal = float(result.params["smoothing_seasonal"])
+        # Run the recurrences from the fitted initial state to get the state after the history
+        self.level = float(result.params["initial_level"])
+        self.season = np.array(result.params["initial_seasons"], dtype=float)
+        self.fit_rmse = self._smooth(clean_history)
+        self.fit_steps = len(clean_history)
+        self.update_steps = 0
+
+    def _smooth(self, observations: np.ndarray) -> float:
+        """Update the state by the exponential smoothing recurrences.
+
+        Args:
+            observations (np.ndarray): Capped observations, one per time step.
+
+        Returns:
+            float: Root mean squared one step ahead forecast error of the observations.
+        """
+        alpha = self.smoothing_level
+        gamma = self.smoothing_seasonal
+        m = self.seasonal_periods
+        level = self.level
+        # Rotate through the seasonal components instead of shifting the array every step
+        season = self.season.copy()
+        errors = np.empty(len(observations))
+        for i, y in enumerate(observations):
+            s = season[i % m]
+            errors[i] = y - (level + s)
+            season[i % m] = gamma * (y - level) + (1 - gamma) * s
+            level = alpha * (y - s) + (1 - alpha) * level
+        self.level = float(level)
+        self.season = np.roll(season, -(len(observations) % m))
+        return float(np.sqrt(np.mean(errors**2)))
+
+    def update(self, observations: np.ndarray) -> float:
+        """Update the model state with new observations.
+
+        Args:
+            observations (np.ndarray): New observations, one per time step, following the last
+                observation of the fit or update.
+
+        Returns:
+            float: Root mean squared one step ahead forecast error of the new observations. 0.0 if
+            there are no new observations.
+        """
+        if len(observations) == 0:
+            return 0.0
+        rmse = self._smooth(observations.clip(min=self.lower_bound, max=self.upper_bound))
+        self.update_steps += len(observations)
+        return rmse
+
+    def forecast(self, steps: int) -> np.ndarray:
+        """Forecast the next time steps.
+
+        Args:
+            steps (int): Number of time steps to forecast.
+
+        Returns:
+            np.ndarray: Forecast, one value per time step.
+        """
+        return self.level + self.season[np.arange(steps) % self.seasonal_periods]
+
+    def needs_refit(
+        self,
+        seasonal_periods: int,
+        refit_steps: int,
+        error_ratio: float,
+        rmse: Optional[float] = None,
+    ) -> bool:
+        """Check whether the model has to be fitted again.
+
+        Args:
+            seasonal_periods (int): Requested number of time steps in a season.
+            refit_steps (int): Number of observations added by updates after which the model is
+                refitted.
+            error_ratio (float): Refit if the update error exceeds the fit error by this factor.
+            rmse (float, optional): Root mean squared error of the last update.
+
+        Returns:
+            bool: True if the model should be fitted again.
+        """
+        if self.fit_steps == 0 or seasonal_periods != self.seasonal_periods:
+            return True
+        if self.update_steps >= refit_steps:
+            return True
+        if rmse is not None and rmse > error_ratio * self.fit_rmse:
+            return True
+        return False
@@ -2,6 +2,7 @@
 
 from typing import Optional
 
+import numpy as np
 from loguru import logger
 from pydantic import Field
 
@@ -104,8 +105,11 @@ class ElecPriceFixed(ElecPriceProvider):
         )
 
         # Convert kWh → Wh and store one entry per interval step.
-        for idx, price_kwh in enumerate(prices_kwh):
-            current_dt = start_datetime.add(seconds=idx * interval_seconds)
-            await self.update_value(current_dt, "elecprice_marketprice_wh", price_kwh / 1000.0)
+        await self.key_from_array(
+            "elecprice_marketprice_wh",
+            np.asarray(prices_kwh, dtype=float) / 1000.0,
+            start_datetime=start_datetime,
+            interval=interval,
+        )
 
         logger.debug(f"Successfully generated {len(prices_kwh)} fixed electricity price entries")
@@ -1,10 +1,10 @@
 """Retrieves and processes electricity price forecast data from Tibber."""
 
+import asyncio
 from typing import Any, List, Optional, Union
 
 import numpy as np
 import pandas as pd
-import requests
 from loguru import logger
 from pydantic import Field, ValidationError
 from statsmodels.tsa.holtwinters import ExponentialSmoothing
@@ -14,6 +14,7 @@ from akkudoktoreos.core.cache import cache_in_file
 from akkudoktoreos.core.pydantic import PydanticBaseModel
 from akkudoktoreos.prediction.elecpriceabc import ElecPriceProvider
 from akkudoktoreos.utils.datetimeutil import to_datetime, to_duration
+from akkudoktoreos.utils.httpclient import get_http_client
 
 TIBBER_GRAPHQL_URL = "https://api.tibber.com/v1-beta/gql"
 TIBBER_DAILY_SEASONAL_HOURS = 24 * 7
@@ -233,7 +234,7 @@ class ElecPriceTibber(ElecPriceProvider):
         response = None
         queries = (TIBBER_PRICE_QUERY_QUARTER_HOURLY, TIBBER_PRICE_QUERY)
         for attempt, query in enumerate(queries, start=1):
-            response = requests.post(
+            response = get_http_client().post(
                 TIBBER_GRAPHQL_URL,
                 json={"query": query},
                 headers={
@@ -404,7 +405,7 @@ class ElecPriceTibber(ElecPriceProvider):
 
     async def _update_data(self, force_update: Optional[bool] = False) -> None:
         """Update Tibber price data and extrapolate missing future prices."""
-        tibber_data = self._request_forecast(force_update=force_update)  # type: ignore
+        tibber_data = await asyncio.to_thread(self._request_forecast, force_update=force_update)  # type: ignore
         if not self.ems_start_datetime:
             raise ValueError(f"Start DateTime not set: {self.ems_start_datetime}")
 
@@ -462,11 +463,10 @@ class ElecPriceTibber(ElecPriceProvider):
             history, slots=needed_slots, slots_per_hour=slots_per_hour
         )
 
-        prediction_series = pd.Series(
-            data=prediction,
-            index=[
-                highest_orig_datetime + to_duration(f"{(i + 1) * resolution_seconds} seconds")
-                for i in range(len(prediction))
-            ],
+        prediction_interval = to_duration(f"{resolution_seconds} seconds")
+        await self.key_from_array(
+            "elecprice_marketprice_wh",
+            prediction,
+            start_datetime=highest_orig_datetime + prediction_interval,
+            interval=prediction_interval,
         )
-        await self.key_from_series("elecprice_marketprice_wh", prediction_series)
@@ -1,5 +1,6 @@
 """Provide feed-in tariff data from Akkudoktor market prices."""
 
+import asyncio
 import time
 from datetime import datetime
 from typing import Optional
@@ -17,6 +18,7 @@ from akkudoktoreos.prediction.elecpriceakkudoktor import (
 )
 from akkudoktoreos.prediction.feedintariffabc import FeedInTariffProvider
 from akkudoktoreos.utils.datetimeutil import to_datetime, to_duration
+from akkudoktoreos.utils.httpclient import get_http_client
 
 
 class FeedInTariffAkkudoktorCommonSettings(SettingsBaseModel):
@@ -68,7 +70,7 @@ class FeedInTariffAkkudoktor(FeedInTariffProvider):
         last_exc: Optional[Exception] = None
         for attempt in range(1, max_attempts + 1):
             try:
-                response = requests.get(url, timeout=(5, 20))
+                response = get_http_client().get(url, timeout=(5, 20))
                 logger.debug("Response from {}: {}", url, response)
                 response.raise_for_status()
                 data = ElecPriceAkkudoktor._validate_data(response.content)
@@ -116,7 +118,7 @@ class FeedInTariffAkkudoktor(FeedInTariffProvider):
             raise ValueError(f"Start DateTime not set: {self.ems_start_datetime}")
 
         try:
-            data = self._request_forecast(force_update=force_update)  # type: ignore[call-arg]
+            data = await asyncio.to_thread(self._request_forecast, force_update=force_update)  # type: ignore[call-arg]
             series = self._parse_data(data)
             if series.empty:
                 raise ValueError("No Akkudoktor feed-in tariff data available")
@@ -151,11 +153,10 @@ class FeedInTariffAkkudoktor(FeedInTariffProvider):
             return
 
         prediction = self._predict_prices(history, needed_hours)
-        prediction_series = pd.Series(
-            data=prediction,
-            index=[
-                self.highest_orig_datetime + to_duration(f"{i + 1} hours")
-                for i in range(len(prediction))
-            ],
+        prediction_interval = to_duration("1 hour")
+        await self.key_from_array(
+            "feed_in_tariff_wh",
+            prediction,
+            start_datetime=to_datetime(self.highest_orig_datetime + prediction_interval),
+            interval=prediction_interval,
         )
-        await self.key_from_series("feed_in_tariff_wh", prediction_series)
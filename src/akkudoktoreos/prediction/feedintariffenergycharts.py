@@ -1,5 +1,6 @@
 """Provides feed-in tariff data from Energy-Charts market prices."""
 
+import asyncio
 import time
 from datetime import datetime
 from typing import Optional
@@ -19,6 +20,7 @@ from akkudoktoreos.prediction.elecpriceenergycharts import (
 )
 from akkudoktoreos.prediction.feedintariffabc import FeedInTariffProvider
 from akkudoktoreos.utils.datetimeutil import to_datetime, to_duration
+from akkudoktoreos.utils.httpclient import get_http_client
 
 
 class FeedInTariffEnergyChartsCommonSettings(SettingsBaseModel):
@@ -84,7 +86,7 @@ class FeedInTariffEnergyCharts(FeedInTariffProvider):
         last_exc: Optional[Exception] = None
         for attempt in range(1, max_attempts + 1):
             try:
-                response = requests.get(url, timeout=(5, 60))
+                response = get_http_client().get(url, timeout=(5, 60))
                 logger.debug(f"Response from {url}: {response}")
                 response.raise_for_status()
                 energy_charts_data = ElecPriceEnergyCharts._validate_data(response.content)
@@ -207,8 +209,8 @@ class FeedInTariffEnergyCharts(FeedInTariffProvider):
                 as_string="YYYY-MM-DD",
             )
             try:
-                energy_charts_data = self._request_forecast(
-                    start_date=start_date, force_update=force_update
+                energy_charts_data = await asyncio.to_thread(
+                    self._request_forecast, start_date=start_date, force_update=force_update
                 )  # type: ignore
                 series_data = self._parse_data(energy_charts_data)
                 if series_data.empty:
@@ -282,11 +284,10 @@ class FeedInTariffEnergyCharts(FeedInTariffProvider):
             return
 
         prediction = self._predict_prices(history, needed_slots, slots_per_hour)
-        prediction_series = pd.Series(
-            data=prediction,
-            index=[
-                self.highest_orig_datetime + to_duration(f"{(i + 1) * resolution_seconds} seconds")
-                for i in range(len(prediction))
-            ],
+        prediction_interval = to_duration(f"{resolution_seconds} seconds")
+        await self.key_from_array(
+            "feed_in_tariff_wh",
+            prediction,
+            start_datetime=to_datetime(self.highest_orig_datetime + prediction_interval),
+            interval=prediction_interval,
         )
-        await self.key_from_series("feed_in_tariff_wh", prediction_series)
@@ -1,11 +1,11 @@
 """Provide native quarter-hour feed-in prices from the Tibber API."""
 
+import asyncio
 from datetime import datetime
 from typing import Optional
 
 import numpy as np
 import pandas as pd
-import requests
 from loguru import logger
 
 from akkudoktoreos.config.configabc import SettingsBaseModel
@@ -19,6 +19,7 @@ from akkudoktoreos.prediction.elecpricetibber import (
 )
 from akkudoktoreos.prediction.feedintariffabc import FeedInTariffProvider
 from akkudoktoreos.utils.datetimeutil import to_datetime, to_duration
+from akkudoktoreos.utils.httpclient import get_http_client
 
 
 class FeedInTariffTibberCommonSettings(SettingsBaseModel):
@@ -58,7 +59,7 @@ class FeedInTariffTibber(FeedInTariffProvider):
         if not access_token:
             raise ValueError("Tibber access_token is required")
 
-        response = requests.post(
+        response = get_http_client().post(
             TIBBER_GRAPHQL_URL,
             json={"query": TIBBER_PRICE_QUERY_QUARTER_HOURLY},
             headers={
@@ -110,7 +111,7 @@ class FeedInTariffTibber(FeedInTariffProvider):
             raise ValueError(f"Start DateTime not set: {self.ems_start_datetime}")
 
         try:
-            data = self._request_forecast(force_update=force_update)  # type: ignore[call-arg]
+            data = await asyncio.to_thread(self._request_forecast, force_update=force_update)  # type: ignore[call-arg]
             series = self._parse_data(data)
             resolution_seconds = ElecPriceTibber()._resolution_seconds(series)
             if resolution_seconds != 900:
@@ -159,11 +160,10 @@ class FeedInTariffTibber(FeedInTariffProvider):
         prediction = ElecPriceTibber()._predict_missing_prices(
             history, slots=needed_slots, slots_per_hour=4
         )
-        prediction_series = pd.Series(
-            data=prediction,
-            index=[
-                self.highest_orig_datetime + to_duration(f"{(i + 1) * interval_seconds} seconds")
-                for i in range(len(prediction))
-            ],
+        prediction_interval = to_duration(f"{interval_seconds} seconds")
+        await self.key_from_array(
+            "feed_in_tariff_wh",
+            prediction,
+            start_datetime=to_datetime(self.highest_orig_datetime + prediction_interval),
+            interval=prediction_interval,
         )
-        await self.key_from_series("feed_in_tariff_wh", prediction_series)
@@ -1,20 +1,56 @@
 #!/usr/bin/env python
+import bisect
+import math
 import pickle
 from pathlib import Path
+from typing import Union
 
 import numpy as np
 from scipy.interpolate import RegularGridInterpolator
 
-from akkudoktoreos.core.cache import cache_energy_management
 from akkudoktoreos.core.coreabc import SingletonMixin
 
 
 class SelfConsumptionProbabilityInterpolator:
+    """Self-consumption rate of PV power by the household load.
+
+    The self-consumption rate for a given 1h load and PV power is the sum of the self-consumption
+    probabilities of all partial loads from 0 W up to the PV power in steps of 50 W. The
+    probabilities are provided by a pickled `RegularGridInterpolator` over (load, partial load).
+
+    To avoid evaluating the interpolator for every call, the rates are precomputed once into a
+    table at the load grid points of the interpolator and the native 50 W partial load steps:
+    `table[i, k]` is the rate at load `load_grid[i]` for PV power up to `k * 50` W. The
+    interpolator is linear in the load, so the rate at any load is the linear interpolation of
+    the table rows. Along the PV power the rate is a step function by design - every started
+    50 W step adds a partial load - so a table column is selected directly.
+    """
+
+    # Partial load step of the self-consumption rate [W].
+    partial_load_step: float = 50.0
+
     def __init__(self, filepath: str | Path):
         self.filepath = filepath
         # Load the RegularGridInterpolator
         with open(self.filepath, "rb") as file:
             self.interpolator: RegularGridInterpolator = pickle.load(file)  # noqa: S301
+        self._build_table()
+
+    def _build_table(self) -> None:
+        """Precompute the self-consumption rate table from the interpolator."""
+        load_grid = np.asarray(self.interpolator.grid[0], dtype=float)
+        partial_load_max = float(self.interpolator.grid[1][-1])
+        # Partial loads beyond the interpolator grid have zero probability
+        partial_loads = np.arange(
+            0, partial_load_max + self.partial_load_step, self.partial_load_step
+        )
+        points = np.empty((load_grid.size, partial_loads.size, 2))
+        points[:, :, 0] = load_grid[:, None]
+        points[:, :, 1] = partial_loads[None, :]
+        probabilities = self.interpolator(points.reshape(-1, 2)).reshape(points.shape[:2])
+
+        self.load_grid = load_grid
+        self.table = np.cumsum(probabilities, axis=1)
 
     def _generate_points(
         self, load_1h_power: float, pv_power: float
@@ -24,11 +60,12 @@ class SelfConsumptionProbabilityInterpolator:
         points = np.array([np.full_like(partial_loads, load_1h_power), partial_loads]).T
         return points, partial_loads
 
-    @cache_energy_management
-    def calculate_self_consumption(self, load_1h_power: float, pv_power: float) -> float:
-        """Calculate the PV self-consumption rate using RegularGridInterpolator.
+    def calculate_self_consumption_interpolated(
+        self, load_1h_power: float, pv_power: float
+    ) -> float:
+        """Calculate the PV self-consumption rate by evaluating the RegularGridInterpolator.
 
-        The results are cached until the start of the next energy management run/ optimization.
+        Reference implementation of `calculate_self_consumption`.
 
         Args:
          - last_1h_power: 1h power levels (W).
@@ -41,6 +78,62 @@ class SelfConsumptionProbabilityInterpolator:
         probabilities = self.interpolator(points)
         return probabilities.sum()
 
+    def calculate_self_consumption(self, load_1h_power: float, pv_power: float) -> float:
+        """Calculate the PV self-consumption rate using the precomputed table.
+
+        Args:
+         - last_1h_power: 1h power levels (W).
+         - pv_power: Current PV power output (W).
+
+        Returns:
+         - Self-consumption rate as a float.
+        """
+        load_grid = self.load_grid
+        if not (load_grid[0] <= load_1h_power <= load_grid[-1]):
+            # Out of interpolator bounds (or NaN)
+            return 0.0
+        # Number of partial loads up to the PV power, same as len(np.arange(0, pv + 50, 50))
+        steps = math.ceil((pv_power + self.partial_load_step) / self.partial_load_step)
+        if steps <= 0:
+            return 0.0
+        column = min(steps, self.table.shape[1]) - 1
+
+        index = min(max(bisect.bisect_left(load_grid, load_1h_power) - 1, 0), load_grid.size - 2)
+        weight = (load_1h_power - load_grid[index]) / (load_grid[index + 1] - load_grid[index])
+        return float(
+            self.table[index, column] * (1.0 - weight) + self.table[index + 1, column] * weight
+        )
+
+    def calculate_self_consumption_batch(
+        self, load_1h_power: np.ndarray, pv_power: Union[float, np.ndarray]
+    ) -> np.ndarray:
+        """Calculate the PV self-consumption rate for arrays of loads and PV powers.
+
+        Vectorized counterpart of `calculate_self_consumption`. Loads and PV powers are
+        broadcast against each other.
+
+        Args:
+         - load_1h_power: Array of 1h power levels (W).
+         - pv_power: Current PV power output (W), scalar or array.
+
+        Returns:
+         - Array of self-consumption rates, one per (load, PV power) pair.
+        """
+        loads, pv = np.broadcast_arrays(
+            np.asarray(load_1h_power, dtype=float), np.asarray(pv_power, dtype=float)
+        )
+        load_grid = self.load_grid
+        in_bounds = (loads >= load_grid[0]) & (loads <= load_grid[-1])
+        steps = np.ceil((pv + self.partial_load_step) / self.partial_load_step)
+        in_bounds &= steps > 0
+        column = np.minimum(np.where(in_bounds, steps, 1), self.table.shape[1]).astype(int) - 1
+
+        index = np.clip(np.searchsorted(load_grid, loads) - 1, 0, load_grid.size - 2)
+        with np.errstate(invalid="ignore"):
+            weight = (loads - load_grid[index]) / (load_grid[index + 1] - load_grid[index])
+        rates = self.table[index, column] * (1.0 - weight) + self.table[index + 1, column] * weight
+        return np.where(in_bounds, rates, 0.0)
+
     # def calculate_self_consumption(self, load_1h_power: float, pv_power: float) -> float:
     #     """Calculate the PV self-consumption rate using RegularGridInterpolator.
 
@@ -1,8 +1,19 @@
-"""Retrieves load forecast data from Akkudoktor load profiles."""
-
+"""Retrieves load forecast data from Akkudoktor load profiles.
+
+The relative yearly load profiles are shipped compressed in ``data/load_profiles.npz``. On first
+use they are converted into an uncompressed array file of shape (day of year, hour, mean/std) in
+the EOS cache directory. The array file is memory-mapped, so later updates neither read nor
+decompress the profiles again. The load forecast is sliced from the array for all forecast hours
+at once.
+"""
+
+import os
+import threading
+from pathlib import Path
 from typing import Optional
 
 import numpy as np
+import pandas as pd
 from loguru import logger
 from pydantic import Field
 
@@ -10,6 +21,57 @@ from akkudoktoreos.config.configabc import SettingsBaseModel
 from akkudoktoreos.prediction.loadabc import LoadDataRecord, LoadProvider
 from akkudoktoreos.utils.datetimeutil import compare_datetimes, to_datetime, to_duration
 
+# Relative load profiles by compressed profiles file
+_load_profiles: dict[Path, np.ndarray] = {}
+_load_profiles_lock = threading.Lock()
+
+
+def load_profiles(profiles_file: Path, store_path: Optional[Path] = None) -> np.ndarray:
+    """Get the relative yearly load profiles.
+
+    The compressed profiles file is converted once into the uncompressed array file
+    ``load_profiles.npy`` in `store_path`, which is memory-mapped. The converted file is reused
+    by later calls and other processes as long as it is newer than the profiles file. Without
+    `store_path` the profiles are kept in memory.
+
+    Args:
+        profiles_file (Path): Compressed profiles file with the arrays ``yearly_profiles`` and
+            ``yearly_profiles_std`` of shape (day of year, hour).
+        store_path (Path, optional): Directory for the uncompressed array file.
+
+    Returns:
+        np.ndarray: Read-only array of shape (day of year, hour, 2) with the relative mean
+        (index 0) and standard deviation (index 1) of the load.
+    """
+    with _load_profiles_lock:
+        cached_profiles = _load_profiles.get(profiles_file)
+        if cached_profiles is not None:
+            return cached_profiles
+
+        store_file = None if store_path is None else store_path.joinpath("load_profiles.npy")
+        if (
+            store_file is None
+            or not store_file.exists()
+            or store_file.stat().st_mtime < profiles_file.stat().st_mtime
+        ):
+            file_data = np.load(profiles_file)
+            profiles = np.stack(
+                (file_data["yearly_profiles"], file_data["yearly_profiles_std"]), axis=-1
+            )
+            if store_file is None:
+                profiles.flags.writeable = False
+                _load_profiles[profiles_file] = profiles
+                return profiles
+            store_file.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a temporary file first - other processes may read the store file
+            tmp_file = store_file.with_name(f"{store_file.name}.{os.getpid()}.tmp")
+            with tmp_file.open("wb") as f:
+                np.save(f, profiles)
+            os.replace(tmp_file, store_file)
+        profiles = np.load(store_file, mmap_mode="r")
+        _load_profiles[profiles_file] = profiles
+        return profiles
+
 
 class LoadAkkudoktorCommonSettings(SettingsBaseModel):
     """Common settings for load data import from file."""
@@ -45,19 +107,11 @@ class LoadAkkudoktor(LoadProvider):
         """Return the unique identifier for the LoadAkkudoktor provider."""
         return "LoadAkkudoktor"
 
-    def load_data(self) -> np.ndarray:
-        """Loads data from the Akkudoktor load file."""
+    def _load_profiles(self) -> np.ndarray:
+        """Get the relative load profiles of shape (day of year, hour, mean/std)."""
         load_file = self.config.package_root_path.joinpath("data/load_profiles.npz")
-        data_year_energy = None
         try:
-            file_data = np.load(load_file)
-            profile_data = np.array(
-                list(zip(file_data["yearly_profiles"], file_data["yearly_profiles_std"]))
-            )
-            # Calculate values in W by relative profile data and yearly consumption given in kWh
-            data_year_energy = (
-                profile_data * self.config.load.loadakkudoktor.loadakkudoktor_year_energy_kwh * 1000
-            )
+            return load_profiles(load_file, self.config.cache.path())
         except FileNotFoundError:
             error_msg = f"Error: File {load_file} not found."
             logger.error(error_msg)
@@ -66,26 +120,46 @@ class LoadAkkudoktor(LoadProvider):
             error_msg = f"An error occurred while loading data: {e}"
             logger.error(error_msg)
             raise ValueError(error_msg)
-        return data_year_energy
+
+    def _year_energy_wh(self) -> float:
+        """Yearly energy consumption in Wh."""
+        return self.config.load.loadakkudoktor.loadakkudoktor_year_energy_kwh * 1000
+
+    def load_data(self) -> np.ndarray:
+        """Loads data from the Akkudoktor load file.
+
+        Returns:
+            np.ndarray: Load of shape (day of year, mean/std, hour) in W.
+        """
+        # Calculate values in W by relative profile data and yearly consumption given in kWh
+        return self._load_profiles().transpose(0, 2, 1) * self._year_energy_wh()
+
+    def _forecast_index(self) -> pd.DatetimeIndex:
+        """Hours of the load forecast.
+
+        We provide prediction starting at start of day, to be compatible to old system.
+        End date for prediction is prediction hours from now.
+        """
+        start_date = self.ems_start_datetime.start_of("day")
+        end_date = self.ems_start_datetime.add(hours=self.config.prediction.hours)
+        hours = int(np.ceil((end_date - start_date).total_seconds() / 3600))
+        return pd.date_range(start=start_date, periods=hours, freq="h")
+
+    def _forecast_stats(self, index: pd.DatetimeIndex) -> np.ndarray:
+        """Load mean (index 0) and standard deviation (index 1) for the hours of the index in W."""
+        # Day indexing starts at 0, -1 because of that
+        return self._load_profiles()[index.dayofyear - 1, index.hour] * self._year_energy_wh()
 
     async def _update_data(self, force_update: Optional[bool] = False) -> None:
         """Adds the load means and standard deviations."""
-        data_year_energy = self.load_data()
-        # We provide prediction starting at start of day, to be compatible to old system.
-        # End date for prediction is prediction hours from now.
-        date = self.ems_start_datetime.start_of("day")
-        end_date = self.ems_start_datetime.add(hours=self.config.prediction.hours)
-        while compare_datetimes(date, end_date).lt:
-            # Extract mean (index 0) and standard deviation (index 1) for the given day and hour
-            # Day indexing starts at 0, -1 because of that
-            hourly_stats = data_year_energy[date.day_of_year - 1, :, date.hour]
-            values = {
-                "loadforecast_power_w": hourly_stats[0],
-                "loadakkudoktor_mean_power_w": hourly_stats[0],
-                "loadakkudoktor_std_power_w": hourly_stats[1],
-            }
-            await self.update_value(date, values)
-            date += to_duration("1 hour")
+        index = self._forecast_index()
+        hourly_stats = self._forecast_stats(index)
+        for key, values in (
+            ("loadforecast_power_w", hourly_stats[:, 0]),
+            ("loadakkudoktor_mean_power_w", hourly_stats[:, 0]),
+            ("loadakkudoktor_std_power_w", hourly_stats[:, 1]),
+        ):
+            await self.key_from_array(key, values, start_datetime=to_datetime(index[0]))
         # We are working on fresh data (no cache), report update time
         self.update_datetime = to_datetime(in_timezone=self.config.general.timezone)
 
@@ -168,26 +242,17 @@ class LoadAkkudoktorAdjusted(LoadAkkudoktor):
         """Adds the load means and standard deviations."""
         data_year_energy = self.load_data()
         weekday_adjust, weekend_adjust = await self._calculate_adjustment(data_year_energy)
-        # We provide prediction starting at start of day, to be compatible to old system.
-        # End date for prediction is prediction hours from now.
-        date = self.ems_start_datetime.start_of("day")
-        end_date = self.ems_start_datetime.add(hours=self.config.prediction.hours)
-        while compare_datetimes(date, end_date).lt:
-            # Extract mean (index 0) and standard deviation (index 1) for the given day and hour
-            # Day indexing starts at 0, -1 because of that
-            hourly_stats = data_year_energy[date.day_of_year - 1, :, date.hour]
-            values = {
-                "loadakkudoktor_mean_power_w": hourly_stats[0],
-                "loadakkudoktor_std_power_w": hourly_stats[1],
-            }
-            if date.day_of_week < 5:
-                # Monday to Friday (0..4)
-                value_adjusted = hourly_stats[0] + weekday_adjust[date.hour]
-            else:
-                # Saturday, Sunday (5, 6)
-                value_adjusted = hourly_stats[0] + weekend_adjust[date.hour]
-            values["loadforecast_power_w"] = max(0, value_adjusted)
-            await self.update_value(date, values)
-            date += to_duration("1 hour")
+        index = self._forecast_index()
+        hourly_stats = self._forecast_stats(index)
+        # Monday to Friday (0..4), Saturday, Sunday (5, 6)
+        adjust = np.where(
+            index.dayofweek < 5, weekday_adjust[index.hour], weekend_adjust[index.hour]
+        )
+        for key, values in (
+            ("loadforecast_power_w", np.maximum(0, hourly_stats[:, 0] + adjust)),
+            ("loadakkudoktor_mean_power_w", hourly_stats[:, 0]),
+            ("loadakkudoktor_std_power_w", hourly_stats[:, 1]),
+        ):
+            await self.key_from_array(key, values, start_datetime=to_datetime(index[0]))
         # We are working on fresh data (no cache), report update time
         self.update_datetime = to_datetime(in_timezone=self.config.general.timezone)
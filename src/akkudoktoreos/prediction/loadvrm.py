@@ -1,5 +1,6 @@
 """Retrieves load forecast data from VRM API."""
 
+import asyncio
 from typing import Any, Optional, Union
 
 import requests
@@ -10,6 +11,7 @@ from akkudoktoreos.config.configabc import SettingsBaseModel
 from akkudoktoreos.core.pydantic import PydanticBaseModel
 from akkudoktoreos.prediction.loadabc import LoadProvider
 from akkudoktoreos.utils.datetimeutil import DateTime, to_datetime
+from akkudoktoreos.utils.httpclient import get_http_client
 
 
 class VrmForecastRecords(PydanticBaseModel):
@@ -71,7 +73,7 @@ class LoadVrm(LoadProvider):
 
         logger.debug(f"Requesting VRM load forecast: {url}")
         try:
-            response = requests.get(url, headers=headers, timeout=30)
+            response = get_http_client().get(url, headers=headers, timeout=30)
             response.raise_for_status()
         except requests.RequestException as e:
             logger.error(f"Error during VRM API request: {e}")
@@ -95,7 +97,7 @@ class LoadVrm(LoadProvider):
         end_ts = int(end_date.timestamp())
 
         logger.info(f"Updating Load forecast from VRM: {start_date} to {end_date}")
-        vrm_forecast_data = self._request_forecast(start_ts, end_ts)
+        vrm_forecast_data = await asyncio.to_thread(self._request_forecast, start_ts, end_ts)
 
         loadforecast_power_w_data = []
         for timestamp, value in vrm_forecast_data.records.vrm_consumption_fc:
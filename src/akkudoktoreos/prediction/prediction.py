@@ -6,9 +6,8 @@ and is initialized with a set of forecast providers, such as `WeatherBrightSky`,
 `WeatherClearOutside`, and `PVForecastAkkudoktor`.
 
 Usage:
-    Instantiate the `Prediction` class with the required providers, maintaining
-    the necessary order. Then call the `update` method to refresh forecasts from
-    all providers in sequence.
+    Instantiate the `Prediction` class with the required providers. Then call the `update`
+    method to refresh forecasts from all providers concurrently.
 
 Example:
     # Create singleton prediction instance with prediction providers
@@ -77,6 +76,18 @@ class PredictionCommonSettings(SettingsBaseModel):
         },
     )
 
+    update_timeout_sec: Optional[float] = Field(
+        default=None,
+        gt=0,
+        json_schema_extra={
+            "description": (
+                "Maximum duration of the update of a single prediction provider [seconds]. "
+                "A provider exceeding the timeout keeps its last data. Defaults to no timeout."
+            ),
+            "examples": [None, 30.0],
+        },
+    )
+
 
 # Initialize forecast providers, all are singletons.
 elecprice_akkudoktor = ElecPriceAkkudoktor()
@@ -163,7 +174,8 @@ def prediction_providers() -> list[
         weather_openmeteo, \
         weather_import
 
-    # Care for provider sequence as providers may rely on others to be updated before.
+    # Providers are updated concurrently. Providers that rely on others to be updated before
+    # declare this by `provider_dependencies()`.
     return [
         elecprice_akkudoktor,
         elecprice_energy_charts,
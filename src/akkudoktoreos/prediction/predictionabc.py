@@ -280,3 +280,7 @@ class PredictionContainer(PredictionStartEndKeepMixin, DataContainer):
     providers: List[PredictionProvider] = Field(
         default_factory=list, json_schema_extra={"description": "List of prediction providers"}
     )
+
+    def provider_update_timeout(self, provider: DataProvider) -> Optional[float]:
+        """Return the maximum duration of a provider update [s] from the configuration."""
+        return self.config.prediction.update_timeout_sec
@@ -5,12 +5,16 @@ Notes:
 """
 
 from abc import abstractmethod
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional, Sequence, TypeVar
 
 from loguru import logger
 from pydantic import Field
 
 from akkudoktoreos.prediction.predictionabc import PredictionProvider, PredictionRecord
+from akkudoktoreos.utils.httpclient import get_http_client
+
+T = TypeVar("T")
 
 
 class PVForecastDataRecord(PredictionRecord):
@@ -60,3 +64,34 @@ class PVForecastProvider(PredictionProvider):
             f"PVForecastProvider ID {self.provider_id()} vs. config {self.config.pvforecast.provider}"
         )
         return self.provider_id() == self.config.pvforecast.provider
+
+    def _request_planes(
+        self,
+        request: Callable[..., T],
+        urls: Sequence[str],
+        force_update: Optional[bool] = False,
+    ) -> list[T]:
+        """Request the forecasts of several planes concurrently.
+
+        The plane requests are issued in worker threads. The parallelism is bounded by the per host
+        concurrency limit of the shared HTTP client.
+
+        Args:
+            request (Callable): Function requesting the forecast of one plane. Called with the plane
+                url and the `force_update` keyword argument.
+            urls (Sequence[str]): Request urls, one per plane.
+            force_update (bool, optional): Passed to the request function to bypass the cache.
+
+        Returns:
+            list: The plane forecasts in the order of the urls.
+
+        Raises:
+            Exception: The first exception raised by a plane request.
+        """
+        if len(urls) <= 1:
+            return [request(url, force_update=force_update) for url in urls]
+        max_workers = min(len(urls), get_http_client().max_concurrent_per_host)
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix=f"{self.provider_id()}-plane"
+        ) as executor:
+            return list(executor.map(lambda url: request(url, force_update=force_update), urls))
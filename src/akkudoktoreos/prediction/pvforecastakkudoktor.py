@@ -77,8 +77,10 @@ Methods:
 
 """
 
+import asyncio
 from typing import Any, List, Optional, Union
 
+import numpy as np
 import requests
 from loguru import logger
 from pydantic import Field, ValidationError, computed_field, field_validator
@@ -91,6 +93,7 @@ from akkudoktoreos.prediction.pvforecastabc import (
     PVForecastProvider,
 )
 from akkudoktoreos.utils.datetimeutil import compare_datetimes, to_datetime
+from akkudoktoreos.utils.httpclient import get_http_client
 
 
 class AkkudoktorForecastHorizon(PydanticBaseModel):
@@ -316,44 +319,57 @@ class PVForecastAkkudoktor(PVForecastProvider):
 
         return url
 
-    @cache_in_file(with_ttl="1 hour")
-    def _request_forecast(self) -> AkkudoktorForecast:
+    @cache_in_file(with_ttl="1 hour", ignore_params=["self"])
+    def _request_plane(self, plane_url: str) -> AkkudoktorForecast:
+        """Fetch the PV forecast data of one plane from Akkudoktor API.
+
+        The response is cached per plane url, so planes with unchanged configuration are not
+        fetched again.
+
+        Args:
+            plane_url (str): Akkudoktor API request URL of the plane.
+
+        Returns:
+            AkkudoktorForecast: The validated forecast data of the plane.
+        """
+        response = get_http_client().get(plane_url, timeout=10)
+        response.raise_for_status()  # Raise an error for bad responses
+        logger.debug(f"Response from {plane_url}: {response}")
+        plane_data = self._validate_data(response.content)
+
+        # We are working on fresh data (no cache), report update time
+        self.update_datetime = to_datetime(in_timezone=self.config.general.timezone)
+
+        return plane_data
+
+    def _request_forecast(self, force_update: Optional[bool] = False) -> AkkudoktorForecast:
         """Fetch PV forecast data from Akkudoktor API.
 
-        This method sends a request to Akkudoktor API to retrieve forecast data
-        for a specified date range and location. The response data is parsed and
-        returned as JSON for further processing.
+        This method sends one request per plane to Akkudoktor API to retrieve forecast data
+        for a specified date range and location. The plane requests are issued concurrently.
+        The plane forecasts are combined into one forecast with one value list per plane.
+
+        Args:
+            force_update (bool, optional): Fetch all planes, even if cached.
 
         Returns:
-            dict: The parsed JSON response from Akkudoktor API containing forecast data.
+            AkkudoktorForecast: The forecast data with one value list per plane.
 
         Raises:
-            ValueError: If the API response does not include expected `meta` data.
+            ValueError: If there is no plane configured.
         """
-        akkudoktor_data: Optional[AkkudoktorForecast] = None
-
-        for plane in self.config.pvforecast.planes:
-            plane_url = self._url(plane)
-            response = requests.get(plane_url, timeout=10)
-            response.raise_for_status()  # Raise an error for bad responses
-            logger.debug(f"Response from {plane_url}: {response}")
-            plane_data = self._validate_data(response.content)
-
-            if akkudoktor_data is None:
-                akkudoktor_data = plane_data
-            else:
-                # Add plane data to total akkudoktor data
-                akkudoktor_data.values.append(plane_data.values[0])
-
-        if akkudoktor_data is None:
+        if not self.config.pvforecast.planes:
             error_msg = "PVForecastAkkudoktor is missing plane configuration"
             logger.error(error_msg)
             raise ValueError(error_msg)
 
-        # We are working on fresh data (no cache), report update time
-        self.update_datetime = to_datetime(in_timezone=self.config.general.timezone)
+        plane_urls = [self._url(plane) for plane in self.config.pvforecast.planes]
+        planes_data = self._request_planes(self._request_plane, plane_urls, force_update)
 
-        return akkudoktor_data
+        return AkkudoktorForecast(
+            meta=planes_data[0].meta,
+            values=[plane_data.values[0] for plane_data in planes_data],
+        )
 
     async def _update_data(self, force_update: Optional[bool] = False) -> None:
         """Update forecast data in the PVForecastAkkudoktorDataRecord format.
@@ -369,7 +385,7 @@ class PVForecastAkkudoktor(PVForecastProvider):
             raise ValueError(error_msg)
 
         # Get Akkudoktor PV Forecast data for the given configuration.
-        akkudoktor_data = self._request_forecast(force_update=force_update)  # type: ignore
+        akkudoktor_data = await asyncio.to_thread(self._request_forecast, force_update=force_update)
 
         # Timezone of the PV system
         if self.config.general.timezone != akkudoktor_data.meta.timezone:
@@ -391,23 +407,35 @@ class PVForecastAkkudoktor(PVForecastProvider):
         if not self.ems_start_datetime:
             raise ValueError(f"Start DateTime not set: {self.ems_start_datetime}")
 
+        # Sum up the power of all planes in one pass
+        steps = min(len(plane_values) for plane_values in akkudoktor_data.values)
+        sum_dc_power = np.array(
+            [
+                [value.dcPower for value in plane_values[:steps]]
+                for plane_values in akkudoktor_data.values
+            ]
+        ).sum(axis=0)
+        sum_ac_power = np.array(
+            [
+                [value.power for value in plane_values[:steps]]
+                for plane_values in akkudoktor_data.values
+            ]
+        ).sum(axis=0)
+
         # Iterate over forecast data points
-        for forecast_values in zip(*akkudoktor_data.values):
-            original_datetime = forecast_values[0].datetime
-            dt = to_datetime(original_datetime, in_timezone=self.config.general.timezone)
+        start_of_day = self.ems_start_datetime.start_of("day")
+        for i, forecast_value in enumerate(akkudoktor_data.values[0][:steps]):
+            dt = to_datetime(forecast_value.datetime, in_timezone=self.config.general.timezone)
 
             # Skip outdated forecast data
-            if compare_datetimes(dt, self.ems_start_datetime.start_of("day")).lt:
+            if compare_datetimes(dt, start_of_day).lt:
                 continue
 
-            sum_dc_power = sum(values.dcPower for values in forecast_values)
-            sum_ac_power = sum(values.power for values in forecast_values)
-
             data = {
-                "pvforecast_dc_power": sum_dc_power,
-                "pvforecast_ac_power": sum_ac_power,
-                "pvforecastakkudoktor_wind_speed_10m": forecast_values[0].windspeed_10m,
-                "pvforecastakkudoktor_temp_air": forecast_values[0].temperature,
+                "pvforecast_dc_power": float(sum_dc_power[i]),
+                "pvforecast_ac_power": float(sum_ac_power[i]),
+                "pvforecastakkudoktor_wind_speed_10m": forecast_value.windspeed_10m,
+                "pvforecastakkudoktor_temp_air": forecast_value.temperature,
             }
 
             await self.update_value(dt, data)
@@ -8,8 +8,9 @@ request covers a single plane:
 
 ``result.watts`` is the instantaneous AC power per timestamp — exactly what the
 optimizer consumes as ``pvforecast_ac_power``. EOS plants with several roof
-planes issue one request per plane and the instantaneous powers are summed per
-timestamp.
+planes issue one request per plane, concurrently, and the instantaneous powers
+are summed per timestamp. The plane responses are cached per plane, so planes
+with unchanged configuration are not fetched again.
 
 Note on conventions:
     - Forecast.Solar azimuth is -180=N, -90=E, 0=S, 90=W, whereas EOS
@@ -19,9 +20,11 @@ Note on conventions:
       to resolve them to absolute instants before EOS resamples them.
 """
 
+import asyncio
 import re
 from typing import Any, Optional
 
+import pandas as pd
 import pendulum
 import requests
 from loguru import logger
@@ -31,6 +34,7 @@ from akkudoktoreos.config.configabc import SettingsBaseModel
 from akkudoktoreos.core.cache import cache_in_file
 from akkudoktoreos.prediction.pvforecastabc import PVForecastProvider
 from akkudoktoreos.utils.datetimeutil import to_datetime
+from akkudoktoreos.utils.httpclient import get_http_client
 
 FORECAST_SOLAR_BASE = "https://api.forecast.solar"
 
@@ -96,36 +100,55 @@ class PVForecastForecastSolar(PVForecastProvider):
             base = f"{base}/{api_key}"
         return f"{base}/estimate/{latitude}/{longitude}/{float(tilt)}/{fs_az}/{float(peakpower)}"
 
-    @cache_in_file(with_ttl="1 hour")
-    def _request_forecast(self) -> dict:
-        """Fetch and aggregate the Forecast.Solar estimate across all configured planes."""
+    @cache_in_file(with_ttl="1 hour", ignore_params=["self"])
+    def _request_plane(self, url: str) -> dict:
+        """Fetch the Forecast.Solar estimate of one plane.
+
+        The response is cached per plane url, so planes with unchanged configuration are not
+        fetched again.
+        """
+        logger.debug(f"Requesting Forecast.Solar estimate: {url}")
+        try:
+            response = get_http_client().get(
+                url, headers={"Accept": "application/json"}, timeout=30
+            )
+            response.raise_for_status()
+        except requests.RequestException as e:
+            logger.error(f"Failed to fetch pvforecast from Forecast.Solar: {e}")
+            raise RuntimeError("Failed to fetch pvforecast from Forecast.Solar API") from e
+
+        self.update_datetime = to_datetime(in_timezone=self.config.general.timezone)
+        return response.json()
+
+    def _request_forecast(self, force_update: Optional[bool] = False) -> dict:
+        """Fetch and aggregate the Forecast.Solar estimate across all configured planes.
+
+        The planes are requested concurrently. The instantaneous powers of the planes are summed
+        per timestamp.
+        """
         planes = self.config.pvforecast.planes or []
         if not planes:
             raise ValueError("PVForecastForecastSolar needs at least one pvforecast.planes entry")
 
-        summed: dict[str, float] = {}
-        timezone: Optional[str] = None
-        for plane in planes:
-            url = self._plane_url(plane)
-            logger.debug(f"Requesting Forecast.Solar estimate: {url}")
-            try:
-                response = requests.get(url, headers={"Accept": "application/json"}, timeout=30)
-                response.raise_for_status()
-            except requests.RequestException as e:
-                logger.error(f"Failed to fetch pvforecast from Forecast.Solar: {e}")
-                raise RuntimeError("Failed to fetch pvforecast from Forecast.Solar API") from e
-            data = response.json()
-            if timezone is None:
-                timezone = (data.get("message", {}).get("info", {}) or {}).get("timezone")
-            watts = (data.get("result", {}) or {}).get("watts", {}) or {}
-            for ts, power in watts.items():
-                try:
-                    summed[ts] = summed.get(ts, 0.0) + float(power)
-                except (TypeError, ValueError):
-                    continue
+        urls = [self._plane_url(plane) for plane in planes]
+        planes_data = self._request_planes(self._request_plane, urls, force_update)
 
-        self.update_datetime = to_datetime(in_timezone=self.config.general.timezone)
-        return {"timezone": timezone, "watts": summed}
+        timezone: Optional[str] = None
+        for data in planes_data:
+            timezone = (data.get("message", {}).get("info", {}) or {}).get("timezone")
+            if timezone is not None:
+                break
+
+        # One row per plane, one column per timestamp; non-numeric powers are ignored.
+        watts = pd.DataFrame(
+            [(data.get("result", {}) or {}).get("watts", {}) or {} for data in planes_data]
+        )
+        summed = watts.apply(pd.to_numeric, errors="coerce").sum(axis=0, min_count=1).dropna()
+
+        return {
+            "timezone": timezone,
+            "watts": {str(ts): float(power) for ts, power in summed.items()},
+        }
 
     async def _update_data(self, force_update: Optional[bool] = False) -> None:
         """Update forecast data in the PVForecastDataRecord format."""
@@ -133,7 +156,7 @@ class PVForecastForecastSolar(PVForecastProvider):
             logger.info("PVForecastForecastSolar is disabled, skipping update.")
             return
 
-        body = self._request_forecast(force_update=force_update)  # type: ignore[call-arg]
+        body = await asyncio.to_thread(self._request_forecast, force_update=force_update)
         timezone = body.get("timezone")
         watts = body.get("watts", {})
 
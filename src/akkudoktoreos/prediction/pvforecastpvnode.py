@@ -20,6 +20,7 @@ Notes:
     - API: https://api.pvnode.com/v2  (15-minute resolution).
 """
 
+import asyncio
 import re
 import urllib.parse
 from typing import Any, Optional
@@ -33,6 +34,7 @@ from akkudoktoreos.config.configabc import SettingsBaseModel
 from akkudoktoreos.core.cache import cache_in_file
 from akkudoktoreos.prediction.pvforecastabc import PVForecastProvider
 from akkudoktoreos.utils.datetimeutil import to_datetime
+from akkudoktoreos.utils.httpclient import get_http_client
 
 PVNODE_BASE = "https://api.pvnode.com/v2"
 
@@ -167,12 +169,14 @@ class PVForecastPVNode(PVForecastProvider):
         try:
             if site_id:
                 url = f"{PVNODE_BASE}/forecast/{urllib.parse.quote(site_id, safe='')}"
-                response = requests.get(url, headers=headers, params=params, timeout=30)
+                response = get_http_client().get(url, headers=headers, params=params, timeout=30)
             else:
                 body = self._inline_body()
                 url = f"{PVNODE_BASE}/forecast/inline"
                 headers["Content-Type"] = "application/json"
-                response = requests.post(url, headers=headers, params=params, json=body, timeout=30)
+                response = get_http_client().post(
+                    url, headers=headers, params=params, json=body, timeout=30
+                )
             logger.debug(f"Requesting pvnode forecast: {url}")
             response.raise_for_status()
         except requests.RequestException as e:
@@ -221,7 +225,7 @@ class PVForecastPVNode(PVForecastProvider):
             logger.info("PVForecastPVNode is disabled, skipping update.")
             return
 
-        body = self._request_forecast(force_update=force_update)  # type: ignore[call-arg]
+        body = await asyncio.to_thread(self._request_forecast, force_update=force_update)  # type: ignore[call-arg]
         rows = self._extract_values(body)
 
         for date, power_w in rows:
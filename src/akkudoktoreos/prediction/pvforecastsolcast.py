@@ -16,6 +16,7 @@ Notes:
       cached (1 hour TTL) to stay within budget.
 """
 
+import asyncio
 import re
 import urllib.parse
 from typing import Any, Optional
@@ -28,6 +29,7 @@ from akkudoktoreos.config.configabc import SettingsBaseModel
 from akkudoktoreos.core.cache import cache_in_file
 from akkudoktoreos.prediction.pvforecastabc import PVForecastProvider
 from akkudoktoreos.utils.datetimeutil import to_datetime
+from akkudoktoreos.utils.httpclient import get_http_client
 
 SOLCAST_BASE = "https://api.solcast.com.au/rooftop_sites"
 
@@ -90,7 +92,7 @@ class PVForecastSolcast(PVForecastProvider):
         headers = {"Authorization": f"Bearer {settings.api_key}", "Accept": "application/json"}
         logger.debug(f"Requesting Solcast forecast: {url}")
         try:
-            response = requests.get(url, headers=headers, params=params, timeout=30)
+            response = get_http_client().get(url, headers=headers, params=params, timeout=30)
             response.raise_for_status()
         except requests.RequestException as e:
             logger.error(f"Failed to fetch pvforecast from Solcast: {e}")
@@ -105,7 +107,7 @@ class PVForecastSolcast(PVForecastProvider):
             logger.info("PVForecastSolcast is disabled, skipping update.")
             return
 
-        body = self._request_forecast(force_update=force_update)  # type: ignore[call-arg]
+        body = await asyncio.to_thread(self._request_forecast, force_update=force_update)  # type: ignore[call-arg]
         forecasts = body.get("forecasts", []) if isinstance(body, dict) else []
 
         count = 0
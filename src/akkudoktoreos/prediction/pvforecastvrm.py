@@ -1,5 +1,6 @@
 """Retrieves pvforecast data from Victron Remote Management (VRM) API."""
 
+import asyncio
 from typing import Any, Optional, Union
 
 import requests
@@ -10,6 +11,7 @@ from akkudoktoreos.config.configabc import SettingsBaseModel
 from akkudoktoreos.core.pydantic import PydanticBaseModel
 from akkudoktoreos.prediction.pvforecastabc import PVForecastProvider
 from akkudoktoreos.utils.datetimeutil import DateTime, to_datetime
+from akkudoktoreos.utils.httpclient import get_http_client
 
 
 class VrmForecastRecords(PydanticBaseModel):
@@ -70,7 +72,7 @@ class PVForecastVrm(PVForecastProvider):
         logger.debug(f"Requesting VRM forecast: {url}")
 
         try:
-            response = requests.get(url, headers=headers, timeout=30)
+            response = get_http_client().get(url, headers=headers, timeout=30)
             response.raise_for_status()
         except requests.RequestException as e:
             logger.error(f"Failed to fetch pvforecast: {e}")
@@ -94,7 +96,7 @@ class PVForecastVrm(PVForecastProvider):
         end_ts = int(end_date.timestamp())
 
         logger.info(f"Updating PV forecast from VRM: {start_date} to {end_date}")
-        vrm_forecast_data = self._request_forecast(start_ts, end_ts)
+        vrm_forecast_data = await asyncio.to_thread(self._request_forecast, start_ts, end_ts)
 
         pv_forecast = []
         for timestamp, value in vrm_forecast_data.records.solar_yield_forecast:
@@ -6,18 +6,19 @@ humidity, cloud cover, and solar irradiance. The data is mapped to the `WeatherD
 format, enabling consistent access to forecasted and historical weather attributes.
 """
 
+import asyncio
 import json
 from typing import Dict, List, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
 import pvlib
-import requests
 from loguru import logger
 
 from akkudoktoreos.core.cache import cache_in_file
 from akkudoktoreos.prediction.weatherabc import WeatherDataRecord, WeatherProvider
 from akkudoktoreos.utils.datetimeutil import to_datetime, to_duration
+from akkudoktoreos.utils.httpclient import get_http_client
 
 WheaterDataBrightSkyMapping: List[Tuple[str, Optional[str], Optional[Union[str, float]]]] = [
     # brightsky_key, description, corr_factor
@@ -96,7 +97,7 @@ class WeatherBrightSky(WeatherProvider):
         source = "https://api.brightsky.dev"
         date = to_datetime(self.ems_start_datetime, as_string=True)
         last_date = to_datetime(self.end_datetime, as_string=True)
-        response = requests.get(
+        response = get_http_client().get(
             f"{source}/weather?lat={self.config.general.latitude}&lon={self.config.general.longitude}&date={date}&last_date={last_date}&tz={self.config.general.timezone}",
             timeout=10,
         )
@@ -167,7 +168,7 @@ class WeatherBrightSky(WeatherProvider):
         The final mapped and processed data is inserted into the sequence as `WeatherDataRecord`.
         """
         # Get BrightSky weather data for the given coordinates
-        brightsky_data = self._request_forecast(force_update=force_update)  # type: ignore
+        brightsky_data = await asyncio.to_thread(self._request_forecast, force_update=force_update)  # type: ignore
 
         # Get key mapping from description
         brightsky_key_mapping: Dict[str, Tuple[Optional[str], Optional[Union[str, float]]]] = {}
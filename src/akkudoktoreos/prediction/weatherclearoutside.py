@@ -12,6 +12,7 @@ Notes:
     - Ensure appropriate API keys or configurations are set up if required by external data sources.
 """
 
+import asyncio
 import re
 from typing import Dict, List, Optional, Tuple
 
@@ -23,6 +24,7 @@ from loguru import logger
 from akkudoktoreos.core.cache import cache_in_file
 from akkudoktoreos.prediction.weatherabc import WeatherDataRecord, WeatherProvider
 from akkudoktoreos.utils.datetimeutil import to_datetime, to_duration, to_timezone
+from akkudoktoreos.utils.httpclient import get_http_client
 
 WheaterDataClearOutsideMapping: List[Tuple[str, Optional[str], Optional[float]]] = [
     # clearoutside_key, description, corr_factor
@@ -90,7 +92,9 @@ class WeatherClearOutside(WeatherProvider):
         source = "https://clearoutside.com/forecast"
         latitude = round(self.config.general.latitude, 2)
         longitude = round(self.config.general.longitude, 2)
-        response = requests.get(f"{source}/{latitude}/{longitude}?desktop=true", timeout=10)
+        response = get_http_client().get(
+            f"{source}/{latitude}/{longitude}?desktop=true", timeout=10
+        )
         response.raise_for_status()  # Raise an error for bad responses
         logger.debug(f"Response from {source}: {response}")
         # We are working on fresh data (no cache), report update time
@@ -138,7 +142,7 @@ class WeatherClearOutside(WeatherProvider):
 
         """
         # Get ClearOutside web content - either from site or cached
-        response = self._request_forecast(force_update=force_update)  # type: ignore
+        response = await asyncio.to_thread(self._request_forecast, force_update=force_update)  # type: ignore
 
         # Scrape the data
         soup = BeautifulSoup(response.content, "html.parser")
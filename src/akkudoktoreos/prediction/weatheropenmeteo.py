@@ -6,17 +6,18 @@ humidity, cloud cover, and solar irradiance. The data is mapped to the `WeatherD
 format, enabling consistent access to forecasted and historical weather attributes.
 """
 
+import asyncio
 from typing import Dict, List, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
 import pvlib
-import requests
 from loguru import logger
 
 from akkudoktoreos.core.cache import cache_in_file
 from akkudoktoreos.prediction.weatherabc import WeatherDataRecord, WeatherProvider
 from akkudoktoreos.utils.datetimeutil import to_datetime, to_duration
+from akkudoktoreos.utils.httpclient import get_http_client
 
 WeatherDataOpenMeteoMapping: List[Tuple[str, Optional[str], Optional[Union[str, float]]]] = [
     # openmeteo_key, description, corr_factor
@@ -182,7 +183,7 @@ class WeatherOpenMeteo(WeatherProvider):
 
         logger.debug(f"Open-Meteo Request params: {params}")
 
-        response = requests.get(source, params=params, timeout=10)
+        response = get_http_client().get(source, params=params, timeout=10)
         response.raise_for_status()  # Raise an error for bad responses
         logger.debug(f"Response from {source}: {response.status_code}")
 
@@ -252,7 +253,7 @@ class WeatherOpenMeteo(WeatherProvider):
         data is inserted into the sequence as `WeatherDataRecord`.
         """
         # Retrieve Open-Meteo weather data for the given coordinates
-        openmeteo_data = self._request_forecast(force_update=force_update)  # type: ignore
+        openmeteo_data = await asyncio.to_thread(self._request_forecast, force_update=force_update)  # type: ignore
 
         # Create key mapping from the description
         openmeteo_key_mapping: Dict[str, Tuple[Optional[str], Optional[Union[str, float]]]] = {}
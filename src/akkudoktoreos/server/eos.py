@@ -35,8 +35,9 @@ from akkudoktoreos.core.coreabc import (
     get_resource_registry,
     singletons_init,
 )
+from akkudoktoreos.core.dataabc import DataProviderUpdate
 from akkudoktoreos.core.emplan import EnergyManagementPlan, ResourceStatus
-from akkudoktoreos.core.ems import ems_manage_energy
+from akkudoktoreos.core.ems import EnergyManagementRun, ems_manage_energy
 from akkudoktoreos.core.emsettings import EnergyManagementMode
 from akkudoktoreos.core.logging import logging_track_config, read_file_log
 from akkudoktoreos.core.pydantic import (
@@ -53,6 +54,7 @@ from akkudoktoreos.optimization.genetic.geneticparams import (
 )
 from akkudoktoreos.optimization.genetic.geneticsolution import GeneticSolution
 from akkudoktoreos.optimization.optimization import OptimizationSolution
+from akkudoktoreos.optimization.optimizationstatus import OptimizationProgress
 from akkudoktoreos.prediction.elecprice import ElecPriceCommonSettings
 from akkudoktoreos.prediction.load import LoadCommonSettings
 from akkudoktoreos.prediction.loadakkudoktor import LoadAkkudoktorCommonSettings
@@ -200,6 +202,9 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     retention_manager_task.cancel()
     await asyncio.gather(retention_manager_task, return_exceptions=True)
 
+    # Stop the optimization worker process
+    get_ems().shutdown()
+
     # On shutdown
     await save_eos_state()
 
@@ -455,6 +460,7 @@ def fastapi_health_get():  # type: ignore
             "energy-management": {
                 "start_datetime": to_datetime(get_ems().start_datetime, as_string=True),
                 "last_run_datetime": to_datetime(get_ems().last_run_datetime, as_string=True),
+                "optimization_skip_reason": get_ems().optimization_skip_reason(),
             },
         }
     )
@@ -914,6 +920,16 @@ def fastapi_prediction_providers_get(enabled: Optional[bool] = None) -> list[str
     )
 
 
+@app.get("/v1/prediction/providers/updates", tags=["prediction"])
+def fastapi_prediction_providers_updates_get() -> dict[str, DataProviderUpdate]:
+    """Get the outcome of the latest update of the prediction providers.
+
+    Lists per provider id the start datetime and duration of the update and whether the update
+    succeeded or timed out.
+    """
+    return get_prediction().provider_updates
+
+
 @app.get("/v1/prediction/keys", tags=["prediction"])
 def fastapi_prediction_keys_get() -> list[str]:
     """Get a list of available prediction keys."""
@@ -1173,6 +1189,34 @@ def fastapi_energy_management_plan_get() -> EnergyManagementPlan:
     return plan
 
 
+@app.get("/v1/energy-management/optimization/progress", tags=["energy-management"])
+def fastapi_energy_management_optimization_progress_get() -> OptimizationProgress:
+    """Get the progress of the running or latest optimization."""
+    return get_ems().optimization_progress()
+
+
+@app.post("/v1/energy-management/optimization/cancel", tags=["energy-management"])
+def fastapi_energy_management_optimization_cancel_post() -> OptimizationProgress:
+    """Cancel the running optimization.
+
+    The optimization stops at the next generation boundary and the best solution found so far
+    is used.
+    """
+    if not get_ems().cancel_optimization():
+        raise HTTPException(status_code=404, detail="No optimization running.")
+    return get_ems().optimization_progress()
+
+
+@app.get("/v1/energy-management/runs", tags=["energy-management"])
+def fastapi_energy_management_runs_get() -> list[EnergyManagementRun]:
+    """Get the records of the latest energy management runs.
+
+    Each record lists the stages of the run with their start and end datetime and duration.
+    The records are ordered oldest first.
+    """
+    return get_ems().runs()
+
+
 @app.get("/strompreis", tags=["prediction"], deprecated=True)
 async def fastapi_strompreis() -> list[float]:
     """Deprecated: Electricity Market Price Prediction per Wh [amount/Wh].
@@ -0,0 +1,148 @@
+"""Shared HTTP client for prediction providers.
+
+All prediction providers fetch their data with the shared HTTP client. The client keeps a pool of
+keep-alive connections per host, requests gzip compressed responses, limits the number of
+concurrent requests per host and applies a default timeout.
+
+The requests are blocking. Coroutines run them in a worker thread (e.g. by `asyncio.to_thread`),
+so the event loop is not stalled for the round trip.
+
+Example:
+    .. code-block:: python
+
+        from akkudoktoreos.utils.httpclient import get_http_client
+
+        response = get_http_client().get("https://api.brightsky.dev/weather", timeout=10)
+        response.raise_for_status()
+"""
+
+import threading
+from typing import Any, Optional
+from urllib.parse import urlsplit
+
+import requests
+
+# Timeout for requests without explicit timeout: (connect, read) [seconds]
+DEFAULT_TIMEOUT: tuple[float, float] = (5.0, 30.0)
+
+
+class HttpClient:
+    """Pooled HTTP client with per host concurrency limit.
+
+    The client may be used from several threads. `requests.Session` is not guaranteed to be
+    thread safe, so each thread gets its own session. The sessions share one connection pool;
+    connections are kept alive per host and reused by subsequent requests to the same host.
+
+    Args:
+        max_connections_per_host (int): Maximum number of pooled connections per host.
+        max_concurrent_per_host (int): Maximum number of concurrent requests per host. Further
+            requests to the host wait for a running request to finish.
+        timeout (tuple[float, float]): Default (connect, read) timeout [seconds] for requests
+            without explicit timeout.
+    """
+
+    def __init__(
+        self,
+        max_connections_per_host: int = 10,
+        max_concurrent_per_host: int = 4,
+        timeout: tuple[float, float] = DEFAULT_TIMEOUT,
+    ) -> None:
+        self.max_concurrent_per_host = max_concurrent_per_host
+        self.timeout = timeout
+        self._adapter = requests.adapters.HTTPAdapter(
+            pool_connections=10, pool_maxsize=max_connections_per_host
+        )
+        self._local = threading.local()
+        self._host_slots: dict[str, threading.BoundedSemaphore] = {}
+        self._host_slots_lock = threading.Lock()
+
+    @property
+    def session(self) -> requests.Session:
+        """Session of the calling thread, using the shared connection pool."""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.mount("http://", self._adapter)
+            session.mount("https://", self._adapter)
+            session.headers["Accept-Encoding"] = "gzip, deflate"
+            self._local.session = session
+        return session
+
+    def _host_slot(self, url: str) -> threading.BoundedSemaphore:
+        """Get the semaphore limiting the concurrent requests to the host of the url."""
+        host = urlsplit(url).netloc
+        with self._host_slots_lock:
+            slot = self._host_slots.get(host)
+            if slot is None:
+                slot = threading.BoundedSemaphore(self.max_concurrent_per_host)
+                self._host_slots[host] = slot
+            return slot
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """Send a blocking request.
+
+        Args:
+            method (str): HTTP method, e.g. "GET" or "POST".
+            url (str): Request url.
+            **kwargs: Arguments passed to `requests.Session.request` (params, headers, json, ...).
+
+        Returns:
+            requests.Response: The response. Unless streamed, the response content is already
+                read and the connection is returned to the pool.
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        session = self.session
+        with self._host_slot(url):
+            if method.upper() == "GET":
+                response = session.get(url, **kwargs)
+            elif method.upper() == "POST":
+                response = session.post(url, **kwargs)
+            else:
+                response = session.request(method, url, **kwargs)
+        return response
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        """Send a blocking GET request - see `request`."""
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> requests.Response:
+        """Send a blocking POST request - see `request`."""
+        return self.request("POST", url, **kwargs)
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+        self._adapter.close()
+
+
+# Shared HTTP client of this process
+_http_client: Optional[HttpClient] = None
+_http_client_lock = threading.Lock()
+
+
+def get_http_client() -> HttpClient:
+    """Get the shared HTTP client of this process.
+
+    Returns:
+        HttpClient: The shared HTTP client, created on first use.
+    """
+    global _http_client
+    with _http_client_lock:
+        if _http_client is None:
+            _http_client = HttpClient()
+        return _http_client
+
+
+def set_http_client(client: Optional[HttpClient]) -> None:
+    """Set the shared HTTP client of this process.
+
+    The previous client is closed.
+
+    Args:
+        client (HttpClient, optional): The new shared HTTP client. None to create a new default
+            client on next use.
+    """
+    global _http_client
+    with _http_client_lock:
+        if _http_client is not None and _http_client is not client:
+            _http_client.close()
+        _http_client = client
@@ -11,7 +11,7 @@ from contextlib import contextmanager
 from fnmatch import fnmatch
 from http import HTTPStatus
 from pathlib import Path
-from typing import Generator, Optional, Union
+from typing import Any, Callable, Generator, Optional, Union
 from unittest.mock import PropertyMock, patch
 
 import pendulum
@@ -23,9 +23,16 @@ from loguru import logger
 from xprocess import ProcessStarter, XProcess
 
 from akkudoktoreos.config.config import ConfigEOS
-from akkudoktoreos.core.coreabc import get_config, get_prediction, singletons_init
+from akkudoktoreos.core.cache import CacheEnergyManagementStore
+from akkudoktoreos.core.coreabc import get_config, get_ems, get_prediction, singletons_init
 from akkudoktoreos.core.version import _version_date_hash, version
+from akkudoktoreos.optimization.genetic.genetic import GeneticOptimization
+from akkudoktoreos.optimization.genetic.geneticparams import (
+    GeneticOptimizationParameters,
+)
+from akkudoktoreos.optimization.genetic.geneticsolution import GeneticSolution
 from akkudoktoreos.server.server import get_default_host
+from akkudoktoreos.utils.datetimeutil import to_datetime
 
 # -----------------------------------------------
 # Adapt pytest logging handling to Loguru logging
@@ -331,6 +338,68 @@ def config_eos(config_eos_factory) -> ConfigEOS:
     return config_eos
 
 
+# ------------------------------------
+# Provide optimization test setup
+# ------------------------------------
+
+
+@pytest.fixture
+def optimize_input(
+    config_eos: ConfigEOS,
+) -> Generator[Callable[[str], GeneticOptimizationParameters], None, None]:
+    """Fixture to set up an optimization test with test input data.
+
+    Configures 48 prediction and optimization hours and one electric vehicle, and patches the
+    visualization of the optimization result. Yields a function that loads the optimization
+    parameters from a test input data file.
+    """
+    config_eos.merge_settings_from_dict(
+        {
+            "prediction": {"hours": 48},
+            "optimization": {"horizon_hours": 48},
+            "devices": {
+                "max_electric_vehicles": 1,
+                "electric_vehicles": [
+                    {"charge_rates": [0.0, 0.375, 0.5, 0.625, 0.75, 0.875, 1.0]},
+                ],
+            },
+        }
+    )
+
+    def load(fn_in: str) -> GeneticOptimizationParameters:
+        file = Path(__file__).parent / "testdata" / fn_in
+        with file.open("r") as f_in:
+            return GeneticOptimizationParameters(**json.load(f_in))
+
+    with patch("akkudoktoreos.utils.visualize.prepare_visualize"):
+        yield load
+
+
+@pytest.fixture
+def optimize(
+    optimize_input: Callable[[str], GeneticOptimizationParameters],
+) -> Callable[..., GeneticSolution]:
+    """Fixture to run an optimization with test input data.
+
+    Returns a function that runs the given optimization for a test input data file without start
+    solution, starting at hour 10. Further keyword arguments are passed to `optimize_ems`.
+    """
+    fixed_start_hour = 10
+
+    def run(
+        optimization: GeneticOptimization, fn_in: str, ngen: int, **kwargs: Any
+    ) -> GeneticSolution:
+        input_data = optimize_input(fn_in)
+        input_data.start_solution = None
+        get_ems(init=True).set_start_datetime(to_datetime().set(hour=fixed_start_hour))
+        CacheEnergyManagementStore().clear()
+        return optimization.optimize_ems(
+            parameters=input_data, start_hour=fixed_start_hour, ngen=ngen, **kwargs
+        )
+
+    return run
+
+
 # ------------------------------------
 # Provide pytest EOS server management
 # ------------------------------------
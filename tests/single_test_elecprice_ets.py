@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+
+import argparse
+import time
+
+import numpy as np
+
+from akkudoktoreos.prediction.elecpriceets import ElecPriceETSModel
+
+
+def price_history(hours: int, seed: int) -> np.ndarray:
+    """Synthetic hourly prices [amount/Wh] with daily and weekly season, drifting level and spikes.
+
+    Args:
+        hours (int): Number of hours.
+        seed (int): Seed of the random generator.
+
+    Returns:
+        np.ndarray: Hourly prices.
+    """
+    rng = np.random.default_rng(seed)
+    t = np.arange(hours)
+    level = 0.0001 + np.cumsum(rng.normal(0, 0.000001, hours))
+    daily = 0.00003 * np.sin(2 * np.pi * t / 24) + 0.00001 * np.sin(4 * np.pi * t / 24)
+    weekly = 0.00002 * (t % 168 >= 120)  # cheaper weekends
+    spikes = rng.binomial(1, 0.01, hours) * rng.normal(0, 0.0001, hours)
+    return level + daily - weekly + spikes + rng.normal(0, 0.000005, hours)
+
+
+def main():
+    """Benchmark the cached exponential smoothing model against a refit on every update.
+
+    Each simulated day one new price day arrives and the prices of the next hours are forecasted
+    from the history.
+    """
+    parser = argparse.ArgumentParser(
+        description="Benchmark cached vs. refitted exponential smoothing price extrapolation"
+    )
+    parser.add_argument(
+        "--history-days", type=int, default=35, help="Initial price history (default: 35)"
+    )
+    parser.add_argument("--days", type=int, default=28, help="Simulated days (default: 28)")
+    parser.add_argument(
+        "--hours", type=int, default=48, help="Hours to forecast per update (default: 48)"
+    )
+    parser.add_argument(
+        "--seasonal-periods", type=int, default=168, help="Season length (default: 168)"
+    )
+    parser.add_argument(
+        "--refit-hours", type=int, default=168, help="Hours between full refits (default: 168)"
+    )
+    parser.add_argument(
+        "--refit-error-ratio", type=float, default=2.0, help="Error drift ratio (default: 2.0)"
+    )
+    parser.add_argument("--seed", type=int, default=42, help="Random seed (default: 42)")
+    args = parser.parse_args()
+
+    history_hours = args.history_days * 24
+    prices = price_history(history_hours + args.days * 24 + args.hours, args.seed)
+
+    results: dict[str, dict[str, list[float]]] = {
+        "refit": {"time": [], "mae": []},
+        "cached": {"time": [], "mae": []},
+    }
+    refits = 0
+    model = None
+    for day in range(args.days):
+        end = history_hours + day * 24
+        actual = prices[end : end + args.hours]
+
+        start = time.perf_counter()
+        refit_model = ElecPriceETSModel(args.seasonal_periods)
+        refit_model.fit(prices[:end])
+        forecast = refit_model.forecast(args.hours)
+        results["refit"]["time"].append(time.perf_counter() - start)
+        results["refit"]["mae"].append(float(np.mean(np.abs(forecast - actual))))
+
+        start = time.perf_counter()
+        rmse = None
+        if model is not None:
+            rmse = model.update(prices[end - 24 : end])
+        if model is None or model.needs_refit(
+            args.seasonal_periods, args.refit_hours, args.refit_error_ratio, rmse
+        ):
+            model = ElecPriceETSModel(args.seasonal_periods)
+            model.fit(prices[:end])
+            refits += 1
+        forecast = model.forecast(args.hours)
+        results["cached"]["time"].append(time.perf_counter() - start)
+        results["cached"]["mae"].append(float(np.mean(np.abs(forecast - actual))))
+
+    print(
+        f"{'Method':<8} {'Fits':>5} {'Mean time [ms]':>15} {'Total time [s]':>15} {'MAE [ct/kWh]':>13}"
+    )
+    for name, result in results.items():
+        fits = args.days if name == "refit" else refits
+        print(
+            f"{name:<8} {fits:>5} {np.mean(result['time']) * 1e3:>15.1f} "
+            f"{np.sum(result['time']):>15.2f} {np.mean(result['mae']) * 1e5:>13.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+
+import argparse
+import asyncio
+import time
+from typing import Any, Optional
+
+import numpy as np
+import pandas as pd
+from pydantic import Field
+
+from akkudoktoreos.core.dataabc import DataRecord, DataSequence
+from akkudoktoreos.utils.datetimeutil import to_datetime, to_duration
+
+
+class BenchmarkRecord(DataRecord):
+    value: Optional[float] = Field(default=None, description="Value")
+
+
+class BenchmarkSequence(DataSequence):
+    records: list[BenchmarkRecord] = Field(default_factory=list, description="Records")
+
+    @classmethod
+    def record_class(cls) -> Any:
+        return BenchmarkRecord
+
+    def db_namespace(self) -> str:
+        return "BenchmarkSequence"
+
+
+async def write(method: str, values: np.ndarray, sequence: BenchmarkSequence) -> float:
+    """Write the values at 15 minute intervals by the given method.
+
+    Args:
+        method (str): One of "key_from_lists", "key_from_series", "key_from_array".
+        values (np.ndarray): Values to write.
+        sequence (BenchmarkSequence): Sequence to write to.
+
+    Returns:
+        float: Time needed [seconds].
+    """
+    start_datetime = to_datetime("2024-10-01 00:00:00", in_timezone="Europe/Berlin")
+    interval = to_duration("15 minutes")
+    index = pd.date_range(start=start_datetime, periods=len(values), freq="15min")
+
+    start = time.perf_counter()
+    if method == "key_from_lists":
+        dates = [to_datetime(dt) for dt in index]
+        await sequence.key_from_lists("value", dates, values.tolist())
+    elif method == "key_from_series":
+        await sequence.key_from_series("value", pd.Series(values, index=index))
+    else:
+        await sequence.key_from_array(
+            "value", values, start_datetime=start_datetime, interval=interval
+        )
+    return time.perf_counter() - start
+
+
+async def benchmark(points: int, repeat: int) -> None:
+    """Benchmark per point and bulk writes of aligned value arrays."""
+    rng = np.random.default_rng(42)
+    print(f"{'Method':<16} {'Insert [ms]':>12} {'Update [ms]':>12}")
+    for method in ("key_from_lists", "key_from_series", "key_from_array"):
+        insert_times = []
+        update_times = []
+        for _ in range(repeat):
+            sequence = BenchmarkSequence()
+            # Insert into empty sequence, then update all records
+            insert_times.append(await write(method, rng.random(points), sequence))
+            update_times.append(await write(method, rng.random(points), sequence))
+            if len(sequence) != points:
+                raise RuntimeError(f"{method} wrote {len(sequence)} records instead of {points}")
+        print(
+            f"{method:<16} {np.median(insert_times) * 1e3:>12.1f} "
+            f"{np.median(update_times) * 1e3:>12.1f}"
+        )
+
+
+def main():
+    """Benchmark writing aligned arrays into a data sequence."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark key_from_array against key_from_lists and key_from_series"
+    )
+    parser.add_argument(
+        "--points", type=int, default=10000, help="Number of values to write (default: 10000)"
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Repetitions (default: 3)")
+    args = parser.parse_args()
+
+    asyncio.run(benchmark(args.points, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+from akkudoktoreos.core.cache import CacheEnergyManagementStore
+from akkudoktoreos.core.coreabc import get_config, get_ems
+from akkudoktoreos.optimization.dp.dp import DPOptimization
+from akkudoktoreos.optimization.genetic.genetic import GeneticOptimization
+from akkudoktoreos.optimization.genetic.geneticparams import (
+    GeneticOptimizationParameters,
+)
+from akkudoktoreos.optimization.milp.milp import MILPOptimization
+from akkudoktoreos.utils.datetimeutil import to_datetime
+
+DIR_TESTDATA = Path(__file__).parent / "testdata"
+
+config_eos = get_config()
+ems_eos = get_ems()
+
+
+def prepare_parameters(parameters_file: str) -> GeneticOptimizationParameters:
+    """Prepare optimization parameters the DP algorithm can solve.
+
+    Devices the DP does not model (electric vehicle, home appliance) are removed.
+
+    Args:
+        parameters_file (str): Optimization parameters json file.
+
+    Returns:
+        GeneticOptimizationParameters: Configured optimization parameters
+    """
+    with open(parameters_file, "r") as f:
+        parameters = GeneticOptimizationParameters(**json.load(f))
+    parameters.ev = None
+    parameters.dishwasher = None
+    parameters.start_solution = None
+    return parameters
+
+
+def run_optimization(
+    optimization: GeneticOptimization,
+    parameters: GeneticOptimizationParameters,
+    start_hour: int,
+    ngen: int,
+) -> dict[str, Any]:
+    """Run one optimization and measure it.
+
+    Args:
+        optimization (GeneticOptimization): The optimization algorithm.
+        parameters (GeneticOptimizationParameters): Optimization parameters.
+        start_hour (int): Starting hour for optimization.
+        ngen (int): Number of generations of the GENETIC algorithm.
+
+    Returns:
+        dict: Solve time, cost and fitness of the solution.
+    """
+    CacheEnergyManagementStore().clear()
+    start_time = time.perf_counter()
+    with patch("akkudoktoreos.utils.visualize.prepare_visualize"):
+        solution = optimization.optimize_ems(
+            parameters=parameters, start_hour=start_hour, ngen=ngen
+        )
+    elapsed_time = time.perf_counter() - start_time
+    return {
+        "time": elapsed_time,
+        "cost": solution.result.Gesamtbilanz_Euro,
+        "fitness": optimization.fitness_history["min"][-1],
+        "stop_reason": solution.stop_reason,
+    }
+
+
+def main():
+    """Main function to compare the DP, MILP and GENETIC algorithms."""
+    parser = argparse.ArgumentParser(description="Compare DP, MILP and GENETIC Energy Optimization")
+    parser.add_argument(
+        "--parameters-file",
+        type=str,
+        default=str(DIR_TESTDATA / "optimize_input_1.json"),
+        help="Load optimization parameters from json file (default: optimize_input_1.json)",
+    )
+    parser.add_argument(
+        "--start-hour", type=int, default=10, help="Starting hour for optimization (default: 10)"
+    )
+    parser.add_argument("--seed", type=int, default=42, help="Use fixed random seed (default: 42)")
+    parser.add_argument(
+        "--ngen",
+        type=int,
+        default=400,
+        help="Number of generations of the GENETIC algorithm (default: 400)",
+    )
+    parser.add_argument(
+        "--soc-steps",
+        type=int,
+        default=200,
+        help="Number of battery state of charge steps of the DP algorithm (default: 200)",
+    )
+    args = parser.parse_args()
+
+    config_eos.merge_settings_from_dict(
+        {
+            "prediction": {"hours": 48},
+            "optimization": {
+                "horizon_hours": 48,
+                "dp": {"soc_steps": args.soc_steps},
+            },
+        }
+    )
+    ems_eos.set_start_datetime(to_datetime().set(hour=args.start_hour))
+
+    try:
+        parameters = prepare_parameters(args.parameters_file)
+        results = {
+            "DP": run_optimization(
+                DPOptimization(fixed_seed=args.seed), parameters, args.start_hour, args.ngen
+            ),
+            "MILP": run_optimization(
+                MILPOptimization(fixed_seed=args.seed), parameters, args.start_hour, args.ngen
+            ),
+            "GENETIC": run_optimization(
+                GeneticOptimization(fixed_seed=args.seed), parameters, args.start_hour, args.ngen
+            ),
+        }
+    except Exception as e:
+        print(f"Error during optimization: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    print(f"{'Algorithm':<10} {'Time [s]':>10} {'Cost [€]':>12} {'Fitness':>12}  Stop reason")
+    for algorithm, result in results.items():
+        print(
+            f"{algorithm:<10} {result['time']:>10.3f} {result['cost']:>12.4f} "
+            f"{result['fitness']:>12.4f}  {result['stop_reason']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+
+from akkudoktoreos.core.cache import CacheEnergyManagementStore
+from akkudoktoreos.core.coreabc import get_config, get_ems
+from akkudoktoreos.optimization.genetic.genetic import GeneticOptimization
+from akkudoktoreos.optimization.genetic.geneticparams import (
+    GeneticOptimizationParameters,
+)
+from akkudoktoreos.utils.datetimeutil import to_datetime
+
+DIR_TESTDATA = Path(__file__).parent / "testdata"
+
+config_eos = get_config()
+ems_eos = get_ems()
+
+
+def resample_parameters(
+    parameters: GeneticOptimizationParameters, steps_per_hour: int
+) -> GeneticOptimizationParameters:
+    """Resample hourly optimization parameters to the given number of steps per hour.
+
+    Energies are split evenly among the steps of an hour, prices and temperatures are kept.
+
+    Args:
+        parameters (GeneticOptimizationParameters): Hourly optimization parameters.
+        steps_per_hour (int): Simulation steps per hour.
+
+    Returns:
+        GeneticOptimizationParameters: Optimization parameters per simulation step.
+    """
+    data = parameters.model_dump()
+    data["start_solution"] = None
+    ems = data["ems"]
+    for key in ("pv_forecast_wh", "total_load", "total_load_std"):
+        if ems.get(key) is not None:
+            ems[key] = (np.repeat(ems[key], steps_per_hour) / steps_per_hour).tolist()
+    for key in ("electricity_price_per_wh", "feed_in_tariff_per_wh"):
+        if isinstance(ems.get(key), list):
+            ems[key] = np.repeat(ems[key], steps_per_hour).tolist()
+    if data.get("temperature_forecast") is not None:
+        data["temperature_forecast"] = np.repeat(
+            data["temperature_forecast"], steps_per_hour
+        ).tolist()
+    return GeneticOptimizationParameters(**data)
+
+
+def main():
+    """Benchmark the GENETIC optimization run time for sub-hourly optimization intervals."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark the GENETIC optimization for different optimization intervals"
+    )
+    parser.add_argument(
+        "--parameters-file",
+        type=str,
+        default=str(DIR_TESTDATA / "optimize_input_2.json"),
+        help="Load hourly optimization parameters from json file (default: optimize_input_2.json)",
+    )
+    parser.add_argument(
+        "--start-hour", type=int, default=10, help="Starting hour for optimization (default: 10)"
+    )
+    parser.add_argument(
+        "--ngen", type=int, default=400, help="Number of generations (default: 400)"
+    )
+    parser.add_argument(
+        "--intervals",
+        type=int,
+        nargs="+",
+        default=[3600, 1800, 900],
+        help="Optimization intervals [sec] (default: 3600 1800 900)",
+    )
+    args = parser.parse_args()
+
+    with open(args.parameters_file, "r") as f:
+        hourly_parameters = GeneticOptimizationParameters(**json.load(f))
+
+    print(f"{'Interval':>8} {'Steps':>6} {'Time [s]':>9} {'Evals/s':>9} {'Fitness':>10}  In time")
+    for interval in args.intervals:
+        steps_per_hour = 3600 // interval
+        config_eos.merge_settings_from_dict(
+            {
+                "prediction": {"hours": 48},
+                "optimization": {"horizon_hours": 48, "interval": interval},
+                "devices": {
+                    "max_electric_vehicles": 1,
+                    "electric_vehicles": [
+                        {"charge_rates": [0.0, 0.375, 0.5, 0.625, 0.75, 0.875, 1.0]},
+                    ],
+                },
+            }
+        )
+        ems_eos.set_start_datetime(to_datetime().set(hour=args.start_hour, minute=0))
+        try:
+            parameters = resample_parameters(hourly_parameters, steps_per_hour)
+            CacheEnergyManagementStore().clear()
+            optimization = GeneticOptimization(fixed_seed=42)
+            start = time.perf_counter()
+            with patch("akkudoktoreos.utils.visualize.prepare_visualize"):
+                optimization.optimize_ems(
+                    parameters=parameters, start_hour=args.start_hour, ngen=args.ngen
+                )
+            elapsed = time.perf_counter() - start
+        except Exception as e:
+            print(f"Error during optimization: {e}", file=sys.stderr)
+            sys.exit(1)
+        evaluations = optimization.fitness_cache_misses or sum(
+            optimization.fitness_history.get("nevals", [])
+        )
+        print(
+            f"{interval:>8} {optimization.prediction_steps:>6} {elapsed:>9.1f} "
+            f"{evaluations / elapsed:>9.0f} {min(optimization.fitness_history['min']):>10.4f}  "
+            f"{'yes' if elapsed < interval else 'NO'}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+
+import argparse
+import json
+import statistics
+import sys
+from pathlib import Path
+from typing import Optional
+from unittest.mock import patch
+
+from akkudoktoreos.core.cache import CacheEnergyManagementStore
+from akkudoktoreos.core.coreabc import get_config, get_ems
+from akkudoktoreos.optimization.genetic.genetic import GeneticOptimization
+from akkudoktoreos.optimization.genetic.geneticparams import (
+    GeneticOptimizationParameters,
+)
+from akkudoktoreos.utils.datetimeutil import to_datetime
+
+DIR_TESTDATA = Path(__file__).parent / "testdata"
+
+config_eos = get_config()
+ems_eos = get_ems()
+
+
+def run_optimization(
+    parameters: GeneticOptimizationParameters,
+    start_hour: int,
+    ngen: int,
+    seed: int,
+    fraction: float,
+) -> list[float]:
+    """Run one optimization and return the best fitness per generation.
+
+    Args:
+        parameters (GeneticOptimizationParameters): Optimization parameters.
+        start_hour (int): Starting hour for optimization.
+        ngen (int): Number of generations.
+        seed (int): Random seed.
+        fraction (float): Fraction of the initial population seeded from rule based schedules.
+
+    Returns:
+        list[float]: Best fitness per generation.
+    """
+    config_eos.optimization.genetic.heuristic_seeding_fraction = fraction
+    CacheEnergyManagementStore().clear()
+    optimization = GeneticOptimization(fixed_seed=seed)
+    with patch("akkudoktoreos.utils.visualize.prepare_visualize"):
+        optimization.optimize_ems(parameters=parameters, start_hour=start_hour, ngen=ngen)
+    best = []
+    for fitness in optimization.fitness_history["min"]:
+        best.append(min(fitness, best[-1]) if best else fitness)
+    return best
+
+
+def generations_to_target(best: list[float], target: float) -> Optional[int]:
+    """First generation the best fitness reaches the target, None if never."""
+    for gen, fitness in enumerate(best):
+        if fitness <= target:
+            return gen
+    return None
+
+
+def main():
+    """Benchmark heuristic seeding against a random initial population."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark heuristic seeding of the GENETIC initial population"
+    )
+    parser.add_argument(
+        "--parameters-file",
+        type=str,
+        default=str(DIR_TESTDATA / "optimize_input_1.json"),
+        help="Load optimization parameters from json file (default: optimize_input_1.json)",
+    )
+    parser.add_argument(
+        "--start-hour", type=int, default=10, help="Starting hour for optimization (default: 10)"
+    )
+    parser.add_argument("--runs", type=int, default=5, help="Number of seeds (default: 5)")
+    parser.add_argument(
+        "--ngen", type=int, default=200, help="Number of generations (default: 200)"
+    )
+    parser.add_argument(
+        "--fraction",
+        type=float,
+        default=0.1,
+        help="Heuristic seeding fraction (default: 0.1)",
+    )
+    args = parser.parse_args()
+
+    config_eos.merge_settings_from_dict(
+        {
+            "prediction": {"hours": 48},
+            "optimization": {"horizon_hours": 48},
+            "devices": {
+                "max_electric_vehicles": 1,
+                "electric_vehicles": [
+                    {"charge_rates": [0.0, 0.375, 0.5, 0.625, 0.75, 0.875, 1.0]},
+                ],
+            },
+        }
+    )
+    ems_eos.set_start_datetime(to_datetime().set(hour=args.start_hour))
+
+    try:
+        with open(args.parameters_file, "r") as f:
+            parameters = GeneticOptimizationParameters(**json.load(f))
+        parameters.start_solution = None
+        results = {
+            "random": [
+                run_optimization(parameters, args.start_hour, args.ngen, seed, 0.0)
+                for seed in range(args.runs)
+            ],
+            "seeded": [
+                run_optimization(parameters, args.start_hour, args.ngen, seed, args.fraction)
+                for seed in range(args.runs)
+            ],
+        }
+    except Exception as e:
+        print(f"Error during optimization: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    # Target: Median best fitness of the random initial population runs
+    target = statistics.median(best[-1] for best in results["random"])
+    print(f"Target fitness: {target:.4f}")
+    print(f"{'Init':<8} {'Gen 0':>10} {'Final':>10}  Generations to target")
+    for init, runs in results.items():
+        generations = [generations_to_target(best, target) for best in runs]
+        print(
+            f"{init:<8} {statistics.median(best[0] for best in runs):>10.4f} "
+            f"{statistics.median(best[-1] for best in runs):>10.4f}  "
+            f"{' '.join('-' if gen is None else str(gen) for gen in generations)}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+
+import argparse
+import sys
+import time
+
+import numpy as np
+
+from akkudoktoreos.prediction.interpolator import get_eos_load_interpolator
+
+
+def run_benchmark(samples: int, seed: int, tolerance: float, verbose: bool) -> bool:
+    """Benchmark the self-consumption rate table against the RegularGridInterpolator.
+
+    Args:
+        samples (int): Number of random (load, PV power) pairs.
+        seed (int): Random seed for the pairs.
+        tolerance (float): Maximum allowed absolute deviation of the rates.
+        verbose (bool): Whether to print verbose output.
+
+    Returns:
+        bool: True if all rates match within tolerance.
+    """
+    interpolator = get_eos_load_interpolator()
+
+    rng = np.random.default_rng(seed)
+    # Cover the interpolator grid, including out of bounds loads and PV powers
+    loads = rng.uniform(-100.0, 3600.0, samples)
+    pv_powers = rng.uniform(0.0, 10000.0, samples)
+
+    start_time = time.perf_counter()
+    expected = np.array(
+        [
+            interpolator.calculate_self_consumption_interpolated(load, pv)
+            for load, pv in zip(loads, pv_powers)
+        ]
+    )
+    interpolated_time = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    table = np.array(
+        [interpolator.calculate_self_consumption(load, pv) for load, pv in zip(loads, pv_powers)]
+    )
+    table_time = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    batch = interpolator.calculate_self_consumption_batch(loads, pv_powers)
+    batch_time = time.perf_counter() - start_time
+
+    table_deviation = float(np.max(np.abs(table - expected)))
+    batch_deviation = float(np.max(np.abs(batch - expected)))
+
+    print(f"Samples:             {samples}")
+    print(f"Interpolator:        {interpolated_time:.4f} s")
+    print(
+        f"Table lookup:        {table_time:.4f} s ({interpolated_time / table_time:.1f}x), "
+        f"max deviation {table_deviation:.3e}"
+    )
+    print(
+        f"Table batch lookup:  {batch_time:.4f} s ({interpolated_time / batch_time:.1f}x), "
+        f"max deviation {batch_deviation:.3e}"
+    )
+    if verbose:
+        worst = int(np.argmax(np.abs(table - expected)))
+        print(
+            f"Worst pair: load {loads[worst]:.2f} W, PV {pv_powers[worst]:.2f} W, "
+            f"interpolator {expected[worst]}, table {table[worst]}"
+        )
+
+    return table_deviation <= tolerance and batch_deviation <= tolerance
+
+
+def main():
+    """Main function to run the self-consumption rate benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark Self-Consumption Rate Lookup")
+    parser.add_argument("--verbose", action="store_true", help="Enable verbose output")
+    parser.add_argument(
+        "--samples", type=int, default=20000, help="Number of (load, PV) pairs (default: 20000)"
+    )
+    parser.add_argument("--seed", type=int, default=42, help="Use fixed random seed (default: 42)")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=1e-9,
+        help="Maximum allowed absolute deviation (default: 1e-9)",
+    )
+
+    args = parser.parse_args()
+
+    if not run_benchmark(args.samples, args.seed, args.tolerance, args.verbose):
+        print("Self-consumption rates deviate beyond tolerance.", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable
+from unittest.mock import patch
+
+from akkudoktoreos.core.cache import CacheEnergyManagementStore
+from akkudoktoreos.core.coreabc import get_config, get_ems
+from akkudoktoreos.optimization.genetic.genetic import GeneticOptimization
+from akkudoktoreos.optimization.genetic.geneticparams import (
+    GeneticOptimizationParameters,
+)
+from akkudoktoreos.utils.datetimeutil import to_datetime
+
+DIR_TESTDATA = Path(__file__).parent / "testdata"
+
+config_eos = get_config()
+ems_eos = get_ems()
+
+
+def measure(func: Callable[[], Any], runs: int) -> tuple[float, float]:
+    """Measure the memory allocated and the time needed by a function call.
+
+    Args:
+        func (Callable): Function to measure.
+        runs (int): Number of calls.
+
+    Returns:
+        tuple[float, float]: Mean peak memory allocated during a call [bytes] and mean time per
+        call [µs].
+    """
+    func()  # warm up
+    allocated = 0
+    tracemalloc.start()
+    for _ in range(runs):
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+        allocated += peak - current
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    for _ in range(runs):
+        func()
+    elapsed = time.perf_counter() - start
+    return allocated / runs, elapsed / runs * 1e6
+
+
+def main():
+    """Benchmark the memory allocated by the simulation of one individual."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark memory allocation of the GENETIC device simulation"
+    )
+    parser.add_argument(
+        "--parameters-file",
+        type=str,
+        default=str(DIR_TESTDATA / "optimize_input_2.json"),
+        help="Load optimization parameters from json file (default: optimize_input_2.json)",
+    )
+    parser.add_argument(
+        "--start-hour", type=int, default=10, help="Starting hour for optimization (default: 10)"
+    )
+    parser.add_argument(
+        "--runs", type=int, default=2000, help="Number of simulations (default: 2000)"
+    )
+    parser.add_argument(
+        "--individuals",
+        type=int,
+        default=300,
+        help="Individuals per generation, to scale to a run (default: 300)",
+    )
+    parser.add_argument(
+        "--ngen", type=int, default=400, help="Generations, to scale to a run (default: 400)"
+    )
+    args = parser.parse_args()
+
+    config_eos.merge_settings_from_dict(
+        {
+            "prediction": {"hours": 48},
+            "optimization": {"horizon_hours": 48},
+            "devices": {
+                "max_electric_vehicles": 1,
+                "electric_vehicles": [
+                    {"charge_rates": [0.0, 0.375, 0.5, 0.625, 0.75, 0.875, 1.0]},
+                ],
+            },
+        }
+    )
+    ems_eos.set_start_datetime(to_datetime().set(hour=args.start_hour))
+
+    try:
+        with open(args.parameters_file, "r") as f:
+            parameters = GeneticOptimizationParameters(**json.load(f))
+        CacheEnergyManagementStore().clear()
+        optimization = GeneticOptimization(fixed_seed=42)
+        with patch("akkudoktoreos.utils.visualize.prepare_visualize"):
+            solution = optimization.optimize_ems(
+                parameters=parameters, start_hour=args.start_hour, ngen=1
+            )
+    except Exception as e:
+        print(f"Error during optimization: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    individual = solution.start_solution
+    simulation = optimization.simulation
+    optimization.evaluate_inner(individual)
+
+    def simulate() -> None:
+        simulation.reset()
+        simulation.simulate(args.start_hour)
+
+    def evaluate() -> None:
+        optimization.evaluate_inner(individual)
+
+    evaluations = args.individuals * args.ngen
+    print(f"{'':<10} {'Bytes/eval':>12} {'MB/run':>10} {'µs/eval':>10}")
+    for name, func in (("simulate", simulate), ("evaluate", evaluate)):
+        allocated, elapsed = measure(func, args.runs)
+        print(
+            f"{name:<10} {allocated:>12.0f} {allocated * evaluations / 1e6:>10.1f} {elapsed:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -294,3 +294,33 @@ def test_car_and_pv_battery_discharge_and_max_charge_power(setup_pv_battery, set
     assert car_battery.parameters.max_charge_power_w == 7000, (
         "Car battery max charge power should remain as defined"
     )
+
+
+def test_charge_energy_per_step():
+    params = SolarPanelBatteryParameters(
+        device_id="battery1",
+        capacity_wh=10000,
+        initial_soc_percentage=20,
+        min_soc_percentage=0,
+        max_soc_percentage=100,
+        max_charge_power_w=4000,
+        charging_efficiency=1.0,
+        discharging_efficiency=1.0,
+    )
+    battery = Battery(params, prediction_hours=48, step_hours=0.25)
+    battery.reset()
+
+    assert battery.prediction_steps == 192
+    assert battery.max_charge_wh == 1000
+    assert len(battery.charge_array) == 192
+
+    # Charge power limit applies to the energy of a 15 minute step
+    battery.set_charge_per_hour(np.ones(192))
+    battery.set_discharge_per_hour(np.ones(192))
+    charged_wh, _ = battery.charge_energy(wh=None, hour=0, charge_factor=1.0)
+    assert charged_wh == pytest.approx(1000)
+    discharged_wh, _ = battery.discharge_energy(5000, 1)
+    assert discharged_wh == pytest.approx(1000)
+
+    with pytest.raises(ValueError):
+        battery.set_charge_per_hour(np.zeros(48))
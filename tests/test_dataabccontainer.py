@@ -69,6 +69,65 @@ class DerivedDataContainer(DataContainer):
     )
 
 
+class TimedDataProvider(DataProvider):
+    """DataProvider taking some time on update, logging start and end of the update."""
+
+    records: List[DerivedRecord] = Field(
+        default_factory=list, description="List of DerivedRecord records"
+    )
+    update_sec: ClassVar[float] = 0.1
+    update_log: ClassVar[list[str]] = []
+
+    @classmethod
+    def record_class(cls) -> Any:
+        return DerivedRecord
+
+    def provider_id(self) -> str:
+        return self.__class__.__name__
+
+    def enabled(self) -> bool:
+        return True
+
+    async def _update_data(self, force_update: Optional[bool] = False) -> None:
+        self.update_log.append(f"start {self.provider_id()}")
+        await asyncio.sleep(self.update_sec)
+        self.update_log.append(f"end {self.provider_id()}")
+
+
+class TimedDataProviderA(TimedDataProvider):
+    pass
+
+
+class TimedDataProviderB(TimedDataProvider):
+    pass
+
+
+class PartialDataProvider(TimedDataProvider):
+    """DataProvider changing, deleting and inserting records, then hanging or failing on update."""
+
+    fail: ClassVar[bool] = False
+
+    async def _update_data(self, force_update: Optional[bool] = False) -> None:
+        await self.delete_by_datetime(end_datetime=to_datetime(datetime(2024, 1, 1, 1)))
+        await self._key_from_array(
+            "data_value",
+            np.array([10.0, 11.0, 12.0]),
+            start_datetime=to_datetime(datetime(2024, 1, 1, 1)),
+            interval=to_duration("1 hour"),
+        )
+        if self.fail:
+            raise RuntimeError("Update failed")
+        await asyncio.sleep(self.update_sec)
+
+
+class DependentDataProvider(TimedDataProvider):
+    """DataProvider using the data of TimedDataProviderA."""
+
+    @classmethod
+    def provider_dependencies(cls) -> list[str]:
+        return ["TimedDataProviderA"]
+
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
@@ -260,6 +319,104 @@ class TestDataContainer:
         assert DerivedDataProvider.provider_updated is True
         DerivedDataProvider.provider_enabled = True  # restore
 
+    async def test_update_data_concurrent_with_dependencies(self, container):
+        TimedDataProvider.update_log.clear()
+        container.providers.extend(
+            [DependentDataProvider(), TimedDataProviderA(), TimedDataProviderB()]
+        )
+
+        assert [provider.provider_id() for provider in container.providers_update_order()] == [
+            "TimedDataProviderA",
+            "DependentDataProvider",
+            "TimedDataProviderB",
+        ]
+        await container.update_data()
+
+        log = TimedDataProvider.update_log
+        # Independent providers update concurrently
+        assert log[:2] == ["start TimedDataProviderA", "start TimedDataProviderB"]
+        # Dependent provider updates after its dependency
+        assert log.index("start DependentDataProvider") > log.index("end TimedDataProviderA")
+        assert set(container.provider_updates) >= {
+            "TimedDataProviderA",
+            "TimedDataProviderB",
+            "DependentDataProvider",
+        }
+        update = container.provider_updates["TimedDataProviderA"]
+        assert update.success is True
+        assert update.duration_sec >= TimedDataProvider.update_sec * 0.9
+
+    async def test_update_data_timeout(self, container, monkeypatch):
+        TimedDataProvider.update_log.clear()
+        container.providers.extend([TimedDataProviderA(), DependentDataProvider()])
+        monkeypatch.setattr(TimedDataProviderA, "update_sec", 10.0)
+        monkeypatch.setattr(
+            DerivedDataContainer, "provider_update_timeout", lambda self, provider: 0.2
+        )
+
+        await container.update_data()
+
+        update = container.provider_updates["TimedDataProviderA"]
+        assert update.success is False
+        assert update.timed_out is True
+        assert update.duration_sec < 1.0
+        # Dependent provider still updates on the last data of the timed out provider
+        assert container.provider_updates["DependentDataProvider"].success is True
+        assert "end TimedDataProviderA" not in TimedDataProvider.update_log
+
+    @pytest.mark.parametrize("fail", [False, True])
+    async def test_update_data_rollback(self, container, monkeypatch, fail):
+        provider = PartialDataProvider()
+        await provider.delete_by_datetime()
+        await provider.insert_by_datetime(make_record(datetime(2024, 1, 1, 0), 1.0))
+        await provider.insert_by_datetime(make_record(datetime(2024, 1, 1, 1), 2.0))
+        container.providers.append(provider)
+        monkeypatch.setattr(PartialDataProvider, "update_sec", 10.0)
+        monkeypatch.setattr(PartialDataProvider, "fail", fail)
+        monkeypatch.setattr(
+            DerivedDataContainer, "provider_update_timeout", lambda self, provider: 0.2
+        )
+
+        if fail:
+            with pytest.raises(RuntimeError, match="Update failed"):
+                await container.update_data()
+        else:
+            await container.update_data()
+
+        update = container.provider_updates["PartialDataProvider"]
+        assert update.success is False
+        assert update.timed_out is not fail
+        # Records changed before the provider hung or failed are rolled back
+        assert [record.data_value for record in provider.records] == [1.0, 2.0]
+        series = await provider.key_to_series("data_value")
+        assert series.tolist() == [1.0, 2.0]
+        assert provider._db_journal is None
+
+    async def test_update_data_keeps_changes(self, container, monkeypatch):
+        provider = PartialDataProvider()
+        await provider.delete_by_datetime()
+        await provider.insert_by_datetime(make_record(datetime(2024, 1, 1, 0), 1.0))
+        await provider.insert_by_datetime(make_record(datetime(2024, 1, 1, 1), 2.0))
+        container.providers.append(provider)
+        monkeypatch.setattr(PartialDataProvider, "update_sec", 0.0)
+
+        await container.update_data()
+
+        assert container.provider_updates["PartialDataProvider"].success is True
+        series = await provider.key_to_series("data_value")
+        assert series.tolist() == [10.0, 11.0, 12.0]
+        assert provider._db_journal is None
+
+    async def test_update_data_circular_dependencies(self, container, monkeypatch):
+        container.providers.extend([TimedDataProviderA(), DependentDataProvider()])
+        monkeypatch.setattr(
+            TimedDataProviderA,
+            "provider_dependencies",
+            classmethod(lambda cls: ["DependentDataProvider"]),
+        )
+        with pytest.raises(ValueError, match="Circular provider dependency"):
+            container.providers_update_order()
+
     # -----------------------------------------------------------------------
     # save / load
     # -----------------------------------------------------------------------
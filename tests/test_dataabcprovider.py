@@ -231,7 +231,8 @@ class TestDataImportProvider:
         DerivedDataImportProvider.provider_updated = True
         p = DerivedDataImportProvider()
         p._updates.clear()
-        p.records.clear()
+        # Clear records and the record index
+        p._db_reset_state()
         return p
 
     async def test_import_from_dict_basic(self, provider):
@@ -248,7 +249,9 @@ class TestDataImportProvider:
     async def test_import_from_dict_default_start_and_interval(self, provider):
         data = {"solar_power": [10, 20]}
         await provider.import_from_dict(data)
-        assert len(provider._updates) == 2
+        assert [record["solar_power"] for record in provider.records] == [10, 20]
+        assert provider.records[0].date_time == provider.ems_start_datetime
+        assert provider.records[1].date_time == provider.ems_start_datetime.add(hours=1)
 
     async def test_import_from_dict_with_prefix(self, provider):
         data = {
@@ -256,8 +259,8 @@ class TestDataImportProvider:
             "data_value": [5, 6],
         }
         await provider.import_from_dict(data, key_prefix="dish")
-        assert len(provider._updates) == 2
-        assert all(update[1][0] == "dish_washer_emr" for update in provider._updates)
+        assert [record["dish_washer_emr"] for record in provider.records] == [1, 2]
+        assert all(record["data_value"] is None for record in provider.records)
 
     async def test_import_from_dict_mismatching_lengths(self, provider):
         data = {
@@ -278,9 +281,8 @@ class TestDataImportProvider:
     async def test_import_from_dict_skips_none_and_nan(self, provider):
         data = {"solar_power": [1, None, np.nan, 4]}
         await provider.import_from_dict(data)
-        assert len(provider._updates) == 2
-        assert provider._updates[0][1][1] == 1
-        assert provider._updates[1][1][1] == 4
+        assert [record["solar_power"] for record in provider.records] == [1, 4]
+        assert provider.records[1].date_time == provider.ems_start_datetime.add(hours=3)
 
     async def test_import_from_dict_invalid_value_type(self, provider):
         data = {"solar_power": "not a list"}
@@ -301,7 +303,8 @@ class TestDataImportProvider:
             start_datetime=to_datetime(datetime(2024, 1, 1)),
             interval=to_duration("1 hour"),
         )
-        assert len(provider._updates) == 3
+        assert [record["solar_power"] for record in provider.records] == [5, 6, 7]
+        assert provider.records[2].date_time == to_datetime(datetime(2024, 1, 1, 2))
 
     async def test_import_from_dataframe_prefix_filter(self, provider):
         df = pd.DataFrame({
@@ -309,8 +312,8 @@ class TestDataImportProvider:
             "data_value": [3, 4],
         })
         await provider.import_from_dataframe(df, key_prefix="dish")
-        assert len(provider._updates) == 2
-        assert all(update[1][0] == "dish_washer_emr" for update in provider._updates)
+        assert [record["dish_washer_emr"] for record in provider.records] == [1, 2]
+        assert all(record["data_value"] is None for record in provider.records)
 
     async def test_import_from_dataframe_invalid_input(self, provider):
         with pytest.raises(ValueError):
@@ -319,7 +322,7 @@ class TestDataImportProvider:
     async def test_import_from_json_simple_dict(self, provider):
         json_str = json.dumps({"solar_power": [1, 2, 3]})
         await provider.import_from_json(json_str)
-        assert len(provider._updates) == 3
+        assert [record["solar_power"] for record in provider.records] == [1, 2, 3]
 
     async def test_import_from_json_invalid(self, provider):
         with pytest.raises(ValueError):
@@ -329,4 +332,4 @@ class TestDataImportProvider:
         file_path = tmp_path / "data.json"
         file_path.write_text(json.dumps({"solar_power": [1, 2]}))
         await provider.import_from_file(file_path)
-        assert len(provider._updates) == 2
+        assert [record["solar_power"] for record in provider.records] == [1, 2]
@@ -209,6 +209,68 @@ class TestDataSequence:
         assert record2 is not None
         assert record2.data_value == 0.9
 
+    async def test_key_from_array(self, sequence):
+        start_datetime = to_datetime("2023-11-06 00:00:00", in_timezone="Europe/Berlin")
+        await sequence.update_value(start_datetime.add(hours=1), "data_value", 0.1)
+        await sequence.update_value(start_datetime.add(hours=1), "temp", 20.0)
+
+        await sequence.key_from_array(
+            "data_value", np.array([1.0, 2.0, np.nan, 4.0]), start_datetime=start_datetime
+        )
+        assert len(sequence) == 3
+
+        # Existing record updated, other fields kept
+        record = await sequence.get_by_datetime(start_datetime.add(hours=1))
+        assert record.data_value == 2.0
+        assert record.temp == 20.0
+        # NaN skipped
+        assert await sequence.get_by_datetime(start_datetime.add(hours=2)) is None
+        record = await sequence.get_by_datetime(start_datetime.add(hours=3))
+        assert record.data_value == 4.0
+        assert record.date_time == start_datetime.add(hours=3)
+
+        # Configured field like data, values from list
+        await sequence.key_from_array(
+            "solar_power", [5.0, None, 7.0], start_datetime=start_datetime,
+            interval=to_duration("30 minutes"),
+        )
+        assert len(sequence) == 3
+        record = await sequence.get_by_datetime(start_datetime)
+        assert record.solar_power == 5.0
+        record = await sequence.get_by_datetime(start_datetime.add(minutes=60))
+        assert record.solar_power == 7.0
+        assert record.data_value == 2.0
+        assert [record.date_time for record in sequence.records] == sorted(
+            record.date_time for record in sequence.records
+        )
+
+    async def test_key_from_array_matches_key_from_lists(self, sequence):
+        """Values are stored at fixed UTC steps, also across daylight saving transitions."""
+        start_datetime = to_datetime("2024-10-26 22:00:00", in_timezone="Europe/Berlin")
+        interval = to_duration("15 minutes")
+        values = np.arange(40, dtype=float)
+        await sequence.key_from_array(
+            "data_value", values, start_datetime=start_datetime, interval=interval
+        )
+
+        expected = DerivedSequence2()
+        dates = [start_datetime.add(seconds=i * 900) for i in range(len(values))]
+        await expected.key_from_lists("data_value", dates, values.tolist())
+
+        assert len(sequence) == 40
+        assert [(record.date_time, record.data_value) for record in sequence.records] == [
+            (record.date_time, record.data_value) for record in expected.records
+        ]
+        assert sequence._db_sorted_timestamps == [
+            DatabaseTimestamp.from_datetime(date) for date in dates
+        ]
+
+    async def test_key_from_array_invalid(self, sequence):
+        with pytest.raises(KeyError):
+            await sequence.key_from_array("unknown", [1.0])
+        with pytest.raises(ValueError):
+            await sequence.key_from_array("data_value", [1.0], interval=to_duration("0 seconds"))
+
     async def test_key_to_array(self, sequence):
         interval = to_duration("1 day")
         start_datetime = to_datetime("2023-11-6")
@@ -12,6 +12,7 @@ import time
 from pathlib import Path
 from typing import AsyncIterator, Optional, Type
 
+import numpy as np
 import pytest
 import pytest_asyncio
 from pydantic import Field
@@ -639,6 +640,64 @@ class TestDataSequenceDatabaseProtocol:
         assert expanded_start <= initial_start
         assert expanded_end >= initial_end
 
+    async def test_insert_records_merges_sorted(self, async_database_instance):
+        sequence = SampleDataSequence()
+        await _reset_sequence_state(sequence)
+        base_time = to_datetime("2024-01-01T00:00:00Z")
+
+        for i in (0, 2, 4):
+            await sequence.db_insert_record(
+                SampleDataRecord(date_time=base_time.add(hours=i), temperature=float(i))
+            )
+        await sequence.db_save_records()
+
+        await sequence.db_insert_records(
+            [
+                SampleDataRecord(date_time=base_time.add(hours=i), temperature=float(i))
+                for i in (5, 1, 3)
+            ]
+        )
+        assert [record.temperature for record in sequence.records] == [0, 1, 2, 3, 4, 5]
+        assert sequence._db_sorted_timestamps == sorted(sequence._db_sorted_timestamps)
+        assert len(sequence._db_new_timestamps) == 3
+
+        with pytest.raises(ValueError, match="Duplicate timestamp"):
+            await sequence.db_insert_records(
+                [SampleDataRecord(date_time=base_time.add(hours=6)),
+                 SampleDataRecord(date_time=base_time.add(hours=2))]
+            )
+        assert len(sequence.records) == 6
+
+        assert await sequence.db_save_records() == 3
+
+    async def test_key_from_array_persists(self, async_database_instance):
+        sequence = SampleDataSequence()
+        await _reset_sequence_state(sequence)
+        base_time = to_datetime("2024-01-01T00:00:00Z")
+
+        await sequence.key_from_array("temperature", np.arange(10.0), start_datetime=base_time)
+        assert len(sequence._db_new_timestamps) == 10
+        await sequence.db_save_records()
+
+        # Update records loaded from database
+        await _reset_sequence_state(sequence)
+        await sequence.key_from_array(
+            "humidity", np.full(5, 50.0), start_datetime=base_time.add(hours=8)
+        )
+        assert len(sequence._db_new_timestamps) == 3
+        assert len(sequence._db_dirty_timestamps) == 5
+        await sequence.db_save_records()
+
+        await _reset_sequence_state(sequence)
+        await sequence.db_load_records()
+        assert len(sequence.records) == 13
+        assert [record.temperature for record in sequence.records[7:]] == [
+            7.0, 8.0, 9.0, 0.0, 0.0, 0.0
+        ]
+        assert [record.humidity for record in sequence.records[7:]] == [
+            0.0, 50.0, 50.0, 50.0, 50.0, 50.0
+        ]
+
     async def test_duplicate_insert_raises(self, async_database_instance):
         sequence = SampleDataSequence()
         await _reset_sequence_state(sequence)
@@ -0,0 +1,47 @@
+import pytest
+
+from akkudoktoreos.config.config import ConfigEOS
+from akkudoktoreos.optimization.dp.dp import DPOptimization
+from akkudoktoreos.optimization.genetic.genetic import GeneticOptimization
+
+
+def test_optimize_dp(config_eos: ConfigEOS, optimize):
+    """Test the DP solution is at least as good as the GENETIC solution."""
+    config_eos.merge_settings_from_dict({"optimization": {"dp": {"soc_steps": 100}}})
+    # Battery only - the electric vehicle of the input data does not need charging
+    genetic_optimization = GeneticOptimization(fixed_seed=42)
+    optimize(genetic_optimization, "optimize_input_1.json", ngen=10)
+    genetic_fitness = genetic_optimization.fitness_history["min"][-1]
+
+    dp_optimization = DPOptimization()
+    solution = optimize(dp_optimization, "optimize_input_1.json", ngen=10)
+    dp_fitness = dp_optimization.fitness_history["min"][-1]
+
+    assert solution.stop_reason == "dp_grid"
+    assert solution.generations is None
+    assert len(solution.start_solution) == config_eos.prediction.hours
+    assert dp_fitness <= genetic_fitness + 1e-9
+    # The solution is the simulation result of the DP decisions
+    assert solution.result.Gesamtbilanz_Euro == pytest.approx(
+        dp_optimization.evaluate_inner(solution.start_solution)["Gesamtbilanz_Euro"]
+    )
+
+
+def test_optimize_dp_fallback(optimize):
+    """Test the DP falls back to GENETIC for devices it does not model."""
+    # Electric vehicle charging and home appliance
+    dp_optimization = DPOptimization(fixed_seed=42)
+    solution = optimize(dp_optimization, "optimize_input_2.json", ngen=3)
+
+    assert solution.stop_reason == "generations"
+    assert solution.generations == 3
+
+
+def test_optimize_dp_fallback_scenarios(config_eos: ConfigEOS, optimize):
+    """Test the DP falls back to GENETIC for robust optimization over scenarios."""
+    config_eos.merge_settings_from_dict({"optimization": {"genetic": {"scenarios": 4}}})
+    dp_optimization = DPOptimization(fixed_seed=42)
+    solution = optimize(dp_optimization, "optimize_input_1.json", ngen=3)
+
+    assert solution.stop_reason == "generations"
+    assert solution.generations == 3
@@ -80,7 +80,7 @@ class TestElecPriceAkkudokor:
         mock_logger.assert_called_once_with(mock_logger.call_args[0][0])
 
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_request_forecast(self, mock_get, provider, sample_akkudoktor_1_json):
         """Test requesting forecast from Akkudoktor."""
         # Mock response object
@@ -105,7 +105,7 @@ class TestElecPriceAkkudokor:
 
 
     @pytest.mark.asyncio
-    @patch("requests.get")
+    @patch("requests.Session.get")
     async def test_update_data(self, mock_get, provider, sample_akkudoktor_1_json, cache_store):
         """Test fetching forecast from Akkudoktor."""
         # Mock response object
@@ -141,7 +141,7 @@ class TestElecPriceAkkudokor:
 
 
     @pytest.mark.asyncio
-    @patch("requests.get")
+    @patch("requests.Session.get")
     async def test_update_data_with_incomplete_forecast(self, mock_get, provider):
         """Test `_update_data` with incomplete or missing forecast data."""
         incomplete_data: dict = {"meta": {}, "values": []}
@@ -158,7 +158,7 @@ class TestElecPriceAkkudokor:
         "status_code, exception",
         [(400, requests.exceptions.HTTPError), (500, requests.exceptions.HTTPError), (200, None)],
     )
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_request_forecast_status_codes(
         self, mock_get, provider, sample_akkudoktor_1_json, status_code, exception
     ):
@@ -178,7 +178,7 @@ class TestElecPriceAkkudokor:
 
 
     @pytest.mark.asyncio
-    @patch("requests.get")
+    @patch("requests.Session.get")
     @patch("akkudoktoreos.core.cache.CacheFileStore")
     async def test_cache_integration(self, mock_cache, mock_get, provider, sample_akkudoktor_1_json):
         """Test caching of 8-day electricity price data."""
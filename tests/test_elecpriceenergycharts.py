@@ -80,7 +80,7 @@ class TestElecPriceEnergyCharts:
             provider._validate_data(invalid_data)
         mock_logger.assert_called_once_with(mock_logger.call_args[0][0])
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_request_forecast(self, mock_get, provider, sample_energycharts_json):
         """Test requesting forecast from Energy-Charts."""
         # Mock response object
@@ -97,7 +97,7 @@ class TestElecPriceEnergyCharts:
         assert energy_charts_data.price[0] == 92.85
 
     @pytest.mark.asyncio
-    @patch("requests.get")
+    @patch("requests.Session.get")
     async def test_update_data(self, mock_get, provider, sample_energycharts_json, cache_store):
         """Test fetching forecast from Energy-Charts."""
         # Mock response object
@@ -129,7 +129,7 @@ class TestElecPriceEnergyCharts:
         assert len(np_price_array) == provider.total_hours
 
     @pytest.mark.asyncio
-    @patch("requests.get")
+    @patch("requests.Session.get")
     async def test_update_data_with_incomplete_forecast(self, mock_get, provider):
         """Test `_update_data` with incomplete or missing forecast data."""
         incomplete_data: dict = {"license_info": "", "unix_seconds": [], "price": [], "unit": "", "deprecated": False}
@@ -145,7 +145,7 @@ class TestElecPriceEnergyCharts:
         "status_code, exception",
         [(400, requests.exceptions.HTTPError), (500, requests.exceptions.HTTPError), (200, None)],
     )
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_request_forecast_status_codes(
         self, mock_get, provider, sample_energycharts_json, status_code, exception
     ):
@@ -164,7 +164,7 @@ class TestElecPriceEnergyCharts:
             provider._request_forecast()
 
     @pytest.mark.asyncio
-    @patch("requests.get")
+    @patch("requests.Session.get")
     @patch("akkudoktoreos.core.cache.CacheFileStore")
     async def test_cache_integration(self, mock_cache, mock_get, provider, sample_energycharts_json):
         """Test caching of 8-day electricity price data."""
@@ -195,7 +195,7 @@ class TestElecPriceEnergyCharts:
         assert isinstance(array, np.ndarray)
         assert len(array) == provider.total_hours
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_request_forecast_url_bidding_zone_is_value(self, mock_get, provider, sample_energycharts_json):
         """Test that the bidding zone in the API URL uses the enum *value* (e.g. 'DE-LU'),
         not the enum repr (e.g. 'EnergyChartsBiddingZones.DE_LU').
@@ -0,0 +1,122 @@
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from statsmodels.tsa.holtwinters import ExponentialSmoothing
+
+from akkudoktoreos.prediction.elecpriceakkudoktor import ElecPriceAkkudoktor
+from akkudoktoreos.prediction.elecpriceets import ElecPriceETSModel
+from akkudoktoreos.utils.datetimeutil import to_datetime, to_duration
+
+
+def price_history(hours: int, seed: int = 0) -> np.ndarray:
+    """Hourly prices [amount/Wh] with daily and weekly season."""
+    rng = np.random.default_rng(seed)
+    t = np.arange(hours)
+    return (
+        0.0001
+        + 0.00003 * np.sin(2 * np.pi * t / 24)
+        + 0.00001 * np.sin(2 * np.pi * t / 168)
+        + rng.normal(0, 0.000005, hours)
+    )
+
+
+@pytest.fixture
+def provider(config_eos):
+    """ElecPriceAkkudoktor provider without cached exponential smoothing model."""
+    provider = ElecPriceAkkudoktor()
+    provider._ets_model = None
+    provider._ets_end_datetime = None
+    return provider
+
+
+def test_fit_matches_statsmodels():
+    history = price_history(500)
+    model = ElecPriceETSModel(24)
+    model.fit(history)
+    # Outliers are capped before the fit
+    clean_history = history.clip(min=model.lower_bound, max=model.upper_bound)
+    assert clean_history.max() < history.max()
+    expected = ExponentialSmoothing(clean_history, seasonal="add", seasonal_periods=24).fit()
+    assert model.fit_rmse == pytest.approx(np.sqrt(expected.sse / 500))
+    assert model.fit_steps == 500
+    # statsmodels does not apply the seasonal update of the last observation to the forecast
+    assert np.allclose(model.forecast(23), expected.forecast(23), rtol=1e-9, atol=0)
+
+
+def test_update_matches_smoothing_over_extended_history():
+    """Updating the state equals smoothing the extended history with the fitted parameters."""
+    history = price_history(600)
+    model = ElecPriceETSModel(24)
+    model.fit(history[:500])
+    clean_history = history.clip(min=model.lower_bound, max=model.upper_bound)
+    result = ExponentialSmoothing(clean_history[:500], seasonal="add", seasonal_periods=24).fit()
+
+    rmse = model.update(history[500:])
+    assert model.update_steps == 100
+    assert 0 < rmse < 3 * model.fit_rmse
+
+    expected = ElecPriceETSModel(24)
+    expected.smoothing_level = model.smoothing_level
+    expected.smoothing_seasonal = model.smoothing_seasonal
+    expected.level = result.params["initial_level"]
+    expected.season = np.array(result.params["initial_seasons"])
+    expected._smooth(clean_history)
+    assert np.allclose(model.forecast(48), expected.forecast(48), rtol=1e-9, atol=0)
+
+
+def test_needs_refit():
+    model = ElecPriceETSModel(24)
+    assert model.needs_refit(24, refit_steps=168, error_ratio=2.0)
+    model.fit(price_history(500))
+    assert not model.needs_refit(24, refit_steps=168, error_ratio=2.0)
+    assert model.needs_refit(168, refit_steps=168, error_ratio=2.0)
+    assert model.needs_refit(24, refit_steps=0, error_ratio=2.0)
+    assert model.needs_refit(24, refit_steps=168, error_ratio=2.0, rmse=3 * model.fit_rmse)
+    model.update(price_history(168))
+    assert model.needs_refit(24, refit_steps=168, error_ratio=2.0)
+
+
+def test_predict_ets_cached(provider, config_eos):
+    """The model is fitted once and updated by new prices until the refit schedule."""
+    config_eos.merge_settings_from_dict(
+        {"elecprice": {"ets_refit_hours": 48, "ets_refit_error_ratio": 2.0}}
+    )
+    history = price_history(1000)
+    end_datetime = to_datetime("2025-01-01 00:00:00", in_timezone="Europe/Berlin")
+
+    with patch.object(
+        ElecPriceETSModel, "fit", autospec=True, side_effect=ElecPriceETSModel.fit
+    ) as fit:
+        provider._predict_ets_cached(history[:900], end_datetime, seasonal_periods=24, hours=48)
+        assert fit.call_count == 1
+
+        # No new prices - cached model
+        prediction = provider._predict_ets_cached(
+            history[:900], end_datetime, seasonal_periods=24, hours=48
+        )
+        assert fit.call_count == 1
+        assert len(prediction) == 48
+
+        # One new price day - incremental update
+        end_datetime = end_datetime + to_duration("24 hours")
+        provider._predict_ets_cached(history[:924], end_datetime, seasonal_periods=24, hours=48)
+        assert fit.call_count == 1
+        assert provider._ets_model is not None
+        assert provider._ets_model.update_steps == 24
+
+        # Second new price day - refit by schedule
+        end_datetime = end_datetime + to_duration("24 hours")
+        provider._predict_ets_cached(history[:948], end_datetime, seasonal_periods=24, hours=48)
+        assert fit.call_count == 2
+        assert provider._ets_model.update_steps == 0
+
+        # Other seasonal periods - refit
+        provider._predict_ets_cached(history[:948], end_datetime, seasonal_periods=168, hours=48)
+        assert fit.call_count == 3
+
+        # Price level jump - refit by forecast error drift
+        end_datetime = end_datetime + to_duration("24 hours")
+        jumped = np.concatenate([history[:948], history[948:972] + 0.0002])
+        provider._predict_ets_cached(jumped, end_datetime, seasonal_periods=168, hours=48)
+        assert fit.call_count == 4
@@ -230,7 +230,7 @@ class TestElecPriceTibber:
         mock_warning.assert_called_once_with("Tibber tomorrow prices not available yet")
 
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_request_forecast_uses_tibber_graphql_api(
         self,
         mock_post,
@@ -0,0 +1,161 @@
+import json
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from akkudoktoreos.config.config import ConfigEOS
+from akkudoktoreos.core.ems import EnergyManagement, EnergyManagementStage
+from akkudoktoreos.optimization.genetic.geneticparams import (
+    GeneticOptimizationParameters,
+)
+from akkudoktoreos.utils.datetimeutil import to_datetime
+
+DIR_TESTDATA = Path(__file__).parent / "testdata"
+
+
+@pytest.fixture
+def ems(config_eos: ConfigEOS):
+    """Energy management without adapter and prediction updates."""
+    ems = EnergyManagement()
+    with (
+        patch.object(type(ems.adapter), "update_data", new=AsyncMock()),
+        patch.object(type(ems.prediction), "update_data", new=AsyncMock()),
+    ):
+        yield ems
+    EnergyManagement._genetic_solution = None
+    EnergyManagement._optimization_solution = None
+    EnergyManagement._plan = None
+    EnergyManagement._optimization_fingerprint = None
+    EnergyManagement._optimization_skip_reason = None
+    EnergyManagement._runs.clear()
+
+
+@pytest.mark.asyncio
+async def test_run_skips_unchanged_optimization(ems: EnergyManagement, config_eos: ConfigEOS):
+    """Test the optimization is skipped if the optimization input is unchanged."""
+    with (DIR_TESTDATA / "optimize_input_1.json").open("r") as f_in:
+        parameters = GeneticOptimizationParameters(**json.load(f_in))
+    start_datetime = to_datetime().set(hour=10)
+
+    solution = MagicMock()
+    solution.optimization_solution = AsyncMock()
+    with patch.object(
+        EnergyManagement, "optimize", new=AsyncMock(return_value=solution)
+    ) as optimize:
+        await ems.run(
+            start_datetime=start_datetime, mode="OPTIMIZATION", genetic_parameters=parameters
+        )
+        assert optimize.await_count == 1
+        assert ems.optimization_skip_reason() is None
+
+        # Same input
+        await ems.run(
+            start_datetime=start_datetime, mode="OPTIMIZATION", genetic_parameters=parameters
+        )
+        assert optimize.await_count == 1
+        assert ems.optimization_skip_reason() is not None
+        assert ems.genetic_solution() is solution
+
+        # Forced update
+        await ems.run(
+            start_datetime=start_datetime,
+            mode="OPTIMIZATION",
+            genetic_parameters=parameters,
+            force_update=True,
+        )
+        assert optimize.await_count == 2
+        assert ems.optimization_skip_reason() is None
+
+        # Changed input
+        parameters.ems.electricity_price_per_wh[12] += 1e-6
+        await ems.run(
+            start_datetime=start_datetime, mode="OPTIMIZATION", genetic_parameters=parameters
+        )
+        assert optimize.await_count == 3
+
+        # Skipping disabled
+        config_eos.ems.skip_unchanged_optimization = False
+        await ems.run(
+            start_datetime=start_datetime, mode="OPTIMIZATION", genetic_parameters=parameters
+        )
+        assert optimize.await_count == 4
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("stop_reason", ["cancelled", "time_limit"])
+async def test_run_reoptimizes_after_early_stop(ems: EnergyManagement, stop_reason: str):
+    """Test a solution stopped early is not reused for unchanged optimization input."""
+    with (DIR_TESTDATA / "optimize_input_1.json").open("r") as f_in:
+        parameters = GeneticOptimizationParameters(**json.load(f_in))
+    start_datetime = to_datetime().set(hour=10)
+
+    partial = MagicMock(stop_reason=stop_reason)
+    partial.optimization_solution = AsyncMock()
+    solution = MagicMock(stop_reason="generations")
+    solution.optimization_solution = AsyncMock()
+    with patch.object(
+        EnergyManagement, "optimize", new=AsyncMock(side_effect=[partial, solution])
+    ) as optimize:
+        await ems.run(
+            start_datetime=start_datetime, mode="OPTIMIZATION", genetic_parameters=parameters
+        )
+        assert ems.genetic_solution() is partial
+
+        # Same input - optimized again
+        await ems.run(
+            start_datetime=start_datetime, mode="OPTIMIZATION", genetic_parameters=parameters
+        )
+        assert optimize.await_count == 2
+        assert ems.optimization_skip_reason() is None
+        assert ems.genetic_solution() is solution
+
+        # Same input - now skipped
+        await ems.run(
+            start_datetime=start_datetime, mode="OPTIMIZATION", genetic_parameters=parameters
+        )
+        assert optimize.await_count == 2
+        assert ems.optimization_skip_reason() is not None
+
+
+@pytest.mark.asyncio
+async def test_run_records_stages(ems: EnergyManagement):
+    """Test each stage of a run is run once and recorded."""
+    with (DIR_TESTDATA / "optimize_input_1.json").open("r") as f_in:
+        parameters = GeneticOptimizationParameters(**json.load(f_in))
+
+    solution = MagicMock()
+    solution.optimization_solution = AsyncMock()
+    with patch.object(EnergyManagement, "optimize", new=AsyncMock(return_value=solution)):
+        await ems.run(mode="OPTIMIZATION", algorithm="GENETIC", genetic_parameters=parameters)
+        await ems.run(mode="PREDICTION")
+
+    runs = ems.runs()
+    assert len(runs) == 2
+    assert runs[0].status == "DONE"
+    assert runs[0].algorithm == "GENETIC"
+    assert [stage.stage for stage in runs[0].stages] == [
+        EnergyManagementStage.DATA_ACQUISITION,
+        EnergyManagementStage.FORECAST_RETRIEVAL,
+        EnergyManagementStage.PREPARATION,
+        EnergyManagementStage.OPTIMIZATION,
+        EnergyManagementStage.PUBLICATION,
+        EnergyManagementStage.CONTROL_DISPATCH,
+    ]
+    for stage in runs[0].stages:
+        assert stage.end_datetime is not None
+        assert stage.duration_sec >= 0
+    assert ems.genetic_solution() is solution
+    assert [stage.stage for stage in runs[1].stages] == [
+        EnergyManagementStage.DATA_ACQUISITION,
+        EnergyManagementStage.FORECAST_RETRIEVAL,
+    ]
+    assert runs[1].algorithm is None
+    assert ems.stage() == EnergyManagementStage.IDLE
+
+
+def test_cancel_optimization_not_running(ems: EnergyManagement):
+    """Test cancellation is rejected if no optimization is running."""
+    assert not ems.optimization_progress().running
+    assert not ems.cancel_optimization()
+    assert not ems.optimization_progress().cancel_requested
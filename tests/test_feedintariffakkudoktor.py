@@ -84,7 +84,7 @@ class TestFeedInTariffAkkudokor:
 
         assert values.tolist() == pytest.approx([0.0001] * 4 + [0.0002] * 4)
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_request_uses_akkudoktor_prices_endpoint(self, mock_get, provider, response_data):
         response = Mock()
         response.content = json.dumps(response_data)
@@ -62,7 +62,7 @@ class TestFeedInTariffEnergyCharts:
         assert series.iloc[0] == pytest.approx(sample_energycharts_json["price"][0] / 1_000_000)
 
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_request_forecast_uses_feedintariff_bidding_zone(
         self, mock_get, provider, sample_energycharts_json
     ):
@@ -161,7 +161,7 @@ class TestFeedInTariffEnergyCharts:
         ok_response.raise_for_status = Mock()
 
         with (
-            patch("requests.get", side_effect=[requests.exceptions.ReadTimeout("t1"), ok_response]) as get_mock,
+            patch("requests.Session.get", side_effect=[requests.exceptions.ReadTimeout("t1"), ok_response]) as get_mock,
             patch("akkudoktoreos.prediction.feedintariffenergycharts.time.sleep", return_value=None),
         ):
             provider._request_forecast(start_date="2024-12-10", force_update=True)
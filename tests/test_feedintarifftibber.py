@@ -80,7 +80,7 @@ class TestFeedInTariffTibber:
         assert series.tolist() == pytest.approx([(0.10 + index / 100) / 1000 for index in range(8)])
         assert series.index.to_series().diff().dropna().dt.total_seconds().unique().tolist() == [900.0]
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_request_is_strictly_quarter_hourly_and_requests_energy(
         self, mock_post, provider, quarter_hour_points
     ):
@@ -1,4 +1,5 @@
 import json
+import random
 from pathlib import Path
 from typing import Any
 from unittest.mock import patch
@@ -8,7 +9,10 @@ import pytest
 from akkudoktoreos.config.config import ConfigEOS
 from akkudoktoreos.core.cache import CacheEnergyManagementStore
 from akkudoktoreos.core.coreabc import get_ems
-from akkudoktoreos.optimization.genetic.genetic import GeneticOptimization
+from akkudoktoreos.optimization.genetic.genetic import (
+    GeneticIndividual,
+    GeneticOptimization,
+)
 from akkudoktoreos.optimization.genetic.geneticparams import (
     GeneticOptimizationParameters,
 )
@@ -152,3 +156,354 @@ async def test_optimize(
     # Check the correct generic energy management plan is created
     plan = genetic_solution.energy_management_plan()
     # @TODO
+
+
+@pytest.mark.parametrize("fn_in", ["optimize_input_1.json", "optimize_input_2.json"])
+def test_optimize_fitness_cache(fn_in: str, config_eos: ConfigEOS, optimize_input):
+    """Test the fitness cache does not change the optimization result."""
+    fixed_start_hour = 10
+    fixed_seed = 42
+
+    input_data = optimize_input(fn_in)
+    ems_eos.set_start_datetime(to_datetime().set(hour=fixed_start_hour))
+
+    solutions = {}
+    for fitness_cache_size in (0, 10000):
+        config_eos.optimization.genetic.fitness_cache_size = fitness_cache_size
+        CacheEnergyManagementStore().clear()
+        genetic_optimization = GeneticOptimization(fixed_seed=fixed_seed)
+        solutions[fitness_cache_size] = genetic_optimization.optimize_ems(
+            parameters=input_data, start_hour=fixed_start_hour, ngen=5
+        )
+        if fitness_cache_size:
+            assert genetic_optimization.fitness_cache_hits > 0
+        else:
+            assert genetic_optimization.fitness_cache_hits == 0
+
+    assert solutions[10000].model_dump() == solutions[0].model_dump()
+
+
+def test_optimize_context_reuse(optimize_input):
+    """Test a reused optimization context does not change the optimization result."""
+    fixed_start_hour = 10
+    fixed_seed = 42
+
+    input_data = optimize_input("optimize_input_2.json")
+    ems_eos.set_start_datetime(to_datetime().set(hour=fixed_start_hour))
+
+    GeneticOptimization._contexts.clear()
+    solutions = []
+    devices = []
+    for _ in range(3):
+        CacheEnergyManagementStore().clear()
+        genetic_optimization = GeneticOptimization(fixed_seed=fixed_seed)
+        solutions.append(
+            genetic_optimization.optimize_ems(
+                parameters=input_data, start_hour=fixed_start_hour, ngen=5
+            )
+        )
+        assert genetic_optimization.context is None
+        assert len(GeneticOptimization._contexts) == 1
+        devices.append(dict(GeneticOptimization._contexts[0].devices))
+
+    # Devices are reused by later runs with the same configuration
+    assert devices[2]["pv_battery"][1] is devices[1]["pv_battery"][1]
+    assert devices[2]["inverter"][1] is devices[1]["inverter"][1]
+    assert solutions[1].model_dump() == solutions[0].model_dump()
+    assert solutions[2].model_dump() == solutions[0].model_dump()
+
+
+def test_optimize_random_per_instance(optimize_input):
+    """Test another optimization instance does not change the random numbers of an optimization."""
+    fixed_start_hour = 10
+    fixed_seed = 42
+
+    input_data = optimize_input("optimize_input_2.json")
+    ems_eos.set_start_datetime(to_datetime().set(hour=fixed_start_hour))
+
+    solutions = []
+    for interfere in (False, True):
+        CacheEnergyManagementStore().clear()
+        genetic_optimization = GeneticOptimization(fixed_seed=fixed_seed)
+        if interfere:
+            # Another optimization with another seed and the module global random generator
+            GeneticOptimization(fixed_seed=fixed_seed + 1)
+            random.seed(fixed_seed + 2)
+            random.random()
+        solutions.append(
+            genetic_optimization.optimize_ems(
+                parameters=input_data, start_hour=fixed_start_hour, ngen=5
+            )
+        )
+
+    assert solutions[1].model_dump() == solutions[0].model_dump()
+
+
+@pytest.mark.parametrize(
+    "settings, ngen, stop_reason, max_generations",
+    [
+        ({}, 5, "generations", 5),
+        ({"early_stopping_generations": 1, "early_stopping_tolerance": 1.0}, 50, "converged", 1),
+        ({"time_limit_sec": 1e-6}, 50, "time_limit", 1),
+    ],
+)
+def test_optimize_stopping(
+    settings: dict[str, Any],
+    ngen: int,
+    stop_reason: str,
+    max_generations: int,
+    config_eos: ConfigEOS,
+    optimize_input,
+):
+    """Test early stopping and the wall-clock time limit of the evolution."""
+    fixed_start_hour = 10
+    fixed_seed = 42
+
+    config_eos.merge_settings_from_dict({"optimization": {"genetic": settings}})
+    input_data = optimize_input("optimize_input_1.json")
+    ems_eos.set_start_datetime(to_datetime().set(hour=fixed_start_hour))
+    CacheEnergyManagementStore().clear()
+
+    genetic_optimization = GeneticOptimization(fixed_seed=fixed_seed)
+    solution = genetic_optimization.optimize_ems(
+        parameters=input_data, start_hour=fixed_start_hour, ngen=ngen
+    )
+
+    fitness_history = genetic_optimization.fitness_history
+    assert fitness_history["stop_reason"] == stop_reason
+    assert fitness_history["generations"] <= max_generations
+    assert fitness_history["gen"] == list(range(fitness_history["generations"] + 1))
+    assert solution.stop_reason == stop_reason
+    assert solution.generations == fitness_history["generations"]
+
+
+@pytest.mark.parametrize(
+    "start_solution, hours, expected",
+    [
+        # Battery only, shift within the horizon, padded from one day earlier
+        (list(range(48)), 24, list(range(24, 48)) + list(range(24, 48))),
+        # Battery and EV, padded with idle and no charging
+        (
+            list(range(48)) + [1] * 48,
+            30,
+            (list(range(30, 48)) + [0] * 6) * 2 + [1] * 18 + [0] * 30,
+        ),
+        # Home appliance start hour is kept
+        (list(range(48)) + [13], 0, list(range(48)) + [13]),
+        # Shift beyond the horizon
+        (list(range(48)), 48, None),
+        # Genome that does not match the prediction hours
+        (list(range(47)), 24, None),
+    ],
+)
+def test_time_shift_start_solution(start_solution, hours, expected):
+    """Test the start solution of an earlier run is aligned to a later start day."""
+    assert (
+        GeneticOptimizationParameters.time_shift_start_solution(start_solution, hours, 48)
+        == expected
+    )
+
+
+def test_optimize_warm_start(config_eos: ConfigEOS, optimize_input):
+    """Test the warm start seeds the initial population from the start solution."""
+    fixed_start_hour = 10
+    fixed_seed = 42
+
+    config_eos.merge_settings_from_dict(
+        {"optimization": {"genetic": {"warm_start": True, "warm_start_fraction": 0.1}}}
+    )
+    input_data = optimize_input("optimize_input_1.json")
+    input_data.start_solution = None
+    ems_eos.set_start_datetime(to_datetime().set(hour=fixed_start_hour))
+    CacheEnergyManagementStore().clear()
+
+    genetic_optimization = GeneticOptimization(fixed_seed=fixed_seed)
+    solution = genetic_optimization.optimize_ems(
+        parameters=input_data, start_hour=fixed_start_hour, ngen=10
+    )
+    best_fitness = genetic_optimization.fitness_history["min"][-1]
+
+    input_data.start_solution = solution.start_solution
+    genetic_optimization = GeneticOptimization(fixed_seed=fixed_seed + 1)
+    genetic_optimization.optimize_ems(parameters=input_data, start_hour=fixed_start_hour, ngen=1)
+
+    # The seeded start solution is at least as good as the best solution of the last run
+    assert genetic_optimization.fitness_history["min"][0] <= best_fitness + 1e-9
+
+
+def test_optimize_islands(config_eos: ConfigEOS, optimize_input):
+    """Test the island model merges the fitness history of the islands."""
+    fixed_start_hour = 10
+    fixed_seed = 42
+    islands = 3
+
+    config_eos.merge_settings_from_dict(
+        {
+            "optimization": {
+                "genetic": {"islands": islands, "migration_interval": 2, "migrants": 2},
+            },
+        }
+    )
+    input_data = optimize_input("optimize_input_1.json")
+    ems_eos.set_start_datetime(to_datetime().set(hour=fixed_start_hour))
+    CacheEnergyManagementStore().clear()
+
+    genetic_optimization = GeneticOptimization(fixed_seed=fixed_seed)
+    solution = genetic_optimization.optimize_ems(
+        parameters=input_data, start_hour=fixed_start_hour, ngen=5
+    )
+
+    fitness_history = genetic_optimization.fitness_history
+    assert solution.generations == 5
+    assert len(fitness_history["islands"]) == islands
+    for gen in fitness_history["gen"]:
+        island_min = [island["min"][gen] for island in fitness_history["islands"]]
+        island_max = [island["max"][gen] for island in fitness_history["islands"]]
+        assert fitness_history["min"][gen] == pytest.approx(min(island_min))
+        assert fitness_history["max"][gen] == pytest.approx(max(island_max))
+
+
+def test_parameters_fingerprint(optimize_input):
+    """Test the input fingerprint ignores changes below the tolerances."""
+    input_data = optimize_input("optimize_input_1.json")
+    fingerprint = input_data.fingerprint(soc_tolerance=5, energy_tolerance_wh=10)
+
+    # The start solution is not part of the fingerprint
+    changed = input_data.model_copy(deep=True)
+    changed.start_solution = None
+    assert changed.fingerprint(soc_tolerance=5, energy_tolerance_wh=10) == fingerprint
+
+    # Forecast changes below the tolerance
+    changed.ems.pv_forecast_wh[12] = round(changed.ems.pv_forecast_wh[12] / 10) * 10 + 1
+    changed.ems.total_load[12] = round(changed.ems.total_load[12] / 10) * 10 - 1
+    input_data.ems.pv_forecast_wh[12] = round(input_data.ems.pv_forecast_wh[12] / 10) * 10
+    input_data.ems.total_load[12] = round(input_data.ems.total_load[12] / 10) * 10
+    fingerprint = input_data.fingerprint(soc_tolerance=5, energy_tolerance_wh=10)
+    assert changed.fingerprint(soc_tolerance=5, energy_tolerance_wh=10) == fingerprint
+    assert changed.fingerprint() != input_data.fingerprint()
+
+    # State of charge changes below the tolerance
+    changed.pv_battery.initial_soc_percentage = 81
+    input_data.pv_battery.initial_soc_percentage = 80
+    assert changed.fingerprint(soc_tolerance=5, energy_tolerance_wh=10) == fingerprint
+
+    # Price changes always change the fingerprint
+    changed.ems.electricity_price_per_wh[12] += 1e-6
+    assert changed.fingerprint(soc_tolerance=5, energy_tolerance_wh=10) != fingerprint
+
+
+def test_optimize_heuristic_seeding(config_eos: ConfigEOS, optimize_input):
+    """Test the rule based individuals are valid and improve the initial population."""
+    fixed_start_hour = 10
+    fixed_seed = 42
+
+    input_data = optimize_input("optimize_input_1.json")
+    input_data.start_solution = None
+    ems_eos.set_start_datetime(to_datetime().set(hour=fixed_start_hour))
+
+    initial_best_fitness = {}
+    for fraction in (0.0, 0.1):
+        config_eos.optimization.genetic.heuristic_seeding_fraction = fraction
+        CacheEnergyManagementStore().clear()
+        genetic_optimization = GeneticOptimization(fixed_seed=fixed_seed)
+        genetic_optimization.optimize_ems(
+            parameters=input_data, start_hour=fixed_start_hour, ngen=1
+        )
+        initial_best_fitness[fraction] = genetic_optimization.fitness_history["min"][0]
+
+    individuals = genetic_optimization.heuristic_individuals()
+    assert len(individuals) > 0
+    genome_length = len(genetic_optimization.create_individual())
+    total_states = 3 * len(genetic_optimization.bat_possible_charge_values)
+    for individual in individuals:
+        assert len(individual) == genome_length
+        assert all(0 <= gene < total_states for gene in individual[:48])
+        assert all(
+            0 <= gene < len(genetic_optimization.ev_possible_charge_values)
+            for gene in individual[48:96]
+        )
+        # Electric vehicle is not charged beyond the optimization horizon
+        assert not any(individual[96 - genetic_optimization.fixed_ev_hours : 96])
+
+    assert initial_best_fitness[0.1] < initial_best_fitness[0.0]
+
+
+def test_optimize_scenarios(config_eos: ConfigEOS, optimize_input):
+    """Test robust optimization scores the individuals against the forecast scenarios."""
+    fixed_start_hour = 10
+    fixed_seed = 42
+
+    config_eos.merge_settings_from_dict(
+        {"optimization": {"genetic": {"scenarios": 8, "scenario_objective": "expected"}}}
+    )
+    input_data = optimize_input("optimize_input_1.json")
+    input_data.start_solution = None
+    ems_eos.set_start_datetime(to_datetime().set(hour=fixed_start_hour))
+
+    CacheEnergyManagementStore().clear()
+    genetic_optimization = GeneticOptimization(fixed_seed=fixed_seed)
+    solution = genetic_optimization.optimize_ems(
+        parameters=input_data, start_hour=fixed_start_hour, ngen=3
+    )
+    assert isinstance(solution, GeneticSolution)
+    simulation = genetic_optimization.simulation
+    assert simulation.load_energy_scenarios.shape == (8, 48)
+    assert simulation.pv_prediction_scenarios.shape == (8, 48)
+    assert simulation.elect_price_scenarios.shape == (8, 48)
+
+    individual = genetic_optimization.heuristic_individuals()[0]
+
+    def fitness() -> float:
+        return genetic_optimization.evaluate_population_inner(
+            [GeneticIndividual(individual)], input_data, fixed_start_hour, False
+        )[0][0]
+
+    expected_cost = fitness()
+    config_eos.optimization.genetic.scenario_objective = "cvar"
+    config_eos.optimization.genetic.scenario_cvar_alpha = 0.75
+    assert fitness() > expected_cost
+    # CVaR over all scenarios is the expected cost
+    config_eos.optimization.genetic.scenario_cvar_alpha = 0.0
+    assert fitness() == pytest.approx(expected_cost)
+
+
+def test_optimize_sub_hourly_interval(config_eos: ConfigEOS, optimize_input):
+    """Test the optimization simulates in steps of a 15 minute optimization interval."""
+    fixed_start_hour = 10
+    fixed_seed = 42
+    steps_per_hour = 4
+
+    config_eos.merge_settings_from_dict({"optimization": {"horizon_hours": 24, "interval": 900}})
+    data = optimize_input("optimize_input_1.json").model_dump()
+    data["start_solution"] = None
+    # Hourly energies split among the steps of an hour, prices kept
+    for key in ("pv_forecast_wh", "total_load"):
+        data["ems"][key] = [
+            value / steps_per_hour for value in data["ems"][key] for _ in range(steps_per_hour)
+        ]
+    for key in ("electricity_price_per_wh", "feed_in_tariff_per_wh"):
+        data["ems"][key] = [value for value in data["ems"][key] for _ in range(steps_per_hour)]
+    data["temperature_forecast"] = [
+        value for value in data["temperature_forecast"] for _ in range(steps_per_hour)
+    ]
+    input_data = GeneticOptimizationParameters(**data)
+    ems_eos.set_start_datetime(to_datetime().set(hour=fixed_start_hour))
+
+    CacheEnergyManagementStore().clear()
+    genetic_optimization = GeneticOptimization(fixed_seed=fixed_seed)
+    assert genetic_optimization.step_hours == 0.25
+    assert genetic_optimization.prediction_steps == 192
+    assert genetic_optimization.start_step == fixed_start_hour * steps_per_hour
+    # Electric vehicle is not charged beyond the 24 hours optimization horizon
+    assert genetic_optimization.fixed_ev_hours == 96
+
+    solution = genetic_optimization.optimize_ems(
+        parameters=input_data, start_hour=fixed_start_hour, ngen=3
+    )
+    assert isinstance(solution, GeneticSolution)
+    genes_per_step = 2 if genetic_optimization.optimize_ev else 1
+    assert len(solution.start_solution) == genes_per_step * 192
+    assert len(solution.result.Last_Wh_pro_Stunde) == 192 - fixed_start_hour * steps_per_hour
+    assert genetic_optimization.simulation.ev.max_charge_wh == pytest.approx(
+        genetic_optimization.simulation.ev.max_charge_power_w / steps_per_hour
+    )
@@ -16,6 +16,12 @@ from akkudoktoreos.optimization.genetic.geneticparams import (
     GeneticEnergyManagementParameters,
     GeneticOptimizationParameters,
 )
+from akkudoktoreos.optimization.genetic.geneticpool import (
+    GeneticEvaluationPool,
+    acquire_evaluation_pool,
+    close_evaluation_pool,
+    release_evaluation_pool,
+)
 from akkudoktoreos.optimization.genetic.geneticsolution import GeneticSimulationResult
 from akkudoktoreos.utils.datetimeutil import to_duration, to_time
 
@@ -374,3 +380,234 @@ def test_simulation(genetic_simulation):
     ), "The sum of 'Home_appliance_wh_per_hour' should be 2000."
 
     print("All tests passed successfully.")
+
+
+def test_simulation_preallocated_state(genetic_simulation):
+    """Test repeated simulation runs reuse the preallocated state and give the same results."""
+    simulation = genetic_simulation
+    actions = (
+        simulation.ac_charge_hours.copy(),
+        simulation.dc_charge_hours.copy(),
+        simulation.bat_discharge_hours.copy(),
+        simulation.ev_charge_hours.copy(),
+    )
+    home_appliance_start_hour = simulation.home_appliance_start_hour
+
+    results = []
+    for _ in range(2):
+        simulation.reset()
+        simulation.set_actions(*actions)
+        simulation.home_appliance_start_hour = home_appliance_start_hour
+        result = simulation.simulate(start_hour=start_hour)
+        state = simulation.state(simulation.prediction_hours)
+        assert np.shares_memory(result["Last_Wh_pro_Stunde"], state.buffer)
+        assert np.shares_memory(simulation.ac_charge_hours, state.buffer)
+        results.append({key: np.array(value, dtype=float) for key, value in result.items()})
+
+    for key, value in results[0].items():
+        np.testing.assert_array_equal(results[1][key], value, err_msg=f"Key '{key}' differs.")
+
+    # Load curve of the home appliance is taken from the precomputed load curves
+    home_appliance = simulation.home_appliance
+    load_curve = home_appliance.get_load_curve()
+    assert np.shares_memory(load_curve, home_appliance.load_curves)
+    assert sum(load_curve) == 2000
+    home_appliance.reset_load_curve()
+    assert not np.any(home_appliance.get_load_curve())
+
+
+def test_simulation_batch(genetic_simulation):
+    """Test the population-batched simulation gives the same results as the scalar one."""
+    simulation = genetic_simulation
+
+    individuals = 3
+    ac_charge_hours = np.tile(simulation.ac_charge_hours, (individuals, 1))
+    dc_charge_hours = np.tile(simulation.dc_charge_hours, (individuals, 1))
+    bat_discharge_hours = np.tile(simulation.bat_discharge_hours, (individuals, 1))
+    ev_charge_hours = np.tile(simulation.ev_charge_hours, (individuals, 1))
+    # Vary the individuals
+    bat_discharge_hours[1, start_hour:] = 1.0
+    ac_charge_hours[2, start_hour + 2 : start_hour + 6] = 0.5
+    home_appliance_start_hours = np.array([simulation.home_appliance_start_hour, 5, -1])
+
+    batch_result = simulation.simulate_batch(
+        start_hour,
+        ac_charge_hours,
+        dc_charge_hours,
+        bat_discharge_hours,
+        ev_charge_hours,
+        home_appliance_start_hours=home_appliance_start_hours,
+    )
+    assert not np.any(batch_result["invalid"])
+
+    for idx in range(individuals):
+        simulation.ac_charge_hours = ac_charge_hours[idx].copy()
+        simulation.dc_charge_hours = dc_charge_hours[idx].copy()
+        simulation.bat_discharge_hours = bat_discharge_hours[idx].copy()
+        simulation.ev_charge_hours = ev_charge_hours[idx].copy()
+        if home_appliance_start_hours[idx] < 0:
+            simulation.home_appliance_start_hour = None
+        else:
+            simulation.home_appliance_start_hour = int(home_appliance_start_hours[idx])
+        simulation.battery.reset()
+        simulation.ev.reset()
+
+        result = simulation.simulate(start_hour=start_hour)
+
+        for key, value in result.items():
+            np.testing.assert_array_equal(
+                np.asarray(batch_result[key][idx], dtype=float),
+                np.asarray(value, dtype=float),
+                err_msg=f"Individual {idx}, key '{key}' differs.",
+            )
+        assert batch_result["battery_soc_wh"][idx] == simulation.battery.soc_wh
+        assert batch_result["ev_soc_wh"][idx] == simulation.ev.soc_wh
+
+
+def test_simulation_batch_hourly(genetic_simulation):
+    """Test simulating the population hour by hour from given battery SoCs gives the same results."""
+    simulation = genetic_simulation
+
+    individuals = 5
+    rng = np.random.default_rng(42)
+    hours = simulation.prediction_hours
+    ac_charge_hours = rng.choice([0.0, 0.5, 1.0], size=(individuals, hours))
+    dc_charge_hours = np.ones((individuals, hours))
+    bat_discharge_hours = rng.integers(0, 2, size=(individuals, hours)).astype(float)
+    ev_charge_hours = np.zeros((individuals, hours))
+    args = (ac_charge_hours, dc_charge_hours, bat_discharge_hours, ev_charge_hours)
+
+    expected = simulation.simulate_batch(start_hour, *args)
+
+    battery_soc_wh = None
+    for hour in range(start_hour, hours):
+        result = simulation.simulate_batch(
+            hour, *args, battery_soc_wh=battery_soc_wh, end_hour=hour + 1
+        )
+        hour_idx = hour - start_hour
+        for key in ("akku_soc_pro_stunde", "Kosten_Euro_pro_Stunde", "Einnahmen_Euro_pro_Stunde"):
+            np.testing.assert_array_equal(
+                result[key][:, 0], expected[key][:, hour_idx], err_msg=f"Key '{key}' differs."
+            )
+        battery_soc_wh = result["battery_soc_wh"]
+    np.testing.assert_array_equal(battery_soc_wh, expected["battery_soc_wh"])
+
+
+def test_simulation_batch_parallel(genetic_simulation):
+    """Test the parallel population simulation gives the same results as the serial one."""
+    simulation = genetic_simulation
+
+    individuals = 5
+    rng = np.random.default_rng(42)
+    hours = simulation.prediction_hours
+    ac_charge_hours = rng.choice([0.0, 0.5, 1.0], size=(individuals, hours))
+    dc_charge_hours = np.ones((individuals, hours))
+    bat_discharge_hours = rng.integers(0, 2, size=(individuals, hours)).astype(float)
+    ev_charge_hours = rng.choice([0.0, 1.0], size=(individuals, hours))
+    home_appliance_start_hours = np.array([2, 5, -1, 10, 20])
+
+    args = (
+        ac_charge_hours,
+        dc_charge_hours,
+        bat_discharge_hours,
+        ev_charge_hours,
+        home_appliance_start_hours,
+    )
+    expected = simulation.simulate_batch(start_hour, *args)
+    with GeneticEvaluationPool(simulation, workers=2) as pool:
+        result = pool.simulate_batch(start_hour, *args)
+
+    assert set(result) == set(expected)
+    for key, value in expected.items():
+        np.testing.assert_array_equal(result[key], value, err_msg=f"Key '{key}' differs.")
+
+
+def test_simulation_batch_parallel_reuse(genetic_simulation):
+    """Test the evaluation pool is reused and bound to the simulation of the next run."""
+    simulation = genetic_simulation
+
+    individuals = 4
+    rng = np.random.default_rng(42)
+    hours = simulation.prediction_hours
+    args = (
+        rng.choice([0.0, 0.5, 1.0], size=(individuals, hours)),
+        np.ones((individuals, hours)),
+        rng.integers(0, 2, size=(individuals, hours)).astype(float),
+        rng.choice([0.0, 1.0], size=(individuals, hours)),
+        None,
+    )
+
+    pool = acquire_evaluation_pool(simulation, workers=2)
+    try:
+        first = pool.simulate_batch(start_hour, *args)
+    finally:
+        release_evaluation_pool(pool)
+    assert pool.simulation is None
+
+    # Next run with other forecasts
+    simulation.elect_price_hourly = simulation.elect_price_hourly * 2
+    simulation.load_energy_array = simulation.load_energy_array + 100.0
+    expected = simulation.simulate_batch(start_hour, *args)
+    try:
+        reused = acquire_evaluation_pool(simulation, workers=2)
+        assert reused is pool
+        result = reused.simulate_batch(start_hour, *args)
+        release_evaluation_pool(reused)
+    finally:
+        close_evaluation_pool()
+    assert pool.closed
+
+    assert not np.array_equal(result["Gesamtbilanz_Euro"], first["Gesamtbilanz_Euro"])
+    for key, value in expected.items():
+        np.testing.assert_array_equal(result[key], value, err_msg=f"Key '{key}' differs.")
+
+
+def test_simulation_batch_scenarios(genetic_simulation):
+    """Test the scenario simulation gives the same results as simulating each scenario."""
+    simulation = genetic_simulation
+
+    individuals = 2
+    scenarios = 3
+    rng = np.random.default_rng(42)
+    hours = simulation.prediction_hours
+    ac_charge_hours = rng.choice([0.0, 0.5, 1.0], size=(individuals, hours))
+    dc_charge_hours = np.ones((individuals, hours))
+    bat_discharge_hours = rng.integers(0, 2, size=(individuals, hours)).astype(float)
+    ev_charge_hours = rng.choice([0.0, 1.0], size=(individuals, hours))
+    home_appliance_start_hours = np.array([2, -1])
+    args = (
+        ac_charge_hours,
+        dc_charge_hours,
+        bat_discharge_hours,
+        ev_charge_hours,
+        home_appliance_start_hours,
+    )
+
+    simulation.prepare_scenarios(
+        scenarios,
+        load_std=0.2 * simulation.load_energy_array,
+        pv_std=0.3 * simulation.pv_prediction_wh,
+        price_std=0.1 * simulation.elect_price_hourly,
+        seed=42,
+    )
+    assert simulation.load_energy_scenarios.shape == (scenarios, hours)
+    assert np.all(simulation.pv_prediction_scenarios >= 0)
+    # Quantile scenarios are symmetric around the forecast
+    np.testing.assert_allclose(
+        simulation.load_energy_scenarios.mean(axis=0), simulation.load_energy_array
+    )
+
+    result = simulation.simulate_batch(start_hour, *args, scenarios=True)
+    assert result["Gesamtbilanz_Euro"].shape == (individuals * scenarios,)
+
+    for scenario in range(scenarios):
+        simulation.load_energy_array = simulation.load_energy_scenarios[scenario]
+        simulation.pv_prediction_wh = simulation.pv_prediction_scenarios[scenario]
+        simulation.elect_price_hourly = simulation.elect_price_scenarios[scenario]
+        expected = simulation.simulate_batch(start_hour, *args)
+        for key, value in expected.items():
+            np.testing.assert_allclose(
+                result[key][scenario::scenarios],
+                value,
+                err_msg=f"Scenario {scenario}, key '{key}' differs.",
+            )
@@ -0,0 +1,192 @@
+import asyncio
+import gzip
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlsplit
+
+import pytest
+import requests
+
+from akkudoktoreos.core.cache import CacheFileStore
+from akkudoktoreos.core.coreabc import get_ems
+from akkudoktoreos.prediction.weatherbrightsky import WeatherBrightSky
+from akkudoktoreos.utils.datetimeutil import to_datetime
+from akkudoktoreos.utils.httpclient import HttpClient, get_http_client, set_http_client
+
+DIR_TESTDATA = Path(__file__).absolute().parent.joinpath("testdata")
+
+FILE_TESTDATA_WEATHERBRIGHTSKY_1_JSON = DIR_TESTDATA.joinpath("weatherforecast_brightsky_1.json")
+
+
+class StubServer(ThreadingHTTPServer):
+    """Local HTTP server serving recorded responses."""
+
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), StubHandler)
+        # Recorded response body by path
+        self.responses: dict[str, bytes] = {}
+        self.delay_sec = 0.0
+        self.connections = 0
+        self.requests = 0
+        self.concurrent = 0
+        self.max_concurrent = 0
+        self.accept_encoding: list[str] = []
+        self.lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+    server: StubServer
+
+    def setup(self) -> None:
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def do_GET(self) -> None:
+        server = self.server
+        with server.lock:
+            server.requests += 1
+            server.concurrent += 1
+            server.max_concurrent = max(server.max_concurrent, server.concurrent)
+            server.accept_encoding.append(self.headers.get("Accept-Encoding", ""))
+        try:
+            time.sleep(server.delay_sec)
+            body = server.responses.get(urlsplit(self.path).path)
+            if body is None:
+                self.send_response(404)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            if "gzip" in self.headers.get("Accept-Encoding", ""):
+                body = gzip.compress(body)
+                self.send_header("Content-Encoding", "gzip")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        finally:
+            with server.lock:
+                server.concurrent -= 1
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+class StubHttpClient(HttpClient):
+    """HTTP client sending all requests to the stub server."""
+
+    def __init__(self, stub_url: str, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.stub_url = stub_url
+        self.urls: list[str] = []
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        self.urls.append(url)
+        parts = urlsplit(url)
+        return super().request(method, f"{self.stub_url}{parts.path}?{parts.query}", **kwargs)
+
+
+@pytest.fixture
+def stub_server():
+    """Local HTTP server serving the recorded BrightSky forecast."""
+    server = StubServer()
+    server.responses["/weather"] = FILE_TESTDATA_WEATHERBRIGHTSKY_1_JSON.read_bytes()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def client():
+    client = HttpClient(max_concurrent_per_host=2)
+    yield client
+    client.close()
+
+
+def test_get_recorded_response(client, stub_server):
+    response = client.get(f"{stub_server.url}/weather")
+    response.raise_for_status()
+    assert response.json() == json.loads(FILE_TESTDATA_WEATHERBRIGHTSKY_1_JSON.read_bytes())
+    # Response is transferred gzip compressed and decompressed by the client
+    assert "gzip" in stub_server.accept_encoding[0]
+    assert response.headers["Content-Encoding"] == "gzip"
+
+    response = client.get(f"{stub_server.url}/unknown")
+    with pytest.raises(requests.HTTPError):
+        response.raise_for_status()
+
+
+def test_keep_alive(client, stub_server):
+    for _ in range(5):
+        client.get(f"{stub_server.url}/weather").raise_for_status()
+    assert stub_server.requests == 5
+    assert stub_server.connections == 1
+
+
+def test_timeout(client, stub_server):
+    stub_server.delay_sec = 1.0
+    with pytest.raises(requests.Timeout):
+        client.get(f"{stub_server.url}/weather", timeout=0.2)
+
+
+@pytest.mark.asyncio
+async def test_concurrency_limit_per_host(client, stub_server):
+    stub_server.delay_sec = 0.2
+    responses = await asyncio.gather(
+        *(asyncio.to_thread(client.get, f"{stub_server.url}/weather") for _ in range(6))
+    )
+    assert all(response.status_code == 200 for response in responses)
+    assert stub_server.max_concurrent == 2
+
+
+def test_shared_client():
+    client = get_http_client()
+    assert get_http_client() is client
+    set_http_client(None)
+    assert get_http_client() is not client
+
+
+@pytest.mark.asyncio
+async def test_provider_update_from_stub_server(stub_server, monkeypatch):
+    """Update a provider from recorded responses without blocking the event loop."""
+    monkeypatch.setenv("EOS_GENERAL__LATITUDE", "50.0")
+    monkeypatch.setenv("EOS_GENERAL__LONGITUDE", "10.0")
+    provider = WeatherBrightSky()
+    CacheFileStore().clear(clear_all=True)
+    get_ems().set_start_datetime(to_datetime("2024-10-26 00:00:00", in_timezone="Europe/Berlin"))
+
+    stub_client = StubHttpClient(stub_server.url)
+    set_http_client(stub_client)
+    stub_server.delay_sec = 0.3
+    ticks = 0
+
+    async def ticker() -> None:
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.05)
+            ticks += 1
+
+    task = asyncio.create_task(ticker())
+    try:
+        await provider.update_data(force_enable=True, force_update=True)
+    finally:
+        task.cancel()
+        set_http_client(None)
+
+    assert stub_client.urls[0].startswith("https://api.brightsky.dev/weather?")
+    assert len(provider) == 50
+    assert ticks >= 3
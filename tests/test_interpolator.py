@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+
+from akkudoktoreos.prediction.interpolator import get_eos_load_interpolator
+
+
+@pytest.fixture
+def interpolator():
+    return get_eos_load_interpolator()
+
+
+@pytest.mark.parametrize(
+    "load, pv",
+    [
+        (0.0, 0.0),
+        (25.0, 49.9),
+        (50.0, 50.0),
+        (333.3, 1234.5),
+        (1000.0, 4950.0),
+        (2750.0, 7000.0),
+        (3450.0, 300.0),
+        (-10.0, 500.0),
+        (3500.0, 500.0),
+        (500.0, -60.0),
+    ],
+)
+def test_calculate_self_consumption(interpolator, load, pv):
+    """Test the table lookup matches the RegularGridInterpolator."""
+    expected = interpolator.calculate_self_consumption_interpolated(load, pv)
+    assert interpolator.calculate_self_consumption(load, pv) == pytest.approx(
+        expected, abs=1e-12
+    )
+
+
+def test_calculate_self_consumption_batch(interpolator):
+    """Test the vectorized table lookup matches the scalar lookup."""
+    rng = np.random.default_rng(42)
+    loads = rng.uniform(-100.0, 3600.0, 500)
+    pv_powers = rng.uniform(0.0, 8000.0, 500)
+
+    expected = [interpolator.calculate_self_consumption(l, p) for l, p in zip(loads, pv_powers)]
+    np.testing.assert_allclose(
+        interpolator.calculate_self_consumption_batch(loads, pv_powers), expected, atol=1e-12
+    )
+
+    # Scalar PV power is broadcast to all loads
+    expected = [interpolator.calculate_self_consumption(l, 1500.0) for l in loads]
+    np.testing.assert_allclose(
+        interpolator.calculate_self_consumption_batch(loads, 1500.0), expected, atol=1e-12
+    )
@@ -517,6 +517,7 @@ def _make_mock_simulation(
         initial_soc_percentage=initial_soc_percentage,
         min_soc_wh=min_soc_wh,
         max_charge_power_w=max_charge_power_w,
+        max_charge_wh=max_charge_power_w,  # hourly simulation steps
         current_energy_content=Mock(return_value=0.0),
     )
 
@@ -878,3 +879,58 @@ class TestAcChargeBreakEvenPenalty:
         # = (6000 - 500) * 0.95 * 0.95 = 5500 * 0.9025 = 4963.75
         expected = 5500.0 * 0.95 * 0.95
         assert free_ac_wh == pytest.approx(expected, rel=1e-9)
+
+    # -----------------------------------------------------------------
+    # 5i. Best uncovered future prices are precomputed per run
+    # -----------------------------------------------------------------
+
+    def test_best_uncovered_prices(self):
+        """Free PV energy covers the most expensive future hours first."""
+        from akkudoktoreos.optimization.genetic.genetic import GeneticOptimization
+
+        # Free PV: initial 80% → (8000 - 0) * 0.95 * 0.95 = 7220 Wh deliverable AC
+        prices = [0.0010, 0.0008, 0.0008, 0.0002, 0.0002]
+        sim = _make_mock_simulation(
+            dc_to_ac_efficiency=0.95,
+            discharging_efficiency=0.95,
+            initial_soc_percentage=80.0,
+            elect_price_hourly=prices,
+            ac_charge_hours=[0.0] * 5,
+            load_energy_array=[1000.0, 1000.0, 1000.0, 1000.0, 8000.0],
+        )
+        optim = GeneticOptimization.__new__(GeneticOptimization)
+        optim.simulation = sim
+
+        best_uncovered_prices = optim.calculate_ac_charge_best_uncovered_prices()
+
+        # Hour 0..2: 0.0008 hours and hour 3 covered, hour 4 (8000 Wh) not fully covered
+        # Hour 3: only hour 4 left - not fully covered
+        # Hour 4: no future hour
+        np.testing.assert_array_equal(
+            best_uncovered_prices, [0.0002, 0.0002, 0.0002, 0.0002, 0.0]
+        )
+
+    def test_precomputed_best_uncovered_prices_identical(self, config_eos):
+        """The precomputed prices give exactly the same penalty as calculating them on the fly."""
+        rng = np.random.default_rng(42)
+        n = 24
+        sim = _make_mock_simulation(
+            initial_soc_percentage=30.0,
+            ac_charge_hours=list(rng.choice([0.0, 0.5, 1.0], n)),
+            elect_price_hourly=list(rng.uniform(0.0001, 0.0006, n)),
+            load_energy_array=list(rng.uniform(200.0, 2000.0, n)),
+        )
+
+        fitness = _run_evaluate_with_mocked_sim(config_eos, sim, start_hour=2)
+        assert fitness > 0.0
+
+        from akkudoktoreos.optimization.genetic.genetic import GeneticOptimization
+
+        optim = GeneticOptimization.__new__(GeneticOptimization)
+        optim.simulation = sim
+        best_uncovered_prices = optim.calculate_ac_charge_best_uncovered_prices()
+        with patch.object(
+            GeneticOptimization, "ac_charge_best_uncovered_prices", best_uncovered_prices
+        ):
+            fitness_precomputed = _run_evaluate_with_mocked_sim(config_eos, sim, start_hour=2)
+        assert fitness_precomputed == fitness
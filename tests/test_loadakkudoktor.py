@@ -12,6 +12,7 @@ from akkudoktoreos.prediction.loadakkudoktor import (
     LoadAkkudoktor,
     LoadAkkudoktorAdjusted,
     LoadAkkudoktorCommonSettings,
+    load_profiles,
 )
 from akkudoktoreos.utils.datetimeutil import compare_datetimes, to_datetime, to_duration
 
@@ -108,17 +109,13 @@ class TestLoadAkkudoktor:
         """Test the `provider_id` class method."""
         assert loadakkudoktor.provider_id() == "LoadAkkudoktor"
 
-    @patch("akkudoktoreos.prediction.loadakkudoktor.np.load")
-    async def test_load_data_from_mock(self, mock_np_load, mock_load_profiles_file, loadakkudoktor):
+    async def test_load_data_from_mock(self, mock_load_profiles_file, loadakkudoktor):
         """Test the `load_data` method."""
-        # Mock numpy load to return data similar to what would be in the file
-        mock_np_load.return_value = {
-            "yearly_profiles": np.ones((365, 24)),
-            "yearly_profiles_std": np.zeros((365, 24)),
-        }
-
-        # Test data loading
-        data_year_energy = loadakkudoktor.load_data()
+        # Load profiles from mock load profiles file
+        profiles = load_profiles(mock_load_profiles_file, mock_load_profiles_file.parent)
+        with patch.object(LoadAkkudoktor, "_load_profiles", return_value=profiles):
+            # Test data loading
+            data_year_energy = loadakkudoktor.load_data()
         assert data_year_energy is not None
         assert data_year_energy.shape == (365, 2, 24)
 
@@ -127,6 +124,57 @@ class TestLoadAkkudoktor:
         data_year_energy = loadakkudoktor.load_data()
         assert data_year_energy is not None
 
+    async def test_load_profiles_store(self, mock_load_profiles_file, tmp_path):
+        """Test the profiles are converted once and memory-mapped from the store file."""
+        store_path = tmp_path / "store"
+        profiles = load_profiles(mock_load_profiles_file, store_path)
+        assert isinstance(profiles, np.memmap)
+        assert profiles.shape == (365, 24, 2)
+        assert not profiles.flags.writeable
+        file_data = np.load(mock_load_profiles_file)
+        np.testing.assert_array_equal(profiles[:, :, 0], file_data["yearly_profiles"])
+        np.testing.assert_array_equal(profiles[:, :, 1], file_data["yearly_profiles_std"])
+        assert (store_path / "load_profiles.npy").exists()
+
+        # Same profiles on later calls
+        assert load_profiles(mock_load_profiles_file, store_path) is profiles
+
+        # Other process - maps the store file without decompressing the profiles again
+        with (
+            patch.dict("akkudoktoreos.prediction.loadakkudoktor._load_profiles", clear=True),
+            patch("akkudoktoreos.prediction.loadakkudoktor.np.load", wraps=np.load) as mock_load,
+        ):
+            mapped = load_profiles(mock_load_profiles_file, store_path)
+            mock_load.assert_called_once_with(store_path / "load_profiles.npy", mmap_mode="r")
+        np.testing.assert_array_equal(mapped, profiles)
+
+    async def test_update_data_from_profiles(self, loadakkudoktor, config_eos):
+        """Test the forecast hours are sliced from the profiles, also on DST change."""
+        config_eos.merge_settings_from_dict({"prediction": {"hours": 48}})
+        ems_eos = get_ems()
+        start = to_datetime("2024-10-26 10:00:00", in_timezone="Europe/Berlin")
+        ems_eos.set_start_datetime(start)
+        await loadakkudoktor.delete_by_datetime(start_datetime=None, end_datetime=None)
+
+        await loadakkudoktor._update_data()
+
+        file_data = np.load(config_eos.package_root_path / "data/load_profiles.npz")
+        # From start of day to end of prediction, DST change on 2024-10-27 03:00 is passed
+        assert len(loadakkudoktor) == 10 + 48
+        assert to_datetime(loadakkudoktor.records[-1].date_time, in_timezone="Europe/Berlin").hour == 8
+        date = start.start_of("day")
+        for record in loadakkudoktor.records:
+            assert compare_datetimes(record.date_time, date).equal
+            day, hour = date.day_of_year - 1, date.hour
+            assert record.loadforecast_power_w == pytest.approx(
+                file_data["yearly_profiles"][day, hour] * 1000 * 1000
+            )
+            assert record.loadakkudoktor_mean_power_w == record.loadforecast_power_w
+            assert record.loadakkudoktor_std_power_w == pytest.approx(
+                file_data["yearly_profiles_std"][day, hour] * 1000 * 1000
+            )
+            date += to_duration("1 hour")
+
     @patch("akkudoktoreos.prediction.loadakkudoktor.LoadAkkudoktor.load_data")
     async def test_update_data(self, mock_load_data, loadakkudoktor):
         """Test the `_update` method."""
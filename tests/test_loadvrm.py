@@ -93,7 +93,7 @@ class TestLoadVRM:
         assert "records" in str(exc_info.value)
 
     def test_request_forecast_raises_on_http_error(self, load_vrm_instance):
-        with patch("requests.get", side_effect=requests.Timeout("Request timed out")) as mock_get:
+        with patch("requests.Session.get", side_effect=requests.Timeout("Request timed out")) as mock_get:
             with pytest.raises(RuntimeError) as exc_info:
                 load_vrm_instance._request_forecast(0, 1)
 
@@ -0,0 +1,47 @@
+import pytest
+
+from akkudoktoreos.optimization.genetic.genetic import GeneticOptimization
+from akkudoktoreos.optimization.milp.milp import MILPModel, MILPOptimization
+
+
+def test_milp_model():
+    """Test the MILP model solves a small mixed-integer program."""
+    model = MILPModel()
+    x = model.add_variable(0.0, 10.0, cost=-1.0)
+    y = model.add_binary(cost=-6.0)
+    model.add_constraint([(x, 1.0), (y, 5.0)], upper=7.5)
+
+    result = model.solve()
+
+    assert result.status == 0
+    assert result.x[x] == pytest.approx(2.5)
+    assert result.x[y] == pytest.approx(1.0)
+
+
+@pytest.mark.parametrize("fn_in", ["optimize_input_1.json", "optimize_input_2.json"])
+def test_optimize_milp(fn_in: str, optimize):
+    """Test the MILP solution is at least as good as a short GENETIC run."""
+    genetic_optimization = GeneticOptimization(fixed_seed=42)
+    optimize(genetic_optimization, fn_in, ngen=10)
+    genetic_fitness = genetic_optimization.fitness_history["min"][-1]
+
+    milp_optimization = MILPOptimization()
+    solution = optimize(milp_optimization, fn_in, ngen=10)
+    milp_fitness = milp_optimization.fitness_history["min"][-1]
+
+    assert solution.stop_reason == "optimal"
+    assert solution.generations is None
+    assert milp_fitness <= genetic_fitness + 1e-9
+    # The solution is the simulation result of the MILP decisions
+    assert solution.result.Gesamtbilanz_Euro == pytest.approx(
+        milp_optimization.evaluate_inner(solution.start_solution)["Gesamtbilanz_Euro"]
+    )
+
+
+def test_optimize_milp_fallback(optimize):
+    """Test the MILP falls back to GENETIC for the worst case optimization."""
+    milp_optimization = MILPOptimization(fixed_seed=42)
+    solution = optimize(milp_optimization, "optimize_input_1.json", ngen=3, worst_case=True)
+
+    assert solution.stop_reason == "generations"
+    assert solution.generations == 3
@@ -0,0 +1,185 @@
+import asyncio
+import json
+import time
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+
+import psutil
+import pytest
+
+from akkudoktoreos.config.config import ConfigEOS
+from akkudoktoreos.core.cache import CacheEnergyManagementStore
+from akkudoktoreos.core.coreabc import get_ems
+from akkudoktoreos.optimization.genetic.genetic import GeneticOptimization
+from akkudoktoreos.optimization.genetic.geneticparams import (
+    GeneticOptimizationParameters,
+)
+from akkudoktoreos.optimization.optimizationstatus import get_optimization_status
+from akkudoktoreos.optimization.optimizationworker import OptimizationWorker
+from akkudoktoreos.utils.datetimeutil import to_datetime
+
+ems_eos = get_ems(init=True)  # init once
+
+DIR_TESTDATA = Path(__file__).parent / "testdata"
+
+
+@pytest.fixture
+def parameters(config_eos: ConfigEOS) -> GeneticOptimizationParameters:
+    config_eos.merge_settings_from_dict(
+        {
+            "prediction": {"hours": 48},
+            "optimization": {"horizon_hours": 48},
+            "devices": {
+                "max_electric_vehicles": 1,
+                "electric_vehicles": [
+                    {"charge_rates": [0.0, 0.375, 0.5, 0.625, 0.75, 0.875, 1.0]},
+                ],
+            },
+        }
+    )
+    ems_eos.set_start_datetime(to_datetime().set(hour=10))
+    file = DIR_TESTDATA / "optimize_input_1.json"
+    with file.open("r") as f_in:
+        return GeneticOptimizationParameters(**json.load(f_in))
+
+
+@pytest.mark.asyncio
+async def test_optimization_worker(parameters: GeneticOptimizationParameters):
+    """Test the worker process optimizes like the calling process and can be cancelled."""
+    CacheEnergyManagementStore().clear()
+    expected = GeneticOptimization(fixed_seed=42).optimize_ems(
+        parameters=parameters, start_hour=10, ngen=3
+    )
+
+    worker = OptimizationWorker()
+    try:
+        solution = await worker.optimize(
+            "GENETIC", parameters, ems_eos.start_datetime, ngen=3, fixed_seed=42
+        )
+        assert solution.model_dump() == expected.model_dump()
+
+        # Cancel a long running optimization - terminates the worker process
+        task = asyncio.create_task(
+            worker.optimize("GENETIC", parameters, ems_eos.start_datetime, ngen=10000)
+        )
+        await asyncio.sleep(1.0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert worker._executor is None
+
+        # A new worker process is started on next use
+        solution = await worker.optimize("MILP", parameters, ems_eos.start_datetime)
+        assert solution.stop_reason == "optimal"
+    finally:
+        worker.close()
+
+
+@pytest.mark.asyncio
+async def test_optimization_worker_progress(parameters: GeneticOptimizationParameters):
+    """Test the worker process publishes progress and stops on cancellation request."""
+    status = get_optimization_status()
+    worker = OptimizationWorker()
+    try:
+        status.begin("GENETIC")
+        task = asyncio.create_task(
+            worker.optimize("GENETIC", parameters, ems_eos.start_datetime, ngen=10000)
+        )
+        # Wait for the progress of some generations
+        for _ in range(600):
+            progress = status.progress()
+            if progress.generation >= 2:
+                break
+            await asyncio.sleep(0.1)
+        assert progress.running
+        assert progress.algorithm == "GENETIC"
+        assert progress.generations == 10000
+        assert progress.best_fitness is not None
+        assert progress.avg_fitness >= progress.best_fitness
+        assert progress.evaluations_per_sec > 0
+        assert progress.eta_sec > 0
+
+        # Stops at the next generation boundary with the best solution so far
+        status.cancel()
+        solution = await task
+        assert solution.stop_reason == "cancelled"
+        assert 2 <= solution.generations < 10000
+        assert status.progress().cancel_requested
+    finally:
+        status.end()
+        worker.close()
+
+
+@pytest.mark.asyncio
+async def test_optimization_worker_unknown_algorithm(parameters: GeneticOptimizationParameters):
+    """Test the worker rejects unknown algorithms without starting the worker process."""
+    worker = OptimizationWorker()
+    with pytest.raises(ValueError, match="Unknown optimization algorithm"):
+        await worker.optimize("UNKNOWN", parameters, ems_eos.start_datetime)
+    assert worker._executor is None
+    # Nothing to cancel
+    assert not worker.cancel()
+
+
+@pytest.mark.asyncio
+async def test_optimization_worker_close_running(parameters: GeneticOptimizationParameters):
+    """Test closing the worker does not wait for a running optimization."""
+    worker = OptimizationWorker()
+    task = asyncio.create_task(
+        worker.optimize("GENETIC", parameters, ems_eos.start_datetime, ngen=10000)
+    )
+    try:
+        # Wait for the worker process to start
+        for _ in range(600):
+            if worker._pid is not None and worker._pid.value:
+                break
+            await asyncio.sleep(0.1)
+        assert worker._pid.value
+
+        start = time.perf_counter()
+        worker.close()
+        with pytest.raises(BrokenProcessPool):
+            await task
+        assert time.perf_counter() - start < 10.0
+        assert worker._executor is None
+    finally:
+        task.cancel()
+        worker.close()
+
+
+@pytest.mark.asyncio
+async def test_optimization_worker_cancel_starting(parameters: GeneticOptimizationParameters):
+    """Test cancelling the worker while the worker process is starting up."""
+    status = get_optimization_status()
+    status.begin("GENETIC")  # Reset the progress
+    status.end()
+    worker = OptimizationWorker()
+    task = asyncio.create_task(
+        worker.optimize("GENETIC", parameters, ems_eos.start_datetime, ngen=10000)
+    )
+    try:
+        await asyncio.sleep(0.1)
+        pid = worker._pid
+        assert pid.value == 0
+
+        assert worker.cancel()
+        with pytest.raises(Exception):
+            await task
+
+        # The worker process skips the optimization already handed to it and exits
+        for _ in range(600):
+            if pid.value:
+                break
+            await asyncio.sleep(0.1)
+        assert pid.value
+        for _ in range(600):
+            if not psutil.pid_exists(pid.value):
+                break
+            await asyncio.sleep(0.1)
+        assert not psutil.pid_exists(pid.value)
+        progress = status.progress()
+        assert progress.generation == 0
+        assert progress.best_fitness is None
+    finally:
+        task.cancel()
+        worker.close()
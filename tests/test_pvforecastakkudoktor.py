@@ -264,7 +264,7 @@ async def test_pvforecast_akkudoktor_validate_data_single_plane(
 
 
 @pytest.mark.asyncio
-@patch("requests.get")
+@patch("requests.Session.get")
 async def test_pvforecast_akkudoktor_update_with_sample_forecast(
     mock_get, sample_settings, sample_forecast_data_raw, sample_forecast_start, provider
 ):
@@ -306,7 +306,7 @@ async def test_report_ac_power_and_measurement(provider, config_eos):
     sys.platform.startswith("win"), reason="'other_timezone' fixture not supported on Windows"
 )
 @pytest.mark.asyncio
-@patch("requests.get")
+@patch("requests.Session.get")
 async def test_timezone_behaviour(
     mock_get,
     sample_settings,
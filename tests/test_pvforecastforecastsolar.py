@@ -1,9 +1,11 @@
+import threading
 from unittest.mock import call, patch
 
 import pendulum
 import pytest
 import requests
 
+from akkudoktoreos.core.cache import CacheFileStore
 from akkudoktoreos.prediction.pvforecastforecastsolar import PVForecastForecastSolar
 
 
@@ -84,7 +86,7 @@ def test_plane_url_converts_azimuth(config_eos):
     pv = PVForecastForecastSolar(
         config=config_eos.load, start_datetime=pendulum.datetime(2025, 1, 1, tz="UTC")
     )
-    with patch("requests.get", return_value=_http({})) as mock_get:
+    with patch("requests.Session.get", return_value=_http({})) as mock_get:
         # force_update is consumed by the cache_in_file decorator at runtime
         # (same call convention as pvforecastakkudoktor.py).
         pv._request_forecast(force_update=True)  # type: ignore
@@ -108,7 +110,7 @@ def test_request_forecast_sums_planes(config_eos):
         _http({"2025-01-01 12:00:00": 1000.0}),
         _http({"2025-01-01 12:00:00": 800.0}),
     ]
-    with patch("requests.get", side_effect=responses) as mock_get:
+    with patch("requests.Session.get", side_effect=responses) as mock_get:
         body = pv._request_forecast(force_update=True)  # type: ignore
         assert mock_get.call_count == 2
         assert body["watts"]["2025-01-01 12:00:00"] == 1800.0
@@ -125,7 +127,63 @@ async def test_update_data_skips_when_disabled(pvforecast_instance, config_eos):
 
 
 def test_request_forecast_raises_on_http_error(pvforecast_instance):
-    with patch("requests.get", side_effect=requests.Timeout("timed out")):
+    with patch("requests.Session.get", side_effect=requests.Timeout("timed out")):
         with pytest.raises(RuntimeError) as exc_info:
             pvforecast_instance._request_forecast(force_update=True)
         assert "Failed to fetch pvforecast from Forecast.Solar" in str(exc_info.value)
+
+
+def test_request_forecast_concurrent_planes(config_eos):
+    """Plane requests are issued concurrently."""
+    _config(
+        config_eos,
+        planes=[
+            {"surface_tilt": 30.0, "surface_azimuth": 90.0, "peakpower": 3.0},
+            {"surface_tilt": 30.0, "surface_azimuth": 180.0, "peakpower": 3.0},
+            {"surface_tilt": 30.0, "surface_azimuth": 270.0, "peakpower": 3.0},
+        ],
+    )
+    pv = PVForecastForecastSolar(
+        config=config_eos.load, start_datetime=pendulum.datetime(2025, 1, 1, tz="UTC")
+    )
+    barrier = threading.Barrier(3, timeout=5)
+
+    def get(url, **kwargs):
+        # Fails with BrokenBarrierError if the planes are requested one after the other
+        barrier.wait()
+        return _http({"2025-01-01 12:00:00": 100.0, "2025-01-01 13:00:00": "n/a"})
+
+    with patch("requests.Session.get", side_effect=get):
+        body = pv._request_forecast(force_update=True)
+    assert body["watts"] == {"2025-01-01 12:00:00": 300.0}
+
+
+def test_request_forecast_caches_planes(config_eos):
+    """Unchanged planes are served from the cache, only changed planes are fetched."""
+    planes = [
+        {"surface_tilt": 30.0, "surface_azimuth": 90.0, "peakpower": 3.0},
+        {"surface_tilt": 30.0, "surface_azimuth": 270.0, "peakpower": 3.0},
+    ]
+    _config(config_eos, planes=planes)
+    pv = PVForecastForecastSolar(
+        config=config_eos.load, start_datetime=pendulum.datetime(2025, 1, 1, tz="UTC")
+    )
+    CacheFileStore().clear(clear_all=True)
+    with patch(
+        "requests.Session.get", return_value=_http({"2025-01-01 12:00:00": 500.0})
+    ) as mock_get:
+        pv._request_forecast(force_update=True)
+        assert mock_get.call_count == 2
+
+        # Same planes - all cached
+        body = pv._request_forecast()
+        assert mock_get.call_count == 2
+        assert body["watts"]["2025-01-01 12:00:00"] == 1000.0
+
+        # One plane changed - only this plane is fetched
+        planes[1]["peakpower"] = 4.0
+        _config(config_eos, planes=planes)
+        body = pv._request_forecast()
+        assert mock_get.call_count == 3
+        assert mock_get.call_args[0][0].endswith("/30.0/90.0/4.0")
+        assert body["watts"]["2025-01-01 12:00:00"] == 1000.0
@@ -108,7 +108,7 @@ async def test_update_data_skips_on_empty_forecast(pvforecast_instance):
 def test_request_forecast_uses_saved_site_get(pvforecast_instance):
     """site_id set -> GET /v2/forecast/{site_id} with Bearer auth."""
     fake = type("R", (), {"raise_for_status": lambda self: None, "json": lambda self: {"values": []}})()
-    with patch("requests.get", return_value=fake) as mock_get:
+    with patch("requests.Session.get", return_value=fake) as mock_get:
         pvforecast_instance._request_forecast(force_update=True)
         url = mock_get.call_args[0][0]
         assert url.endswith("/v2/forecast/test-site-123")
@@ -129,7 +129,7 @@ def test_request_forecast_inline_post_when_no_site(config_eos):
     )
     pv = PVForecastPVNode(config=config_eos.load, start_datetime=pendulum.datetime(2025, 1, 1, tz="UTC"))
     fake = type("R", (), {"raise_for_status": lambda self: None, "json": lambda self: {"values": []}})()
-    with patch("requests.post", return_value=fake) as mock_post:
+    with patch("requests.Session.post", return_value=fake) as mock_post:
         # force_update is consumed by the cache_in_file decorator at runtime
         # (same call convention as pvforecastakkudoktor.py).
         pv._request_forecast(force_update=True)  # type: ignore
@@ -140,7 +140,7 @@ def test_request_forecast_inline_post_when_no_site(config_eos):
 
 
 def test_request_forecast_raises_on_http_error(pvforecast_instance):
-    with patch("requests.get", side_effect=requests.Timeout("timed out")):
+    with patch("requests.Session.get", side_effect=requests.Timeout("timed out")):
         with pytest.raises(RuntimeError) as exc_info:
             pvforecast_instance._request_forecast(force_update=True)
         assert "Failed to fetch pvforecast from pvnode" in str(exc_info.value)
@@ -72,7 +72,7 @@ async def test_update_data_normalises_to_period_start_and_converts_kw(pvforecast
 
 
 def test_request_forecast_uses_site_and_bearer(pvforecast_instance):
-    with patch("requests.get", return_value=_http([])) as mock_get:
+    with patch("requests.Session.get", return_value=_http([])) as mock_get:
         pvforecast_instance._request_forecast(force_update=True)
         url = mock_get.call_args[0][0]
         assert url.endswith("/rooftop_sites/site-abc/forecasts")
@@ -91,7 +91,7 @@ async def test_update_data_skips_when_disabled(pvforecast_instance, config_eos):
 
 
 def test_request_forecast_raises_on_http_error(pvforecast_instance):
-    with patch("requests.get", side_effect=requests.Timeout("timed out")):
+    with patch("requests.Session.get", side_effect=requests.Timeout("timed out")):
         with pytest.raises(RuntimeError) as exc_info:
             pvforecast_instance._request_forecast(force_update=True)
         assert "Failed to fetch pvforecast from Solcast" in str(exc_info.value)
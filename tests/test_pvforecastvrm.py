@@ -93,7 +93,7 @@ def test_validate_data_invalid_json_raises():
 
 def test_request_forecast_raises_on_http_error(pvforecast_instance):
     """Ensure _request_forecast raises RuntimeError on HTTP failure."""
-    with patch("requests.get", side_effect=requests.Timeout("Request timed out")) as mock_get:
+    with patch("requests.Session.get", side_effect=requests.Timeout("Request timed out")) as mock_get:
         with pytest.raises(RuntimeError) as exc_info:
             pvforecast_instance._request_forecast(0, 1)
 
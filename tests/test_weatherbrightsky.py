@@ -98,7 +98,7 @@ def test_irridiance_estimate_from_cloud_cover(provider):
 # ------------------------------------------------
 
 
-@patch("requests.get")
+@patch("requests.Session.get")
 def test_request_forecast(mock_get, provider, sample_brightsky_1_json):
     """Test requesting forecast from BrightSky."""
     # Mock response object
@@ -145,7 +145,7 @@ def test_request_forecast(mock_get, provider, sample_brightsky_1_json):
 
 
 @pytest.mark.asyncio
-@patch("requests.get")
+@patch("requests.Session.get")
 async def test_update_data(mock_get, provider, sample_brightsky_1_json, cache_store):
     """Test fetching forecast from BrightSky."""
     # Mock response object
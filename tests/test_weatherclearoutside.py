@@ -123,7 +123,7 @@ def test_irridiance_estimate_from_cloud_cover(provider):
 # ------------------------------------------------
 
 
-@patch("requests.get")
+@patch("requests.Session.get")
 def test_request_forecast(mock_get, provider, sample_clearout_1_html, config_eos):
     """Test fetching forecast from ClearOutside."""
     # Mock response object
@@ -143,7 +143,7 @@ def test_request_forecast(mock_get, provider, sample_clearout_1_html, config_eos
 
 
 @pytest.mark.asyncio
-@patch("requests.get")
+@patch("requests.Session.get")
 async def test_update_data(mock_get, provider, sample_clearout_1_html, sample_clearout_1_data):
     # Mock response object
     mock_response = Mock()
@@ -180,7 +180,7 @@ async def test_update_data(mock_get, provider, sample_clearout_1_html, sample_cl
 
 @pytest.mark.asyncio
 @pytest.mark.skip(reason="Test fixture to be improved")
-@patch("requests.get")
+@patch("requests.Session.get")
 async def test_cache_forecast(mock_get, provider, sample_clearout_1_html, cache_store):
     """Test that ClearOutside forecast data is cached with TTL.
 
@@ -214,7 +214,7 @@ async def test_cache_forecast(mock_get, provider, sample_clearout_1_html, cache_
 
 @pytest.mark.asyncio
 @pytest.mark.skip(reason="For development only")
-@patch("requests.get")
+@patch("requests.Session.get")
 async def test_development_forecast_data(mock_get, provider, sample_clearout_1_html):
     # Mock response object
     mock_response = Mock()
@@ -104,7 +104,7 @@ def test_irridiance_estimate_from_cloud_cover(provider):
 # ------------------------------------------------
 
 
-@patch("requests.get")
+@patch("requests.Session.get")
 def test_request_forecast(mock_get, provider, sample_openmeteo_1_json):
     """Test requesting forecast from Open-Meteo."""
     # Mock response object
@@ -136,7 +136,7 @@ def test_request_forecast(mock_get, provider, sample_openmeteo_1_json):
 
 
 @pytest.mark.asyncio
-@patch("requests.get")
+@patch("requests.Session.get")
 async def test_update_data(mock_get, provider, sample_openmeteo_1_json, cache_store):
     """Test fetching and processing forecast from Open-Meteo."""
     # Mock response object
@@ -222,7 +222,7 @@ def test_openmeteo_unit_conversions(provider):
         (-2, ["start_date", "end_date", "models"], ["forecast_days"]),
     ],
 )
-@patch("requests.get")
+@patch("requests.Session.get")
 def test_openmeteo_request_mode_selection(
     mock_get,
     provider,